@@ -0,0 +1 @@
+"""Performance benchmarks for fitness center assistant."""
@@ -0,0 +1,8 @@
+"""Run the benchmark suite: python -m benchmarks --help."""
+
+import sys
+
+from benchmarks.suite import main
+
+if __name__ == "__main__":
+    sys.exit(main())
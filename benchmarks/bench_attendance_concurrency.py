@@ -0,0 +1,109 @@
+"""Multi-threaded stress benchmark for concurrent attendance stores.
+
+Kiosk threads share one store and record entries for a zipf-like mix of
+activities. Each store is run with 1, 2, 4, ... threads doing the same
+total work; the benchmark reports throughput and how much attendance
+was lost (recorded total minus the sum of all entry counts).
+
+A very short thread switch interval is used by default to force frequent
+preemption, which exposes the lost updates of an unlocked dict.
+
+Usage:
+    python -m benchmarks.bench_attendance_concurrency [--entries 400000]
+        [--threads 1,2,4,8] [--switch-interval 1e-5]
+"""
+
+import argparse
+import sys
+import sysconfig
+import threading
+import time
+
+from benchmarks.generators import generate_attendance
+from src.logic.attendance import AttendanceAggregate
+from src.logic.attendance_concurrent import StripedAttendanceStore
+
+
+class UnsafeDictStore:
+    """The plain dict store: read-modify-write without a lock."""
+
+    def __init__(self):
+        self.counts = {}
+
+    def add_entry(self, activity, count):
+        self.counts[activity] = self.counts.get(activity, 0) + count
+
+    def total(self):
+        return sum(self.counts.values())
+
+
+class GlobalLockStore:
+    """An AttendanceAggregate behind one lock shared by all threads."""
+
+    def __init__(self):
+        self.aggregate = AttendanceAggregate()
+        self.lock = threading.Lock()
+
+    def add_entry(self, activity, count):
+        with self.lock:
+            self.aggregate.add_entry(activity, count)
+
+    def total(self):
+        return self.aggregate.total
+
+
+class StripedStore(StripedAttendanceStore):
+    """StripedAttendanceStore with the total() used by this benchmark."""
+
+    def total(self):
+        return self.summarize()["total"]
+
+
+STORES = {
+    "dict, no lock": UnsafeDictStore,
+    "aggregate, global lock": GlobalLockStore,
+    "striped, 16 locks": StripedStore,
+}
+
+
+def run(store_class, entries, threads: int):
+    """Record entries from threads kiosks; return (seconds, lost attendance)."""
+    store = store_class()
+    parts = [entries[i::threads] for i in range(threads)]
+    
+    def kiosk(part):
+        add = store.add_entry
+        for activity, count in part:
+            add(activity, count)
+    
+    workers = [threading.Thread(target=kiosk, args=(part,)) for part in parts]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    seconds = time.perf_counter() - start
+    return seconds, sum(count for _, count in entries) - store.total()
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=400_000)
+    parser.add_argument("--threads", default="1,2,4,8", help="Comma-separated thread counts")
+    parser.add_argument("--switch-interval", type=float, default=1e-5, help="Thread switch interval in seconds")
+    args = parser.parse_args()
+    
+    sys.setswitchinterval(args.switch_interval)
+    entries = generate_attendance(args.entries)
+    gil = "free-threaded" if sysconfig.get_config_var("Py_GIL_DISABLED") else "GIL"
+    print(f"Python {sys.version.split()[0]} ({gil}), {args.entries:,} entries")
+    print(f"{'store':<24}{'threads':>8}{'entries/s':>14}{'lost':>10}")
+    for name, store_class in STORES.items():
+        for threads in (int(n) for n in args.threads.split(",")):
+            seconds, lost = run(store_class, entries, threads)
+            print(f"{name:<24}{threads:>8}{args.entries / seconds:>14,.0f}{lost:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark attendance history memory: tuples and dicts vs the compact store.
+
+A year of check-ins across several sites is held two ways: as the list of
+(activity, count, recorded_at) tuples plus dict totals that
+SQLiteAttendanceStore.entries() and summarize() hand back today, and as a
+CompactAttendanceStore with history. Also times building the dashboard
+table from each.
+
+Usage:
+    python -m benchmarks.bench_attendance_memory [--sites 12] [--activities 40] [--per-day 8]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.logic.attendance_compact import CompactAttendanceStore
+from src.logic.frames import attendance_frame
+
+DAY = 86400.0
+
+
+def generate_history(sites: int, activities: int, per_day: int, days: int = 365, seed: int = 0):
+    """Yield (activity, count, recorded_at) entries for every site, class and day."""
+    rng = np.random.default_rng(seed)
+    names = [f"Site {s:02d} / Class {a:03d}" for s in range(sites) for a in range(activities)]
+    per_chunk = len(names) * per_day
+    for day in range(days):
+        picks = rng.integers(0, len(names), per_chunk).tolist()
+        counts = rng.integers(0, 40, per_chunk).tolist()
+        times = (1.7e9 + (day + np.sort(rng.random(per_chunk))) * DAY).tolist()
+        yield from ((names[i], c, t) for i, c, t in zip(picks, counts, times))
+
+
+def _measure(build):
+    """Return (result, bytes allocated) for build()."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def _tuples_and_totals(entries):
+    """Today's in-memory shape: a list of entry tuples and a dict of totals."""
+    history = list(entries)
+    totals = {}
+    for activity, count, _ in history:
+        totals[activity] = totals.get(activity, 0) + count
+    return history, totals
+
+
+def _time(func, repeat: int = 5) -> float:
+    """Best wall time of func() in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sites", type=int, default=12)
+    parser.add_argument("--activities", type=int, default=40, help="Classes per site")
+    parser.add_argument("--per-day", type=int, default=8, help="Entries per class per day")
+    args = parser.parse_args()
+
+    def entries():
+        return generate_history(args.sites, args.activities, args.per_day)
+    
+    (history, totals), plain_bytes = _measure(lambda: _tuples_and_totals(entries()))
+    store, compact_bytes = _measure(lambda: CompactAttendanceStore.from_entries(entries()))
+    print(f"entries: {len(history):,} over {len(totals):,} activities")
+    print(f"memory, tuples + dict:     {plain_bytes / 2**20:8.1f} MiB ({plain_bytes / len(history):5.1f} bytes/entry)")
+    print(f"memory, compact store:     {compact_bytes / 2**20:8.1f} MiB ({compact_bytes / len(history):5.1f} bytes/entry)")
+    print(f"compact / today:           {compact_bytes / plain_bytes:8.1%}")
+    
+    by_activity = store.summarize()["by_activity"]
+    dict_seconds = _time(lambda: attendance_frame(totals))
+    view_seconds = _time(lambda: attendance_frame(by_activity))
+    print(f"attendance_frame, dict:    {dict_seconds * 1e6:8.0f} us")
+    print(f"attendance_frame, view:    {view_seconds * 1e6:8.0f} us (zero-copy)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Measure the cost of an "Add Entry" click on the dashboard's Attendance page.
+
+Before the page was split into fragments, a click re-executed the whole
+script twice (the click's own rerun plus st.rerun()). Now a click reruns
+only the attendance fragment. This drives src/app.py headlessly with
+Streamlit's AppTest, times full-script runs of the Attendance page, and
+compares them with the fragment's own recorded duration.
+
+Usage:
+    python -m benchmarks.bench_attendance_rerun [--activities 200] [--clicks 20]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.generators import generate_activities
+from src.logic import instrumentation
+from src.logic.attendance_sqlite import SQLiteAttendanceStore
+
+APP_PATH = Path(__file__).resolve().parents[1] / "src" / "app.py"
+
+
+def main() -> None:
+    """Run the benchmark and print per-click timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--activities", type=int, default=200, help="Activities already recorded")
+    parser.add_argument("--clicks", type=int, default=20)
+    args = parser.parse_args()
+    
+    from streamlit.testing.v1 import AppTest
+    
+    db_path = Path(tempfile.mkdtemp(prefix="bench_rerun_")) / "attendance.db"
+    SQLiteAttendanceStore(db_path).add_entries((name, 7) for name in generate_activities(args.activities))
+    os.environ["ATTENDANCE_DB"] = str(db_path)
+    
+    at = AppTest.from_file(str(APP_PATH), default_timeout=60).run()
+    at.sidebar.radio[0].set_value("Attendance").run()
+    instrumentation.enable()
+    
+    full_runs = []
+    for i in range(args.clicks):
+        at.text_input[0].set_value(f"Bench {i % 5}")
+        at.number_input[0].set_value(3)
+        start = time.perf_counter()
+        at.button[0].click().run()
+        full_runs.append(time.perf_counter() - start)
+    
+    fragment = instrumentation.snapshot()["timers"]["fragment.attendance"]
+    full = sorted(full_runs)[len(full_runs) // 2]
+    before = 2 * full
+    after = fragment["mean"]
+    print(f"activities: {args.activities:,}, clicks: {args.clicks}")
+    print(f"full script run (median):      {full * 1e3:8.2f} ms")
+    print(f"before, 2 full runs per click: {before * 1e3:8.2f} ms")
+    print(f"after, fragment rerun (mean):  {after * 1e3:8.2f} ms  ({before / after:.1f}x less work)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark vectorized batch pricing against the scalar price_membership loop.
+
+Usage:
+    python -m benchmarks.bench_batch_pricing [--rows 1000000] [--seed 0]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.generators import generate_quotes
+from src.data import plans, promo_codes
+from src.logic.batch_pricing import price_membership_batch
+from src.logic.pricing import price_membership
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    plan, months, student, promo = generate_quotes(args.rows, args.seed)
+    plan_list, months_list = plan.tolist(), months.tolist()
+    student_list, promo_list = student.tolist(), promo.tolist()
+    
+    start = time.perf_counter()
+    scalar = [
+        price_membership(p, m, s, c, plans, promo_codes)["final_cost"]
+        for p, m, s, c in zip(plan_list, months_list, student_list, promo_list)
+    ]
+    scalar_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    batch = price_membership_batch(plan, months, student, promo, plans, promo_codes)
+    batch_seconds = time.perf_counter() - start
+    
+    if not np.array_equal(np.asarray(scalar), batch["final_cost"]):
+        raise SystemExit("Batch results differ from scalar price_membership")
+    
+    print(f"rows:        {args.rows:,}")
+    print(f"scalar loop: {scalar_seconds:8.3f} s ({args.rows / scalar_seconds:,.0f} quotes/s)")
+    print(f"batch:       {batch_seconds:8.3f} s ({args.rows / batch_seconds:,.0f} quotes/s)")
+    print(f"speedup:     {scalar_seconds / batch_seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark duplicate check-in suppression and measure Bloom filter false positives.
+
+Replays generated badge scans (one per second, some fired twice) through
+a CheckInDeduplicator and through a baseline that asks the database
+about every scan, into fresh database files (or in-memory databases
+with --memory, where each lookup is cheapest). Then fills rotating filters
+of several capacities past their sizing and compares the observed
+false-positive rate with the expected one.
+
+Usage:
+    python -m benchmarks.bench_checkins [--scans 200000] [--double-rate 0.1]
+                                        [--memory]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.generators import generate_scans
+from src.logic.attendance_sqlite import SQLiteAttendanceStore
+from src.logic.checkins import DEFAULT_ERROR_RATE, CheckInDeduplicator, RotatingBloomFilter
+
+
+def check_in_with_lookups(store, scans, batch_size=1000):
+    """Baseline: look every scan up in the store, then write new ones in batches."""
+    pending, keys, duplicates = [], set(), 0
+    for member, activity, recorded_at, occurrence in scans:
+        if (member, occurrence) in keys or store.has_check_in(member, occurrence):
+            duplicates += 1
+            continue
+        keys.add((member, occurrence))
+        pending.append((member, occurrence, activity, recorded_at))
+        if len(pending) >= batch_size:
+            store.record_check_ins(pending)
+            pending, keys = [], set()
+    store.record_check_ins(pending)
+    return duplicates
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scans", type=int, default=200_000)
+    parser.add_argument("--members", type=int, default=50_000)
+    parser.add_argument("--double-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory", action="store_true", help="use in-memory databases")
+    args = parser.parse_args()
+    
+    scans = generate_scans(args.scans, args.members, args.double_rate, args.seed)
+    
+    with tempfile.TemporaryDirectory(prefix="bench_checkins_") as directory:
+        paths = [":memory:"] * 2 if args.memory else [os.path.join(directory, f"{n}.db") for n in ("filter", "lookup")]
+        
+        start = time.perf_counter()
+        with CheckInDeduplicator(SQLiteAttendanceStore(paths[0])) as guard:
+            for member, activity, recorded_at, occurrence in scans:
+                guard.check_in(member, activity, recorded_at, occurrence)
+        filter_seconds = time.perf_counter() - start
+        
+        store = SQLiteAttendanceStore(paths[1])
+        start = time.perf_counter()
+        duplicates = check_in_with_lookups(store, scans)
+        lookup_seconds = time.perf_counter() - start
+        store.close()
+    
+    if duplicates != guard.stats.duplicates:
+        raise SystemExit(f"Duplicates differ: {guard.stats.duplicates} with the filter, {duplicates} with lookups")
+    
+    stats = guard.stats
+    print(f"scans:          {len(scans):,} ({stats.duplicates:,} duplicates)")
+    print(f"bloom + store:  {filter_seconds:8.3f} s ({len(scans) / filter_seconds:,.0f} scans/s), "
+          f"{stats.filter_hits:,} lookups, filter {guard.filter.nbytes / 1024:,.0f} KiB")
+    print(f"lookup always:  {lookup_seconds:8.3f} s ({len(scans) / lookup_seconds:,.0f} scans/s), {len(scans):,} lookups")
+    print(f"false positives: {stats.false_positives:,} ({stats.false_positive_rate:.4%} of new check-ins)")
+    
+    print(f"\nfilter fill vs false positives (target {DEFAULT_ERROR_RATE:.2%} at capacity):")
+    for load in (0.5, 1.0, 2.0, 4.0):
+        bloom = RotatingBloomFilter(window=3, slices=3, capacity=10_000, error_rate=DEFAULT_ERROR_RATE)
+        keys = int(10_000 * load)
+        for second in range(4):
+            for i in range(keys):
+                bloom.add(f"{second}:{i}", second)
+        observed = sum(f"probe:{i}" in bloom for i in range(100_000)) / 100_000
+        print(f"  {load:3.1f}x capacity: observed {observed:.4%}, expected {bloom.false_positive_rate():.4%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark dashboard cold start: import time and first render per page.
+
+Every measurement runs in a fresh interpreter, as a new container would:
+
+- shell: importing what src/app.py imports before any page is shown
+  (streamlit, the theme and the page registry), and whether pandas got
+  loaded along the way;
+- page imports: importing each page module on top of the shell;
+- first render: running the app with streamlit's AppTest, first on the
+  Home page, then switching to each other page for the first time.
+
+Exits with status 1 when the shell import plus the first Home render
+exceeds --budget-ms.
+
+Usage:
+    python -m benchmarks.bench_cold_start [--budget-ms 1200] [--repeat 3]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+from src.views import PAGES
+
+PROJECT_ROOT = Path(__file__).parent.parent
+APP_PATH = PROJECT_ROOT / "src" / "app.py"
+
+SHELL_IMPORTS = "import streamlit, src.theme, src.views"
+
+SHELL_SCRIPT = f"""
+import json, sys, time
+start = time.perf_counter()
+{SHELL_IMPORTS}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "pandas": "pandas" in sys.modules}}))
+"""
+
+PAGE_SCRIPT = f"""
+import importlib, json, time
+{SHELL_IMPORTS}
+start = time.perf_counter()
+importlib.import_module("src.views." + {{module!r}})
+print(json.dumps({{{{"seconds": time.perf_counter() - start}}}}))
+"""
+
+RENDER_SCRIPT = """
+import json, time
+from streamlit.testing.v1 import AppTest
+start = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=60).run()
+timings = {{"Home": time.perf_counter() - start}}
+for page in {pages!r}:
+    start = time.perf_counter()
+    at.sidebar.radio[0].set_value(page).run()
+    timings[page] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+
+def _run(script: str) -> Dict:
+    """Run a script in a fresh interpreter and parse the JSON it prints."""
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _best(script: str, repeat: int) -> Dict:
+    """Per-key minimum over repeated fresh-interpreter runs."""
+    runs = [_run(script) for _ in range(repeat)]
+    return {key: min(run[key] for run in runs) for key in runs[0]}
+
+
+def main() -> int:
+    """Run the benchmark, print results and return the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=1200.0, help="Budget for shell import + first Home render")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per measurement (best is kept)")
+    args = parser.parse_args()
+    
+    shell = _best(SHELL_SCRIPT, args.repeat)
+    print(f"shell import:             {shell['seconds'] * 1e3:8.0f} ms (pandas loaded: {bool(shell['pandas'])})")
+    
+    for page, module in PAGES.items():
+        seconds = _best(PAGE_SCRIPT.format(module=module), args.repeat)["seconds"]
+        print(f"  + import {module:<16}{seconds * 1e3:8.0f} ms  ({page})")
+    
+    others = [page for page in PAGES if page != "Home"]
+    renders = _best(RENDER_SCRIPT.format(app=str(APP_PATH), pages=others), args.repeat)
+    for page, seconds in renders.items():
+        print(f"first render {page:<18}{seconds * 1e3:6.0f} ms")
+    
+    cold_start = (shell["seconds"] + renders["Home"]) * 1e3
+    within = cold_start <= args.budget_ms
+    print(f"cold start (shell + Home): {cold_start:7.0f} ms, budget {args.budget_ms:.0f} ms: {'OK' if within else 'OVER BUDGET'}")
+    return 0 if within else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
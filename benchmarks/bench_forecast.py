@@ -0,0 +1,57 @@
+"""Benchmark batch Holt-Winters fitting against fitting one class at a time.
+
+Fits generated weekly attendance series, holds out the last weeks and
+reports fit throughput, the speedup over a per-series loop (timed on a
+sample and extrapolated) and forecast error against a seasonal naive
+forecast (same week of the previous cycle).
+
+Usage:
+    python -m benchmarks.bench_forecast [--series 5000] [--weeks 104]
+                                        [--holdout 4] [--loop-series 200]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.generators import generate_class_series
+from src.logic.forecast import SEASON_WEEKS, fit_holt_winters
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=5000)
+    parser.add_argument("--weeks", type=int, default=104, help="Weeks of history per series")
+    parser.add_argument("--holdout", type=int, default=4, help="Weeks held out for scoring")
+    parser.add_argument("--loop-series", type=int, default=200, help="Series fitted one at a time")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    series = generate_class_series(args.series, args.weeks + args.holdout, SEASON_WEEKS, args.seed)
+    history, actual = series[:, :args.weeks], series[:, args.weeks:]
+    
+    start = time.perf_counter()
+    model = fit_holt_winters(history)
+    forecast = model.forecast(args.holdout)
+    batch_seconds = time.perf_counter() - start
+    
+    sample = min(args.loop_series, args.series)
+    start = time.perf_counter()
+    for row in history[:sample]:
+        fit_holt_winters(row).forecast(args.holdout)
+    loop_seconds = (time.perf_counter() - start) / sample * args.series
+    
+    naive = history[:, args.weeks - SEASON_WEEKS + np.arange(args.holdout) % SEASON_WEEKS]
+    
+    print(f"series:      {args.series:,} x {args.weeks} weeks (season {SEASON_WEEKS})")
+    print(f"batch fit:   {batch_seconds:8.3f} s ({args.series / batch_seconds:,.0f} series/s)")
+    print(f"per series:  {loop_seconds:8.3f} s (extrapolated from {sample:,} series)")
+    print(f"speedup:     {loop_seconds / batch_seconds:8.1f}x")
+    print(f"MAE over {args.holdout} weeks: Holt-Winters {np.nanmean(np.abs(forecast - actual)):.2f}, "
+          f"seasonal naive {np.nanmean(np.abs(naive - actual)):.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark the member registry: snapshot load vs rebuild, and autocomplete latency.
+
+Startup is timed both ways: building the index from raw member records
+(normalizing and sorting every name) and loading the saved snapshot.
+Autocomplete is timed per query for typed prefixes of 1 to 6 letters,
+against a linear scan of the names, as a kiosk would without an index.
+
+Usage:
+    python -m benchmarks.bench_members [--members 100000] [--queries 2000]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.generators import generate_member_names
+from src.logic.members import DEFAULT_SUGGESTIONS, MemberRegistry, normalize_name, registry_from_records
+
+
+def complete_by_scan(members, prefix, limit=DEFAULT_SUGGESTIONS):
+    """Baseline: normalize and test every member's name words until enough match."""
+    key, found = normalize_name(prefix), []
+    for member in members:
+        words = normalize_name(member["name"]).split(" ")
+        if any(" ".join(words[i:]).startswith(key) for i in range(len(words))):
+            found.append(member)
+            if len(found) == limit:
+                break
+    return found
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    records = generate_member_names(args.members, args.seed)
+    
+    start = time.perf_counter()
+    registry, _ = registry_from_records(records)
+    build_seconds = time.perf_counter() - start
+    
+    with tempfile.TemporaryDirectory(prefix="bench_members_") as directory:
+        path = os.path.join(directory, "members.idx")
+        size = registry.save(path)
+        start = time.perf_counter()
+        loaded = MemberRegistry.load(path)
+        load_seconds = time.perf_counter() - start
+    
+    print(f"members:          {len(registry):,}")
+    print(f"build from rows:  {build_seconds * 1000:8.1f} ms")
+    print(f"load snapshot:    {load_seconds * 1000:8.1f} ms ({size / 1024:,.0f} KiB on disk)")
+    
+    names = [m.name for m in loaded]
+    prefixes = [names[(i * 7919) % len(names)][:1 + i % 6] for i in range(args.queries)]
+    timings = []
+    for prefix in prefixes:
+        start = time.perf_counter()
+        loaded.complete(prefix)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    print(
+        f"autocomplete:     median {statistics.median(timings) * 1e6:,.1f} us, "
+        f"p99 {timings[int(len(timings) * 0.99)] * 1e6:,.1f} us, max {timings[-1] * 1e6:,.1f} us"
+    )
+    
+    sample = prefixes[:max(1, args.queries // 100)]
+    start = time.perf_counter()
+    for prefix in sample:
+        complete_by_scan(records, prefix)
+    scan_seconds = (time.perf_counter() - start) / len(sample)
+    print(f"linear scan:      mean {scan_seconds * 1e6:,.1f} us per query ({len(sample)} queries)")
+    
+    start = time.perf_counter()
+    for record in records[:args.queries]:
+        loaded.get(record["id"])
+    print(f"lookup by id:     mean {(time.perf_counter() - start) / args.queries * 1e6:,.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark integer-cents pricing against float and Decimal implementations.
+
+Usage:
+    python -m benchmarks.bench_money [--rows 200000] [--seed 0]
+"""
+
+import argparse
+import time
+from decimal import Decimal, ROUND_HALF_UP
+
+import numpy as np
+
+from benchmarks.generators import generate_quotes
+from src.data import plans, promo_codes
+from src.logic.batch_pricing import price_membership_batch
+from src.logic.pricing import price_membership
+
+CENT = Decimal("0.01")
+STUDENT_RATE = Decimal("0.15")
+
+
+def float_price_membership(plan, months, is_student_or_staff, promo) -> dict:
+    """Breakdown using the original float arithmetic."""
+    monthly_price = plans[plan]
+    base_cost = monthly_price * months
+    student_staff_discount = base_cost * (0.15 if is_student_or_staff else 0.0)
+    cost = base_cost - student_staff_discount
+    promo_applied, promo_rate, promo_discount = None, 0.0, 0.0
+    if promo:
+        code = promo.strip().upper()
+        if code in promo_codes:
+            promo_applied, promo_rate = code, promo_codes[code]
+            promo_discount = cost * promo_rate
+    return {
+        "plan": plan,
+        "months": months,
+        "monthly_price": monthly_price,
+        "base_cost": base_cost,
+        "student_staff_discount": student_staff_discount,
+        "promo_applied": promo_applied,
+        "promo_rate": promo_rate,
+        "promo_discount": promo_discount,
+        "final_cost": max(0.0, cost - promo_discount),
+    }
+
+
+def decimal_price_membership(plan, months, is_student_or_staff, promo) -> dict:
+    """Breakdown using Decimal with the same rounding policy as src.logic.money."""
+    monthly_price = plans[plan]
+    base_cost = Decimal(str(monthly_price)) * months
+    student_staff_discount = Decimal(0)
+    if is_student_or_staff:
+        student_staff_discount = (base_cost * STUDENT_RATE).quantize(CENT, rounding=ROUND_HALF_UP)
+    cost = base_cost - student_staff_discount
+    promo_applied, promo_rate, promo_discount = None, 0.0, Decimal(0)
+    if promo:
+        code = promo.strip().upper()
+        if code in promo_codes:
+            promo_applied, promo_rate = code, promo_codes[code]
+            rate = Decimal(str(promo_rate))
+            promo_discount = (cost * rate).quantize(CENT, rounding=ROUND_HALF_UP)
+    return {
+        "plan": plan,
+        "months": months,
+        "monthly_price": monthly_price,
+        "base_cost": base_cost,
+        "student_staff_discount": student_staff_discount,
+        "promo_applied": promo_applied,
+        "promo_rate": promo_rate,
+        "promo_discount": promo_discount,
+        "final_cost": max(Decimal(0), cost - promo_discount),
+    }
+
+
+def _time(label: str, rows: int, func):
+    """Run func once, print its throughput and return its result."""
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<14}{seconds:8.3f} s ({rows / seconds:,.0f} quotes/s)")
+    return result
+
+
+def main() -> None:
+    """Run the benchmark, check exactness and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    plan, months, student, promo = generate_quotes(args.rows, args.seed)
+    rows = list(zip(plan.tolist(), months.tolist(), student.tolist(), promo.tolist()))
+    
+    print(f"rows: {args.rows:,}")
+    floats = _time("float:", args.rows, lambda: [
+        float_price_membership(*row)["final_cost"] for row in rows
+    ])
+    decimals = _time("decimal:", args.rows, lambda: [
+        decimal_price_membership(*row)["final_cost"] for row in rows
+    ])
+    cents = _time("cents scalar:", args.rows, lambda: [
+        price_membership(p, m, s, c, plans, promo_codes)["final_cost"] for p, m, s, c in rows
+    ])
+    batch = _time("cents batch:", args.rows, lambda: price_membership_batch(
+        plan, months, student, promo, plans, promo_codes
+    ))
+    
+    exact = [Decimal(str(value)) for value in cents]
+    if exact != decimals:
+        raise SystemExit("Integer-cents results differ from the Decimal reference")
+    if not np.array_equal(np.asarray(cents), batch["final_cost"]):
+        raise SystemExit("Batch results differ from scalar price_membership")
+    
+    drift = sum(1 for f, d in zip(floats, decimals) if Decimal(str(f)) != d)
+    print(f"float rows that are not whole cents / differ from Decimal: {drift:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark the promo catalog: memory, validation and concurrent redemption.
+
+Usage:
+    python -m benchmarks.bench_promos [--codes 100000] [--threads 8]
+"""
+
+import argparse
+import random
+import threading
+import time
+import tracemalloc
+
+from src.logic.promos import PromoCatalog
+
+
+def build_catalog(codes: int, stripes: int) -> PromoCatalog:
+    """Catalog of single-use codes spread over 20 campaigns."""
+    catalog = PromoCatalog(stripes=stripes)
+    per_campaign = codes // 20
+    for c in range(20):
+        campaign = catalog.add_campaign(f"Campaign {c}", (5 + c) / 100, expires_at=2e9, max_redemptions=1)
+        catalog.add_codes((f"C{c:02d}-{i:07d}" for i in range(per_campaign)), campaign)
+    return catalog
+
+
+def build_dicts(codes: int) -> dict:
+    """The same codes as one dict of per-code records (for comparison)."""
+    per_campaign = codes // 20
+    return {
+        f"C{c:02d}-{i:07d}": {"rate": (5 + c) / 100, "expires_at": 2e9, "max_redemptions": 1, "redeemed": 0, "exclusive": False}
+        for c in range(20)
+        for i in range(per_campaign)
+    }
+
+
+def _measure(build):
+    """Return (result, bytes allocated) for build()."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def _redeem_all(catalog: PromoCatalog, codes, threads: int) -> float:
+    """Redeem every code twice across threads; return the elapsed seconds."""
+    def kiosk(part):
+        for code in part:
+            catalog.redeem(code)
+    
+    workers = [threading.Thread(target=kiosk, args=(codes[i::threads] * 2,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--codes", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+    
+    catalog, catalog_bytes = _measure(lambda: build_catalog(args.codes, 64))
+    _, dict_bytes = _measure(lambda: build_dicts(args.codes))
+    print(f"codes: {len(catalog):,}")
+    print(f"memory, PromoCatalog:      {catalog_bytes / len(catalog):8.0f} bytes/code")
+    print(f"memory, dict of records:   {dict_bytes / len(catalog):8.0f} bytes/code")
+    
+    lookups = random.Random(0).choices(list(catalog), k=200_000)
+    start = time.perf_counter()
+    for code in lookups:
+        catalog.is_valid(code)
+    seconds = time.perf_counter() - start
+    print(f"is_valid:                  {seconds / len(lookups) * 1e9:8.0f} ns/lookup")
+    
+    codes = list(catalog)
+    for stripes in (1, 64):
+        catalog = build_catalog(args.codes, stripes)
+        seconds = _redeem_all(catalog, codes, args.threads)
+        redeemed = sum(catalog.redemptions(code) for code in codes)
+        print(
+            f"redeem, {stripes:>2} lock stripe(s):  {len(codes) * 2 / seconds:10,.0f} redemptions/s "
+            f"on {args.threads} threads ({redeemed:,} of {len(codes) * 2:,} accepted)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark month-end member reports: rendering, then writing with 1 and N workers.
+
+Rendering is timed on its own against building every line with f-strings
+per member (the approach of the single-member CLI summary). Writing goes
+through export_text, which fsyncs each file, so it is usually bound by
+disk latency rather than CPU; more workers overlap those waits.
+
+Usage:
+    python -m benchmarks.bench_reports [--members 20000] [--workers 4]
+                                       [--chunk-size 500]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.generators import generate_members
+from src.data import plans, promo_codes
+from src.logic.bulk import parse_bool
+from src.logic.pricing import price_membership
+from src.logic.reports import ReportTemplate, generate_reports
+
+
+def render_with_fstrings(member, breakdown, attendance, center, period):
+    """Build a report line by line, as the single-member summary does."""
+    lines = ["=" * 60, "FITNESS CENTER MEMBER SUMMARY", "=" * 60]
+    lines.append(f"Name: {member.get('name') or 'Member'}")
+    lines.append(f"Member ID: {member.get('id', '')}")
+    lines.append(f"Center: {center}")
+    lines.append(f"Period: {period}")
+    lines.append("")
+    lines.append("PRICING BREAKDOWN:")
+    lines.append(f"  Plan: {breakdown.get('plan', 'N/A')}")
+    lines.append(f"  Months: {breakdown.get('months', 'N/A')}")
+    lines.append(f"  Final Cost: ${breakdown.get('final_cost', 0.0):,.2f}")
+    lines.append("")
+    lines.append("ATTENDANCE SUMMARY:")
+    if attendance:
+        total = sum(attendance.values())
+        lines.append(f"  Total Attendance: {total}")
+        lines.append(f"  Average per Activity: {total / len(attendance):.2f}")
+        lines.append("  By Activity:")
+        for activity, count in attendance.items():
+            lines.append(f"    • {activity}: {count}")
+    else:
+        lines.append("  No attendance data recorded.")
+    lines.append("")
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    members, attendance = generate_members(args.members, args.seed)
+    period = "October 2026"
+    template = ReportTemplate(period=period)
+    breakdowns = [
+        price_membership(m["plan"], m["months"], parse_bool(m["is_student_or_staff"]), m["promo"], plans, promo_codes)
+        for m in members
+    ]
+    
+    start = time.perf_counter()
+    compiled = [template.render(m, b, attendance[m["id"]]) for m, b in zip(members, breakdowns)]
+    compiled_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    fstrings = [
+        render_with_fstrings(m, b, attendance[m["id"]], "Baun Fitness Center", period)
+        for m, b in zip(members, breakdowns)
+    ]
+    fstring_seconds = time.perf_counter() - start
+    
+    if compiled != fstrings:
+        raise SystemExit("Compiled template output differs from the f-string reports")
+    
+    print(f"members:          {args.members:,}")
+    print(f"render, compiled: {compiled_seconds:8.3f} s ({args.members / compiled_seconds:,.0f} members/s)")
+    print(f"render, f-strings:{fstring_seconds:8.3f} s ({args.members / fstring_seconds:,.0f} members/s)")
+    
+    for workers in sorted({1, args.workers}):
+        with tempfile.TemporaryDirectory(prefix="bench_reports_") as directory:
+            start = time.perf_counter()
+            results = list(generate_reports(members, directory, template, attendance, workers, args.chunk_size))
+            seconds = time.perf_counter() - start
+        errors = sum(r["error"] is not None for r in results)
+        print(f"write, {workers} worker(s): {seconds:8.3f} s ({args.members / seconds:,.0f} members/s), {errors} errors")
+
+
+if __name__ == "__main__":
+    main()
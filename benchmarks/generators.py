@@ -0,0 +1,146 @@
+"""Synthetic data generators for benchmarks.
+
+Every generator is deterministic for a given size and seed, so results
+from different runs are comparable.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.data import plans
+from src.logic.schedule import DAYS, format_time
+
+
+def generate_quotes(rows: int, seed: int = 0):
+    """Generate random quote columns covering every plan and promo outcome."""
+    rng = np.random.default_rng(seed)
+    plan_names = np.array(list(plans.keys()), dtype=object)
+    promo_choices = np.array([None, "WELCOME10", "fall5", "INVALID"], dtype=object)
+    return (
+        plan_names[rng.integers(0, len(plan_names), rows)],
+        rng.integers(1, 25, rows),
+        rng.random(rows) < 0.3,
+        promo_choices[rng.integers(0, len(promo_choices), rows)],
+    )
+
+
+def generate_activities(count: int) -> List[str]:
+    """Generate distinct activity names."""
+    return [f"Activity {i:07d}" for i in range(count)]
+
+
+def generate_attendance(rows: int, activities: int = 1000, seed: int = 0) -> List[Tuple[str, int]]:
+    """
+    Generate (activity, count) attendance entries.
+    
+    Activity popularity is skewed (Zipf-like), as it is in real check-in data.
+    """
+    rng = np.random.default_rng(seed)
+    names = generate_activities(activities)
+    picks = np.minimum(rng.zipf(1.3, rows) - 1, activities - 1)
+    counts = rng.integers(0, 40, rows)
+    return [(names[i], int(c)) for i, c in zip(picks.tolist(), counts.tolist())]
+
+
+def generate_schedule(slots: int, seed: int = 0) -> Dict[str, List[str]]:
+    """Generate a day -> class strings schedule with the given number of slots."""
+    rng = np.random.default_rng(seed)
+    days = rng.integers(0, len(DAYS), slots)
+    minutes = rng.integers(5 * 12, 22 * 12, slots) * 5  # 5:00 AM to 10:00 PM, 5-minute steps
+    schedule: Dict[str, List[str]] = {day: [] for day in DAYS}
+    for i, (day, minute) in enumerate(zip(days.tolist(), minutes.tolist())):
+        schedule[DAYS[day]].append(f"Class {i % 500} Room {i % 40} - {format_time(minute)}")
+    return schedule
+
+
+def generate_report_lines(rows: int) -> List[str]:
+    """Generate session summary style report lines."""
+    return [f"    • Activity {i:07d}: {i % 97}" for i in range(rows)]
+
+
+def generate_class_series(series: int, weeks: int, season: int = 4, seed: int = 0) -> np.ndarray:
+    """
+    Generate weekly attendance series, one row per class slot.
+    
+    Each class has its own base size, trend and seasonal cycle plus noise.
+    A quarter of the classes start partway through (leading NaNs), as new
+    slots join the schedule.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(weeks)
+    base = rng.uniform(5, 40, (series, 1))
+    trend = rng.normal(0, 0.05, (series, 1))
+    pattern = rng.normal(0, 0.15, (series, season)) * base
+    values = base + trend * t + pattern[:, t % season] + rng.normal(0, 1.5, (series, weeks))
+    values = np.maximum(np.round(values), 0)
+    starts = np.where(rng.random(series) < 0.25, rng.integers(0, weeks // 2 + 1, series), 0)
+    values[t < starts[:, None]] = np.nan
+    return values
+
+
+def generate_timetable(sessions: int, seed: int = 0) -> List[Dict]:
+    """Generate timetable records: about 25 sessions per room and 20 per instructor."""
+    rng = np.random.default_rng(seed)
+    days = rng.integers(0, len(DAYS), sessions)
+    minutes = rng.integers(5 * 12, 21 * 12, sessions) * 5  # 5:00 AM to 9:00 PM, 5-minute steps
+    lengths = rng.choice([30, 45, 60, 90], sessions)
+    rooms = rng.integers(0, max(sessions // 25, 1), sessions)
+    instructors = rng.integers(0, max(sessions // 20, 1), sessions)
+    return [
+        {
+            "name": f"Class {i % 500}",
+            "day": DAYS[day],
+            "start": format_time(minute),
+            "minutes": int(length),
+            "room": f"Room {room}",
+            "instructor": f"Instructor {instructor}",
+        }
+        for i, (day, minute, length, room, instructor) in enumerate(zip(
+            days.tolist(), minutes.tolist(), lengths.tolist(), rooms.tolist(), instructors.tolist()
+        ))
+    ]
+
+
+def generate_members(count: int, seed: int = 0) -> Tuple[List[Dict], Dict[str, Dict[str, int]]]:
+    """Generate member records and their attendance (up to 4 activities each)."""
+    plan, months, student, promo = generate_quotes(count, seed)
+    rng = np.random.default_rng(seed + 1)
+    activities = generate_activities(12)
+    members, attendance = [], {}
+    for i, (p, m, s, c) in enumerate(zip(plan.tolist(), months.tolist(), student.tolist(), promo.tolist())):
+        member_id = f"M{i:07d}"
+        members.append({"id": member_id, "name": f"Member {i}", "plan": p, "months": m, "is_student_or_staff": s, "promo": c})
+        picks = rng.choice(len(activities), rng.integers(0, 5), replace=False)
+        attendance[member_id] = {activities[a]: int(rng.integers(1, 20)) for a in picks}
+    return members, attendance
+
+
+def generate_scans(count: int, members: int = 50_000, double_rate: float = 0.1, seed: int = 0) -> List[Tuple[str, str, float, str]]:
+    """Generate badge scans (member, activity, time, occurrence), one per second, some fired twice."""
+    rng = np.random.default_rng(seed)
+    member_ids = rng.integers(0, members, count)
+    activities = rng.integers(0, 12, count)
+    doubles = rng.random(count) < double_rate
+    scans = []
+    for i, (member, activity, double) in enumerate(zip(member_ids.tolist(), activities.tolist(), doubles.tolist())):
+        recorded_at = 1_700_000_000.0 + i
+        scan = (f"M{member:07d}", f"Activity {activity:07d}", recorded_at, f"{activity}@{i // 3600}")
+        scans.append(scan)
+        if double:
+            scans.append(scan[:2] + (recorded_at + 0.3,) + scan[3:])
+    return scans
+
+
+def generate_member_names(count: int, seed: int = 0) -> List[Dict]:
+    """Generate member records (id, name) with realistic, often shared, names."""
+    rng = np.random.default_rng(seed)
+    syllables = np.array(["an", "bel", "car", "da", "el", "fi", "gor", "ha", "is", "jo", "ka", "li", "mar", "no",
+                          "os", "pe", "ri", "sa", "ta", "ul", "va", "wen", "xi", "yo", "zé", "ño"], dtype=object)
+    first = sorted({"".join(row).title() for row in syllables[rng.integers(0, len(syllables), (2000, 2))].tolist()})
+    last = sorted({"".join(row).title() for row in syllables[rng.integers(0, len(syllables), (20_000, 3))].tolist()})
+    firsts, lasts = rng.integers(0, len(first), count), rng.integers(0, len(last), count)
+    return [
+        {"id": f"M{i:07d}", "name": f"{first[f]} {last[l]}"}
+        for i, (f, l) in enumerate(zip(firsts.tolist(), lasts.tolist()))
+    ]
@@ -0,0 +1,461 @@
+"""Benchmark suite covering every logic module, with JSON baselines.
+
+Usage:
+    python -m benchmarks list
+    python -m benchmarks run [--scales 1e3,1e4,1e5] [--cases pricing,attendance]
+                             [--repeat 3] [--output results.json]
+                             [--compare baseline.json] [--threshold 0.25]
+    python -m benchmarks compare baseline.json results.json [--threshold 0.25]
+
+Each case is timed at every requested scale (number of rows, entries,
+slots or lines); the best of --repeat runs is kept. compare (or run
+--compare) exits with status 1 when any case got slower than the baseline
+by more than the threshold (0.25 = 25%).
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.generators import (
+    generate_activities,
+    generate_attendance,
+    generate_class_series,
+    generate_member_names,
+    generate_members,
+    generate_quotes,
+    generate_report_lines,
+    generate_scans,
+    generate_schedule,
+    generate_timetable,
+)
+from src.data import plans, promo_codes
+from src.logic.analytics import AttendanceAnalytics
+from src.logic.attendance import AttendanceAggregate, add_entry, summarize
+from src.logic.attendance_compact import CompactAttendanceStore
+from src.logic.attendance_sqlite import SQLiteAttendanceStore
+from src.logic.batch_pricing import price_membership_batch
+from src.logic.checkins import CheckInDeduplicator
+from src.logic.export import export_table, export_text, table_formats
+from src.logic.forecast import fit_holt_winters
+from src.logic.frames import ActivityTable, attendance_frame, attendance_history_frames
+from src.logic.members import MemberRegistry, registry_from_records
+from src.logic.messaging import reminders
+from src.logic.price_matrix import PriceMatrix
+from src.logic.pricing import price_membership
+from src.logic.promos import PromoCatalog
+from src.logic.quote_cache import QuoteCache
+from src.logic.reports import ReportTemplate, generate_reports
+from src.logic.schedule import DAYS, ScheduleIndex, day_classes
+from src.logic.timetable import Timetable, parse_session
+
+DEFAULT_SCALES = [10**3, 10**4, 10**5]
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclass
+class Case:
+    """A benchmark case: setup(scale) returns the zero-argument function to time."""
+    
+    name: str
+    setup: Callable[[int], Callable[[], object]]
+    max_scale: int = 10**7
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, max_scale: int = 10**7) -> Callable:
+    """Register a benchmark setup function under name."""
+    def register(setup: Callable[[int], Callable[[], object]]) -> Callable:
+        CASES[name] = Case(name, setup, max_scale)
+        return setup
+    return register
+
+
+@case("pricing.price_membership")
+def _price_membership(scale: int):
+    """Scalar price_membership loop over generated quotes."""
+    rows = list(zip(*(column.tolist() for column in generate_quotes(scale))))
+    return lambda: [price_membership(p, m, s, c, plans, promo_codes) for p, m, s, c in rows]
+
+
+@case("pricing.price_membership_batch")
+def _price_membership_batch(scale: int):
+    """Vectorized price_membership_batch over generated quotes."""
+    plan, months, student, promo = generate_quotes(scale)
+    return lambda: price_membership_batch(plan, months, student, promo, plans, promo_codes)
+
+
+@case("pricing.quote_cache")
+def _quote_cache(scale: int):
+    """QuoteCache.quote loop over generated quotes (mostly repeated combinations)."""
+    rows = list(zip(*(column.tolist() for column in generate_quotes(scale))))
+    
+    def run():
+        cache = QuoteCache()
+        for p, m, s, c in rows:
+            cache.quote(p, m, s, c, plans, promo_codes)
+    return run
+
+
+@case("pricing.price_matrix_lookup")
+def _price_matrix_lookup(scale: int):
+    """PriceMatrix.lookup over generated quotes."""
+    rows = list(zip(*(column.tolist() for column in generate_quotes(scale))))
+    matrix = PriceMatrix.build(plans, promo_codes)
+    return lambda: [matrix.lookup(p, m, s, c, promo_codes) for p, m, s, c in rows]
+
+
+@case("promos.is_valid", max_scale=10**6)
+def _promo_is_valid(scale: int):
+    """PromoCatalog.is_valid lookups in a catalog of scale single-use codes."""
+    catalog = PromoCatalog()
+    campaign = catalog.add_campaign("Bench", 0.10, max_redemptions=1)
+    catalog.add_codes((f"BENCH-{i:08d}" for i in range(scale)), campaign)
+    codes = list(catalog)
+    return lambda: [catalog.is_valid(code) for code in codes]
+
+
+@case("attendance.add_entry")
+def _add_entry(scale: int):
+    """add_entry into a dict store, one call per entry."""
+    entries = generate_attendance(scale)
+
+    def run():
+        store = {}
+        for activity, count in entries:
+            add_entry(store, activity, count)
+    return run
+
+
+@case("attendance.summarize", max_scale=10**6)
+def _summarize(scale: int):
+    """summarize() of a dict store with scale activities."""
+    store = dict.fromkeys(generate_activities(scale), 7)
+    return lambda: summarize(store)
+
+
+@case("attendance.aggregate_add_entry")
+def _aggregate_add_entry(scale: int):
+    """AttendanceAggregate.add_entry, one call per entry."""
+    entries = generate_attendance(scale)
+
+    def run():
+        aggregate = AttendanceAggregate()
+        for activity, count in entries:
+            aggregate.add_entry(activity, count)
+    return run
+
+
+@case("attendance.aggregate_summarize", max_scale=10**6)
+def _aggregate_summarize(scale: int):
+    """AttendanceAggregate summary and top 10 with scale activities."""
+    aggregate = AttendanceAggregate(dict.fromkeys(generate_activities(scale), 7))
+    return lambda: (aggregate.summarize(), aggregate.top(10))
+
+
+@case("attendance.compact_add_entries")
+def _compact_add_entries(scale: int):
+    """CompactAttendanceStore.add_entries with history kept."""
+    entries = [(activity, count, float(i)) for i, (activity, count) in enumerate(generate_attendance(scale))]
+    return lambda: CompactAttendanceStore.from_entries(entries)
+
+
+def _timestamped(scale: int):
+    """Generated attendance entries as columns, spread over a year."""
+    activities, counts = zip(*generate_attendance(scale))
+    recorded_at = [1.7e9 + i * (365 * 86400 / scale) for i in range(scale)]
+    return activities, counts, recorded_at
+
+
+@case("analytics.add_entries")
+def _analytics_add_entries(scale: int):
+    """Folding scale timestamped entries into the analytics views (one batch)."""
+    activities, counts, recorded_at = _timestamped(scale)
+    return lambda: AttendanceAnalytics(tz="UTC").add_entries(activities, counts, recorded_at)
+
+
+@case("analytics.views", max_scale=10**6)
+def _analytics_views(scale: int):
+    """Heatmap, 30-day rolling and week-over-week views after a new entry."""
+    activities, counts, recorded_at = _timestamped(scale)
+    analytics = AttendanceAnalytics(tz="UTC")
+    analytics.add_entries(activities, counts, recorded_at)
+    now = recorded_at[-1]
+    
+    def run():
+        analytics.add_entry(activities[0], 1, now)
+        return analytics.heatmap(), analytics.rolling(7, 30, now=now), analytics.week_over_week(now=now)
+    return run
+
+
+@case("forecast.fit_holt_winters", max_scale=10**5)
+def _fit_holt_winters(scale: int):
+    """Batch Holt-Winters fit and 4-week forecast of scale weekly class series (one year)."""
+    series = generate_class_series(scale, 52)
+    return lambda: fit_holt_winters(series).forecast(4)
+
+
+@case("checkins.check_in", max_scale=10**5)
+def _check_in(scale: int):
+    """Deduplicating scale badge scans (10% double-fired) into an in-memory database."""
+    scans = generate_scans(scale)
+
+    def run():
+        with CheckInDeduplicator(SQLiteAttendanceStore(":memory:")) as guard:
+            for member, activity, recorded_at, occurrence in scans:
+                guard.check_in(member, activity, recorded_at, occurrence)
+    return run
+
+
+@case("members.load", max_scale=10**6)
+def _members_load(scale: int):
+    """Loading the registry snapshot of scale members."""
+    registry, _ = registry_from_records(generate_member_names(scale))
+    path = Path(tempfile.mkdtemp(prefix="bench_members_")) / "members.idx"
+    registry.save(path)
+    return lambda: MemberRegistry.load(path)
+
+
+@case("members.complete", max_scale=10**6)
+def _members_complete(scale: int):
+    """1,000 autocomplete lookups of 1- to 4-letter prefixes among scale members."""
+    registry, _ = registry_from_records(generate_member_names(scale))
+    prefixes = [m.name[:1 + i % 4] for i, m in zip(range(1000), registry)]
+    return lambda: [registry.complete(prefix) for prefix in prefixes]
+
+
+@case("schedule.reminders", max_scale=10**6)
+def _reminders(scale: int):
+    """reminders() lookups on a schedule with scale slots."""
+    schedule = generate_schedule(scale)
+    days = [DAYS[i % 7] for i in range(scale)]
+    return lambda: [reminders(day, schedule) for day in days]
+
+
+@case("schedule.day_classes", max_scale=10**6)
+def _day_classes(scale: int):
+    """day_classes() lookups on a schedule with scale slots."""
+    schedule = generate_schedule(scale)
+    days = [DAYS[i % 7] for i in range(scale)]
+    return lambda: [day_classes(day, schedule) for day in days]
+
+
+@case("schedule.index_build", max_scale=10**6)
+def _index_build(scale: int):
+    """Parsing and indexing a schedule with scale slots."""
+    schedule = generate_schedule(scale)
+    return lambda: ScheduleIndex.from_schedule(schedule)
+
+
+@case("timetable.conflicts", max_scale=10**6)
+def _timetable_conflicts(scale: int):
+    """Indexing a timetable of scale sessions and finding every conflict."""
+    sessions = [session for record in generate_timetable(scale) for session in parse_session(record)]
+    return lambda: Timetable(sessions).conflicts()
+
+
+@case("export.export_text")
+def _export_text(scale: int):
+    """export_text of scale report lines."""
+    lines = generate_report_lines(scale)
+    path = Path(tempfile.mkdtemp(prefix="bench_export_")) / "summary.txt"
+    return lambda: export_text(str(path), lines)
+
+
+@case("export.export_table")
+def _export_table(scale: int):
+    """Columnar export of scale history entries from a compact store (Parquet, or CSV without pyarrow)."""
+    store = CompactAttendanceStore.from_entries(zip(*_timestamped(scale)))
+    fmt = table_formats()[0]
+    path = Path(tempfile.mkdtemp(prefix="bench_export_")) / f"history.{fmt}"
+    return lambda: export_table(str(path), attendance_history_frames(store))
+
+
+@case("reports.generate_reports", max_scale=10**5)
+def _generate_reports(scale: int):
+    """Pricing, rendering and writing reports for scale members in one process."""
+    members, attendance = generate_members(scale)
+    directory = tempfile.mkdtemp(prefix="bench_reports_")
+    template = ReportTemplate(period="October 2026")
+    return lambda: list(generate_reports(members, directory, template, attendance))
+
+
+@case("app.attendance_frame", max_scale=10**6)
+def _attendance_frame(scale: int):
+    """Dashboard attendance table for scale activities."""
+    by_activity = dict.fromkeys(generate_activities(scale), 7)
+    return lambda: attendance_frame(by_activity)
+
+
+@case("app.attendance_frame_compact", max_scale=10**6)
+def _attendance_frame_compact(scale: int):
+    """Dashboard attendance table for scale activities from a compact store."""
+    by_activity = CompactAttendanceStore.from_counts(dict.fromkeys(generate_activities(scale), 7)).by_activity
+    return lambda: attendance_frame(by_activity)
+
+
+@case("app.activity_table", max_scale=10**6)
+def _activity_table(scale: int):
+    """First page, a filtered page and the top-N chart for scale activities, uncached."""
+    by_activity = CompactAttendanceStore.from_counts(dict(zip(generate_activities(scale), range(scale)))).by_activity
+
+    def run():
+        table = ActivityTable(by_activity)
+        return table.page(1), table.page(1, search="00042"), table.top_frame()
+    return run
+
+
+def parse_scales(text: str) -> List[int]:
+    """Parse a comma-separated list of scales such as "1e3,1e4,50000"."""
+    return [int(float(part)) for part in text.split(",") if part.strip()]
+
+
+def select_cases(patterns: Optional[List[str]]) -> List[Case]:
+    """Select cases whose names start with any of the given prefixes."""
+    if not patterns:
+        return list(CASES.values())
+    return [c for name, c in CASES.items() if any(name.startswith(p) for p in patterns)]
+
+
+def run_suite(cases: List[Case], scales: List[int], repeat: int = 3, log=None) -> Dict:
+    """
+    Time each case at each scale.
+    
+    Args:
+        cases: Cases to run
+        scales: Problem sizes; cases skip scales above their max_scale
+        repeat: Runs per measurement (the fastest is kept)
+        log: Optional file to print progress to
+        
+    Returns:
+        Results document (see save_results)
+    """
+    results = []
+    for bench in cases:
+        for scale in scales:
+            if scale > bench.max_scale:
+                continue
+            func = bench.setup(scale)
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                best = min(best, time.perf_counter() - start)
+            results.append({
+                "case": bench.name,
+                "scale": scale,
+                "seconds": best,
+                "ns_per_item": best / scale * 1e9,
+            })
+            if log is not None:
+                print(f"{bench.name:<34}{scale:>12,}{best:>12.4f} s{best / scale * 1e9:>12,.0f} ns/item", file=log)
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def save_results(document: Dict, path: str) -> None:
+    """Write a results document as JSON."""
+    export_text(path, [json.dumps(document, indent=2)])
+
+
+def load_results(path: str) -> Dict:
+    """Read a results document written by save_results."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Compare two results documents.
+    
+    Args:
+        baseline: Reference results
+        current: New results
+        threshold: Allowed slowdown as a fraction (0.25 = 25% slower)
+        
+    Returns:
+        One row per (case, scale) present in both, with "ratio"
+        (current / baseline seconds) and a "regression" flag
+    """
+    reference = {(r["case"], r["scale"]): r["seconds"] for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        key = (result["case"], result["scale"])
+        if key not in reference or reference[key] <= 0:
+            continue
+        ratio = result["seconds"] / reference[key]
+        rows.append({
+            "case": result["case"],
+            "scale": result["scale"],
+            "baseline": reference[key],
+            "current": result["seconds"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
+
+
+def print_comparison(rows: List[Dict], threshold: float) -> int:
+    """Print a comparison table and return the number of regressions."""
+    regressions = 0
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        regressions += row["regression"]
+        print(f"{row['case']:<34}{row['scale']:>12,}{row['baseline']:>11.4f} s{row['current']:>11.4f} s{row['ratio']:>8.2f}x  {flag}")
+    print(f"{regressions} regression(s) beyond {threshold:.0%}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns the exit status."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    subparsers.add_parser("list", help="List benchmark cases")
+    
+    run = subparsers.add_parser("run", help="Run benchmarks")
+    run.add_argument("--scales", type=parse_scales, default=DEFAULT_SCALES, help="Comma-separated sizes, e.g. 1e3,1e4,1e7")
+    run.add_argument("--cases", type=lambda text: text.split(","), help="Comma-separated case name prefixes")
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--output", help="Save results as JSON (e.g. a new baseline)")
+    run.add_argument("--compare", help="Baseline JSON to check the results against")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    
+    compare = subparsers.add_parser("compare", help="Compare two saved results")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "list":
+        for bench in CASES.values():
+            print(f"{bench.name:<34} (max scale {bench.max_scale:,})")
+        return 0
+    
+    if args.command == "compare":
+        rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+        return 1 if print_comparison(rows, args.threshold) else 0
+    
+    document = run_suite(select_cases(args.cases), args.scales, args.repeat, log=sys.stdout)
+    if args.output:
+        save_results(document, args.output)
+        print(f"Saved results to {args.output}")
+    if args.compare:
+        rows = compare_results(load_results(args.compare), document, args.threshold)
+        return 1 if print_comparison(rows, args.threshold) else 0
+    return 0
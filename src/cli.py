@@ -1,13 +1,63 @@
 """Command-line interface for Fitness Center Assistant."""
 
+import argparse
 import sys
-from typing import Dict
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
 
-from src.data import plans, class_schedule, promo_codes
+from src.data import plans, class_details, class_schedule, promo_codes
 from src.logic.messaging import build_welcome, reminders
-from src.logic.pricing import price_membership
+from src.logic.pricing import purchase_membership
+from src.logic.quote_cache import quote_cache
 from src.logic.attendance import add_entry, summarize
-from src.logic.export import export_text
+from src.logic.attendance_sqlite import open_attendance_store, resolve_db_path
+from src.logic.bulk import (
+    FORMATS,
+    PRICING_FIELDS,
+    attendance_chunk,
+    chunked,
+    map_chunks,
+    price_chunk,
+    purchase_chunk,
+    read_records,
+    record_writer,
+)
+from src.logic.checkins import (
+    DEFAULT_CAPACITY,
+    DEFAULT_ERROR_RATE,
+    DEFAULT_WINDOW_SECONDS,
+    CheckInDeduplicator,
+)
+from src.logic.export import TABLE_FORMATS, export_table, export_text
+from src.logic.members import (
+    DEFAULT_SUGGESTIONS,
+    open_member_registry,
+    registry_from_records,
+    resolve_snapshot_path,
+)
+from src.logic.outbox import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_SENDER,
+    FileSinkTransport,
+    Outbox,
+    SMTPTransport,
+    reminder_messages,
+)
+from src.logic.reports import (
+    DEFAULT_CHUNK_SIZE as REPORT_CHUNK_SIZE,
+    REPORT_FIELDS,
+    ReportTemplate,
+    attendance_by_member,
+    generate_reports,
+)
+from src.logic.records import record_fields
+from src.logic.schedule import DAYS, format_time
+from src.logic.timetable import Timetable, timetable_from_records
+from src.logic import instrumentation
+from src.logic.instrumentation import timed
 
 
 def format_currency(amount: float) -> str:
@@ -29,7 +79,7 @@ def print_pricing_breakdown(breakdown: Dict) -> None:
         print(f"Student/Staff Discount (15%): -{format_currency(breakdown['student_staff_discount'])}")
     
     if breakdown['promo_applied']:
-        print(f"Promo Code ({breakdown['promo_applied']}): -{format_currency(breakdown['base_cost'] * breakdown['promo_rate'])}")
+        print(f"Promo Code ({breakdown['promo_applied']}): -{format_currency(breakdown['promo_discount'])}")
     elif breakdown.get('promo_attempted'):
         print("⚠️  Invalid promo code - not applied")
     
@@ -38,27 +88,33 @@ def print_pricing_breakdown(breakdown: Dict) -> None:
     print("="*50 + "\n")
 
 
-def main() -> None:
-    """Main CLI application flow."""
+def run_wizard() -> None:
+    """Interactive CLI application flow."""
     print("="*60)
     print("🏋️  FITNESS CENTER MEMBERSHIP ASSISTANT")
     print("="*60)
     print()
     
     # 1. Personalized greeting
-    name = input("Enter your name: ").strip()
+    registry = open_member_registry()
+    name = input("Enter your name or member ID: ").strip()
     if not name:
         name = "Guest"
+    elif registry.lookup(name) is None:
+        suggestions = registry.complete(name, 5)
+        if suggestions:
+            print("Did you mean: " + ", ".join(f"{m.name} ({m.id})" for m in suggestions))
     
     center = "Baun Fitness Center"
-    welcome_msg = build_welcome(name, center)
+    welcome_msg = build_welcome(name, center, registry)
     print(f"\n{welcome_msg}\n")
     
     # 2. Class reminders
     print("-"*60)
     day_input = input("Enter a day of the week for class reminders: ").strip()
     if day_input:
-        day_classes = reminders(day_input, class_schedule)
+        with timed("logic.schedule"):
+            day_classes = reminders(day_input, class_schedule)
         if day_classes:
             print(f"\n📅 Classes on {day_input.title()}:")
             for cls in day_classes:
@@ -99,19 +155,28 @@ def main() -> None:
     
     breakdown = {}
     try:
-        breakdown = price_membership(
-            plan=plan,
-            months=months,
-            is_student_or_staff=is_student_or_staff,
-            promo=promo,
-            plans=plans,
-            promo_codes=promo_codes
-        )
+        with timed("logic.pricing"):
+            breakdown = quote_cache.quote(
+                plan=plan,
+                months=months,
+                is_student_or_staff=is_student_or_staff,
+                promo=promo,
+                plans=plans,
+                promo_codes=promo_codes
+            )
         
         if promo and not breakdown['promo_applied']:
             breakdown['promo_attempted'] = True
         
         print_pricing_breakdown(breakdown)
+        
+        if input("Confirm purchase? (Y/N): ").strip().upper() in ['Y', 'YES']:
+            sale = purchase_membership(plan, months, is_student_or_staff, promo, plans, promo_codes)
+            if sale['promo_applied'] != breakdown['promo_applied']:
+                print("⚠️  A promo code ran out before the purchase; updated price:")
+                print_pricing_breakdown(sale)
+            breakdown = sale
+            print(f"✅ Purchase confirmed: {format_currency(sale['final_cost'])}\n")
     except ValueError as e:
         print(f"❌ Error: {e}\n")
     
@@ -122,7 +187,7 @@ def main() -> None:
     print("Enter activity names and attendance counts.")
     print("Type 'done' when finished.\n")
     
-    attendance_store: Dict[str, int] = {}
+    attendance_store = open_attendance_store()
     
     while True:
         activity = input("Activity name (or 'done' to finish): ").strip()
@@ -146,7 +211,8 @@ def main() -> None:
     
     # Print attendance summary
     if attendance_store:
-        summary = summarize(attendance_store)
+        with timed("logic.summarize"):
+            summary = summarize(attendance_store)
         print("\n" + "="*50)
         print("ATTENDANCE SUMMARY")
         print("="*50)
@@ -180,7 +246,8 @@ def main() -> None:
         ]
         
         if attendance_store:
-            summary = summarize(attendance_store)
+            with timed("logic.summarize"):
+                summary = summarize(attendance_store)
             lines.append(f"  Total Attendance: {summary['total']}")
             lines.append(f"  Average per Activity: {summary['avg_per_activity']:.2f}")
             lines.append("  By Activity:")
@@ -194,7 +261,8 @@ def main() -> None:
         
         export_path = "fitness_session_summary.txt"
         try:
-            export_text(export_path, lines)
+            with timed("logic.export"):
+                export_text(export_path, lines)
             print(f"\n✓ Summary exported to: {export_path}\n")
         except Exception as e:
             print(f"\n❌ Error exporting file: {e}\n")
@@ -204,13 +272,433 @@ def main() -> None:
     print("="*60)
 
 
+def report_throughput(label: str, rows: int, errors: int, seconds: float) -> None:
+    """Print bulk processing throughput to stderr."""
+    rate = rows / seconds if seconds > 0 else 0.0
+    print(
+        f"{label} {rows:,} rows in {seconds:.2f} s ({rate:,.0f} rows/s), {errors:,} errors",
+        file=sys.stderr
+    )
+
+
+def run_bulk_pricing(args: argparse.Namespace) -> int:
+    """Stream pricing requests through the quote cache, or record them as purchases."""
+    start = time.perf_counter()
+    rows = errors = 0
+    records = enumerate(read_records(args.input, args.input_format), start=1)
+    # Purchases redeem codes in this process's catalog, so they never go to workers
+    func, workers = (purchase_chunk, 1) if args.purchase else (price_chunk, args.workers)
+    
+    with record_writer(args.output, PRICING_FIELDS, args.output_format) as write:
+        for results in map_chunks(func, chunked(records, args.chunk_size), workers):
+            with timed("bulk.write"):
+                for result in results:
+                    write(result)
+                    errors += result["error"] is not None
+            rows += len(results)
+            instrumentation.count("bulk.chunks")
+    
+    instrumentation.count("bulk.rows", rows)
+    instrumentation.count("bulk.errors", errors)
+    report_throughput("Priced", rows, errors, time.perf_counter() - start)
+    return 1 if errors else 0
+
+
+def run_bulk_attendance(args: argparse.Namespace) -> int:
+    """Stream attendance entries into the attendance database."""
+    start = time.perf_counter()
+    db_path = resolve_db_path(args.db)
+    store = open_attendance_store(db_path)  # Creates the schema before workers start
+    rows = errors = 0
+    records = enumerate(read_records(args.input, args.input_format), start=1)
+    jobs = ((db_path, chunk) for chunk in chunked(records, args.chunk_size))
+    
+    with record_writer(args.output, ["row", "error"], args.output_format) as write:
+        for recorded, chunk_errors in map_chunks(attendance_chunk, jobs, args.workers):
+            for error in chunk_errors:
+                write(error)
+            rows += recorded + len(chunk_errors)
+            errors += len(chunk_errors)
+            instrumentation.count("bulk.chunks")
+    
+    instrumentation.count("bulk.rows", rows)
+    instrumentation.count("bulk.errors", errors)
+    report_throughput("Recorded", rows, errors, time.perf_counter() - start)
+    with timed("logic.summarize"):
+        summary = summarize(store)
+    print(
+        f"Total Attendance: {summary['total']} across {len(summary['by_activity'])} activities",
+        file=sys.stderr
+    )
+    return 1 if errors else 0
+
+
+def run_check_ins(args: argparse.Namespace) -> int:
+    """Record badge scans as check-ins, counting each member once per class occurrence."""
+    start = time.perf_counter()
+    store = open_attendance_store(resolve_db_path(args.db))
+    guard = CheckInDeduplicator(store, args.window, capacity=args.capacity, error_rate=args.error_rate)
+    rows = errors = 0
+    
+    with guard, record_writer(args.output, ["row", "error"], args.output_format) as write:
+        for row, record in enumerate(read_records(args.input, args.input_format), start=1):
+            rows += 1
+            try:
+                record = record_fields(record)
+                recorded_at = record.get("recorded_at")
+                guard.check_in(
+                    record.get("member_id", ""),
+                    str(record.get("activity", "")),
+                    time.time() if recorded_at in (None, "") else float(recorded_at),
+                    record.get("occurrence") or None
+                )
+            except (TypeError, ValueError) as e:
+                write({"row": row, "error": str(e)})
+                errors += 1
+    
+    stats = guard.stats
+    instrumentation.count("checkins.recorded", stats.checked_in)
+    instrumentation.count("checkins.duplicates", stats.duplicates)
+    report_throughput("Scanned", rows, errors, time.perf_counter() - start)
+    print(
+        f"Checked in {stats.checked_in:,}, suppressed {stats.duplicates:,} duplicates; "
+        f"{stats.false_positives:,} filter false positives ({stats.false_positive_rate:.3%} observed, "
+        f"{guard.filter.false_positive_rate():.3%} expected), filter memory {guard.filter.nbytes / 1024:,.0f} KiB",
+        file=sys.stderr
+    )
+    return 1 if errors else 0
+
+
+def run_reminders(args: argparse.Namespace) -> int:
+    """Send each member the day's class reminders through the outbox."""
+    if args.transport == "smtp":
+        transport = SMTPTransport(args.smtp_host, args.smtp_port, sender=args.sender)
+    else:
+        transport = FileSinkTransport(args.outbox_dir, sender=args.sender)
+    outbox = Outbox(
+        transport,
+        args.journal or f"{args.outbox_dir}/journal.tsv",
+        concurrency=args.concurrency,
+        rate=args.rate or None,
+        batch_size=args.batch_size,
+        max_attempts=args.max_attempts
+    )
+    day = args.day or DAYS[datetime.now().weekday()]
+    members = read_records(args.members, args.input_format)
+    invalid: List = []
+    
+    with timed("outbox.send_all"):
+        report = outbox.run(reminder_messages(members, day, class_schedule, run_id=args.run_id, errors=invalid))
+    
+    instrumentation.count("outbox.sent", report.sent)
+    instrumentation.count("outbox.retries", report.retries)
+    print(
+        f"Sent {report.sent:,} reminders in {report.seconds:.2f} s ({report.rate:,.0f} messages/s), "
+        f"{report.skipped:,} already sent, {report.failed:,} failed, {report.retries:,} retries",
+        file=sys.stderr
+    )
+    if report.in_doubt:
+        print(
+            f"{report.in_doubt:,} reminders were in flight when a previous run stopped and were not resent",
+            file=sys.stderr
+        )
+    for key, error in report.failures.items():
+        print(f"  {key}: {error}", file=sys.stderr)
+    for row, error in invalid:
+        print(f"  row {row}: {error}", file=sys.stderr)
+    return 1 if report.failed or invalid else 0
+
+
+def run_export(args: argparse.Namespace) -> int:
+    """Export attendance or pricing data as a Parquet, Arrow IPC or CSV file."""
+    # Imported here: pandas would add about 0.4 s to every other command's startup
+    from src.logic.frames import attendance_export_frame, attendance_history_frames
+    from src.logic.price_matrix import current_price_matrix
+    
+    start = time.perf_counter()
+    if args.dataset == "prices":
+        chunks = current_price_matrix(plans, promo_codes).frame_chunks(args.chunk_size)
+    else:
+        store = open_attendance_store(resolve_db_path(args.db))
+        if args.dataset == "attendance":
+            chunks = attendance_history_frames(store, args.chunk_size)
+        else:
+            chunks = [attendance_export_frame(summarize(store)["by_activity"])]
+    
+    with timed("logic.export_table"):
+        rows = export_table(args.output, chunks, args.format)
+    report_throughput(f"Exported {args.dataset}:", rows, 0, time.perf_counter() - start)
+    return 0
+
+
+def run_reports(args: argparse.Namespace) -> int:
+    """Write a month-end summary file for every member."""
+    start = time.perf_counter()
+    invalid_checkins: List = []
+    attendance = attendance_by_member(read_records(args.checkins, args.input_format), invalid_checkins) if args.checkins else {}
+    for row, error in invalid_checkins:
+        print(f"  check-in row {row}: {error}", file=sys.stderr)
+    template = ReportTemplate(period=args.period or datetime.now().strftime("%B %Y"))
+    members = read_records(args.members, args.input_format)
+    rows = errors = 0
+    
+    with record_writer(args.output, REPORT_FIELDS, args.output_format) as write:
+        for result in generate_reports(members, args.out_dir, template, attendance, args.workers, args.chunk_size):
+            write(result)
+            rows += 1
+            errors += result["error"] is not None
+    
+    instrumentation.count("reports.written", rows - errors)
+    instrumentation.count("reports.errors", errors)
+    seconds = time.perf_counter() - start
+    rate = rows / seconds if seconds > 0 else 0.0
+    print(
+        f"Wrote {rows - errors:,} member reports to {args.out_dir} in {seconds:.2f} s "
+        f"({rate:,.0f} members/s), {errors:,} errors, {len(invalid_checkins):,} invalid check-ins",
+        file=sys.stderr
+    )
+    return 1 if errors or invalid_checkins else 0
+
+
+def run_index_members(args: argparse.Namespace) -> int:
+    """Build the member registry snapshot from a member list."""
+    start = time.perf_counter()
+    registry, invalid = registry_from_records(read_records(args.members, args.input_format))
+    snapshot = resolve_snapshot_path(args.snapshot)
+    size = registry.save(snapshot)
+    
+    with record_writer(args.output, ["row", "error"], args.output_format) as write:
+        for row, error in invalid:
+            write({"row": row, "error": error})
+    
+    instrumentation.count("members.indexed", len(registry))
+    report_throughput("Indexed", len(registry) + len(invalid), len(invalid), time.perf_counter() - start)
+    print(f"Saved {len(registry):,} members to {snapshot} ({size / 1024:,.0f} KiB)", file=sys.stderr)
+    return 1 if invalid else 0
+
+
+def run_member_lookup(args: argparse.Namespace) -> int:
+    """Print the members matching a typed id, name or name prefix."""
+    registry = open_member_registry(args.snapshot)
+    member = registry.get(args.query)
+    matches = [member] if member is not None else registry.complete(args.query, args.limit)
+    
+    with record_writer(args.output, ["id", "name"], args.output_format) as write:
+        for match in matches:
+            write(match._asdict())
+    return 0 if matches else 1
+
+
+CONFLICT_FIELDS = ["kind", "resource", "day", "start", "end", "first", "second", "suggestion", "row", "error"]
+
+
+def run_timetable_check(args: argparse.Namespace) -> int:
+    """Report room and instructor conflicts in a timetable, with suggested moves."""
+    start = time.perf_counter()
+    with timed("logic.timetable"):
+        if args.input:
+            timetable, invalid = timetable_from_records(read_records(args.input, args.input_format))
+        else:
+            timetable, invalid = Timetable.from_schedule(class_schedule, class_details), []
+        conflicts = timetable.conflicts()
+    
+    with record_writer(args.output, CONFLICT_FIELDS, args.output_format) as write:
+        for row, error in invalid:
+            write({"row": row, "error": error})
+        for conflict in conflicts:
+            suggestions = timetable.suggest(conflict.second, limit=1) if args.suggest else []
+            write({
+                "kind": conflict.kind,
+                "resource": conflict.resource,
+                "day": conflict.first.day.title(),
+                "start": format_time(conflict.start_minute),
+                "end": format_time(conflict.end_minute),
+                "first": str(conflict.first),
+                "second": str(conflict.second),
+                "suggestion": str(suggestions[0]) if suggestions else "",
+            })
+    
+    instrumentation.count("timetable.conflicts", len(conflicts))
+    print(
+        f"Checked {len(timetable):,} sessions in {time.perf_counter() - start:.2f} s: "
+        f"{len(conflicts):,} conflicts, {len(invalid):,} invalid rows",
+        file=sys.stderr
+    )
+    return 1 if conflicts or invalid else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Fitness Center Assistant. Run without a command for the interactive assistant."
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time logic calls and print a latency report to stderr on exit"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    
+    def add_bulk_arguments(subparser: argparse.ArgumentParser, default_output: str) -> None:
+        subparser.add_argument("input", help="CSV or JSON Lines file ('-' for stdin)")
+        subparser.add_argument("-o", "--output", default=default_output, help=f"Results file (default: {default_output}, '-' for stdout)")
+        subparser.add_argument("--input-format", choices=FORMATS, help="Input format (default: from file suffix)")
+        subparser.add_argument("--output-format", choices=FORMATS, help="Output format (default: from file suffix)")
+        subparser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+        subparser.add_argument("--chunk-size", type=int, default=10_000, help="Rows per chunk (default: 10000)")
+    
+    price = subparsers.add_parser(
+        "price",
+        help="Price membership requests (plan, months, is_student_or_staff, promo)"
+    )
+    add_bulk_arguments(price, "-")
+    price.add_argument(
+        "--purchase",
+        action="store_true",
+        help="Record the rows as purchases, redeeming their promo codes in order (runs in one process)"
+    )
+    price.set_defaults(handler=run_bulk_pricing)
+    
+    attendance = subparsers.add_parser(
+        "attendance",
+        help="Record attendance entries (activity, count, recorded_at)"
+    )
+    add_bulk_arguments(attendance, "-")
+    attendance.add_argument("--db", help="Attendance database (default: $ATTENDANCE_DB or data/attendance.db)")
+    attendance.set_defaults(handler=run_bulk_attendance)
+    
+    checkin = subparsers.add_parser(
+        "checkin",
+        help="Record badge scans, once per member and class occurrence (member_id, activity, optional occurrence, recorded_at)"
+    )
+    checkin.add_argument("input", help="CSV or JSON Lines file ('-' for stdin)")
+    checkin.add_argument("-o", "--output", default="-", help="Errors file (default: '-' for stdout)")
+    checkin.add_argument("--input-format", choices=FORMATS, help="Input format (default: from file suffix)")
+    checkin.add_argument("--output-format", choices=FORMATS, help="Output format (default: from file suffix)")
+    checkin.add_argument("--db", help="Attendance database (default: $ATTENDANCE_DB or data/attendance.db)")
+    checkin.add_argument("--window", type=float, default=DEFAULT_WINDOW_SECONDS, help=f"Seconds duplicates are suppressed for (default: {DEFAULT_WINDOW_SECONDS})")
+    checkin.add_argument("--capacity", type=int, default=DEFAULT_CAPACITY, help=f"Scans per window slice the filter is sized for (default: {DEFAULT_CAPACITY})")
+    checkin.add_argument("--error-rate", type=float, default=DEFAULT_ERROR_RATE, help=f"Target filter false-positive rate (default: {DEFAULT_ERROR_RATE})")
+    checkin.set_defaults(handler=run_check_ins)
+    
+    remind = subparsers.add_parser(
+        "remind",
+        help="Send members their class reminders for a day (id, name, email)"
+    )
+    remind.add_argument("members", help="CSV or JSON Lines member list ('-' for stdin)")
+    remind.add_argument("--input-format", choices=FORMATS, help="Input format (default: from file suffix)")
+    remind.add_argument("--day", help="Day of the week (default: today)")
+    remind.add_argument("--run-id", help="Resume key prefix (default: today's date and the day)")
+    remind.add_argument("--transport", choices=["file", "smtp"], default="file", help="Delivery transport (default: file)")
+    remind.add_argument("--outbox-dir", default="data/outbox", help="Directory for the file transport and journal (default: data/outbox)")
+    remind.add_argument("--journal", help="Progress journal (default: <outbox-dir>/journal.tsv)")
+    remind.add_argument("--smtp-host", default="localhost")
+    remind.add_argument("--smtp-port", type=int, default=25)
+    remind.add_argument("--sender", default=DEFAULT_SENDER, help=f"From address (default: {DEFAULT_SENDER})")
+    remind.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help=f"Sends in flight (default: {DEFAULT_CONCURRENCY})")
+    remind.add_argument("--rate", type=float, default=0, help="Maximum messages per second (default: no limit)")
+    remind.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help=f"Messages per journaled batch (default: {DEFAULT_BATCH_SIZE})")
+    remind.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS, help=f"Attempts per message (default: {DEFAULT_MAX_ATTEMPTS})")
+    remind.set_defaults(handler=run_reminders)
+    
+    export = subparsers.add_parser(
+        "export",
+        help="Export attendance history, attendance totals or the price list as Parquet, Arrow IPC or CSV"
+    )
+    export.add_argument("dataset", choices=["attendance", "totals", "prices"])
+    export.add_argument("output", help="Output file (.parquet, .arrow or .csv)")
+    export.add_argument("--format", choices=TABLE_FORMATS, help="Output format (default: from file suffix)")
+    export.add_argument("--chunk-size", type=int, default=65_536, help="Rows per row group / batch (default: 65536)")
+    export.add_argument("--db", help="Attendance database (default: $ATTENDANCE_DB or data/attendance.db)")
+    export.set_defaults(handler=run_export)
+    
+    timetable = subparsers.add_parser(
+        "timetable",
+        help="Check a timetable for room and instructor conflicts (name, day, start, end or minutes, room, instructor)"
+    )
+    timetable.add_argument("input", nargs="?", help="CSV or JSON Lines timetable ('-' for stdin; default: the class schedule)")
+    timetable.add_argument("-o", "--output", default="-", help="Conflicts file (default: '-' for stdout)")
+    timetable.add_argument("--input-format", choices=FORMATS, help="Input format (default: from file suffix)")
+    timetable.add_argument("--output-format", choices=FORMATS, help="Output format (default: from file suffix)")
+    timetable.add_argument("--suggest", action="store_true", help="Suggest a conflict-free move for the later session")
+    timetable.set_defaults(handler=run_timetable_check)
+    
+    reports = subparsers.add_parser(
+        "reports",
+        help="Write a month-end summary for every member (id, name, plan, months, is_student_or_staff, promo)"
+    )
+    reports.add_argument("members", help="CSV or JSON Lines member list ('-' for stdin)")
+    reports.add_argument("--checkins", help="CSV or JSON Lines check-ins (member_id, activity, count)")
+    reports.add_argument("--out-dir", default="data/reports", help="Directory for the reports (default: data/reports)")
+    reports.add_argument("--period", help="Reporting period (default: the current month)")
+    reports.add_argument("-o", "--output", default="-", help="Results file (default: '-' for stdout)")
+    reports.add_argument("--input-format", choices=FORMATS, help="Input format (default: from file suffix)")
+    reports.add_argument("--output-format", choices=FORMATS, help="Output format (default: from file suffix)")
+    reports.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+    reports.add_argument("--chunk-size", type=int, default=REPORT_CHUNK_SIZE, help=f"Members per chunk (default: {REPORT_CHUNK_SIZE})")
+    reports.set_defaults(handler=run_reports)
+    
+    members = subparsers.add_parser(
+        "members",
+        help="Build the member registry snapshot used for lookups and autocomplete (id, name)"
+    )
+    members.add_argument("members", help="CSV or JSON Lines member list ('-' for stdin)")
+    members.add_argument("--snapshot", help="Registry snapshot (default: $MEMBER_REGISTRY or data/members.idx)")
+    members.add_argument("-o", "--output", default="-", help="Errors file (default: '-' for stdout)")
+    members.add_argument("--input-format", choices=FORMATS, help="Input format (default: from file suffix)")
+    members.add_argument("--output-format", choices=FORMATS, help="Output format (default: from file suffix)")
+    members.set_defaults(handler=run_index_members)
+    
+    lookup = subparsers.add_parser(
+        "lookup",
+        help="Find a member by id, or autocomplete a name prefix, in the registry snapshot"
+    )
+    lookup.add_argument("query", help="Member id, name or the start of a name")
+    lookup.add_argument("--snapshot", help="Registry snapshot (default: $MEMBER_REGISTRY or data/members.idx)")
+    lookup.add_argument("--limit", type=int, default=DEFAULT_SUGGESTIONS, help=f"Most names to suggest (default: {DEFAULT_SUGGESTIONS})")
+    lookup.add_argument("-o", "--output", default="-", help="Output file (default: '-' for stdout)")
+    lookup.add_argument("--output-format", choices=FORMATS, help="Output format (default: from file suffix)")
+    lookup.set_defaults(handler=run_member_lookup)
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run a bulk command, or the interactive assistant if none is given.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Process exit code
+    """
+    args = build_parser().parse_args(argv)
+    instrumentation.enable(args.profile)
+    try:
+        with timed(f"command.{args.command or 'wizard'}"):
+            if args.command is None:
+                run_wizard()
+                return 0
+            return args.handler(args)
+    finally:
+        if args.profile:
+            print("\n".join(instrumentation.report_lines()), file=sys.stderr)
+            stats = quote_cache.stats()
+            print(
+                f"quote cache: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['evictions']} evictions, {stats['size']}/{stats['maxsize']} cached",
+                file=sys.stderr
+            )
+
+
 if __name__ == "__main__":
     try:
-        main()
+        sys.exit(main())
     except KeyboardInterrupt:
         print("\n\nExiting...")
         sys.exit(0)
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
         sys.exit(1)
-
@@ -2,12 +2,16 @@
 
 from typing import Dict, List
 
-# Membership plans with monthly prices
-plans: Dict[str, float] = {
+from src.logic.catalog import VersionedDict
+from src.logic.promos import PromoCatalog
+
+# Membership plans with monthly prices (versioned, so cached quotes are
+# invalidated when a price changes)
+plans: Dict[str, float] = VersionedDict({
     "Basic": 25.0,
     "Plus": 35.0,
     "Premium": 50.0
-}
+})
 
 # Class schedule by day of week
 class_schedule: Dict[str, List[str]] = {
@@ -41,9 +45,28 @@ class_schedule: Dict[str, List[str]] = {
     ]
 }
 
-# Promo codes with discount rates (as decimals)
-promo_codes: Dict[str, float] = {
+# Room, instructor and length (minutes) of each class in the schedule
+class_details: Dict[str, Dict] = {
+    "Yoga Flow": {"room": "Studio A", "instructor": "Maya", "minutes": 60},
+    "HIIT Training": {"room": "Gym Floor", "instructor": "Jordan", "minutes": 45},
+    "Spin Class": {"room": "Cycle Studio", "instructor": "Alex", "minutes": 45},
+    "Strength Training": {"room": "Gym Floor", "instructor": "Jordan", "minutes": 60},
+    "Pilates": {"room": "Studio A", "instructor": "Maya", "minutes": 50},
+    "Cardio Blast": {"room": "Studio B", "instructor": "Sam", "minutes": 45},
+    "Morning Run Club": {"room": "Track", "instructor": "Alex", "minutes": 60},
+    "CrossFit": {"room": "Gym Floor", "instructor": "Jordan", "minutes": 60},
+    "Yoga Relaxation": {"room": "Studio A", "instructor": "Maya", "minutes": 60},
+    "Dance Fitness": {"room": "Studio B", "instructor": "Sam", "minutes": 60},
+    "Bootcamp": {"room": "Gym Floor", "instructor": "Jordan", "minutes": 60},
+    "Swimming Lessons": {"room": "Pool", "instructor": "Riley", "minutes": 45},
+    "Stretch & Restore": {"room": "Studio A", "instructor": "Maya", "minutes": 45},
+    "Cycling": {"room": "Cycle Studio", "instructor": "Alex", "minutes": 60},
+}
+
+# Promo codes with discount rates (as decimals); campaigns with expiry dates,
+# redemption caps or stacking rules can be added with PromoCatalog.add_campaign
+promo_codes: PromoCatalog = PromoCatalog.from_rates({
     "WELCOME10": 0.10,
     "FALL5": 0.05
-}
+})
 
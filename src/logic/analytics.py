@@ -0,0 +1,337 @@
+"""Time-series analytics over timestamped attendance entries.
+
+AttendanceAnalytics keeps two materialized views as dense NumPy arrays:
+- check-ins per activity by weekday and hour of day (the heatmap);
+- check-ins per activity per calendar day.
+
+Both are updated incrementally: each batch of new entries (for example
+from SQLiteAttendanceStore.entries_since) is folded in with one
+vectorized group-by per view (np.add.at over the batch's activity, day
+and hour codes). An update therefore costs O(batch), not O(history).
+Rolling windows and week-over-week deltas are derived from the daily
+view with cumulative sums and cached until the next update.
+
+The daily view only keeps the last DAILY_RETENTION_DAYS days (the
+heatmap keeps everything), so its size does not depend on how far back
+the history goes. Timestamps before 2000 or more than a day in the
+future (a 0, or milliseconds instead of seconds) are skipped and
+counted in `skipped` rather than stretching the views.
+
+Days and hours are in the analytics' time zone (the machine's local
+zone by default), so "Tuesday 6 PM" means what the front desk means.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from dateutil.tz import tzlocal
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+HOURS = 24
+
+# Entries fetched per query while catching up with a store
+REFRESH_BATCH = 50_000
+
+# Days kept in the daily view, counted back from the latest entry
+DAILY_RETENTION_DAYS = 400
+
+# Days allocated ahead, and dropped behind, at a time, so daily updates rarely reallocate
+DAILY_SLACK_DAYS = 28
+
+# Accepted entry timestamps: from 2000-01-01 UTC to this far past the current time
+EARLIEST_TIMESTAMP = 946_684_800.0
+MAX_FUTURE_SECONDS = 86_400.0
+
+
+class AttendanceAnalytics:
+    """
+    Incrementally maintained attendance heatmap, daily totals and trends.
+    
+    Safe to share between threads (e.g. dashboard sessions): updates and
+    reads take an internal lock.
+    """
+
+    def __init__(self, tz=None):
+        """
+        Create empty analytics.
+        
+        Args:
+            tz: Time zone for days and hours (a tzinfo or name such as
+                "America/Los_Angeles"; defaults to the local zone)
+        """
+        self.tz = tz if tz is not None else tzlocal()
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all entries and views."""
+        with self._lock:
+            self._ids: Dict[str, int] = {}
+            self._names: List[str] = []
+            self._heat = np.zeros((0, len(WEEKDAYS), HOURS), dtype=np.int64)
+            self._daily = np.zeros((0, 0), dtype=np.int64)
+            self._first_day = 0
+            self._last_day = 0
+            self._entries = 0
+            self._skipped = 0
+            self._cursor = 0
+            self._generation: Optional[int] = None
+            self._views: Dict[Tuple, pd.DataFrame] = {}
+
+    def __len__(self) -> int:
+        """Number of entries folded in."""
+        return self._entries
+
+    @property
+    def skipped(self) -> int:
+        """Number of entries skipped for an out-of-range timestamp."""
+        return self._skipped
+
+    @property
+    def activities(self) -> List[str]:
+        """Activity names, in first-seen order."""
+        return list(self._names)
+
+    def _local_codes(self, recorded_at: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Local (day number since 1970-01-01, weekday, hour) of Unix timestamps."""
+        local = pd.to_datetime(recorded_at, unit="s", utc=True).tz_convert(self.tz)
+        days = local.tz_localize(None).to_numpy().astype("datetime64[D]").astype(np.int64)
+        return days, local.dayofweek.to_numpy(), local.hour.to_numpy()
+
+    def _day(self, now: Optional[float]) -> int:
+        """Local day number of a timestamp (default: now)."""
+        return int(self._local_codes(np.array([time.time() if now is None else now]))[0][0])
+
+    def add_entries(
+        self,
+        activities: Sequence[str],
+        counts: Sequence[int],
+        recorded_at: Sequence[float]
+    ) -> None:
+        """
+        Fold a batch of entries into the views.
+        
+        Entries timestamped before EARLIEST_TIMESTAMP or more than
+        MAX_FUTURE_SECONDS from now are skipped (see skipped); entries
+        older than the daily view's retention only reach the heatmap.
+        
+        Args:
+            activities: Activity names (already cleaned, as stores keep them)
+            counts: Attendees per entry (must be >= 0)
+            recorded_at: Unix timestamps of the entries
+            
+        Raises:
+            ValueError: If the sequences differ in length or a count is negative
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        recorded_at = np.asarray(recorded_at, dtype=np.float64)
+        if not len(activities) == len(counts) == len(recorded_at):
+            raise ValueError("activities, counts and recorded_at must have the same length")
+        if not len(counts):
+            return
+        if (counts < 0).any():
+            raise ValueError(f"Count must be non-negative, got {int(counts.min())}")
+        
+        activities = np.asarray(activities, dtype=object)
+        valid = (recorded_at >= EARLIEST_TIMESTAMP) & (recorded_at <= time.time() + MAX_FUTURE_SECONDS)
+        skipped = len(valid) - int(valid.sum())
+        if skipped:
+            activities, counts, recorded_at = activities[valid], counts[valid], recorded_at[valid]
+        
+        with self._lock:
+            self._skipped += skipped
+            if not len(counts):
+                return
+            codes, uniques = pd.factorize(activities)
+            days, weekdays, hours = self._local_codes(recorded_at)
+            for name in uniques:
+                if name not in self._ids:
+                    self._ids[name] = len(self._names)
+                    self._names.append(name)
+            ids = np.array([self._ids[name] for name in uniques], dtype=np.int64)[codes]
+            self._grow(len(self._names), int(days.min()), int(days.max()))
+            
+            np.add.at(self._heat, (ids, weekdays, hours), counts)
+            kept = days >= self._first_day  # Older days are past the daily retention
+            np.add.at(self._daily, (ids[kept], days[kept] - self._first_day), counts[kept])
+            self._entries += len(counts)
+            self._views.clear()
+
+    def add_entry(self, activity: str, count: int, recorded_at: Optional[float] = None) -> None:
+        """Fold in a single entry (recorded now unless recorded_at is given)."""
+        self.add_entries([activity], [count], [time.time() if recorded_at is None else recorded_at])
+
+    def _grow(self, activities: int, first_day: int, last_day: int) -> None:
+        """Resize the views to cover the given activities and day range, within the daily retention."""
+        rows = max(activities, len(self._heat))
+        if rows > len(self._heat):
+            heat = np.zeros((max(rows, 2 * len(self._heat)), len(WEEKDAYS), HOURS), dtype=np.int64)
+            heat[:len(self._heat)] = self._heat
+            self._heat = heat
+        
+        old_rows, old_days = self._daily.shape
+        old_end = self._first_day + old_days
+        self._last_day = max(last_day, self._last_day) if old_days else last_day
+        floor = self._last_day - DAILY_RETENTION_DAYS + 1
+        if not old_days:
+            start, end = max(first_day, floor), self._last_day + 1 + DAILY_SLACK_DAYS
+        else:
+            start = max(min(first_day, self._first_day), floor)
+            if start == self._first_day and floor - self._first_day > DAILY_SLACK_DAYS:
+                start = floor  # Drop days past the retention, a few weeks at a time
+            end = self._last_day + 1 + DAILY_SLACK_DAYS if self._last_day >= old_end else old_end
+        if rows > old_rows or start != self._first_day or end != old_end:
+            daily = np.zeros((len(self._heat), end - start), dtype=np.int64)
+            lo, hi = max(start, self._first_day), min(end, old_end)
+            if old_days and lo < hi:
+                daily[:old_rows, lo - start:hi - start] = self._daily[:, lo - self._first_day:hi - self._first_day]
+            self._daily = daily
+            self._first_day = start
+
+    def refresh(self, store) -> int:
+        """
+        Catch up with entries recorded in a store since the last refresh.
+        
+        Args:
+            store: SQLiteAttendanceStore (anything with entries_since)
+            
+        Returns:
+            Number of new entries folded in (everything is re-read after
+            the store was cleared)
+        """
+        with self._lock:
+            added = 0
+            while True:
+                generation, rows = store.entries_since(self._cursor, REFRESH_BATCH)
+                if generation != self._generation:
+                    self.reset()
+                    self._generation = generation
+                    added = 0
+                    continue
+                if not rows:
+                    return added
+                ids, activities, counts, recorded_at = zip(*rows)
+                self.add_entries(activities, counts, recorded_at)
+                self._cursor = ids[-1]
+                added += len(rows)
+
+    def _cached(self, key: Tuple, build) -> pd.DataFrame:
+        """Return a derived view, building it once per update."""
+        with self._lock:
+            view = self._views.get(key)
+            if view is None:
+                view = self._views[key] = build()
+            return view
+
+    def _rows(self, activity: Optional[str]) -> Optional[np.ndarray]:
+        """Row selector for one activity (None for all); an empty array if unknown."""
+        if activity is None:
+            return None
+        index = self._ids.get(activity)
+        return np.array([], dtype=np.int64) if index is None else np.array([index])
+
+    def heatmap(self, activity: Optional[str] = None) -> pd.DataFrame:
+        """
+        Check-ins by weekday and hour of day.
+        
+        Args:
+            activity: Only this activity (default: all)
+            
+        Returns:
+            DataFrame indexed by weekday name with one column per hour (0-23)
+        """
+        def build():
+            rows = self._rows(activity)
+            heat = self._heat[:len(self._names)] if rows is None else self._heat[rows]
+            return pd.DataFrame(heat.sum(axis=0), index=pd.Index(WEEKDAYS, name="Weekday"), columns=range(HOURS))
+        return self._cached(("heatmap", activity), build)
+
+    def _daily_window(self, first_day: int, days: int) -> np.ndarray:
+        """Daily totals per activity for days [first_day, first_day + days), zero-filled."""
+        window = np.zeros((len(self._names), days), dtype=np.int64)
+        start = max(first_day, self._first_day)
+        end = min(first_day + days, self._first_day + self._daily.shape[1])
+        if start < end:
+            window[:, start - first_day:end - first_day] = self._daily[:len(self._names), start - self._first_day:end - self._first_day]
+        return window
+
+    def rolling(self, window: int = 7, days: int = 30, now: Optional[float] = None) -> pd.DataFrame:
+        """
+        Trailing window sums per activity for recent days.
+        
+        Args:
+            window: Days summed per point (7 gives a weekly rolling total)
+            days: Number of days shown, ending today (days before the
+                daily retention show 0)
+            now: Timestamp defining "today" (default: now)
+            
+        Returns:
+            DataFrame indexed by date with one column per activity
+            
+        Raises:
+            ValueError: If window or days is not positive
+        """
+        if window <= 0 or days <= 0:
+            raise ValueError(f"Window and days must be greater than 0, got {window} and {days}")
+        today = self._day(now)
+
+        def build():
+            first = today - days - window + 2
+            daily = self._daily_window(first, days + window - 1)
+            totals = np.cumsum(daily, axis=1)
+            sums = totals[:, window - 1:].copy()
+            sums[:, 1:] -= totals[:, :-window]
+            dates = pd.Index(np.arange(today - days + 1, today + 1).astype("datetime64[D]"), name="Date")
+            return pd.DataFrame(sums.T, index=dates, columns=self._names)
+        return self._cached(("rolling", window, days, today), build)
+
+    def week_over_week(self, now: Optional[float] = None) -> pd.DataFrame:
+        """
+        Check-ins in the last 7 days against the 7 days before, per activity.
+        
+        Args:
+            now: Timestamp defining "today" (default: now)
+            
+        Returns:
+            DataFrame with Activity, This Week, Last Week, Change and
+            Change % (NaN when last week had none), busiest first
+        """
+        today = self._day(now)
+
+        def build():
+            weeks = self._daily_window(today - 13, 14).reshape(len(self._names), 2, 7).sum(axis=2)
+            last, this = weeks[:, 0], weeks[:, 1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                percent = np.where(last > 0, (this - last) / np.maximum(last, 1) * 100, np.nan)
+            frame = pd.DataFrame({
+                "Activity": self._names,
+                "This Week": this,
+                "Last Week": last,
+                "Change": this - last,
+                "Change %": percent,
+            })
+            return frame.sort_values(["This Week", "Activity"], ascending=[False, True], ignore_index=True)
+        return self._cached(("week_over_week", today), build)
+
+
+def analytics_from_entries(entries: Iterable[Tuple[str, int, float]], tz=None) -> AttendanceAnalytics:
+    """
+    Build analytics from (activity, count, recorded_at) tuples.
+    
+    Args:
+        entries: Entries, e.g. from SQLiteAttendanceStore.entries() or
+            CompactAttendanceStore.entries()
+        tz: Time zone for days and hours (default: local)
+        
+    Returns:
+        AttendanceAnalytics over the entries
+    """
+    analytics = AttendanceAnalytics(tz)
+    rows = list(entries)
+    if rows:
+        activities, counts, recorded_at = zip(*rows)
+        analytics.add_entries(activities, counts, recorded_at)
+    return analytics
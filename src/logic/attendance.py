@@ -1,40 +1,85 @@
 """Attendance tracking and summarization."""
 
-from typing import Dict
+from bisect import bisect_left, insort
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Protocol, Tuple, Union
 
 
-def add_entry(store: Dict[str, int], activity: str, count: int) -> Dict[str, int]:
+class AttendanceStore(Protocol):
     """
-    Add an attendance entry to the store.
+    Interface for attendance stores other than a plain dict.
+    
+    add_entry and summarize below delegate to these methods, so a store
+    object can be passed anywhere a dict store is accepted.
+    """
+
+    def add_entry(self, activity: str, count: int) -> "AttendanceStore":
+        ...
+
+    def summarize(self) -> Dict:
+        ...
+
+
+def clean_entry(activity: str, count: int) -> str:
+    """
+    Validate an attendance entry and normalize its activity name.
     
     Args:
-        store: Dictionary mapping activity names to counts
         activity: Name of the activity
         count: Number of attendees (must be >= 0)
-        
+    
     Returns:
-        Updated store dictionary
-        
+        Activity name with surrounding whitespace removed (may be empty,
+        in which case the entry should be ignored)
+    
     Raises:
         ValueError: If count is negative
     """
     if count < 0:
         raise ValueError(f"Count must be non-negative, got {count}")
     
-    activity_clean = activity.strip()
+    return activity.strip()
+
+
+def add_entry(
+    store: Union[Dict[str, int], AttendanceStore],
+    activity: str,
+    count: int
+) -> Union[Dict[str, int], AttendanceStore]:
+    """
+    Add an attendance entry to the store.
+    
+    Args:
+        store: Dictionary mapping activity names to counts, or an
+            AttendanceStore object
+        activity: Name of the activity
+        count: Number of attendees (must be >= 0)
+    
+    Returns:
+        Updated store
+    
+    Raises:
+        ValueError: If count is negative
+    """
+    activity_clean = clean_entry(activity, count)
+    
+    if not isinstance(store, dict):
+        return store.add_entry(activity_clean, count)
+    
     if activity_clean:
         store[activity_clean] = store.get(activity_clean, 0) + count
     
     return store
 
 
-def summarize(store: Dict[str, int]) -> Dict:
+def summarize(store: Union[Dict[str, int], AttendanceStore]) -> Dict:
     """
     Summarize attendance data.
     
     Args:
-        store: Dictionary mapping activity names to counts
-        
+        store: Dictionary mapping activity names to counts, or an
+            AttendanceStore object
+    
     Returns:
         Dictionary with summary statistics:
         {
@@ -43,6 +88,9 @@ def summarize(store: Dict[str, int]) -> Dict:
             "by_activity": dict
         }
     """
+    if not isinstance(store, dict):
+        return store.summarize()
+    
     if not store:
         return {
             "total": 0,
@@ -60,3 +108,110 @@ def summarize(store: Dict[str, int]) -> Dict:
         "by_activity": store.copy()
     }
 
+
+class AttendanceAggregate:
+    """
+    Attendance store that keeps its summary statistics current.
+    
+    The total, activity count and a ranking of activities by count are
+    updated on every add_entry, so summarize() is O(1) and top(k) is O(k).
+    The ranking is a sorted list of (-count, activity) pairs, which orders
+    activities by count, then by name.
+    """
+
+    def __init__(self, store: Optional[Mapping[str, int]] = None):
+        """
+        Create an aggregate, optionally seeded from a dict store.
+        
+        Args:
+            store: Dictionary mapping activity names to counts
+        """
+        self._counts: Dict[str, int] = {}
+        self._ranking: List[Tuple[int, str]] = []
+        self._total = 0
+        
+        if store:
+            self._counts = dict(store)
+            self._ranking = sorted((-count, activity) for activity, count in self._counts.items())
+            self._total = sum(self._counts.values())
+
+    def add_entry(self, activity: str, count: int) -> "AttendanceAggregate":
+        """
+        Add an attendance entry and update the statistics.
+        
+        Args:
+            activity: Name of the activity
+            count: Number of attendees (must be >= 0)
+        
+        Returns:
+            This aggregate
+        
+        Raises:
+            ValueError: If count is negative
+        """
+        activity_clean = clean_entry(activity, count)
+        if not activity_clean:
+            return self
+        
+        previous = self._counts.get(activity_clean)
+        if previous is not None:
+            if count == 0:
+                return self
+            del self._ranking[bisect_left(self._ranking, (-previous, activity_clean))]
+        
+        updated = (previous or 0) + count
+        insort(self._ranking, (-updated, activity_clean))
+        self._counts[activity_clean] = updated
+        self._total += count
+        return self
+
+    @property
+    def total(self) -> int:
+        """Total attendance across all activities."""
+        return self._total
+
+    @property
+    def average(self) -> float:
+        """Average attendance per activity."""
+        return self._total / len(self._counts) if self._counts else 0.0
+
+    @property
+    def by_activity(self) -> Mapping[str, int]:
+        """Read-only live view of the per-activity counts."""
+        return MappingProxyType(self._counts)
+
+    def __len__(self) -> int:
+        """Number of distinct activities."""
+        return len(self._counts)
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """
+        Get the k activities with the highest attendance.
+        
+        Args:
+            k: Number of activities to return
+        
+        Returns:
+            List of (activity, count) pairs, highest count first
+        """
+        return [(activity, -negated) for negated, activity in self._ranking[:k]]
+
+    def summarize(self) -> Dict:
+        """
+        Summarize attendance data without copying the counts.
+        
+        Returns:
+            Dictionary with the same shape as summarize(), where
+            by_activity is a read-only view of the live counts
+        """
+        return {
+            "total": self._total,
+            "avg_per_activity": self.average,
+            "by_activity": self.by_activity
+        }
+
+    def clear(self) -> None:
+        """Remove all attendance data."""
+        self._counts = {}
+        self._ranking = []
+        self._total = 0
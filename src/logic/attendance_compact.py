@@ -0,0 +1,371 @@
+"""Compact in-memory attendance store for long, multi-site histories.
+
+Activity names are interned to integer ids, so each name is stored once.
+Per-activity counts live in a single int64 array indexed by id, and the
+optional entry history is kept as three parallel typed columns (activity
+id, count, timestamp). A year of check-ins then costs 16 bytes per entry
+instead of a tuple, an int and a float object per entry.
+
+Summaries expose the arrays themselves (see ActivityCounts), so dashboard
+tables and charts can be built without copying them
+(src.logic.frames.attendance_frame).
+"""
+
+import time
+from collections.abc import Mapping
+from operator import index as as_int
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.logic.attendance import clean_entry
+
+# Initial number of activity (and history entry) slots; arrays double when full
+INITIAL_CAPACITY = 64
+
+Entry = Union[Tuple[str, int], Tuple[str, int, float]]
+
+
+def _grow(array: np.ndarray, needed: int) -> np.ndarray:
+    """Return a copy of array with at least `needed` slots (doubling)."""
+    capacity = max(len(array), 1)
+    while capacity < needed:
+        capacity *= 2
+    grown = np.zeros(capacity, dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Read-only view of an array."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class ActivityCounts(Mapping):
+    """
+    Read-only mapping of activity names to counts backed by arrays.
+    
+    names (object array) and counts (int64 array) are aligned by activity
+    id, in first-seen order, and can be handed to pandas without copying.
+    """
+    
+    __slots__ = ("names", "counts", "_ids")
+
+    def __init__(self, names: np.ndarray, counts: np.ndarray, ids: Dict[str, int]):
+        """
+        Wrap aligned arrays.
+        
+        Args:
+            names: Activity names by id
+            counts: Counts by id (same length as names)
+            ids: Activity name to id (may also hold ids beyond the arrays)
+        """
+        self.names = names
+        self.counts = counts
+        self._ids = ids
+
+    def __getitem__(self, activity: str) -> int:
+        """Count for an activity."""
+        index = self._ids.get(activity)
+        if index is None or index >= len(self.counts):
+            raise KeyError(activity)
+        return int(self.counts[index])
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over activity names."""
+        return iter(self.names.tolist())
+
+    def __len__(self) -> int:
+        """Number of activities."""
+        return len(self.counts)
+
+    def values(self) -> List[int]:
+        """Counts in activity order."""
+        return self.counts.tolist()
+
+    def items(self) -> List[Tuple[str, int]]:
+        """(activity, count) pairs in activity order."""
+        return list(zip(self.names.tolist(), self.counts.tolist()))
+
+    def __repr__(self) -> str:
+        """Show the counts like a dict."""
+        return f"ActivityCounts({dict(self.items())!r})"
+
+
+class CompactAttendanceStore:
+    """
+    Attendance store with interned activity names and typed-array counts.
+    
+    Implements the add_entry/summarize contract of src.logic.attendance.
+    Like AttendanceAggregate it is not thread-safe; callers that share one
+    across threads must lock around it (as SQLiteAttendanceStore does).
+    
+    Views returned by summarize() and by_activity share memory with the
+    store, so they are cheap but not frozen: counts may keep changing
+    until the store next grows its arrays, and activities added later
+    never show up. Pass snapshot=True to summarize() for a copy.
+    """
+
+    def __init__(self, keep_history: bool = False, capacity: int = INITIAL_CAPACITY):
+        """
+        Create an empty store.
+        
+        Args:
+            keep_history: Also keep every entry (activity, count, time)
+            capacity: Initial number of activity and history slots
+            
+        Raises:
+            ValueError: If capacity <= 0
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be greater than 0, got {capacity}")
+        self.keep_history = keep_history
+        self._capacity = capacity
+        self.clear()
+
+    @classmethod
+    def from_counts(cls, counts: Union[Mapping, Iterable[Tuple[str, int]]]) -> "CompactAttendanceStore":
+        """
+        Create a store from per-activity totals.
+        
+        Args:
+            counts: Mapping or (activity, count) pairs
+            
+        Returns:
+            New store without history
+        """
+        store = cls()
+        store.add_entries(counts.items() if isinstance(counts, Mapping) else counts)
+        return store
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Entry]) -> "CompactAttendanceStore":
+        """
+        Create a store, with history, from recorded entries.
+        
+        Args:
+            entries: (activity, count, recorded_at) tuples, e.g. from
+                SQLiteAttendanceStore.entries()
+                
+        Returns:
+            New store keeping the entries
+        """
+        return cls(keep_history=True).add_entries(entries)
+
+    def _intern(self, activity: str) -> int:
+        """Id of a cleaned activity name, assigning the next id if new."""
+        index = self._ids.get(activity)
+        if index is None:
+            index = len(self._ids)
+            if index == len(self._counts):
+                self._counts = _grow(self._counts, index + 1)
+                self._names = _grow(self._names, index + 1)
+                self._count_cells = memoryview(self._counts)
+            self._names[index] = activity
+            self._ids[activity] = index
+        return index
+
+    def activity_id(self, activity: str) -> Optional[int]:
+        """Interned id of an activity, or None if it has no entries."""
+        return self._ids.get(activity.strip())
+
+    def add_entry(self, activity: str, count: int, recorded_at: Optional[float] = None) -> "CompactAttendanceStore":
+        """
+        Add an attendance entry.
+        
+        Args:
+            activity: Name of the activity
+            count: Number of attendees (must be >= 0; below 2**31 when
+                history is kept)
+            recorded_at: Unix timestamp of the entry (defaults to now;
+                only stored when history is kept)
+                
+        Returns:
+            This store
+            
+        Raises:
+            ValueError: If count is negative
+        """
+        return self.add_entries([(activity, count, recorded_at)])
+
+    def add_entries(self, entries: Iterable[Entry]) -> "CompactAttendanceStore":
+        """
+        Add many attendance entries.
+        
+        Args:
+            entries: (activity, count) or (activity, count, recorded_at) tuples
+            
+        Returns:
+            This store
+            
+        Raises:
+            ValueError: If any count is negative (earlier entries are kept)
+        """
+        ids = self._ids
+        for entry in entries:
+            activity, count = entry[0], as_int(entry[1])
+            activity_clean = clean_entry(activity, count)
+            if not activity_clean:
+                continue
+            index = ids.get(activity_clean)
+            if index is None:
+                index = self._intern(activity_clean)
+            self._count_cells[index] += count
+            self._total += count
+            if self.keep_history:
+                recorded_at = entry[2] if len(entry) > 2 and entry[2] is not None else time.time()
+                self._append_history(index, count, recorded_at)
+        return self
+
+    def _append_history(self, index: int, count: int, recorded_at: float) -> None:
+        """Append one entry to the history columns."""
+        position = self._entries
+        if position == len(self._entry_times):
+            self._entry_ids = _grow(self._entry_ids, position + 1)
+            self._entry_counts = _grow(self._entry_counts, position + 1)
+            self._entry_times = _grow(self._entry_times, position + 1)
+            self._history_cells = (
+                memoryview(self._entry_ids),
+                memoryview(self._entry_counts),
+                memoryview(self._entry_times),
+            )
+        ids, counts, times = self._history_cells
+        ids[position] = index
+        counts[position] = count
+        times[position] = recorded_at
+        self._entries = position + 1
+
+    @property
+    def total(self) -> int:
+        """Total attendance across all activities."""
+        return self._total
+
+    @property
+    def average(self) -> float:
+        """Average attendance per activity."""
+        return self._total / len(self._ids) if self._ids else 0.0
+
+    @property
+    def by_activity(self) -> ActivityCounts:
+        """Read-only view of the per-activity counts."""
+        n = len(self._ids)
+        return ActivityCounts(_read_only(self._names[:n]), _read_only(self._counts[:n]), self._ids)
+
+    def count(self, activity: str) -> int:
+        """Attendance recorded for one activity (0 if none)."""
+        index = self._ids.get(activity.strip())
+        return 0 if index is None else self._count_cells[index]
+
+    def __len__(self) -> int:
+        """Number of distinct activities."""
+        return len(self._ids)
+
+    def summarize(self, snapshot: bool = False) -> Dict:
+        """
+        Summarize attendance data without copying the counts.
+        
+        Args:
+            snapshot: Copy the arrays, so later entries never show up
+                in the returned by_activity
+                
+        Returns:
+            Dictionary with the same shape as src.logic.attendance.summarize,
+            where by_activity is an ActivityCounts view
+        """
+        by_activity = self.by_activity
+        if snapshot:
+            by_activity = ActivityCounts(
+                _read_only(by_activity.names.copy()),
+                _read_only(by_activity.counts.copy()),
+                self._ids
+            )
+        return {
+            "total": self._total,
+            "avg_per_activity": self.average,
+            "by_activity": by_activity
+        }
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """
+        Get the k activities with the highest attendance.
+        
+        Args:
+            k: Number of activities to return
+            
+        Returns:
+            List of (activity, count) pairs, highest count first (ties by name)
+        """
+        n = len(self._ids)
+        if k <= 0 or not n:
+            return []
+        counts = self._counts[:n]
+        if k < n:
+            # Only activities tied with or above the k-th largest count can rank
+            threshold = np.partition(counts, n - k)[n - k]
+            candidates = np.flatnonzero(counts >= threshold)
+        else:
+            candidates = np.arange(n)
+        pairs = zip(self._names[candidates].tolist(), counts[candidates].tolist())
+        return sorted(pairs, key=lambda item: (-item[1], item[0]))[:k]
+
+    def history(self) -> Dict[str, np.ndarray]:
+        """
+        Read-only views of the entry history columns.
+        
+        Returns:
+            {"activity_id": int32, "count": int32, "recorded_at": float64
+            (Unix seconds)} arrays in insertion order, plus "names"
+            (activity names by id); all empty when history is not kept
+        """
+        n = self._entries
+        return {
+            "activity_id": _read_only(self._entry_ids[:n]),
+            "count": _read_only(self._entry_counts[:n]),
+            "recorded_at": _read_only(self._entry_times[:n]),
+            "names": _read_only(self._names[:len(self._ids)]),
+        }
+
+    def entries(self) -> Iterator[Tuple[str, int, float]]:
+        """
+        Iterate over the kept entries in insertion order.
+        
+        Yields:
+            (activity, count, recorded_at) tuples
+        """
+        n = self._entries
+        names = self._names
+        for index, count, recorded_at in zip(
+            self._entry_ids[:n].tolist(), self._entry_counts[:n].tolist(), self._entry_times[:n].tolist()
+        ):
+            yield names[index], count, recorded_at
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the typed arrays (names themselves not included)."""
+        return sum(a.nbytes for a in (self._counts, self._names, self._entry_ids, self._entry_counts, self._entry_times))
+
+    def clear(self) -> None:
+        """
+        Remove all attendance data.
+        
+        Fresh arrays are allocated, so views handed out earlier keep
+        their values.
+        """
+        capacity = self._capacity
+        history = capacity if self.keep_history else 0
+        self._ids: Dict[str, int] = {}
+        self._names = np.empty(capacity, dtype=object)
+        self._counts = np.zeros(capacity, dtype=np.int64)
+        self._count_cells = memoryview(self._counts)
+        self._total = 0
+        self._entry_ids = np.zeros(history, dtype=np.int32)
+        self._entry_counts = np.zeros(history, dtype=np.int32)
+        self._entry_times = np.zeros(history, dtype=np.float64)
+        self._history_cells = (
+            memoryview(self._entry_ids),
+            memoryview(self._entry_counts),
+            memoryview(self._entry_times),
+        )
+        self._entries = 0
@@ -0,0 +1,124 @@
+"""Thread-safe in-memory attendance store for concurrent check-in kiosks."""
+
+import threading
+from contextlib import ExitStack
+from typing import Dict, List, Tuple
+
+from src.logic.attendance import clean_entry
+
+# Number of lock stripes; activities are spread across them by hash
+DEFAULT_STRIPES = 16
+
+
+class StripedAttendanceStore:
+    """
+    Attendance store whose activities are sharded across lock stripes.
+    
+    Implements the add_entry/summarize contract of src.logic.attendance.
+    Each activity lives in one shard (chosen by hash), and each shard has
+    its own lock, so kiosks checking in to different activities rarely
+    wait for each other, and the read-modify-write of a count is never
+    interleaved with another thread's, so no increment is lost.
+    
+    Reads that span activities (summarize, top) take every lock
+    in a fixed order, so they see a consistent snapshot.
+    """
+
+    def __init__(self, stripes: int = DEFAULT_STRIPES):
+        """
+        Create an empty store.
+        
+        Args:
+            stripes: Number of shards (must be > 0)
+            
+        Raises:
+            ValueError: If stripes <= 0
+        """
+        if stripes <= 0:
+            raise ValueError(f"Stripes must be greater than 0, got {stripes}")
+        self._shards: List[Dict[str, int]] = [{} for _ in range(stripes)]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _stripe(self, activity: str) -> int:
+        """Shard index of an activity."""
+        return hash(activity) % len(self._shards)
+
+    def add_entry(self, activity: str, count: int) -> "StripedAttendanceStore":
+        """
+        Add an attendance entry (safe to call from many threads).
+        
+        Args:
+            activity: Name of the activity
+            count: Number of attendees (must be >= 0)
+            
+        Returns:
+            This store
+            
+        Raises:
+            ValueError: If count is negative
+        """
+        activity_clean = clean_entry(activity, count)
+        if not activity_clean:
+            return self
+        
+        stripe = self._stripe(activity_clean)
+        shard = self._shards[stripe]
+        with self._locks[stripe]:
+            shard[activity_clean] = shard.get(activity_clean, 0) + count
+        return self
+
+    def count(self, activity: str) -> int:
+        """Attendance recorded for one activity (0 if none)."""
+        activity_clean = activity.strip()
+        return self._shards[self._stripe(activity_clean)].get(activity_clean, 0)
+
+    def _snapshot(self) -> Dict[str, int]:
+        """Copy all counts while holding every stripe lock."""
+        with ExitStack() as stack:
+            for lock in self._locks:
+                stack.enter_context(lock)
+            counts = {}
+            for shard in self._shards:
+                counts.update(shard)
+            return counts
+
+    def summarize(self) -> Dict:
+        """
+        Summarize attendance data.
+        
+        Returns:
+            Dictionary with the same shape as src.logic.attendance.summarize
+            (by_activity is a consistent snapshot)
+        """
+        counts = self._snapshot()
+        total = sum(counts.values())
+        return {
+            "total": total,
+            "avg_per_activity": total / len(counts) if counts else 0.0,
+            "by_activity": counts
+        }
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """
+        Get the k activities with the highest attendance.
+        
+        Args:
+            k: Number of activities to return
+            
+        Returns:
+            List of (activity, count) pairs, highest count first (ties by name)
+        """
+        counts = self._snapshot()
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+    def __len__(self) -> int:
+        """Number of distinct activities."""
+        return sum(len(shard) for shard in self._shards)
+
+    def clear(self) -> None:
+        """Remove all attendance data."""
+        with ExitStack() as stack:
+            for lock in self._locks:
+                stack.enter_context(lock)
+            for shard in self._shards:
+                shard.clear()
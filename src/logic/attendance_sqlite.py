@@ -0,0 +1,464 @@
+"""SQLite-backed persistent attendance store."""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.logic.attendance import clean_entry
+from src.logic.attendance_compact import CompactAttendanceStore
+
+# Default database location, overridable with the ATTENDANCE_DB environment variable
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "data" / "attendance.db"
+
+# Every entry is kept in attendance_entries; triggers roll each insert into
+# attendance_totals (per activity) and attendance_summary (one row), so
+# totals never need a scan of the entry history.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attendance_entries (
+    id INTEGER PRIMARY KEY,
+    activity TEXT NOT NULL,
+    count INTEGER NOT NULL CHECK (count >= 0),
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_activity_time
+    ON attendance_entries (activity, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_entries_time
+    ON attendance_entries (recorded_at);
+
+CREATE TABLE IF NOT EXISTS attendance_totals (
+    activity TEXT PRIMARY KEY,
+    total INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS attendance_summary (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total INTEGER NOT NULL,
+    activities INTEGER NOT NULL,
+    generation INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO attendance_summary (id, total, activities, generation) VALUES (1, 0, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_entries_insert AFTER INSERT ON attendance_entries
+BEGIN
+    INSERT INTO attendance_totals (activity, total) VALUES (NEW.activity, NEW.count)
+        ON CONFLICT (activity) DO UPDATE SET total = total + excluded.total;
+    UPDATE attendance_summary SET total = total + NEW.count WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_totals_insert AFTER INSERT ON attendance_totals
+BEGIN
+    UPDATE attendance_summary SET activities = activities + 1 WHERE id = 1;
+END;
+
+-- One row per member and class occurrence; each new row is counted as an
+-- attendance entry of 1, so repeats (INSERT OR IGNORE) are never counted
+CREATE TABLE IF NOT EXISTS attendance_checkins (
+    member_id TEXT NOT NULL,
+    occurrence TEXT NOT NULL,
+    activity TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (member_id, occurrence)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_checkins_time
+    ON attendance_checkins (recorded_at);
+
+CREATE TRIGGER IF NOT EXISTS trg_checkins_insert AFTER INSERT ON attendance_checkins
+BEGIN
+    INSERT INTO attendance_entries (activity, count, recorded_at) VALUES (NEW.activity, 1, NEW.recorded_at);
+END;
+"""
+
+# (member_id, occurrence, activity, recorded_at)
+CheckIn = Tuple[str, str, str, float]
+
+Entry = Union[Tuple[str, int], Tuple[str, int, float]]
+
+
+class SQLiteAttendanceStore:
+    """
+    Attendance store persisted to a SQLite database in WAL mode.
+    
+    Implements the add_entry/summarize contract of src.logic.attendance.
+    Each thread gets its own connection, and WAL mode lets many front-desk
+    sessions (threads or processes) write while others read. Writers wait
+    for each other through SQLite's busy timeout.
+    
+    summarize() is served from an in-process CompactAttendanceStore that is
+    caught up with entries committed since the last call (by any writer),
+    so a summary costs O(new entries) rather than a query over all totals.
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 30.0):
+        """
+        Open (and create if needed) an attendance database.
+        
+        Args:
+            path: Database file path, or ":memory:" for a private
+                in-memory database (single connection, for tests)
+            timeout: Seconds to wait for another writer's lock
+        """
+        self.path = str(path)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._shared = None
+        self._lock = threading.Lock()
+        self._aggregate = CompactAttendanceStore()
+        self._seen_id = 0
+        self._seen_generation = None
+        
+        if self.path == ":memory:":
+            self._shared = self._connect()
+        else:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode and apply the schema."""
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=self.path != ":memory:"
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        if self._shared is not None:
+            return self._shared
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def add_entry(self, activity: str, count: int, recorded_at: Optional[float] = None) -> "SQLiteAttendanceStore":
+        """
+        Record one attendance entry.
+        
+        Args:
+            activity: Name of the activity
+            count: Number of attendees (must be >= 0)
+            recorded_at: Unix timestamp of the entry (defaults to now)
+        
+        Returns:
+            This store
+        
+        Raises:
+            ValueError: If count is negative
+        """
+        return self.add_entries([(activity, count, recorded_at)])
+
+    def add_entries(self, entries: Iterable[Entry], batch_size: int = 1000) -> "SQLiteAttendanceStore":
+        """
+        Record many attendance entries, committing one transaction per batch.
+        
+        Args:
+            entries: (activity, count) or (activity, count, recorded_at) tuples
+            batch_size: Number of entries written per transaction
+        
+        Returns:
+            This store
+        
+        Raises:
+            ValueError: If any count is negative (entries in earlier,
+                already committed batches are kept)
+        """
+        batch = []
+        for entry in entries:
+            activity_clean = clean_entry(entry[0], entry[1])
+            if not activity_clean:
+                continue
+            recorded_at = entry[2] if len(entry) > 2 and entry[2] is not None else time.time()
+            batch.append((activity_clean, entry[1], recorded_at))
+            if len(batch) >= batch_size:
+                self._insert(batch)
+                batch = []
+        if batch:
+            self._insert(batch)
+        return self
+
+    def _insert(self, batch: Sequence[Tuple[str, int, float]]) -> None:
+        """Insert a batch of cleaned entries in a single write transaction."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO attendance_entries (activity, count, recorded_at) VALUES (?, ?, ?)",
+                batch
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def total(self) -> int:
+        """Total attendance across all activities (constant time)."""
+        return self._connection().execute(
+            "SELECT total FROM attendance_summary WHERE id = 1"
+        ).fetchone()[0]
+
+    def __len__(self) -> int:
+        """Number of distinct activities (constant time)."""
+        return self._connection().execute(
+            "SELECT activities FROM attendance_summary WHERE id = 1"
+        ).fetchone()[0]
+
+    def _catch_up(self) -> None:
+        """
+        Bring the in-process aggregate up to date with the database.
+        
+        Entry ids only grow between clears, so entries newer than the last
+        seen id are folded in; a clear (new generation) triggers a reload
+        from the per-activity totals. Must be called with self._lock held.
+        """
+        conn = self._connection()
+        conn.execute("BEGIN")
+        try:
+            generation, last_id = conn.execute(
+                "SELECT generation, (SELECT max(id) FROM attendance_entries) "
+                "FROM attendance_summary WHERE id = 1"
+            ).fetchone()
+            last_id = last_id or 0
+            if generation != self._seen_generation:
+                self._aggregate = CompactAttendanceStore.from_counts(
+                    conn.execute("SELECT activity, total FROM attendance_totals")
+                )
+                self._seen_generation = generation
+            elif last_id > self._seen_id:
+                new_entries = conn.execute(
+                    "SELECT activity, count FROM attendance_entries WHERE id > ? ORDER BY id",
+                    (self._seen_id,)
+                )
+                self._aggregate.add_entries(new_entries)
+            self._seen_id = last_id
+        finally:
+            conn.execute("COMMIT")
+
+    def record_check_ins(self, check_ins: Sequence[CheckIn]) -> int:
+        """
+        Record member check-ins, each at most once per class occurrence.
+        
+        In one write transaction, each check-in whose (member_id,
+        occurrence) is not yet recorded is stored and counted as an
+        attendance entry of 1 for its activity; repeats are ignored.
+        
+        Args:
+            check_ins: (member_id, occurrence, activity, recorded_at) tuples
+                (activities already cleaned)
+        
+        Returns:
+            Number of check-ins recorded (repeats excluded)
+        """
+        if not check_ins:
+            return 0
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            recorded = conn.executemany(
+                "INSERT OR IGNORE INTO attendance_checkins (member_id, occurrence, activity, recorded_at) "
+                "VALUES (?, ?, ?, ?)",
+                check_ins
+            ).rowcount
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return recorded
+
+    def has_check_in(self, member_id: str, occurrence: str) -> bool:
+        """Whether a member's check-in to a class occurrence is recorded."""
+        return self._connection().execute(
+            "SELECT 1 FROM attendance_checkins WHERE member_id = ? AND occurrence = ?",
+            (member_id, occurrence)
+        ).fetchone() is not None
+
+    def check_ins_since(self, since: float) -> Iterator[Tuple[str, str, float]]:
+        """
+        Iterate over check-ins recorded at or after a Unix timestamp.
+        
+        Yields:
+            (member_id, occurrence, recorded_at) tuples in time order
+        """
+        yield from self._connection().execute(
+            "SELECT member_id, occurrence, recorded_at FROM attendance_checkins "
+            "WHERE recorded_at >= ? ORDER BY recorded_at",
+            (since,)
+        )
+
+    def prune_check_ins(self, before: float) -> int:
+        """
+        Forget check-ins recorded before a Unix timestamp.
+        
+        Attendance entries are kept; a repeat of a forgotten check-in is
+        recorded again.
+        
+        Returns:
+            Number of check-ins forgotten
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            forgotten = conn.execute(
+                "DELETE FROM attendance_checkins WHERE recorded_at < ?", (before,)
+            ).rowcount
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return forgotten
+
+    def summarize(self) -> Dict:
+        """
+        Summarize attendance data.
+        
+        Returns:
+            Dictionary with the same shape as src.logic.attendance.summarize
+            (by_activity is an array-backed snapshot, safe to use while
+            others write)
+        """
+        with self._lock:
+            self._catch_up()
+            return self._aggregate.summarize(snapshot=True)
+
+    def version(self) -> Tuple[int, int]:
+        """
+        Identify the current contents, for keying caches of derived views.
+        
+        Returns:
+            (generation, last entry id); changes whenever an entry is added
+            or the store is cleared
+        """
+        with self._lock:
+            self._catch_up()
+            return self._seen_generation, self._seen_id
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """
+        Get the k activities with the highest attendance.
+        
+        Args:
+            k: Number of activities to return
+        
+        Returns:
+            List of (activity, count) pairs, highest count first
+        """
+        with self._lock:
+            self._catch_up()
+            return self._aggregate.top(k)
+
+    def entries(
+        self,
+        activity: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> Iterator[Tuple[str, int, float]]:
+        """
+        Iterate over recorded entries in time order.
+        
+        Args:
+            activity: Only entries for this activity
+            since: Only entries recorded at or after this Unix timestamp
+            until: Only entries recorded before this Unix timestamp
+        
+        Yields:
+            (activity, count, recorded_at) tuples
+        """
+        clauses, params = [], []
+        if activity is not None:
+            clauses.append("activity = ?")
+            params.append(activity.strip())
+        if since is not None:
+            clauses.append("recorded_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("recorded_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"SELECT activity, count, recorded_at FROM attendance_entries {where} ORDER BY recorded_at, id"
+        yield from self._connection().execute(query, params)
+
+    def entries_since(self, entry_id: int, limit: Optional[int] = None) -> Tuple[int, List[Tuple[int, str, int, float]]]:
+        """
+        Fetch entries recorded after a cursor, for incremental consumers.
+        
+        Entry ids only grow until the store is cleared; a clear bumps the
+        generation, after which a consumer should start again from 0.
+        
+        Args:
+            entry_id: Id of the last entry already seen (0 for all)
+            limit: Maximum number of entries to return
+        
+        Returns:
+            (generation, entries), read in one transaction; entries are
+            (id, activity, count, recorded_at) tuples in id order
+        """
+        conn = self._connection()
+        conn.execute("BEGIN")
+        try:
+            generation = conn.execute("SELECT generation FROM attendance_summary WHERE id = 1").fetchone()[0]
+            rows = conn.execute(
+                "SELECT id, activity, count, recorded_at FROM attendance_entries WHERE id > ? ORDER BY id LIMIT ?",
+                (entry_id, -1 if limit is None else limit)
+            ).fetchall()
+        finally:
+            conn.execute("COMMIT")
+        return generation, rows
+
+    def clear(self) -> None:
+        """Delete all recorded attendance."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM attendance_entries")
+            conn.execute("DELETE FROM attendance_totals")
+            conn.execute("DELETE FROM attendance_checkins")
+            conn.execute(
+                "UPDATE attendance_summary SET total = 0, activities = 0, generation = generation + 1 WHERE id = 1"
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        if self._shared is not None:
+            self._shared.close()
+            return
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def resolve_db_path(path: Optional[Union[str, Path]] = None) -> str:
+    """
+    Resolve the attendance database location.
+    
+    Args:
+        path: Explicit path; defaults to $ATTENDANCE_DB, then DEFAULT_DB_PATH
+        
+    Returns:
+        Database path as a string
+    """
+    return str(path or os.getenv("ATTENDANCE_DB") or DEFAULT_DB_PATH)
+
+
+def open_attendance_store(path: Optional[Union[str, Path]] = None) -> SQLiteAttendanceStore:
+    """
+    Open the attendance database.
+    
+    Args:
+        path: Database path; defaults to $ATTENDANCE_DB, then DEFAULT_DB_PATH
+        
+    Returns:
+        SQLiteAttendanceStore for that database
+    """
+    return SQLiteAttendanceStore(resolve_db_path(path))
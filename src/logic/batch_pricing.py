@@ -0,0 +1,171 @@
+"""Vectorized membership pricing for quoting many members at once."""
+
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.logic.money import BASIS_POINTS, CENTS_PER_DOLLAR, to_basis_points, to_cents
+from src.logic.pricing import STUDENT_STAFF_BASIS_POINTS
+from src.logic.promos import PromoCatalog, combined_rate, resolve_promos
+
+BREAKDOWN_COLUMNS = [
+    "plan",
+    "months",
+    "monthly_price",
+    "base_cost",
+    "student_staff_discount",
+    "promo_applied",
+    "promo_rate",
+    "promo_discount",
+    "final_cost",
+]
+
+
+def _promo_text(promo) -> Optional[str]:
+    """Promo field text, or None for missing values (None, NaN, "")."""
+    if isinstance(promo, str) and promo:
+        return promo
+    return None
+
+
+def apply_rate_array(cents: np.ndarray, basis_points: np.ndarray) -> np.ndarray:
+    """Vectorized src.logic.money.apply_rate over int64 arrays."""
+    product = cents * basis_points
+    rounded = (np.abs(product) + BASIS_POINTS // 2) // BASIS_POINTS
+    return np.where(product >= 0, rounded, -rounded)
+
+
+def price_membership_batch(
+    plan,
+    months,
+    is_student_or_staff,
+    promo,
+    plans: Dict[str, float],
+    promo_codes: Union[Dict[str, float], PromoCatalog],
+    now: Optional[float] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate membership pricing for many quotes at once.
+    
+    Every input is a column (list, NumPy array or pandas Series) with one
+    entry per quote. The arithmetic runs on int64 cents with the same
+    rounding as price_membership, so each row matches the scalar result
+    exactly.
+    
+    Args:
+        plan: Plan names (each must exist in plans dict)
+        months: Number of months per quote (each must be > 0)
+        is_student_or_staff: Student/staff flags per quote
+        promo: Promo code strings per quote (None/empty for no promo), or
+            None to quote every row without a promo
+        plans: Dictionary of plan names to monthly prices
+        promo_codes: PromoCatalog, or dictionary of promo codes to
+            discount rates
+        now: Unix timestamp for promo expiry checks (defaults to now)
+    
+    Returns:
+        Dictionary mapping each price_membership breakdown key to an array
+        of per-quote values (promo_applied is an object array holding the
+        applied code or None)
+    
+    Raises:
+        ValueError: If any plan is invalid, any months <= 0, or the
+            columns have different lengths
+    """
+    plan_codes, plan_names = pd.factorize(np.asarray(plan, dtype=object))
+    months_arr = np.asarray(months, dtype=np.int64)
+    student_arr = np.asarray(is_student_or_staff, dtype=bool)
+    n = len(plan_codes)
+    
+    if promo is None:
+        promo_codes_idx = np.full(n, -1, dtype=np.intp)
+        promo_values = []
+    else:
+        promo_codes_idx, promo_values = pd.factorize(np.asarray(promo, dtype=object))
+    
+    if not (len(months_arr) == len(student_arr) == len(promo_codes_idx) == n):
+        raise ValueError("All input columns must have the same length")
+    
+    if (plan_codes < 0).any():
+        raise ValueError(f"Invalid plan: None. Available plans: {list(plans.keys())}")
+    for name in plan_names:
+        if name not in plans:
+            raise ValueError(f"Invalid plan: {name}. Available plans: {list(plans.keys())}")
+    
+    invalid_months = months_arr <= 0
+    if invalid_months.any():
+        bad = months_arr[np.argmax(invalid_months)]
+        raise ValueError(f"Months must be greater than 0, got {bad}")
+    
+    # Lookup tables over the distinct values only; index -1 (missing promo)
+    # lands on the trailing "no promo" entry. Column k of points_table holds
+    # the k-th stacked code's rate (0 where fewer codes apply).
+    price_table = np.array([plans[name] for name in plan_names], dtype=np.float64)
+    price_cents_table = np.array([to_cents(plans[name]) for name in plan_names], dtype=np.int64)
+    resolved = [resolve_promos(_promo_text(value), promo_codes, now) for value in promo_values] + [[]]
+    applied_table = np.array(["+".join(code for code, _ in applied) or None for applied in resolved], dtype=object)
+    rate_table = np.array([combined_rate(applied) if applied else 0.0 for applied in resolved], dtype=np.float64)
+    points_table = np.zeros((len(resolved), max(map(len, resolved))), dtype=np.int64)
+    for row, applied in enumerate(resolved):
+        for column, (_, rate) in enumerate(applied):
+            points_table[row, column] = to_basis_points(rate)
+    
+    base_cents = price_cents_table[plan_codes] * months_arr
+    
+    student_points = np.where(student_arr, STUDENT_STAFF_BASIS_POINTS, 0)
+    student_staff_cents = apply_rate_array(base_cents, student_points)
+    cents_after_student_discount = base_cents - student_staff_cents
+    
+    promo_cents = np.zeros(n, dtype=np.int64)
+    for column in points_table.T:
+        promo_cents += apply_rate_array(cents_after_student_discount - promo_cents, column[promo_codes_idx])
+    final_cents = cents_after_student_discount - promo_cents
+    
+    return {
+        "plan": np.asarray(plan_names, dtype=object)[plan_codes],
+        "months": months_arr,
+        "monthly_price": price_table[plan_codes],
+        "base_cost": base_cents / CENTS_PER_DOLLAR,
+        "student_staff_discount": student_staff_cents / CENTS_PER_DOLLAR,
+        "promo_applied": applied_table[promo_codes_idx],
+        "promo_rate": rate_table[promo_codes_idx],
+        "promo_discount": promo_cents / CENTS_PER_DOLLAR,
+        "final_cost": np.maximum(final_cents, 0) / CENTS_PER_DOLLAR  # Ensure non-negative
+    }
+
+
+def price_membership_frame(
+    quotes: pd.DataFrame,
+    plans: Dict[str, float],
+    promo_codes: Union[Dict[str, float], PromoCatalog],
+    now: Optional[float] = None
+) -> pd.DataFrame:
+    """
+    Calculate membership pricing for every row of a DataFrame.
+    
+    Args:
+        quotes: DataFrame with "plan", "months" and "is_student_or_staff"
+            columns, plus an optional "promo" column
+        plans: Dictionary of plan names to monthly prices
+        promo_codes: PromoCatalog, or dictionary of promo codes to
+            discount rates
+        now: Unix timestamp for promo expiry checks (defaults to now)
+    
+    Returns:
+        DataFrame with one breakdown column per price_membership key,
+        aligned with the index of quotes
+    
+    Raises:
+        ValueError: If any row is invalid (see price_membership_batch)
+    """
+    breakdown = price_membership_batch(
+        plan=quotes["plan"].to_numpy(dtype=object),
+        months=quotes["months"].to_numpy(),
+        is_student_or_staff=quotes["is_student_or_staff"].to_numpy(dtype=bool),
+        promo=quotes["promo"].to_numpy(dtype=object) if "promo" in quotes else None,
+        plans=plans,
+        promo_codes=promo_codes,
+        now=now
+    )
+    return pd.DataFrame(breakdown, index=quotes.index, columns=BREAKDOWN_COLUMNS)
@@ -0,0 +1,299 @@
+"""Streaming bulk processing of pricing requests and attendance entries."""
+
+import csv
+import json
+import sys
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from src.data import plans, promo_codes
+from src.logic.attendance import clean_entry
+from src.logic.attendance_sqlite import SQLiteAttendanceStore
+from src.logic.pricing import purchase_membership
+from src.logic.quote_cache import quote_cache
+from src.logic.records import MalformedRecord, record_fields
+
+FORMATS = ("csv", "jsonl")
+
+PRICING_FIELDS = [
+    "row",
+    "plan",
+    "months",
+    "monthly_price",
+    "base_cost",
+    "student_staff_discount",
+    "promo_applied",
+    "promo_rate",
+    "promo_discount",
+    "final_cost",
+    "error",
+]
+
+TRUE_VALUES = {"1", "true", "t", "yes", "y"}
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """
+    Determine the record format of a file.
+    
+    Args:
+        path: File path ("-" for stdin/stdout)
+        fmt: Explicit format, if given
+        
+    Returns:
+        "csv" or "jsonl" (JSON Lines is the default for "-" and unknown suffixes)
+        
+    Raises:
+        ValueError: If fmt is not a supported format
+    """
+    if fmt is not None:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}. Choose from {list(FORMATS)}")
+        return fmt
+    return "csv" if Path(path).suffix.lower() == ".csv" else "jsonl"
+
+
+@contextmanager
+def _open_text(path: str, mode: str) -> Iterator[TextIO]:
+    """Open a text file, or use stdin/stdout for "-"."""
+    if path == "-":
+        yield sys.stdin if "r" in mode else sys.stdout
+        return
+    with open(path, mode, encoding="utf-8", newline="") as f:
+        yield f
+
+
+def _parse_json_line(line: str, number: int) -> Union[Dict, MalformedRecord]:
+    """Parse one JSON line into a record, or a MalformedRecord naming the line."""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return MalformedRecord(f"Malformed JSON on line {number}: {getattr(e, 'msg', e)}")
+    if not isinstance(record, dict):
+        return MalformedRecord(f"Line {number} is not a JSON object")
+    return record
+
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Union[Dict, MalformedRecord]]:
+    """
+    Stream records from a CSV (with header) or JSON Lines file.
+    
+    Args:
+        path: File path ("-" for stdin)
+        fmt: "csv" or "jsonl" (detected from the suffix if omitted)
+        
+    Yields:
+        One dict per record; blank JSON lines are skipped, and a line
+        that is not a JSON object yields a MalformedRecord, which callers
+        must check for (see src.logic.records.record_fields)
+    """
+    fmt = detect_format(path, fmt)
+    with _open_text(path, "r") as f:
+        if fmt == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield _parse_json_line(line, number)
+
+
+@contextmanager
+def record_writer(path: str, fields: List[str], fmt: Optional[str] = None) -> Iterator[Callable[[Dict], None]]:
+    """
+    Open a streaming CSV or JSON Lines writer.
+    
+    Args:
+        path: File path ("-" for stdout)
+        fields: Column order (CSV header)
+        fmt: "csv" or "jsonl" (detected from the suffix if omitted)
+        
+    Yields:
+        Function that writes one record
+    """
+    fmt = detect_format(path, fmt)
+    with _open_text(path, "w") as f:
+        if fmt == "csv":
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+            writer.writeheader()
+            yield writer.writerow
+        else:
+            yield lambda record: f.write(json.dumps(record) + "\n")
+
+
+def chunked(records: Iterable, size: int) -> Iterator[List]:
+    """
+    Group an iterable into lists of up to size items.
+    
+    Args:
+        records: Items to group
+        size: Maximum items per chunk (must be > 0)
+        
+    Yields:
+        Lists of consecutive items
+    """
+    if size <= 0:
+        raise ValueError(f"Chunk size must be greater than 0, got {size}")
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_chunks(func: Callable, chunks: Iterable, workers: int = 1) -> Iterator:
+    """
+    Apply func to every chunk, in parallel when workers > 1.
+    
+    Results are yielded in input order. At most 2 * workers chunks are in
+    flight at once, so memory stays bounded however long the input is.
+    
+    Args:
+        func: Picklable function taking one chunk
+        chunks: Iterable of chunks
+        workers: Number of worker processes (1 runs in this process)
+        
+    Yields:
+        func(chunk) for each chunk, in order
+    """
+    if workers <= 1:
+        yield from map(func, chunks)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _map_bounded(executor, func, chunks, 2 * workers)
+
+
+def _map_bounded(executor: Executor, func: Callable, chunks: Iterable, limit: int) -> Iterator:
+    """Submit chunks keeping at most limit futures pending, yielding in order."""
+    pending = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(func, chunk))
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def parse_bool(value) -> bool:
+    """Parse a CSV/JSON student flag such as "Y", "true" or 1."""
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    return bool(value)
+
+
+def pricing_request(request: Union[Dict, MalformedRecord]) -> Dict:
+    """
+    Keyword arguments for pricing a bulk request.
+    
+    Args:
+        request: Record with "plan", "months" and optional
+            "is_student_or_staff" and "promo" fields
+            
+    Returns:
+        Arguments for price_membership / quote_cache.quote (a promo read
+        as a number, such as 10, becomes the code "10")
+        
+    Raises:
+        ValueError: If the request is malformed or months is not a whole number
+    """
+    request = record_fields(request)
+    promo = request.get("promo")
+    return {
+        "plan": str(request.get("plan", "")).strip(),
+        "months": int(request.get("months", 0)),
+        "is_student_or_staff": parse_bool(request.get("is_student_or_staff", False)),
+        "promo": None if promo is None else str(promo).strip() or None,
+        "plans": plans,
+        "promo_codes": promo_codes,
+    }
+
+
+def price_chunk(chunk: List[Tuple[int, Dict]]) -> List[Dict]:
+    """
+    Price a chunk of (row number, request) pairs through the quote cache.
+    
+    Invalid requests produce a record with an "error" message instead of
+    stopping the run.
+    
+    Args:
+        chunk: (row number, request dict) pairs; requests have "plan",
+            "months" and optional "is_student_or_staff" and "promo" fields
+            
+    Returns:
+        One result record per request, in order
+    """
+    results = []
+    for row, request in chunk:
+        try:
+            breakdown = quote_cache.quote(**pricing_request(request))
+            results.append({"row": row, **breakdown, "error": None})
+        except (TypeError, ValueError) as e:
+            results.append({"row": row, "error": str(e)})
+    return results
+
+
+def purchase_chunk(chunk: List[Tuple[int, Dict]]) -> List[Dict]:
+    """
+    Record a chunk of membership sales, redeeming their promo codes.
+    
+    Like price_chunk, but each row is a purchase (see purchase_membership):
+    capped and single-use codes are used up in row order, so a later row
+    with a spent code is priced without it. Must run in the process that
+    owns the promo catalog, not in a worker.
+    
+    Args:
+        chunk: (row number, request dict) pairs, as for price_chunk
+        
+    Returns:
+        One result record per request, in order
+    """
+    results = []
+    for row, request in chunk:
+        try:
+            breakdown = purchase_membership(**pricing_request(request))
+            results.append({"row": row, **breakdown, "error": None})
+        except (TypeError, ValueError) as e:
+            results.append({"row": row, "error": str(e)})
+    return results
+
+
+def attendance_chunk(job: Tuple[str, List[Tuple[int, Dict]]]) -> Tuple[int, List[Dict]]:
+    """
+    Record a chunk of attendance entries into a SQLite attendance store.
+    
+    The whole chunk is written in one transaction. Invalid entries are
+    returned rather than recorded.
+    
+    Args:
+        job: (database path, chunk) where chunk holds (row number, entry)
+            pairs; entries have "activity", "count" and optional
+            "recorded_at" (Unix timestamp) fields
+            
+    Returns:
+        (number of entries recorded, error records)
+    """
+    db_path, chunk = job
+    entries, errors = [], []
+    for row, entry in chunk:
+        try:
+            entry = record_fields(entry)
+            count = int(entry.get("count", ""))
+            activity = clean_entry(str(entry.get("activity", "")), count)
+            if not activity:
+                raise ValueError("Activity name cannot be empty")
+            recorded_at = entry.get("recorded_at")
+            entries.append((activity, count, float(recorded_at) if recorded_at not in (None, "") else None))
+        except (TypeError, ValueError) as e:
+            errors.append({"row": row, "error": str(e)})
+    
+    store = SQLiteAttendanceStore(db_path)
+    try:
+        store.add_entries(entries, batch_size=max(len(entries), 1))
+    finally:
+        store.close()
+    return len(entries), errors
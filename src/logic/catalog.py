@@ -0,0 +1,85 @@
+"""Versioned catalogs for membership plans and promo codes."""
+
+from itertools import count
+from typing import Any, Optional
+
+# Shared counter: every change to any catalog gets a new, never reused
+# version number, so a version identifies both the catalog and its contents
+_versions = count(1)
+
+
+def next_version() -> int:
+    """Allocate a new catalog version number (thread-safe)."""
+    return next(_versions)
+
+
+class VersionedDict(dict):
+    """
+    Dictionary that gets a new version number whenever it is modified.
+    
+    Caches derived from a catalog (quotes, price tables) remember the
+    version they were built from and rebuild when it changes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Create the dictionary (same arguments as dict)."""
+        super().__init__(*args, **kwargs)
+        self.version = next_version()
+
+    def _touch(self) -> None:
+        """Assign a new version after a modification."""
+        self.version = next_version()
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._touch()
+
+    def __ior__(self, other) -> "VersionedDict":
+        super().__ior__(other)
+        self._touch()
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._touch()
+
+    def pop(self, *args) -> Any:
+        value = super().pop(*args)
+        self._touch()
+        return value
+
+    def popitem(self) -> Any:
+        item = super().popitem()
+        self._touch()
+        return item
+
+    def setdefault(self, key, default=None) -> Any:
+        value = super().setdefault(key, default)
+        self._touch()
+        return value
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+    def __reduce__(self):
+        """Pickle as a VersionedDict (a fresh version is assigned on load)."""
+        return (type(self), (dict(self),))
+
+
+def catalog_version(catalog: Any) -> Optional[int]:
+    """
+    Get the version of a catalog.
+    
+    Args:
+        catalog: VersionedDict or any object with a version attribute
+        
+    Returns:
+        Version number, or None for catalogs that are not versioned
+        (such as plain dicts), whose changes cannot be detected
+    """
+    return getattr(catalog, "version", None)
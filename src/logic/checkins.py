@@ -0,0 +1,428 @@
+"""Idempotent member check-ins, with duplicate scans suppressed in memory.
+
+Badge readers often fire twice for one tap. A check-in is identified by
+(member, class occurrence) and counted once: SQLiteAttendanceStore keeps
+the recorded keys (the exact store) and writes each new key together with
+its attendance entry.
+
+Asking the database about every scan would cost a query per tap, so a
+CheckInDeduplicator keeps a RotatingBloomFilter of the keys seen in the
+last few hours in front of it:
+- filter says "never seen": the scan is new and is queued for the next
+  batched write, without a lookup;
+- filter says "maybe seen": the queue and then the exact store decide. A
+  key that turns out not to be recorded is a false positive and is
+  counted, so the false-positive rate is measured.
+
+The filter is split into time slices; the oldest slice is dropped as time
+moves on, so memory stays fixed however many scans arrive. A repeat that
+arrives after its key left the filter is still caught when the batch is
+written, as long as the store keeps the check-in: check-ins are pruned
+from the store after a longer retention period (a week by default), and
+only a repeat after that is counted again.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+# Check-ins remembered in memory, and kept in the exact store
+DEFAULT_WINDOW_SECONDS = 3 * 3600
+DEFAULT_RETENTION_SECONDS = 7 * 24 * 3600
+
+# Window slices; one Bloom filter each, the oldest dropped as time moves on
+DEFAULT_SLICES = 3
+
+# Scans per slice each filter is sized for, and the target false-positive
+# rate of the whole rotating filter at that load
+DEFAULT_CAPACITY = 100_000
+DEFAULT_ERROR_RATE = 0.001
+
+# New check-ins written per transaction
+DEFAULT_BATCH_SIZE = 1000
+
+
+def bloom_size(capacity: int, error_rate: float) -> Tuple[int, int]:
+    """
+    Bits and hash functions for a Bloom filter.
+    
+    Args:
+        capacity: Keys expected
+        error_rate: False-positive rate at capacity, between 0 and 1
+        
+    Returns:
+        (bits, hashes)
+        
+    Raises:
+        ValueError: If capacity is not positive or error_rate not in (0, 1)
+    """
+    if capacity <= 0:
+        raise ValueError(f"Capacity must be greater than 0, got {capacity}")
+    if not 0 < error_rate < 1:
+        raise ValueError(f"Error rate must be between 0 and 1, got {error_rate}")
+    bits = max(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+    return bits, max(round(bits / capacity * math.log(2)), 1)
+
+
+def bit_cells(key: str, bits: int, hashes: int) -> List[Tuple[int, int]]:
+    """(byte index, bit mask) of each bit of a key in a filter of the given size."""
+    digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+    first, step = digest & 0xFFFFFFFF, digest >> 32 | 1
+    positions = [(first + i * step) % bits for i in range(hashes)]
+    return [(p >> 3, 1 << (p & 7)) for p in positions]
+
+
+class BloomFilter:
+    """
+    Fixed-size set membership with false positives but no false negatives.
+    
+    Keys are hashed once with BLAKE2b; the k bit positions are derived by
+    double hashing, so adding or checking a key costs O(k) regardless of
+    how many keys were added. Filters of the same size share positions,
+    so a key hashed once (cells) can be checked against several.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Size a filter for a number of keys and false-positive rate.
+        
+        Args:
+            capacity: Keys expected (more keys raise the false-positive rate)
+            error_rate: False-positive rate at capacity, between 0 and 1
+            
+        Raises:
+            ValueError: If capacity is not positive or error_rate not in (0, 1)
+        """
+        self.capacity = capacity
+        self.bits, self.hashes = bloom_size(capacity, error_rate)
+        self._array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Number of keys added."""
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._array)
+
+    def cells(self, key: str) -> List[Tuple[int, int]]:
+        """Bits of a key (the same in any filter of this size)."""
+        return bit_cells(key, self.bits, self.hashes)
+
+    def __contains__(self, key: str) -> bool:
+        """Whether the key may have been added (False means certainly not)."""
+        return self.contains_cells(self.cells(key))
+
+    def contains_cells(self, cells: List[Tuple[int, int]]) -> bool:
+        """Whether every bit of a key is set."""
+        array = self._array
+        for index, mask in cells:
+            if not array[index] & mask:
+                return False
+        return True
+
+    def add(self, key: str) -> bool:
+        """
+        Add a key.
+        
+        Returns:
+            Whether the key may already have been present
+        """
+        return self.add_cells(self.cells(key))
+
+    def add_cells(self, cells: List[Tuple[int, int]]) -> bool:
+        """Set the bits of a key; returns whether all were already set."""
+        array = self._array
+        present = True
+        for index, mask in cells:
+            if not array[index] & mask:
+                present = False
+                array[index] |= mask
+        if not present:
+            self.count += 1
+        return present
+
+    def false_positive_rate(self) -> float:
+        """Expected false-positive rate at the current fill."""
+        return (-math.expm1(-self.hashes * self.count / self.bits)) ** self.hashes
+
+
+class RotatingBloomFilter:
+    """
+    Bloom filter over a sliding time window, in fixed memory.
+    
+    The window is split into slices, each with its own BloomFilter. A key
+    is added to the filter of its timestamp's slice; when a timestamp
+    reaches a new slice, filters that no longer overlap the window are
+    dropped. A key is therefore remembered for at least window seconds
+    and at most one slice longer.
+    """
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW_SECONDS,
+        slices: int = DEFAULT_SLICES,
+        capacity: int = DEFAULT_CAPACITY,
+        error_rate: float = DEFAULT_ERROR_RATE
+    ):
+        """
+        Create an empty rotating filter.
+        
+        Args:
+            window: Seconds a key is remembered for
+            slices: Number of slices the window is split into
+            capacity: Keys per slice each filter is sized for
+            error_rate: False-positive rate of a check against all live
+                slices when each holds capacity keys
+                
+        Raises:
+            ValueError: If window or slices is not positive
+        """
+        if window <= 0 or slices <= 0:
+            raise ValueError(f"Window and slices must be greater than 0, got {window} and {slices}")
+        self.window = window
+        self.slice_seconds = window / slices
+        self.live_slices = slices + 1  # The current slice is partial
+        self.capacity = capacity
+        # A key is checked against every live filter, so each gets a share of the rate
+        self.slice_error_rate = 1 - (1 - error_rate) ** (1 / self.live_slices)
+        self._filters: Dict[int, BloomFilter] = {}
+        self._newest: Optional[int] = None
+        # Every slice has the same size, so a key's bit positions are computed once
+        self._bits, self._hashes = bloom_size(capacity, self.slice_error_rate)
+
+    def advance(self, timestamp: float) -> int:
+        """
+        Move the window forward to a timestamp, dropping slices that left it.
+        
+        Returns:
+            Slice a key recorded at the timestamp belongs to (keys older
+            than the window go to the oldest live slice)
+        """
+        number = int(timestamp // self.slice_seconds)
+        if self._newest is None or number > self._newest:
+            self._newest = number
+            for old in [n for n in self._filters if n <= number - self.live_slices]:
+                del self._filters[old]
+        return max(number, self._newest - self.live_slices + 1)
+
+    @property
+    def oldest_timestamp(self) -> Optional[float]:
+        """Start of the oldest live slice (keys recorded before it are forgotten)."""
+        if self._newest is None:
+            return None
+        return (self._newest - self.live_slices + 1) * self.slice_seconds
+
+    def __contains__(self, key: str) -> bool:
+        """Whether the key may have been added within the window."""
+        cells = bit_cells(key, self._bits, self._hashes)
+        return any(f.contains_cells(cells) for f in self._filters.values())
+
+    def add(self, key: str, timestamp: float) -> bool:
+        """
+        Add a key to the slice of a timestamp, unless it may already be present.
+        
+        A key that may be present is not added again, so it leaves the
+        filter with the slice it was first added to.
+        
+        Returns:
+            Whether the key may already have been added within the window
+        """
+        number = self.advance(timestamp)
+        cells = bit_cells(key, self._bits, self._hashes)
+        for f in self._filters.values():
+            if f.contains_cells(cells):
+                return True
+        target = self._filters.get(number)
+        if target is None:
+            target = self._filters[number] = BloomFilter(self.capacity, self.slice_error_rate)
+        target.add_cells(cells)
+        return False
+
+    def __len__(self) -> int:
+        """Keys added to the live slices."""
+        return sum(len(f) for f in self._filters.values())
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the live filters."""
+        return sum(f.nbytes for f in self._filters.values())
+
+    def false_positive_rate(self) -> float:
+        """Expected false-positive rate of a check against the live slices."""
+        miss = 1.0
+        for f in self._filters.values():
+            miss *= 1 - f.false_positive_rate()
+        return 1 - miss
+
+
+@dataclass
+class CheckInStats:
+    """Counters of a deduplicator's decisions."""
+    
+    checked_in: int = 0
+    duplicates: int = 0
+    filter_hits: int = 0
+    false_positives: int = 0
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Share of new check-ins the filter wrongly reported as seen."""
+        new = self.checked_in
+        return self.false_positives / new if new else 0.0
+
+
+def occurrence_key(activity: str, recorded_at: float, tz=None) -> str:
+    """
+    Default class occurrence of a scan: the activity on the scan's local date.
+    
+    Args:
+        activity: Activity name
+        recorded_at: Unix timestamp of the scan
+        tz: Time zone of the date (default: local)
+        
+    Returns:
+        Occurrence key, e.g. "Yoga Flow@2026-10-17"
+    """
+    return f"{activity}@{datetime.fromtimestamp(recorded_at, tz).date().isoformat()}"
+
+
+class CheckInDeduplicator:
+    """
+    Idempotent check-in path in front of a SQLiteAttendanceStore.
+    
+    check_in decides in memory whether a scan is new and queues new
+    check-ins; they are written (with their attendance entries) in batches
+    by flush, which runs when the batch is full and on close. The store still ignores keys it already
+    has, so a cold or lost filter never lets a duplicate through.
+    
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        store,
+        window: float = DEFAULT_WINDOW_SECONDS,
+        slices: int = DEFAULT_SLICES,
+        capacity: int = DEFAULT_CAPACITY,
+        error_rate: float = DEFAULT_ERROR_RATE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        retention: float = DEFAULT_RETENTION_SECONDS
+    ):
+        """
+        Create a deduplicator and load recent check-ins into its filter.
+        
+        Args:
+            store: SQLiteAttendanceStore keeping the recorded check-ins
+            window: Seconds a check-in is remembered in memory
+            slices: Bloom filter slices the window is split into
+            capacity: Scans per slice each filter is sized for
+            error_rate: Target false-positive rate of the filter
+            batch_size: New check-ins written per transaction
+            retention: Seconds a check-in is kept in the store
+            
+        Raises:
+            ValueError: If retention is shorter than the window
+        """
+        if retention < window:
+            raise ValueError(f"Retention must be at least the window ({window} s), got {retention}")
+        self.store = store
+        self.retention = retention
+        self.filter = RotatingBloomFilter(window, slices, capacity, error_rate)
+        self.batch_size = batch_size
+        self.stats = CheckInStats()
+        self._pending: List[Tuple[str, str, str, float]] = []
+        self._pending_keys: Set[Tuple[str, str]] = set()
+        self._lock = threading.RLock()
+        self._pruned_before: Optional[float] = None
+        
+        # Scans older than this (e.g. a replayed file) are left to the store
+        since = time.time() - window - self.filter.slice_seconds
+        for member_id, occurrence, recorded_at in store.check_ins_since(since):
+            self.filter.add(self._key(member_id, occurrence), recorded_at)
+
+    @staticmethod
+    def _key(member_id: str, occurrence: str) -> str:
+        """Filter key of a check-in."""
+        return f"{member_id}\x1f{occurrence}"
+
+    def check_in(
+        self,
+        member_id: str,
+        activity: str,
+        recorded_at: float,
+        occurrence: Optional[str] = None
+    ) -> bool:
+        """
+        Check a member in to a class occurrence, once.
+        
+        Args:
+            member_id: Member id
+            activity: Activity name
+            recorded_at: Unix timestamp of the scan
+            occurrence: Class occurrence (default: occurrence_key)
+            
+        Returns:
+            True for a new check-in (queued for the next flush), False for
+            a duplicate
+            
+        Raises:
+            ValueError: If member_id or activity is empty
+        """
+        member_id, activity = str(member_id).strip(), activity.strip()
+        if not member_id or not activity:
+            raise ValueError("Member id and activity cannot be empty")
+        occurrence = occurrence or occurrence_key(activity, recorded_at)
+        
+        with self._lock:
+            if self.filter.add(self._key(member_id, occurrence), recorded_at):
+                self.stats.filter_hits += 1
+                # A queued key is not in the store yet, so look in the queue first
+                if (member_id, occurrence) in self._pending_keys or self.store.has_check_in(member_id, occurrence):
+                    self.stats.duplicates += 1
+                    return False
+                self.stats.false_positives += 1
+            self._pending_keys.add((member_id, occurrence))
+            self._pending.append((member_id, occurrence, activity, recorded_at))
+            self.stats.checked_in += 1
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+            return True
+
+    def flush(self) -> int:
+        """
+        Prune the store's check-ins past their retention and write queued ones.
+        
+        Returns:
+            Number of check-ins written; queued check-ins the store already
+            had (e.g. recorded by another process) are counted as
+            duplicates instead
+        """
+        with self._lock:
+            oldest = self.filter.oldest_timestamp
+            if oldest is not None and oldest != self._pruned_before:
+                # The store outlives the filter, so a key in the filter is always in the store
+                self.store.prune_check_ins(oldest + self.filter.window - self.retention)
+                self._pruned_before = oldest
+            
+            pending, self._pending, self._pending_keys = self._pending, [], set()
+            recorded = self.store.record_check_ins(pending)
+            self.stats.checked_in -= len(pending) - recorded
+            self.stats.duplicates += len(pending) - recorded
+            return recorded
+
+    def close(self) -> None:
+        """Write any queued check-ins."""
+        self.flush()
+
+    def __enter__(self) -> "CheckInDeduplicator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
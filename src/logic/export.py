@@ -1,24 +1,328 @@
-"""Export utilities for session summaries."""
+"""Export utilities for session summaries and columnar data files."""
 
-from typing import List
+import gzip
+import importlib.util
+import io
+import os
+import secrets
+import stat
+import tempfile
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, List, Optional, Tuple
 
+try:
+    import zstandard
+except ImportError:  # Optional dependency, only needed for compression="zstd"
+    zstandard = None
 
-def export_text(path: str, lines: List[str]) -> None:
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Size of the buffer between the text encoder and the file
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# Lines joined into a single write call
+LINES_PER_WRITE = 4096
+
+COMPRESSIONS = (None, "gzip", "zstd")
+
+# Exports spooled for download stay in memory up to this size, then move to disk
+SPOOL_MAX_BYTES = 8 << 20
+
+# Columnar formats for export_table, by file suffix
+TABLE_FORMATS = ("parquet", "arrow", "csv")
+TABLE_SUFFIXES = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow", ".csv": "csv"}
+TABLE_MIME_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+    "csv": "text/csv",
+}
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Yield successive lists of up to size lines."""
+    iterator = iter(lines)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _compressed_writer(raw: BinaryIO, compression: Optional[str]) -> BinaryIO:
+    """Wrap a binary file in a compressing writer (or return it unchanged)."""
+    if compression is None:
+        return raw
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6)
+    if zstandard is None:
+        raise ImportError("zstd compression requires the 'zstandard' package")
+    return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+
+
+def export_text(
+    path: str,
+    lines: Iterable[str],
+    compression: Optional[str] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> None:
     """
     Export lines of text to a file.
     
+    Lines are streamed from any iterable (a list or a generator), so
+    memory use does not grow with the number of lines. The output is
+    written to a temporary file next to path and atomically renamed over
+    it once complete, so readers never see a partially written file.
+    
     Args:
         path: File path to write to
-        lines: List of strings to write (one per line)
-        
+        lines: Iterable of strings to write (one per line)
+        compression: None, "gzip" or "zstd" ("zstd" needs zstandard)
+        buffer_size: Bytes buffered before each write to disk
+    
     Raises:
-        IOError: If file cannot be written
+        ValueError: If compression is not supported
+        ImportError: If compression is "zstd" and zstandard is missing
+        IOError: If file cannot be written (the target is left untouched)
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression}. Choose from {list(COMPRESSIONS)}")
+    
+    with atomic_file(path, buffer_size) as raw:
+        binary = _compressed_writer(raw, compression)
+        f = io.TextIOWrapper(binary, encoding='utf-8', write_through=True)
+        for chunk in _chunks(lines, LINES_PER_WRITE):
+            f.write('\n'.join(chunk))
+            f.write('\n')
+        if binary is raw:
+            f.detach()
+        else:
+            f.close()  # Writes the compressed stream's trailer
+
+
+# Attempts at a fresh temporary file name before giving up
+_TEMP_NAME_ATTEMPTS = 100
+
+
+def _create_temp_file(file_path: Path) -> Tuple[int, str]:
+    """
+    Create an empty temporary file next to file_path, like mkstemp.
+    
+    Unlike mkstemp (always 0600), the file is created with mode 0666 less
+    the process umask, exactly as open() would create file_path itself.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(_TEMP_NAME_ATTEMPTS):
+        temp_path = str(file_path.parent / f".{file_path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(temp_path, flags, 0o666), temp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No free temporary file name next to {file_path}")
+
+
+@contextmanager
+def atomic_file(path: str, buffer_size: int = DEFAULT_BUFFER_SIZE, mode: Optional[int] = None) -> Iterator[BinaryIO]:
+    """
+    Open a temporary file next to path that replaces it once the block succeeds.
+    
+    The file is flushed and fsynced before the rename. If the block
+    raises, the temporary file is removed and path is left untouched.
+    
+    Args:
+        path: File to write
+        buffer_size: Bytes buffered before each write to disk
+        mode: Permission bits for the file; by default a replaced file
+            keeps its own and a new one gets open()'s (0666 less the umask)
     """
     file_path = Path(path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        for line in lines:
-            f.write(line + '\n')
+    fd, temp_path = _create_temp_file(file_path)
+    try:
+        with open(fd, 'wb', buffering=buffer_size) as raw:
+            yield raw
+            raw.flush()
+            os.fsync(raw.fileno())
+        if mode is None:
+            try:
+                mode = stat.S_IMODE(os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                pass
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def _pyarrow():
+    """
+    Import pyarrow and its writers on first use, or return None if missing.
+    
+    pyarrow is optional (only Parquet and Arrow files need it) and slow to
+    import, so it is not imported with this module, which the CLI and the
+    reminder outbox load at startup.
+    """
+    try:
+        import pyarrow
+        import pyarrow.csv
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def table_formats() -> List[str]:
+    """Columnar formats available here (Parquet and Arrow need pyarrow; checked without importing it)."""
+    if importlib.util.find_spec("pyarrow") is None:
+        return ["csv"]
+    return list(TABLE_FORMATS)
+
+
+def table_format(path: str, fmt: Optional[str] = None) -> str:
+    """
+    Determine the columnar format of a file.
+    
+    Args:
+        path: File path
+        fmt: Explicit format, if given
+        
+    Returns:
+        "parquet", "arrow" or "csv"
+        
+    Raises:
+        ValueError: If the format is not supported or cannot be detected
+    """
+    fmt = fmt or TABLE_SUFFIXES.get(Path(path).suffix.lower())
+    if fmt not in TABLE_FORMATS:
+        raise ValueError(f"Unsupported table format for {path}. Choose from {list(TABLE_FORMATS)}")
+    return fmt
+
+
+def write_table(f: BinaryIO, chunks: Iterable["pd.DataFrame"], fmt: str) -> int:
+    """
+    Write DataFrame chunks to a binary file as one table.
+    
+    Each chunk is converted to Arrow columns and written as it arrives:
+    a row group in Parquet, a record batch in Arrow IPC, a block of rows
+    in CSV. Only one chunk is held at a time, and no per-row strings are
+    built in Python. Every chunk must have the columns and types of the
+    first one.
+    
+    Args:
+        f: Binary file open for writing
+        chunks: DataFrames to write, in order (at least one, possibly empty)
+        fmt: "parquet", "arrow" or "csv"
+        
+    Returns:
+        Number of rows written
+        
+    Raises:
+        ValueError: If the format is not supported or there are no chunks
+        ImportError: If Parquet or Arrow is requested and pyarrow is missing
+    """
+    if fmt not in TABLE_FORMATS:
+        raise ValueError(f"Unsupported table format: {fmt}. Choose from {list(TABLE_FORMATS)}")
+    pyarrow = _pyarrow()
+    if pyarrow is None:
+        if fmt != "csv":
+            raise ImportError(f"{fmt.title()} exports require the 'pyarrow' package")
+        return _write_csv_pandas(f, chunks)
+    
+    rows, writer = 0, None
+    try:
+        for chunk in chunks:
+            table = pyarrow.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                if fmt == "parquet":
+                    writer = pyarrow.parquet.ParquetWriter(f, table.schema)
+                elif fmt == "arrow":
+                    writer = pyarrow.ipc.new_file(f, table.schema)
+                else:
+                    writer = pyarrow.csv.CSVWriter(f, table.schema)
+            writer.write_table(table)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError("No chunks to write")
+    return rows
+
+
+def _write_csv_pandas(f: BinaryIO, chunks: Iterable["pd.DataFrame"]) -> int:
+    """CSV fallback without pyarrow: pandas' C writer, one chunk at a time."""
+    rows, header = 0, True
+    text = io.TextIOWrapper(f, encoding="utf-8", newline="", write_through=True)
+    try:
+        for chunk in chunks:
+            chunk.to_csv(text, header=header, index=False)
+            rows += len(chunk)
+            header = False
+    finally:
+        text.detach()
+    if header:
+        raise ValueError("No chunks to write")
+    return rows
+
+
+def export_table(
+    path: str,
+    chunks: Iterable["pd.DataFrame"],
+    fmt: Optional[str] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> int:
+    """
+    Export DataFrame chunks to a Parquet, Arrow IPC or CSV file.
+    
+    Like export_text, the file is written through a temporary file that
+    is atomically renamed over path once complete.
+    
+    Args:
+        path: File path to write to
+        chunks: DataFrames to write, in order (see write_table)
+        fmt: "parquet", "arrow" or "csv" (default: from the file suffix)
+        buffer_size: Bytes buffered before each write to disk
+        
+    Returns:
+        Number of rows written
+        
+    Raises:
+        ValueError: If the format is not supported or there are no chunks
+        ImportError: If Parquet or Arrow is requested and pyarrow is missing
+        IOError: If file cannot be written (the target is left untouched)
+    """
+    fmt = table_format(path, fmt)
+    with atomic_file(path, buffer_size) as raw:
+        return write_table(raw, chunks, fmt)
+
 
+def spool_table(chunks: Iterable["pd.DataFrame"], fmt: str, max_size: int = SPOOL_MAX_BYTES) -> BinaryIO:
+    """
+    Write DataFrame chunks to a spooled temporary file, e.g. for a download.
+    
+    The file stays in memory up to max_size bytes and then rolls over to
+    disk, so a large export never needs the whole payload in memory while
+    it is written.
+    
+    Args:
+        chunks: DataFrames to write, in order (see write_table)
+        fmt: "parquet", "arrow" or "csv"
+        max_size: Bytes kept in memory before rolling over to disk
+        
+    Returns:
+        The file, positioned at the start; closing it deletes it
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=max_size)
+    try:
+        write_table(spool, chunks, fmt)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
@@ -0,0 +1,309 @@
+"""Batch attendance forecasting for class slots.
+
+fit_holt_winters fits additive Holt-Winters models (level, trend and a
+seasonal cycle) to many series at once. The series are the rows of one
+matrix, and the smoothing parameters are picked per series from a small
+grid. That grid is one more axis of the same arrays, so fitting is a
+single pass over time with NumPy operations across every
+(series, parameter) pair. There is no loop per series.
+
+class_history turns timestamped attendance entries into one weekly
+series per class slot of the schedule (e.g. "Yoga Flow - 6:00 AM" on
+Mondays). forecast_classes fits those series and predicts attendance for
+the coming weeks, to staff instructors and cap class sizes.
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from dateutil.tz import tzlocal
+
+from src.logic.schedule import MINUTES_PER_DAY, ClassSlot, ScheduleIndex, format_time
+
+# Seasonal cycle of weekly class series, in weeks (roughly a month: pay
+# days, month-start resolutions)
+SEASON_WEEKS = 4
+
+# Smoothing parameter grid searched per series
+ALPHAS = (0.1, 0.3, 0.5, 0.8)
+BETAS = (0.0, 0.05, 0.2)
+GAMMAS = (0.05, 0.2, 0.5)
+
+# Check-ins within this many minutes of a class start count for that class
+MATCH_MINUTES = 90
+
+# z-score of the one-sided 80% upper bound reported next to each forecast
+UPPER_Z = 1.2816
+
+# 1970-01-01 was a Thursday; shifting day numbers by 3 puts weeks on Mondays
+_EPOCH_WEEKDAY = 3
+
+
+def _nanmean(values: np.ndarray) -> np.ndarray:
+    """Mean over the last axis ignoring NaN (0 where everything is NaN)."""
+    observed = ~np.isnan(values)
+    return np.where(observed, values, 0.0).sum(axis=-1) / np.maximum(observed.sum(axis=-1), 1)
+
+
+@dataclass
+class HoltWinters:
+    """Fitted additive Holt-Winters models, one per series (row)."""
+    
+    level: np.ndarray
+    trend: np.ndarray
+    season: np.ndarray
+    alpha: np.ndarray
+    beta: np.ndarray
+    gamma: np.ndarray
+    rmse: np.ndarray
+    observations: np.ndarray
+    steps: int
+
+    def __len__(self) -> int:
+        """Number of fitted series."""
+        return len(self.level)
+
+    def forecast(self, horizon: int) -> np.ndarray:
+        """
+        Forecast every series.
+        
+        Args:
+            horizon: Number of steps ahead
+            
+        Returns:
+            Array of shape (series, horizon); NaN for series without any
+            observations
+            
+        Raises:
+            ValueError: If horizon is negative
+        """
+        if horizon < 0:
+            raise ValueError(f"Horizon must be non-negative, got {horizon}")
+        ahead = np.arange(1, horizon + 1)
+        phase = (self.steps + ahead - 1) % self.season.shape[1]
+        forecast = self.level[:, None] + self.trend[:, None] * ahead + self.season[:, phase]
+        forecast[self.observations == 0] = np.nan
+        return forecast
+
+
+def fit_holt_winters(
+    series: np.ndarray,
+    season_length: int = SEASON_WEEKS,
+    alphas: Sequence[float] = ALPHAS,
+    betas: Sequence[float] = BETAS,
+    gammas: Sequence[float] = GAMMAS
+) -> HoltWinters:
+    """
+    Fit additive Holt-Winters models to every row of a matrix at once.
+    
+    NaN marks a missing observation. Leading NaNs mean the series had not
+    started yet: its states start from its first two observed seasons.
+    Later NaNs are skipped by letting the model run on its own forecast.
+    The parameters minimizing each series' one-step-ahead squared error
+    are kept.
+    
+    Args:
+        series: Array of shape (series, steps), or one series
+        season_length: Steps per seasonal cycle (1 disables seasonality,
+            giving Holt's linear trend)
+        alphas: Level smoothing candidates
+        betas: Trend smoothing candidates
+        gammas: Seasonal smoothing candidates
+        
+    Returns:
+        HoltWinters with the final states and chosen parameters per series
+        
+    Raises:
+        ValueError: If there are no steps, the season length is not
+            positive or a parameter grid is empty
+    """
+    y = np.atleast_2d(np.asarray(series, dtype=np.float64))
+    count, steps = y.shape
+    if steps == 0:
+        raise ValueError("Series must have at least one step")
+    if season_length < 1:
+        raise ValueError(f"Season length must be positive, got {season_length}")
+    if season_length == 1:
+        gammas = (0.0,)
+    if not (alphas and betas and gammas):
+        raise ValueError("Parameter grids must not be empty")
+    m = season_length
+    
+    grid = np.array(list(itertools.product(alphas, betas, gammas)), dtype=np.float64)
+    alpha, beta, gamma = grid.T
+    
+    # Initial states from each series' first two seasons after its first observation
+    observed = ~np.isnan(y)
+    first = np.where(observed.any(axis=1), observed.argmax(axis=1), steps)
+    window = first[:, None] + np.arange(2 * m)
+    values = np.take_along_axis(y, np.minimum(window, steps - 1), axis=1)
+    values[window >= steps] = np.nan
+    first_mean, second_mean = _nanmean(values[:, :m]), _nanmean(values[:, m:])
+    has_second = ~np.isnan(values[:, m:]).all(axis=1)
+    
+    level = np.repeat(first_mean[:, None], len(grid), axis=1)
+    trend = np.repeat(np.where(has_second, (second_mean - first_mean) / m, 0.0)[:, None], len(grid), axis=1)
+    initial_season = np.zeros((count, m))
+    if m > 1:
+        offsets = np.nan_to_num(values[:, :m] - first_mean[:, None])
+        np.put_along_axis(initial_season, window[:, :m] % m, offsets, axis=1)
+    season = np.repeat(initial_season[:, None, :], len(grid), axis=1)
+    sse = np.zeros((count, len(grid)))
+    
+    for t in range(steps):
+        active = (t >= first)[:, None]
+        actual = y[:, t, None]
+        current = season[:, :, t % m]
+        predicted = level + trend + current
+        error = np.where(np.isnan(actual) | ~active, 0.0, actual - predicted)
+        sse += error * error
+        actual = predicted + error
+        
+        new_level = alpha * (actual - current) + (1 - alpha) * (level + trend)
+        trend = np.where(active, beta * (new_level - level) + (1 - beta) * trend, trend)
+        season[:, :, t % m] = np.where(active, gamma * (actual - new_level) + (1 - gamma) * current, current)
+        level = np.where(active, new_level, level)
+    
+    best = sse.argmin(axis=1)
+    rows = np.arange(count)
+    observations = observed.sum(axis=1)
+    return HoltWinters(
+        level=level[rows, best],
+        trend=trend[rows, best],
+        season=season[rows, best],
+        alpha=alpha[best],
+        beta=beta[best],
+        gamma=gamma[best],
+        rmse=np.sqrt(sse[rows, best] / np.maximum(observations, 1)),
+        observations=observations,
+        steps=steps,
+    )
+
+
+def _local_weeks(recorded_at: np.ndarray, tz) -> Tuple[np.ndarray, np.ndarray]:
+    """Local (week number, minute of the week) of Unix timestamps; weeks start on Monday."""
+    local = pd.to_datetime(recorded_at, unit="s", utc=True).tz_convert(tz).tz_localize(None)
+    minutes = local.to_numpy().astype("datetime64[m]").astype(np.int64)
+    days, minute = np.divmod(minutes, MINUTES_PER_DAY)
+    weeks, weekday = np.divmod(days + _EPOCH_WEEKDAY, 7)
+    return weeks, weekday * MINUTES_PER_DAY + minute
+
+
+def class_history(
+    entries: Iterable[Tuple[str, int, float]],
+    schedule: Dict[str, List[str]],
+    weeks: int = 26,
+    now: Optional[float] = None,
+    tz=None
+) -> Tuple[List[ClassSlot], np.ndarray]:
+    """
+    Weekly attendance per class slot over the last complete weeks.
+    
+    An entry counts for a slot when its activity is the class name
+    (case-insensitive) and it was recorded on the class's day within
+    MATCH_MINUTES of its start (the nearest slot wins).
+    
+    Args:
+        entries: (activity, count, recorded_at) tuples, e.g. from
+            SQLiteAttendanceStore.entries()
+        schedule: Dictionary mapping days to lists of class strings
+        weeks: Number of complete weeks before the current one
+        now: Timestamp defining the current week (default: now)
+        tz: Time zone for days and times (default: local)
+        
+    Returns:
+        (slots in time-of-week order, array of shape (slots, weeks)).
+        Weeks before a slot's first recorded check-in are NaN; later weeks
+        without check-ins are 0.
+        
+    Raises:
+        ValueError: If weeks is not positive or the schedule cannot be parsed
+    """
+    if weeks <= 0:
+        raise ValueError(f"Weeks must be greater than 0, got {weeks}")
+    tz = tz if tz is not None else tzlocal()
+    slots = list(ScheduleIndex.from_schedule(schedule))
+    history = np.full((len(slots), weeks), np.nan)
+    rows = list(entries)
+    if not rows or not slots:
+        return slots, history
+    
+    activities, counts, recorded_at = zip(*rows)
+    entry_weeks, entry_minutes = _local_weeks(np.asarray(recorded_at, dtype=np.float64), tz)
+    checkins = pd.DataFrame({
+        "key": pd.Series(activities, dtype=object).str.strip().str.casefold().astype(object),
+        "minute": entry_minutes,
+        "week": entry_weeks,
+        "count": np.asarray(counts, dtype=np.int64),
+    }).sort_values("minute", kind="stable")
+    classes = pd.DataFrame({
+        "key": pd.Series([slot.name.casefold() for slot in slots], dtype=object),
+        "minute": np.array([slot.week_minute for slot in slots], dtype=np.int64),
+        "slot": np.arange(len(slots)),
+    })
+    matched = pd.merge_asof(
+        checkins, classes, on="minute", by="key", direction="nearest", tolerance=MATCH_MINUTES
+    ).dropna(subset=["slot"])
+    # Tolerance may reach across midnight into another day's class
+    slot = matched["slot"].to_numpy(dtype=np.int64)
+    slot_day = classes["minute"].to_numpy()[slot] // MINUTES_PER_DAY
+    same_day = matched["minute"].to_numpy() // MINUTES_PER_DAY == slot_day
+    slot, week, count = slot[same_day], matched["week"].to_numpy()[same_day], matched["count"].to_numpy()[same_day]
+    
+    current = int(_local_weeks(np.array([pd.Timestamp.now().timestamp() if now is None else now]), tz)[0][0])
+    start = current - weeks
+    started = np.full(len(slots), current, dtype=np.int64)
+    np.minimum.at(started, slot, week)
+    
+    history[np.arange(weeks) + start >= started[:, None]] = 0.0
+    in_window = (week >= start) & (week < current)
+    np.add.at(history, (slot[in_window], week[in_window] - start), count[in_window])
+    return slots, history
+
+
+def forecast_classes(
+    entries: Iterable[Tuple[str, int, float]],
+    schedule: Dict[str, List[str]],
+    weeks_ahead: int = 4,
+    history_weeks: int = 26,
+    season_length: int = SEASON_WEEKS,
+    now: Optional[float] = None,
+    tz=None
+) -> pd.DataFrame:
+    """
+    Forecast attendance of every class slot for the coming weeks.
+    
+    Args:
+        entries: (activity, count, recorded_at) tuples
+        schedule: Dictionary mapping days to lists of class strings
+        weeks_ahead: Weeks to forecast, starting with the current one
+        history_weeks: Complete weeks of history to fit
+        season_length: Seasonal cycle in weeks (1 for none)
+        now: Timestamp defining the current week (default: now)
+        tz: Time zone for days and times (default: local)
+        
+    Returns:
+        DataFrame with Week (Monday's date), Day, Time, Class, Forecast
+        and Upper (80% upper bound), one row per slot and week. Forecasts
+        are NaN for slots without history.
+    """
+    tz = tz if tz is not None else tzlocal()
+    now = pd.Timestamp.now().timestamp() if now is None else now
+    slots, history = class_history(entries, schedule, history_weeks, now, tz)
+    model = fit_holt_winters(history, season_length)
+    forecast = np.maximum(model.forecast(weeks_ahead), 0.0)
+    upper = forecast + UPPER_Z * model.rmse[:, None] * np.sqrt(np.arange(1, weeks_ahead + 1))
+    
+    current = int(_local_weeks(np.array([now]), tz)[0][0])
+    mondays = ((np.arange(weeks_ahead) + current) * 7 - _EPOCH_WEEKDAY).astype("datetime64[D]")
+    return pd.DataFrame({
+        "Week": np.repeat(mondays, len(slots)),
+        "Day": [slot.day.title() for slot in slots] * weeks_ahead,
+        "Time": [format_time(slot.start_minute) for slot in slots] * weeks_ahead,
+        "Class": [slot.name for slot in slots] * weeks_ahead,
+        "Forecast": forecast.T.ravel(),
+        "Upper": upper.T.ravel(),
+    })
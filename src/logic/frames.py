@@ -0,0 +1,289 @@
+"""DataFrame builders for dashboard tables and charts."""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterator, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.logic.attendance_compact import ActivityCounts, CompactAttendanceStore
+
+# Rows per DataFrame chunk handed to export_table (one Parquet row group each)
+EXPORT_CHUNK_ROWS = 65_536
+
+# Activity table defaults: rows per page and bars before the rest become "Other"
+PAGE_SIZE = 25
+TOP_ACTIVITIES = 15
+
+SORT_COLUMNS = ("Count", "Activity")
+
+# Filtered orders and page slices kept per ActivityTable
+VIEW_CACHE_SIZE = 64
+
+
+def _activity_columns(by_activity: Mapping[str, int]):
+    """
+    Activity names and counts of a mapping, as two columns.
+    
+    ActivityCounts (from CompactAttendanceStore or SQLiteAttendanceStore)
+    already holds both columns as arrays and is returned as-is, so the
+    frames below wrap them without copying; any other mapping is copied
+    into lists.
+    """
+    if isinstance(by_activity, ActivityCounts):
+        return by_activity.names, by_activity.counts
+    return list(by_activity.keys()), list(by_activity.values())
+
+
+def attendance_frame(by_activity: Mapping[str, int]) -> pd.DataFrame:
+    """
+    Build the attendance table shown on the dashboard.
+    
+    Args:
+        by_activity: Mapping of activity names to counts
+        
+    Returns:
+        DataFrame with "Activity" and "Count" columns, one row per activity
+    """
+    activities, counts = _activity_columns(by_activity)
+    return pd.DataFrame({
+        "Activity": pd.Series(activities, dtype=object, copy=False),
+        "Count": pd.Series(counts, dtype="int64", copy=False)
+    }, copy=False)
+
+
+def attendance_chart_frame(by_activity: Mapping[str, int]) -> pd.DataFrame:
+    """
+    Build the attendance bar chart data shown on the dashboard.
+    
+    Args:
+        by_activity: Mapping of activity names to counts
+        
+    Returns:
+        DataFrame of counts indexed by activity name
+    """
+    activities, counts = _activity_columns(by_activity)
+    index = pd.Index(activities, dtype=object, copy=False, name="Activity")
+    return pd.DataFrame({"Count": pd.Series(counts, index=index, dtype="int64", copy=False)}, copy=False)
+
+
+class ActivityTable:
+    """
+    Filtered, sorted and paginated views of attendance by activity.
+    
+    Built once per version of the data (see
+    SQLiteAttendanceStore.version), so that the dashboard sends the
+    browser one page of rows and a top-N chart instead of every activity.
+    Sort orders, filter results and page slices are cached (least
+    recently used first out) and shared between sessions; the cache is
+    safe to use from several threads.
+    """
+
+    def __init__(self, by_activity: Mapping[str, int]):
+        """
+        Wrap a snapshot of attendance by activity.
+        
+        Args:
+            by_activity: Mapping of activity names to counts (not copied if
+                it is an ActivityCounts snapshot; must not change afterwards)
+        """
+        names, counts = _activity_columns(by_activity)
+        self.names = np.asarray(names, dtype=object)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self._lock = threading.Lock()
+        self._views: "OrderedDict[Tuple, object]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of activities."""
+        return len(self.counts)
+
+    @property
+    def total(self) -> int:
+        """Total attendance across all activities."""
+        return int(self.counts.sum())
+
+    def _cached(self, key: Tuple, build: Callable[[], object]):
+        """Return a derived view, building it on first use."""
+        with self._lock:
+            if key in self._views:
+                self._views.move_to_end(key)
+                return self._views[key]
+        view = build()
+        with self._lock:
+            self._views[key] = view
+            if len(self._views) > VIEW_CACHE_SIZE:
+                self._views.popitem(last=False)
+        return view
+
+    def _sorted(self, sort_by: str, descending: bool) -> np.ndarray:
+        """Row order for a sort; ties (and names) in alphabetical order."""
+        by_name = self._cached(("order", "Activity"), lambda: np.argsort(self.names, kind="stable"))
+        if sort_by == "Activity":
+            return by_name[::-1] if descending else by_name
+        counts = self.counts[by_name]
+        return by_name[np.argsort(-counts if descending else counts, kind="stable")]
+
+    def rows(self, search: str = "", sort_by: str = "Count", descending: bool = True) -> np.ndarray:
+        """
+        Positions of the matching activities, in display order.
+        
+        Args:
+            search: Case-insensitive substring of the activity name ("" for all)
+            sort_by: "Count" or "Activity"
+            descending: Largest count (or last name) first
+            
+        Returns:
+            Integer positions into names and counts
+            
+        Raises:
+            ValueError: If sort_by is not a column
+        """
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort by {sort_by!r}; use one of {list(SORT_COLUMNS)}")
+        search = search.strip().casefold()
+
+        def build():
+            order = self._cached(("order", sort_by, descending), lambda: self._sorted(sort_by, descending))
+            if not search:
+                return order
+            folded = self._cached(("casefold",), lambda: [name.casefold() for name in self.names.tolist()])
+            matches = np.fromiter((search in name for name in folded), dtype=bool, count=len(folded))
+            return order[matches[order]]
+        return self._cached(("rows", search, sort_by, descending), build)
+
+    def page(
+        self,
+        page: int,
+        page_size: int = PAGE_SIZE,
+        search: str = "",
+        sort_by: str = "Count",
+        descending: bool = True
+    ) -> pd.DataFrame:
+        """
+        One page of the table.
+        
+        Args:
+            page: Page number, from 1 (past the last page gives no rows)
+            page_size: Rows per page
+            search: Case-insensitive substring of the activity name
+            sort_by: "Count" or "Activity"
+            descending: Largest count (or last name) first
+            
+        Returns:
+            DataFrame with "Activity" and "Count" columns, indexed by the
+            1-based position in the filtered, sorted table
+            
+        Raises:
+            ValueError: If page or page_size is not positive, or sort_by is
+                not a column
+        """
+        if page <= 0 or page_size <= 0:
+            raise ValueError(f"Page and page size must be greater than 0, got {page} and {page_size}")
+
+        def build():
+            start = (page - 1) * page_size
+            rows = self.rows(search, sort_by, descending)[start:start + page_size]
+            return pd.DataFrame(
+                {"Activity": self.names[rows], "Count": self.counts[rows]},
+                index=pd.RangeIndex(start + 1, start + 1 + len(rows))
+            )
+        return self._cached(("page", page, page_size, search.strip().casefold(), sort_by, descending), build)
+
+    def top_frame(self, n: int = TOP_ACTIVITIES, other: str = "Other") -> pd.DataFrame:
+        """
+        Bar chart data: the n most attended activities, then the rest as one bar.
+        
+        Args:
+            n: Activities shown on their own
+            other: Label of the remaining activities' bar, followed by
+                their number, e.g. "Other (1,204)"
+            
+        Returns:
+            DataFrame of counts indexed by activity, highest first and the
+            remainder last (at most n + 1 rows)
+        """
+        def build():
+            rows = self.rows()[:n]
+            names, counts = self.names[rows].tolist(), self.counts[rows].tolist()
+            rest = len(self) - len(rows)
+            if rest > 0:
+                names.append(f"{other} ({rest:,})")
+                counts.append(self.total - sum(counts))
+            index = pd.Index(names, dtype=object, name="Activity")
+            return pd.DataFrame({"Count": pd.Series(counts, index=index, dtype="int64")})
+        return self._cached(("top", n, other), build)
+
+
+def attendance_export_frame(by_activity: Mapping[str, int]) -> pd.DataFrame:
+    """
+    Build the attendance totals table for columnar exports.
+    
+    Args:
+        by_activity: Mapping of activity names to counts
+        
+    Returns:
+        DataFrame with "activity" and "count" columns (sharing memory with
+        an ActivityCounts)
+    """
+    return attendance_frame(by_activity).rename(columns={"Activity": "activity", "Count": "count"})
+
+
+def _history_frame(activity, counts, recorded_at) -> pd.DataFrame:
+    """One chunk of the attendance history export."""
+    # Unix seconds to microsecond timestamps; much faster than to_datetime(unit="s") on floats
+    micros = np.rint(np.asarray(recorded_at, dtype=np.float64) * 1e6).astype(np.int64)
+    return pd.DataFrame({
+        "activity": activity,
+        "count": np.asarray(counts, dtype=np.int64),
+        "recorded_at": pd.DatetimeIndex(micros.view("datetime64[us]")).tz_localize("UTC"),
+    })
+
+
+def attendance_history_frames(store, rows: int = EXPORT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Stream a store's entry history as DataFrame chunks, for export_table.
+    
+    A CompactAttendanceStore's history columns are sliced directly, with
+    activities as a categorical over the store's interned names. A
+    SQLiteAttendanceStore is read in id order, rows entries per query.
+    
+    Args:
+        store: CompactAttendanceStore or SQLiteAttendanceStore
+        rows: Entries per chunk
+        
+    Yields:
+        DataFrames with "activity", "count" and "recorded_at" (UTC
+        timestamp) columns; a single empty one if there is no history
+        
+    Raises:
+        ValueError: If rows is not positive or the store keeps no history
+    """
+    if rows <= 0:
+        raise ValueError(f"Rows must be greater than 0, got {rows}")
+    
+    if isinstance(store, CompactAttendanceStore):
+        history = store.history()
+        names = pd.Index(history["names"], dtype=object)
+        total = len(history["count"])
+        for start in range(0, max(total, 1), rows):
+            stop = min(start + rows, total)
+            yield _history_frame(
+                pd.Categorical.from_codes(history["activity_id"][start:stop], categories=names),
+                history["count"][start:stop],
+                history["recorded_at"][start:stop]
+            )
+        return
+    
+    if not hasattr(store, "entries_since"):
+        raise ValueError(f"{type(store).__name__} does not keep an entry history")
+    cursor, empty = 0, True
+    while True:
+        _, entries = store.entries_since(cursor, rows)
+        if not entries:
+            break
+        ids, activities, counts, recorded_at = zip(*entries)
+        yield _history_frame(pd.Series(activities, dtype="str"), counts, recorded_at)
+        cursor, empty = ids[-1], False
+    if empty:
+        yield _history_frame(pd.Series([], dtype="str"), [], [])
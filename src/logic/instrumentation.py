@@ -0,0 +1,214 @@
+"""Lightweight timing and counter hooks for hot paths.
+
+Instrumentation is off by default. While disabled, timed() returns a shared
+no-op context manager and start_timer()/count() return after a single
+flag check, so hooks can stay in place on hot paths.
+
+Usage:
+    with timed("logic.pricing"):
+        price_membership(...)
+
+    started = start_timer()
+    ...  # code that cannot easily be indented into a with block
+    stop_timer("page.Home", started)
+"""
+
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
+# Histogram buckets are powers of two in microseconds: bucket i holds
+# durations below 2**i microseconds (bucket 0 is "under 1 us").
+NUM_BUCKETS = 32
+
+_enabled = False
+_lock = threading.Lock()
+_timers: Dict[str, "LatencyHistogram"] = {}
+_counters: Dict[str, int] = {}
+_NULL_CONTEXT = nullcontext()
+
+
+class LatencyHistogram:
+    """Log2-bucketed latency histogram with count, total, min and max."""
+
+    def __init__(self):
+        """Create an empty histogram."""
+        self.buckets: List[int] = [0] * NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one duration.
+        
+        Args:
+            seconds: Duration in seconds
+        """
+        bucket = min(int(seconds * 1e6).bit_length(), NUM_BUCKETS - 1)
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile from the buckets.
+        
+        Args:
+            fraction: Percentile as a fraction (0.95 for p95)
+            
+        Returns:
+            Upper bound in seconds of the bucket holding the percentile,
+            capped at the largest recorded duration
+        """
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bucket, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= target:
+                return min((1 << bucket) / 1e6, self.max)
+        return self.max
+
+
+class _Timer:
+    """Context manager that records its duration into a named histogram."""
+    
+    __slots__ = ("name", "started")
+
+    def __init__(self, name: str):
+        """Create a timer for the named histogram."""
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self) -> "_Timer":
+        """Start timing."""
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop timing and record the duration."""
+        record(self.name, time.perf_counter() - self.started)
+
+
+def enable(flag: bool = True) -> None:
+    """Turn instrumentation on (or off with flag=False)."""
+    global _enabled
+    _enabled = flag
+
+
+def is_enabled() -> bool:
+    """Whether instrumentation is currently on."""
+    return _enabled
+
+
+def timed(name: str):
+    """
+    Time a block of code.
+    
+    Args:
+        name: Timer name, e.g. "logic.pricing" or "page.Attendance"
+        
+    Returns:
+        Context manager recording the block's duration (a shared no-op
+        when instrumentation is disabled)
+    """
+    if not _enabled:
+        return _NULL_CONTEXT
+    return _Timer(name)
+
+
+def start_timer() -> Optional[float]:
+    """Start a manual timer; returns None when instrumentation is disabled."""
+    return time.perf_counter() if _enabled else None
+
+
+def stop_timer(name: str, started: Optional[float]) -> None:
+    """
+    Stop a timer returned by start_timer and record its duration.
+    
+    Args:
+        name: Timer name
+        started: Value returned by start_timer (None is ignored)
+    """
+    if started is not None:
+        record(name, time.perf_counter() - started)
+
+
+def record(name: str, seconds: float) -> None:
+    """Record a duration for a named timer."""
+    with _lock:
+        histogram = _timers.get(name)
+        if histogram is None:
+            histogram = _timers[name] = LatencyHistogram()
+        histogram.record(seconds)
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Increment a named counter (no-op when disabled)."""
+    if _enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + amount
+
+
+def snapshot() -> Dict:
+    """
+    Get a copy of all timers and counters.
+    
+    Returns:
+        {"timers": {name: {"count", "total", "mean", "min", "p50", "p95",
+        "p99", "max", "buckets"}}, "counters": {name: int}}; durations are
+        in seconds
+    """
+    with _lock:
+        timers = {
+            name: {
+                "count": h.count,
+                "total": h.total,
+                "mean": h.mean,
+                "min": h.min if h.count else 0.0,
+                "p50": h.percentile(0.50),
+                "p95": h.percentile(0.95),
+                "p99": h.percentile(0.99),
+                "max": h.max,
+                "buckets": list(h.buckets),
+            }
+            for name, h in _timers.items()
+        }
+        return {"timers": timers, "counters": dict(_counters)}
+
+
+def reset() -> None:
+    """Discard all recorded timers and counters."""
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+
+
+def report_lines() -> List[str]:
+    """
+    Format the current timers and counters as text.
+    
+    Returns:
+        Lines of a fixed-width report (times in milliseconds)
+    """
+    data = snapshot()
+    lines = [f"{'timer':<28}{'count':>8}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+    for name, t in sorted(data["timers"].items()):
+        lines.append(
+            f"{name:<28}{t['count']:>8}{t['mean'] * 1e3:>10.3f}{t['p50'] * 1e3:>10.3f}"
+            f"{t['p95'] * 1e3:>10.3f}{t['p99'] * 1e3:>10.3f}{t['max'] * 1e3:>10.3f}"
+        )
+    for name, value in sorted(data["counters"].items()):
+        lines.append(f"{name:<28}{value:>8}")
+    return lines
@@ -0,0 +1,329 @@
+"""Member registry: lookup by id or name and prefix autocomplete.
+
+MemberRegistry keeps members sorted by id, so an id is found by bisection,
+and a sorted list of normalized name keys (the full name and the rest of
+the name from each later word, so "Ana Smith" is found by "an" and by
+"smi") with the member each key belongs to. Autocomplete bisects to the
+first key with the typed prefix and walks forward, so a lookup touches
+only the matching keys however many members there are.
+
+The registry is saved as a compact snapshot: a fixed header, then one
+zlib-compressed body holding the ids, names and sorted keys as
+newline-separated text and the key-to-member rows as a uint32 array.
+Loading splits those sections back into lists; nothing is sorted or
+re-normalized at startup.
+"""
+
+import os
+import struct
+import sys
+import unicodedata
+import zlib
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from src.logic.export import atomic_file
+from src.logic.records import MalformedRecord, record_fields
+
+# Default snapshot location, overridable with the MEMBER_REGISTRY environment variable
+DEFAULT_SNAPSHOT_PATH = Path(__file__).resolve().parents[2] / "data" / "members.idx"
+
+# Suggestions returned by complete() unless a limit is given
+DEFAULT_SUGGESTIONS = 10
+
+# magic, format version, members, keys, then byte lengths of the ids,
+# names and keys sections of the decompressed body
+_HEADER = struct.Struct("<4sHxxIIIII")
+_MAGIC = b"FCMR"
+_VERSION = 1
+
+# Apostrophes are dropped ("O'Neil" -> "oneil"); other punctuation splits words
+_DROPPED = dict.fromkeys(map(ord, "'’`"))
+
+
+class Member(NamedTuple):
+    """A registered member."""
+    id: str
+    name: str
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for lookup: case-folded, accents removed, words separated by single spaces.
+    
+    Args:
+        name: Name as typed or registered
+        
+    Returns:
+        Normalized name ("" if nothing is left)
+    """
+    decomposed = unicodedata.normalize("NFKD", name.translate(_DROPPED).casefold())
+    letters = "".join(c if c.isalnum() else " " for c in decomposed if not unicodedata.combining(c))
+    return " ".join(letters.split())
+
+
+def member_entry(record: Dict) -> Member:
+    """
+    Clean a member record (id, name) for the registry.
+    
+    Args:
+        record: Member record with "id" and "name"
+        
+    Returns:
+        Member with the id stripped and whitespace in the name collapsed
+        
+    Raises:
+        ValueError: If the id is empty or contains a line break, or the
+            name has no letters or digits
+    """
+    member_id = str(record.get("id") or "").strip()
+    name = " ".join(str(record.get("name") or "").split())
+    if not member_id:
+        raise ValueError("Member id cannot be empty")
+    if "\n" in member_id or "\r" in member_id:
+        raise ValueError(f"Member id {member_id!r} cannot contain line breaks")
+    if not normalize_name(name):
+        raise ValueError(f"Member {member_id} has no name")
+    return Member(member_id, name)
+
+
+def _name_keys(name: str) -> List[str]:
+    """Lookup keys of a name: the normalized name from each of its words on."""
+    words = normalize_name(name).split(" ")
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class MemberRegistry:
+    """
+    Members indexed by id and by normalized name, with prefix autocomplete.
+    
+    The registry is read-only once built; build a new one (or load a new
+    snapshot) to pick up membership changes.
+    """
+
+    def __init__(self, members: Iterable[Member] = ()):
+        """
+        Index members.
+        
+        Args:
+            members: Members (see member_entry), in any order
+            
+        Raises:
+            ValueError: If two members share an id
+        """
+        ordered = sorted(members)
+        for previous, member in zip(ordered, ordered[1:]):
+            if previous.id == member.id:
+                raise ValueError(f"Duplicate member id {member.id!r}")
+        entries = sorted((key, row) for row, member in enumerate(ordered) for key in _name_keys(member.name))
+        self._ids = [m.id for m in ordered]
+        self._names = [m.name for m in ordered]
+        self._keys = [key for key, _ in entries]
+        self._rows = array("I", [row for _, row in entries])
+
+    def __len__(self) -> int:
+        """Number of members."""
+        return len(self._ids)
+
+    def __contains__(self, member_id: str) -> bool:
+        """Whether a member id is registered."""
+        return self._row(member_id) is not None
+
+    def __iter__(self):
+        """Members in id order."""
+        return (Member(*m) for m in zip(self._ids, self._names))
+
+    def _row(self, member_id: str) -> Optional[int]:
+        """Position of a member id, or None if it is not registered."""
+        row = bisect_left(self._ids, member_id)
+        return row if row < len(self._ids) and self._ids[row] == member_id else None
+
+    def get(self, member_id: str) -> Optional[Member]:
+        """
+        Look a member up by id.
+        
+        Args:
+            member_id: Member id (surrounding whitespace ignored)
+            
+        Returns:
+            The member, or None if the id is not registered
+        """
+        row = self._row(str(member_id).strip())
+        return None if row is None else Member(self._ids[row], self._names[row])
+
+    def complete(self, prefix: str, limit: Optional[int] = DEFAULT_SUGGESTIONS) -> List[Member]:
+        """
+        Members with a name, or a later part of it, starting with a prefix.
+        
+        Args:
+            prefix: Typed text, normalized like names ("smi" matches "Ana Smith")
+            limit: Maximum number of members (None for all)
+            
+        Returns:
+            Matching members, in order of the matched key, each once
+        """
+        key = normalize_name(prefix)
+        if not key or limit == 0:
+            return []
+        keys, rows = self._keys, self._rows
+        found: Dict[int, None] = {}
+        for i in range(bisect_left(keys, key), len(keys)):
+            if not keys[i].startswith(key):
+                break
+            found[rows[i]] = None
+            if len(found) == limit:
+                break
+        return [Member(self._ids[row], self._names[row]) for row in found]
+
+    def find(self, name: str) -> List[Member]:
+        """
+        Members whose normalized name equals that of a name.
+        
+        Args:
+            name: Full name, in any case or accenting
+            
+        Returns:
+            Matching members in id order (several members may share a name)
+        """
+        key = normalize_name(name)
+        if not key:
+            return []
+        keys, rows = self._keys, self._rows
+        matches = []
+        for i in range(bisect_left(keys, key), len(keys)):
+            if keys[i] != key:
+                break
+            row = rows[i]
+            if normalize_name(self._names[row]) == key:  # Not just the end of a longer name
+                matches.append(row)
+        return [Member(self._ids[row], self._names[row]) for row in sorted(matches)]
+
+    def lookup(self, query: str) -> Optional[Member]:
+        """
+        Resolve what a member typed: their id, or a name only they have.
+        
+        Args:
+            query: Member id or full name
+            
+        Returns:
+            The member, or None if the query is unknown or the name is shared
+        """
+        member = self.get(query)
+        if member is None:
+            matches = self.find(query)
+            member = matches[0] if len(matches) == 1 else None
+        return member
+
+    def save(self, path: Union[str, Path]) -> int:
+        """
+        Write the registry as a snapshot, atomically.
+        
+        Args:
+            path: Snapshot path (parent directories are created)
+            
+        Returns:
+            Size of the snapshot in bytes
+        """
+        sections = ["\n".join(values).encode("utf-8") for values in (self._ids, self._names, self._keys)]
+        rows = array("I", self._rows)
+        if sys.byteorder == "big":
+            rows.byteswap()
+        header = _HEADER.pack(_MAGIC, _VERSION, len(self._ids), len(self._keys), *(len(s) for s in sections))
+        body = zlib.compress(b"".join(sections) + rows.tobytes())
+        with atomic_file(str(path)) as f:
+            f.write(header)
+            f.write(body)
+        return len(header) + len(body)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "MemberRegistry":
+        """
+        Read a registry snapshot written by save().
+        
+        Args:
+            path: Snapshot path
+            
+        Returns:
+            The registry
+            
+        Raises:
+            ValueError: If the file is not a snapshot of this format version
+        """
+        data = Path(path).read_bytes()
+        try:
+            magic, version, members, keys, *lengths = _HEADER.unpack_from(data)
+            body = zlib.decompress(data[_HEADER.size:])
+        except (struct.error, zlib.error) as e:
+            raise ValueError(f"{path} is not a member registry snapshot") from e
+        if magic != _MAGIC or version != _VERSION or len(body) != sum(lengths) + 4 * keys:
+            raise ValueError(f"{path} is not a member registry snapshot (version {_VERSION})")
+        
+        registry = cls.__new__(cls)
+        offset, sections = 0, []
+        for length, count in zip(lengths, (members, members, keys)):
+            text = body[offset:offset + length].decode("utf-8")
+            sections.append(text.split("\n") if count else [])
+            offset += length
+        registry._ids, registry._names, registry._keys = sections
+        registry._rows = array("I")
+        registry._rows.frombytes(body[offset:])
+        if sys.byteorder == "big":
+            registry._rows.byteswap()
+        return registry
+
+
+def registry_from_records(records: Iterable[Union[Dict, MalformedRecord]]) -> Tuple[MemberRegistry, List[Tuple[int, str]]]:
+    """
+    Build a registry from member records, skipping invalid ones.
+    
+    Args:
+        records: Member records (id, name), e.g. from read_records
+        
+    Returns:
+        (registry, [(row number, error message)]) with rows numbered from 1;
+        a repeated id is an error on every row after its first
+    """
+    members: Dict[str, Member] = {}
+    errors = []
+    for row, record in enumerate(records, start=1):
+        try:
+            member = member_entry(record_fields(record))
+            if member.id in members:
+                raise ValueError(f"Duplicate member id {member.id!r}")
+        except ValueError as e:
+            errors.append((row, str(e)))
+            continue
+        members[member.id] = member
+    return MemberRegistry(members.values()), errors
+
+
+def resolve_snapshot_path(path: Optional[Union[str, Path]] = None) -> str:
+    """
+    Resolve the member registry snapshot location.
+    
+    Args:
+        path: Explicit path; defaults to $MEMBER_REGISTRY, then DEFAULT_SNAPSHOT_PATH
+        
+    Returns:
+        Snapshot path as a string
+    """
+    return str(path or os.getenv("MEMBER_REGISTRY") or DEFAULT_SNAPSHOT_PATH)
+
+
+def open_member_registry(path: Optional[Union[str, Path]] = None) -> MemberRegistry:
+    """
+    Load the member registry snapshot, or an empty registry if there is none yet.
+    
+    Args:
+        path: Snapshot path; defaults to $MEMBER_REGISTRY, then DEFAULT_SNAPSHOT_PATH
+        
+    Returns:
+        MemberRegistry from the snapshot
+        
+    Raises:
+        ValueError: If the file exists but is not a registry snapshot
+    """
+    snapshot = resolve_snapshot_path(path)
+    return MemberRegistry.load(snapshot) if os.path.exists(snapshot) else MemberRegistry()
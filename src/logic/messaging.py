@@ -1,19 +1,26 @@
 """Messaging functions for greetings and reminders."""
 
-from typing import List
+from typing import List, Optional
 
+from src.logic.members import MemberRegistry
 
-def build_welcome(name: str, center: str = "Baun Fitness Center") -> str:
+
+def build_welcome(name: str, center: str = "Baun Fitness Center", registry: Optional[MemberRegistry] = None) -> str:
     """
     Build a personalized welcome message.
     
     Args:
-        name: User's name
+        name: User's name, or with a registry, their member id
         center: Name of the fitness center
+        registry: Members to look the name up in; a known id or unique
+            name is greeted by the registered name
         
     Returns:
         Formatted welcome message string
     """
+    member = registry.lookup(name) if registry is not None else None
+    if member is not None:
+        name = member.name
     return f"Welcome to {center}, {name}! We're excited to help you achieve your fitness goals. 🏋️"
 
 
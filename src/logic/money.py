@@ -0,0 +1,71 @@
+"""Fixed-point money arithmetic in integer cents.
+
+Amounts are held as integer cents and discount rates as integer basis
+points (1/100 of a percent), so every calculation is exact. Whenever a
+rate is applied the result is rounded to the nearest cent, with ties
+rounded half away from zero (ROUND_HALF_UP), and that rounded amount is
+what gets subtracted. Line items therefore always add up to the total.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+CENTS_PER_DOLLAR = 100
+BASIS_POINTS = 10_000
+
+
+@lru_cache(maxsize=1024)
+def to_cents(amount: float) -> int:
+    """
+    Convert a dollar amount to integer cents.
+    
+    Args:
+        amount: Dollar amount (e.g. 25.0 or 19.99)
+    
+    Returns:
+        Amount in cents, rounded half up to the nearest cent
+    """
+    cents = Decimal(str(amount)) * CENTS_PER_DOLLAR
+    return int(cents.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+@lru_cache(maxsize=1024)
+def to_basis_points(rate: float) -> int:
+    """
+    Convert a decimal discount rate to integer basis points.
+    
+    Args:
+        rate: Discount rate as a decimal (e.g. 0.15 for 15%)
+    
+    Returns:
+        Rate in basis points (e.g. 1500)
+    
+    Raises:
+        ValueError: If the rate is finer than one basis point
+    """
+    points = Decimal(str(rate)) * BASIS_POINTS
+    if points != points.to_integral_value():
+        raise ValueError(f"Rate must be a whole number of basis points, got {rate}")
+    return int(points)
+
+
+def from_cents(cents: int) -> float:
+    """Convert integer cents to a dollar float for display."""
+    return cents / CENTS_PER_DOLLAR
+
+
+def apply_rate(cents: int, basis_points: int) -> int:
+    """
+    Compute a rate applied to an amount, rounded half up to the cent.
+    
+    Args:
+        cents: Amount in cents
+        basis_points: Rate in basis points
+    
+    Returns:
+        cents * basis_points / 10000, rounded to the nearest cent
+    """
+    product = cents * basis_points
+    if product >= 0:
+        return (product + BASIS_POINTS // 2) // BASIS_POINTS
+    return -((BASIS_POINTS // 2 - product) // BASIS_POINTS)
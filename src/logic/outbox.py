@@ -0,0 +1,475 @@
+"""Asynchronous outbox for sending class reminders to a whole member list.
+
+Messages come from a generator (reminder_messages), so the member list is
+streamed rather than held in memory. Outbox.send_all() sends them in
+batches through a pluggable transport. Up to `concurrency` sends are in
+flight at once, no more than `rate` start per second, and transient
+failures are retried with exponential backoff.
+
+Progress is kept in an append-only journal: before a batch is sent its
+keys are recorded as started, and each outcome is recorded once the batch
+is done. A rerun with the same journal skips messages already sent.
+Messages that a crashed run started but never recorded an outcome for
+are "in doubt": they may or may not have been delivered, so they are
+reported and not sent again (unless resend_in_doubt is set). A resumed
+run therefore never sends a duplicate.
+
+FileSinkTransport (one file per message) and SMTPTransport (any SMTP
+server, including a local debugging server) are provided; anything with
+an async send(message) method can be used instead.
+"""
+
+import asyncio
+import os
+import re
+import smtplib
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from email.message import EmailMessage
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Protocol, Set, Tuple, Union
+
+from src.logic.export import export_text
+from src.logic.messaging import reminders
+from src.logic.records import MalformedRecord, record_fields
+from src.logic.schedule import normalized_day
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_SENDER = "noreply@baunfitness.example"
+
+# Journal states; the last state recorded for a key wins
+STARTED = "started"
+SENT = "sent"
+FAILED = "failed"
+
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@dataclass(frozen=True)
+class Message:
+    """An outgoing message; key identifies it across runs (e.g. run id + member id)."""
+    
+    key: str
+    recipient: str
+    subject: str
+    body: str
+
+    def __post_init__(self):
+        """Reject keys that cannot be written to the journal."""
+        if not self.key or any(c in self.key for c in "\t\r\n"):
+            raise ValueError(f"Message key must be non-empty without tabs or newlines, got {self.key!r}")
+
+    def to_email(self, sender: str = DEFAULT_SENDER) -> EmailMessage:
+        """Build the RFC 5322 message."""
+        email = EmailMessage()
+        email["From"] = sender
+        email["To"] = self.recipient
+        email["Subject"] = self.subject
+        email.set_content(self.body)
+        return email
+
+
+class TransientError(Exception):
+    """A delivery failure worth retrying (server busy, connection dropped)."""
+
+
+class Transport(Protocol):
+    """Interface for message transports used by Outbox."""
+    
+    async def send(self, message: Message) -> None:
+        """Deliver one message; raise TransientError if a retry may succeed."""
+        ...
+
+
+class FileSinkTransport:
+    """
+    Transport that writes each message to its own .eml file.
+    
+    For testing and dry runs. Files are named after the message key and
+    written atomically (export_text), so resending a key overwrites
+    rather than duplicates.
+    """
+
+    def __init__(self, directory: Union[str, Path], sender: str = DEFAULT_SENDER):
+        """
+        Create a sink.
+        
+        Args:
+            directory: Directory to write messages to (created if needed)
+            sender: From address
+        """
+        self.directory = Path(directory)
+        self.sender = sender
+
+    def path_for(self, message: Message) -> Path:
+        """File a message is written to."""
+        return self.directory / f"{_UNSAFE_FILENAME.sub('_', message.key)}.eml"
+    
+    async def send(self, message: Message) -> None:
+        """Write the message (in a worker thread, off the event loop)."""
+        text = message.to_email(self.sender).as_string()
+        await asyncio.to_thread(export_text, str(self.path_for(message)), [text])
+
+
+class SMTPTransport:
+    """
+    Transport that delivers through an SMTP server.
+    
+    Each send opens its own connection in a worker thread, so concurrent
+    sends do not share an smtplib client. Connection problems and 4xx
+    replies raise TransientError; 5xx replies and refused recipients are
+    permanent.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 25,
+        sender: str = DEFAULT_SENDER,
+        timeout: float = 30.0,
+        starttls: bool = False,
+        username: Optional[str] = None,
+        password: Optional[str] = None
+    ):
+        """
+        Configure the server.
+        
+        Args:
+            host: SMTP server host
+            port: SMTP server port
+            sender: From address
+            timeout: Socket timeout in seconds
+            starttls: Upgrade the connection with STARTTLS
+            username: Login user (no login if None)
+            password: Login password
+        """
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.timeout = timeout
+        self.starttls = starttls
+        self.username = username
+        self.password = password
+
+    def _send_sync(self, message: Message) -> None:
+        """Deliver one message over a fresh connection."""
+        try:
+            with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+                if self.starttls:
+                    smtp.starttls()
+                if self.username is not None:
+                    smtp.login(self.username, self.password or "")
+                smtp.send_message(message.to_email(self.sender))
+        except smtplib.SMTPServerDisconnected as e:
+            raise TransientError(f"SMTP connection dropped: {e}") from e
+        except smtplib.SMTPResponseException as e:
+            if 400 <= e.smtp_code < 500:
+                raise TransientError(f"SMTP {e.smtp_code}: {e.smtp_error!r}") from e
+            raise
+        except smtplib.SMTPException:
+            raise  # Refused recipients and the like (SMTPException is an OSError)
+        except OSError as e:
+            raise TransientError(f"SMTP connection failed: {e}") from e
+    
+    async def send(self, message: Message) -> None:
+        """Deliver the message (in a worker thread, off the event loop)."""
+        await asyncio.to_thread(self._send_sync, message)
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` acquisitions per second, in bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Create a limiter.
+        
+        Args:
+            rate: Acquisitions per second (must be > 0)
+            burst: Acquisitions allowed back to back after an idle period
+            
+        Raises:
+            ValueError: If rate or burst is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be greater than 0, got {rate}")
+        if burst <= 0:
+            raise ValueError(f"Burst must be greater than 0, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class Journal:
+    """
+    Append-only progress journal, one "state<TAB>key[<TAB>detail]" line per event.
+    
+    Reopening a journal replays it, so a run can resume where a previous
+    (possibly crashed) run stopped. A torn last line is ignored.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (and create if needed) a journal and replay its events.
+        
+        Args:
+            path: Journal file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._states: Dict[str, str] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    state, _, rest = line.rstrip("\n").partition("\t")
+                    key = rest.partition("\t")[0]
+                    if state in (STARTED, SENT, FAILED) and key and line.endswith("\n"):
+                        self._states[key] = state
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def state(self, key: str) -> Optional[str]:
+        """Last recorded state of a key (None if never seen)."""
+        return self._states.get(key)
+
+    def in_doubt(self) -> List[str]:
+        """Keys whose send started but never recorded an outcome."""
+        return [key for key, state in self._states.items() if state == STARTED]
+
+    def record(self, events: Iterable[Tuple[str, str, str]]) -> None:
+        """
+        Append events and flush them to disk.
+        
+        Args:
+            events: (state, key, detail) tuples; detail may be empty
+        """
+        lines = []
+        for state, key, detail in events:
+            self._states[key] = state
+            detail = " ".join(detail.split())
+            lines.append(f"{state}\t{key}\t{detail}\n" if detail else f"{state}\t{key}\n")
+        self._file.write("".join(lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
+
+
+@dataclass
+class OutboxReport:
+    """Outcome counts of one Outbox run."""
+    
+    sent: int = 0
+    skipped: int = 0
+    failed: int = 0
+    in_doubt: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+    failures: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def rate(self) -> float:
+        """Messages sent per second."""
+        return self.sent / self.seconds if self.seconds > 0 else 0.0
+
+
+class Outbox:
+    """Batched, concurrent, rate-limited and resumable message sender."""
+
+    def __init__(
+        self,
+        transport: Transport,
+        journal_path: Union[str, Path],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate: Optional[float] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = 0.5,
+        timeout: float = 60.0,
+        resend_in_doubt: bool = False
+    ):
+        """
+        Configure the outbox.
+        
+        Args:
+            transport: Object with an async send(message) method
+            journal_path: Progress journal (reuse it to resume a run)
+            concurrency: Maximum sends in flight at once
+            rate: Maximum sends started per second (None for no limit)
+            batch_size: Messages journaled and sent per batch
+            max_attempts: Attempts per message for transient failures
+            retry_delay: Delay before the first retry; doubles each retry
+            timeout: Seconds before a send attempt counts as a transient failure
+            resend_in_doubt: Resend messages a crashed run may have
+                delivered (risking duplicates) instead of skipping them
+                
+        Raises:
+            ValueError: If concurrency, batch_size or max_attempts is not positive
+        """
+        for name, value in (("Concurrency", concurrency), ("Batch size", batch_size), ("Max attempts", max_attempts)):
+            if value <= 0:
+                raise ValueError(f"{name} must be greater than 0, got {value}")
+        self.transport = transport
+        self.journal_path = Path(journal_path)
+        self.concurrency = concurrency
+        self.rate = rate
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+        self.resend_in_doubt = resend_in_doubt
+
+    def _pending(self, messages: Iterable[Message], journal: Journal, report: OutboxReport) -> Iterator[Message]:
+        """Messages still to send; already sent, in doubt and repeated keys are counted and dropped."""
+        seen: Set[str] = set()
+        for message in messages:
+            state = journal.state(message.key)
+            if message.key in seen or state == SENT:
+                report.skipped += 1
+            elif state == STARTED and not self.resend_in_doubt:
+                report.in_doubt += 1
+            else:
+                yield message
+            seen.add(message.key)
+    
+    async def _deliver(
+        self,
+        message: Message,
+        semaphore: asyncio.Semaphore,
+        limiter: Optional[RateLimiter],
+        report: OutboxReport
+    ) -> Optional[str]:
+        """Send one message with retries; return None on success or the error text."""
+        async with semaphore:
+            for attempt in range(1, self.max_attempts + 1):
+                if limiter is not None:
+                    await limiter.acquire()
+                try:
+                    await asyncio.wait_for(self.transport.send(message), self.timeout)
+                    return None
+                except (TransientError, asyncio.TimeoutError) as e:
+                    if attempt == self.max_attempts:
+                        return f"{type(e).__name__}: {e} (after {attempt} attempts)"
+                    report.retries += 1
+                    await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+                except Exception as e:  # Permanent failure: record it and move on
+                    return f"{type(e).__name__}: {e}"
+    
+    async def send_all(self, messages: Iterable[Message]) -> OutboxReport:
+        """
+        Send messages, resuming from the journal.
+        
+        Args:
+            messages: Messages to send (any iterable, e.g. reminder_messages)
+            
+        Returns:
+            OutboxReport for this run
+        """
+        report = OutboxReport()
+        start = time.perf_counter()
+        journal = Journal(self.journal_path)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limiter = RateLimiter(self.rate) if self.rate else None
+        try:
+            pending = self._pending(messages, journal, report)
+            while True:
+                batch = list(islice(pending, self.batch_size))
+                if not batch:
+                    break
+                journal.record((STARTED, message.key, "") for message in batch)
+                errors = await asyncio.gather(*(
+                    self._deliver(message, semaphore, limiter, report) for message in batch
+                ))
+                journal.record(
+                    (SENT, message.key, "") if error is None else (FAILED, message.key, error)
+                    for message, error in zip(batch, errors)
+                )
+                for message, error in zip(batch, errors):
+                    if error is None:
+                        report.sent += 1
+                    else:
+                        report.failed += 1
+                        report.failures[message.key] = error
+        finally:
+            journal.close()
+            report.seconds = time.perf_counter() - start
+        return report
+
+    def run(self, messages: Iterable[Message]) -> OutboxReport:
+        """Send messages from synchronous code (see send_all)."""
+        return asyncio.run(self.send_all(messages))
+
+
+def reminder_messages(
+    members: Iterable[Union[Mapping, MalformedRecord]],
+    day: str,
+    schedule: Dict[str, List[str]],
+    center: str = "Baun Fitness Center",
+    run_id: Optional[str] = None,
+    errors: Optional[List[Tuple[int, str]]] = None
+) -> Iterator[Message]:
+    """
+    Build each member's class reminders for a day.
+    
+    Args:
+        members: Records with "email" and optionally "id" and "name"
+            (members without an email are skipped)
+        day: Day of the week (case-insensitive, abbreviations allowed)
+        schedule: Dictionary mapping days to lists of class strings
+        center: Name of the fitness center
+        run_id: Prefix of every message key (defaults to today's date and
+            the day), so rerunning the same run id resumes it
+        errors: If given, malformed member records are appended to it as
+            (row number, error) and skipped instead of raising
+            
+    Yields:
+        One Message per member; nothing if no classes run that day
+        
+    Raises:
+        ValueError: If a member record is malformed (only when errors is None)
+    """
+    classes = reminders(day, schedule)
+    if not classes:
+        return
+    day_name = normalized_day(day)
+    run_id = run_id or f"{date.today().isoformat()}-{day_name}"
+    subject = f"Your {day_name.title()} classes at {center}"
+    class_lines = "\n".join(f"  • {entry}" for entry in classes)
+    
+    for row, member in enumerate(members, start=1):
+        try:
+            member = record_fields(member)
+        except ValueError as e:
+            if errors is None:
+                raise
+            errors.append((row, str(e)))
+            continue
+        email = str(member.get("email") or "").strip()
+        if not email:
+            continue
+        member_id = str(member.get("id") or email).strip()
+        name = str(member.get("name") or "").strip() or "there"
+        yield Message(
+            key=f"{run_id}:{member_id}",
+            recipient=email,
+            subject=subject,
+            body=f"Hi {name},\n\nHere are {day_name.title()}'s classes at {center}:\n{class_lines}\n\nSee you there! 🏋️\n"
+        )
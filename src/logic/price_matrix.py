@@ -0,0 +1,424 @@
+"""Precomputed price lists: every plan, duration, student flag and promo."""
+
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.logic.batch_pricing import apply_rate_array
+from src.logic.money import CENTS_PER_DOLLAR, to_basis_points, to_cents
+from src.logic.pricing import STUDENT_STAFF_BASIS_POINTS
+from src.logic.promos import PromoCatalog, resolve_promos
+
+try:
+    import pyarrow
+except ImportError:  # Optional dependency, only needed for Parquet files
+    pyarrow = None
+
+# Longest membership duration in the precomputed tables
+DEFAULT_MAX_MONTHS = 36
+
+NO_PROMO = "No promo"
+
+
+def promo_options(promo_codes: Union[Dict[str, float], PromoCatalog], now: Optional[float] = None) -> List[Tuple[str, float]]:
+    """
+    List the promo columns of a price matrix.
+    
+    Args:
+        promo_codes: PromoCatalog (one column per active campaign), or a
+            dictionary of codes to rates (one column per code)
+        now: Unix timestamp to check campaign expiry against
+        
+    Returns:
+        (label, rate) pairs
+    """
+    if isinstance(promo_codes, PromoCatalog):
+        return [(campaign["name"], campaign["rate"]) for campaign in promo_codes.campaigns(now)]
+    return list(promo_codes.items())
+
+
+def _compact(cents: np.ndarray) -> np.ndarray:
+    """Store cents as int32 when every value fits (halving the memory)."""
+    if cents.size and cents.max() >= np.iinfo(np.int32).max:
+        return cents
+    return cents.astype(np.int32)
+
+
+class PriceMatrix:
+    """
+    Final and discount amounts for every quote, held in integer-cent arrays.
+    
+    Axes are plan × months (1..max_months) × student flag (no, yes) ×
+    promo column (column 0 is "no promo"). Per-quote lookups, price
+    grids and cheapest-option searches are array reads, and the values
+    are exactly what price_membership returns.
+    """
+
+    def __init__(
+        self,
+        plans: List[str],
+        monthly_prices: List[float],
+        promos: List[Tuple[str, float]],
+        student_cents: np.ndarray,
+        promo_cents: np.ndarray,
+        final_cents: np.ndarray
+    ):
+        """
+        Wrap precomputed tables (use build or load to create one).
+        
+        Args:
+            plans: Plan names (axis 0)
+            monthly_prices: Monthly price of each plan
+            promos: (label, rate) of each promo column after "no promo"
+            student_cents: Student/staff discount, shape (plans, months, 2)
+            promo_cents: Promo discount, shape (plans, months, 2, promos + 1)
+            final_cents: Final cost, same shape as promo_cents
+        """
+        self.plans = list(plans)
+        self.monthly_prices = list(monthly_prices)
+        self.promos = list(promos)
+        self.max_months = final_cents.shape[1]
+        self.student_cents = np.ascontiguousarray(student_cents)
+        self.promo_cents = np.ascontiguousarray(promo_cents)
+        self.final_cents = np.ascontiguousarray(final_cents)
+        # Memoryviews read single cells as Python ints, much faster than
+        # NumPy scalar indexing
+        self._student_view = memoryview(self.student_cents)
+        self._promo_view = memoryview(self.promo_cents)
+        self._final_view = memoryview(self.final_cents)
+        self._plan_index = {name: i for i, name in enumerate(self.plans)}
+        self._promo_index = {label: i + 1 for i, (label, _) in enumerate(self.promos)}
+
+    @classmethod
+    def build(
+        cls,
+        plans: Dict[str, float],
+        promo_codes: Union[Dict[str, float], PromoCatalog],
+        max_months: int = DEFAULT_MAX_MONTHS,
+        now: Optional[float] = None
+    ) -> "PriceMatrix":
+        """
+        Compute the full price matrix.
+        
+        Args:
+            plans: Dictionary of plan names to monthly prices
+            promo_codes: PromoCatalog or dictionary of codes to rates
+            max_months: Longest duration to precompute (must be > 0)
+            now: Unix timestamp to check campaign expiry against
+            
+        Returns:
+            New PriceMatrix
+            
+        Raises:
+            ValueError: If max_months <= 0
+        """
+        if max_months <= 0:
+            raise ValueError(f"Months must be greater than 0, got {max_months}")
+        promos = promo_options(promo_codes, now)
+        
+        price_cents = np.array([to_cents(price) for price in plans.values()], dtype=np.int64)
+        months = np.arange(1, max_months + 1, dtype=np.int64)
+        student_points = np.array([0, STUDENT_STAFF_BASIS_POINTS], dtype=np.int64)
+        promo_points = np.array([0] + [to_basis_points(rate) for _, rate in promos], dtype=np.int64)
+        
+        base = price_cents[:, None] * months[None, :]
+        student = apply_rate_array(base[:, :, None], student_points[None, None, :])
+        after_student = base[:, :, None] - student
+        promo = apply_rate_array(after_student[:, :, :, None], promo_points[None, None, None, :])
+        final = np.maximum(after_student[:, :, :, None] - promo, 0)
+        
+        return cls(list(plans), list(plans.values()), promos, _compact(student), _compact(promo), _compact(final))
+
+    def nbytes(self) -> int:
+        """Memory used by the tables."""
+        return self.student_cents.nbytes + self.promo_cents.nbytes + self.final_cents.nbytes
+
+    def promo_column(
+        self,
+        promo: Optional[str],
+        promo_codes: Union[Dict[str, float], PromoCatalog],
+        now: Optional[float] = None
+    ) -> Optional[Tuple[int, Optional[str]]]:
+        """
+        Find the column for a promo field.
+        
+        Args:
+            promo: Promo field text
+            promo_codes: The catalog the matrix was built from
+            now: Unix timestamp to check expiry against
+            
+        Returns:
+            (column, applied code or None), or None when the promo field
+            resolves to stacked codes, which the matrix does not hold
+        """
+        applied = resolve_promos(promo, promo_codes, now)
+        if not applied:
+            return 0, None
+        if len(applied) > 1:
+            return None
+        code = applied[0][0]
+        label = promo_codes.campaign_of(code) if isinstance(promo_codes, PromoCatalog) else code
+        column = self._promo_index.get(label)
+        return None if column is None else (column, code)
+
+    def lookup(
+        self,
+        plan: str,
+        months: int,
+        is_student_or_staff: bool,
+        promo: Optional[str],
+        promo_codes: Union[Dict[str, float], PromoCatalog],
+        now: Optional[float] = None
+    ) -> Optional[Dict]:
+        """
+        Read a quote from the matrix.
+        
+        Args:
+            plan, months, is_student_or_staff, promo, promo_codes, now:
+                As for src.logic.pricing.price_membership
+                
+        Returns:
+            The price_membership breakdown, or None if the quote is outside
+            the matrix (unknown plan, months out of range, stacked codes)
+        """
+        i = self._plan_index.get(plan)
+        column = self.promo_column(promo, promo_codes, now)
+        if i is None or column is None or not 1 <= months <= self.max_months:
+            return None
+        k, code = column
+        m, s = months - 1, int(bool(is_student_or_staff))
+        base_cents = to_cents(self.monthly_prices[i]) * months
+        return {
+            "plan": plan,
+            "months": months,
+            "monthly_price": self.monthly_prices[i],
+            "base_cost": base_cents / CENTS_PER_DOLLAR,
+            "student_staff_discount": self._student_view[i, m, s] / CENTS_PER_DOLLAR,
+            "promo_applied": code,
+            "promo_rate": self.promos[k - 1][1] if k else 0.0,
+            "promo_discount": self._promo_view[i, m, s, k] / CENTS_PER_DOLLAR,
+            "final_cost": self._final_view[i, m, s, k] / CENTS_PER_DOLLAR,
+        }
+
+    def grid(self, is_student_or_staff: bool = False, promo: str = NO_PROMO, max_months: Optional[int] = None) -> pd.DataFrame:
+        """
+        Price grid of final costs for one student flag and promo column.
+        
+        Args:
+            is_student_or_staff: Student/staff flag
+            promo: Promo column label (NO_PROMO for none)
+            max_months: Number of rows (defaults to all)
+            
+        Returns:
+            DataFrame indexed by months with one column per plan (dollars)
+            
+        Raises:
+            KeyError: If promo is not a column label
+        """
+        k = 0 if promo == NO_PROMO else self._promo_index[promo]
+        rows = self.max_months if max_months is None else min(max_months, self.max_months)
+        values = self.final_cents[:, :rows, int(bool(is_student_or_staff)), k].T / CENTS_PER_DOLLAR
+        return pd.DataFrame(values, index=pd.RangeIndex(1, rows + 1, name="Months"), columns=self.plans)
+
+    def cheapest(
+        self,
+        k: int = 5,
+        plan: Optional[str] = None,
+        months: Optional[int] = None,
+        is_student_or_staff: Optional[bool] = None,
+        budget: Optional[float] = None,
+        per_month: bool = True
+    ) -> pd.DataFrame:
+        """
+        Find the cheapest options matching some constraints.
+        
+        Args:
+            k: Number of options to return
+            plan: Only this plan
+            months: Only this duration
+            is_student_or_staff: Only this student flag
+            budget: Only options whose final cost is at most this (dollars)
+            per_month: Rank by cost per month (otherwise by final cost)
+            
+        Returns:
+            DataFrame with plan, months, student_or_staff, promo,
+            final_cost and cost_per_month columns, cheapest first
+        """
+        final = self.final_cents.astype(np.float64)
+        cost = final / np.arange(1, self.max_months + 1)[None, :, None, None] if per_month else final.copy()
+        if plan is not None:
+            keep = np.zeros(len(self.plans), dtype=bool)
+            if plan in self._plan_index:
+                keep[self._plan_index[plan]] = True
+            cost[~keep] = np.inf
+        if months is not None:
+            keep = np.arange(1, self.max_months + 1) == months
+            cost[:, ~keep] = np.inf
+        if is_student_or_staff is not None:
+            cost[:, :, 1 - int(bool(is_student_or_staff))] = np.inf
+        if budget is not None:
+            cost[final > round(budget * CENTS_PER_DOLLAR)] = np.inf
+        
+        flat = cost.ravel()
+        k = min(k, int(np.isfinite(flat).sum()))
+        best = np.argpartition(flat, k - 1)[:k] if k else np.array([], dtype=np.intp)
+        best = best[np.argsort(flat[best], kind="stable")]
+        p, m, s, c = np.unravel_index(best, cost.shape)
+        labels = [NO_PROMO] + [label for label, _ in self.promos]
+        return pd.DataFrame({
+            "plan": [self.plans[i] for i in p],
+            "months": m + 1,
+            "student_or_staff": s.astype(bool),
+            "promo": [labels[i] for i in c],
+            "final_cost": final[p, m, s, c] / CENTS_PER_DOLLAR,
+            "cost_per_month": final[p, m, s, c] / (m + 1) / CENTS_PER_DOLLAR,
+        })
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Flatten the matrix into one row per quote.
+        
+        Returns:
+            DataFrame with plan, months, student_or_staff, promo, promo_rate,
+            student_staff_cents, promo_cents and final_cents columns
+        """
+        return self._rows_frame(0, self.final_cents.size)
+
+    def frame_chunks(self, rows: int) -> Iterator[pd.DataFrame]:
+        """
+        Flatten the matrix into one row per quote, a chunk at a time.
+        
+        Args:
+            rows: Rows per chunk
+            
+        Yields:
+            DataFrames with the to_frame columns, in to_frame row order
+            
+        Raises:
+            ValueError: If rows is not positive
+        """
+        if rows <= 0:
+            raise ValueError(f"Rows must be greater than 0, got {rows}")
+        for start in range(0, self.final_cents.size, rows):
+            yield self._rows_frame(start, min(start + rows, self.final_cents.size))
+
+    def _rows_frame(self, start: int, stop: int) -> pd.DataFrame:
+        """Rows [start, stop) of the flattened matrix as a DataFrame."""
+        p, m, s, c = np.unravel_index(np.arange(start, stop), self.final_cents.shape)
+        labels = np.array([NO_PROMO] + [label for label, _ in self.promos], dtype=object)
+        rates = np.array([0.0] + [rate for _, rate in self.promos])
+        return pd.DataFrame({
+            "plan": pd.Categorical.from_codes(p, self.plans),
+            "monthly_price": np.asarray(self.monthly_prices)[p],
+            "months": (m + 1).astype(np.int16),
+            "student_or_staff": s.astype(bool),
+            "promo": pd.Categorical(labels[c], categories=list(dict.fromkeys(labels))),
+            "promo_rate": rates[c],
+            "student_staff_cents": self.student_cents[p, m, s],
+            "promo_cents": self.promo_cents.ravel()[start:stop],
+            "final_cents": self.final_cents.ravel()[start:stop],
+        })
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save the matrix as Parquet (".parquet", needs pyarrow) or NumPy (".npz").
+        
+        Args:
+            path: Output file path
+            
+        Raises:
+            ImportError: If a Parquet file is requested and pyarrow is missing
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".parquet":
+            if pyarrow is None:
+                raise ImportError("Parquet price lists require the 'pyarrow' package")
+            self.to_frame().to_parquet(path, index=False)
+            return
+        np.savez_compressed(
+            path,
+            plans=np.array(self.plans),
+            monthly_prices=np.array(self.monthly_prices),
+            promo_labels=np.array([label for label, _ in self.promos], dtype=str),
+            promo_rates=np.array([rate for _, rate in self.promos], dtype=np.float64),
+            student_cents=self.student_cents,
+            promo_cents=self.promo_cents,
+            final_cents=self.final_cents,
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PriceMatrix":
+        """
+        Load a matrix written by save.
+        
+        Args:
+            path: ".parquet" or ".npz" file
+            
+        Returns:
+            PriceMatrix
+        """
+        path = Path(path)
+        if path.suffix == ".parquet":
+            if pyarrow is None:
+                raise ImportError("Parquet price lists require the 'pyarrow' package")
+            frame = pd.read_parquet(path)
+            plans = list(frame["plan"].cat.categories)
+            labels = list(frame["promo"].cat.categories)
+            shape = (len(plans), int(frame["months"].max()), 2, len(labels))
+            prices = frame.drop_duplicates("plan").set_index("plan")["monthly_price"]
+            rates = frame.drop_duplicates("promo").set_index("promo")["promo_rate"]
+            return cls(
+                plans,
+                [float(prices[name]) for name in plans],
+                [(label, float(rates[label])) for label in labels[1:]],
+                frame["student_staff_cents"].to_numpy().reshape(shape)[:, :, :, 0],
+                frame["promo_cents"].to_numpy().reshape(shape),
+                frame["final_cents"].to_numpy().reshape(shape),
+            )
+        with np.load(path) as data:
+            return cls(
+                data["plans"].tolist(),
+                data["monthly_prices"].tolist(),
+                list(zip(data["promo_labels"].tolist(), data["promo_rates"].tolist())),
+                data["student_cents"],
+                data["promo_cents"],
+                data["final_cents"],
+            )
+
+
+_cache_lock = threading.Lock()
+_cached: Optional[Tuple[Tuple, PriceMatrix]] = None
+
+
+def current_price_matrix(
+    plans: Dict[str, float],
+    promo_codes: Union[Dict[str, float], PromoCatalog],
+    max_months: int = DEFAULT_MAX_MONTHS
+) -> PriceMatrix:
+    """
+    Get the price matrix for the catalogs, rebuilding it only when they change.
+    
+    The matrix is cached against the catalogs' versions (see
+    src.logic.catalog), so it is rebuilt after any price or promo change.
+    Catalogs without a version are rebuilt on every call.
+    
+    Args:
+        plans: Dictionary of plan names to monthly prices
+        promo_codes: PromoCatalog or dictionary of codes to rates
+        max_months: Longest duration to precompute
+        
+    Returns:
+        Up-to-date PriceMatrix
+    """
+    global _cached
+    versions = (getattr(plans, "version", None), getattr(promo_codes, "version", None), max_months)
+    if None in versions:
+        return PriceMatrix.build(plans, promo_codes, max_months)
+    with _cache_lock:
+        if _cached is None or _cached[0] != versions:
+            _cached = (versions, PriceMatrix.build(plans, promo_codes, max_months))
+        return _cached[1]
@@ -1,6 +1,16 @@
 """Pricing calculations for membership plans."""
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
+
+from src.logic.money import apply_rate, from_cents, to_basis_points, to_cents
+from src.logic.promos import MAX_STACKED_CODES, PromoCatalog, combined_rate, resolve_promos
+
+# Student/staff discount rate (15% off the base cost)
+STUDENT_STAFF_DISCOUNT_RATE = 0.15
+STUDENT_STAFF_BASIS_POINTS = to_basis_points(STUDENT_STAFF_DISCOUNT_RATE)
+
+# Times a purchase is re-priced when a promo code runs out while it is redeemed
+PURCHASE_ATTEMPTS = MAX_STACKED_CODES + 1
 
 
 def price_membership(
@@ -9,18 +19,25 @@ def price_membership(
     is_student_or_staff: bool,
     promo: Optional[str],
     plans: Dict[str, float],
-    promo_codes: Dict[str, float]
+    promo_codes: Union[Dict[str, float], PromoCatalog],
+    now: Optional[float] = None
 ) -> Dict:
     """
     Calculate membership pricing with discounts and promo codes.
     
+    All money math is done in integer cents (see src.logic.money); each
+    discount is rounded half up to the cent before it is subtracted.
+    
     Args:
         plan: Membership plan name (must exist in plans dict)
         months: Number of months (must be > 0)
         is_student_or_staff: Whether user qualifies for student/staff discount
-        promo: Optional promo code string
+        promo: Optional promo code string (with a PromoCatalog, several
+            codes may be entered; see PromoCatalog.resolve)
         plans: Dictionary of plan names to monthly prices
-        promo_codes: Dictionary of promo codes to discount rates
+        promo_codes: PromoCatalog, or dictionary of promo codes to
+            discount rates
+        now: Unix timestamp for promo expiry checks (defaults to now)
         
     Returns:
         Dictionary with pricing breakdown:
@@ -30,8 +47,9 @@ def price_membership(
             "monthly_price": float,
             "base_cost": float,
             "student_staff_discount": float,
-            "promo_applied": str | None,
-            "promo_rate": float,
+            "promo_applied": str | None,  # Stacked codes joined by "+"
+            "promo_rate": float,  # Combined rate of stacked codes
+            "promo_discount": float,
             "final_cost": float
         }
         
@@ -45,38 +63,78 @@ def price_membership(
         raise ValueError(f"Months must be greater than 0, got {months}")
     
     monthly_price = plans[plan]
-    base_cost = monthly_price * months
+    base_cents = to_cents(monthly_price) * months
     
     # Student/staff discount: 15% off
-    student_staff_discount_rate = 0.15 if is_student_or_staff else 0.0
-    student_staff_discount = base_cost * student_staff_discount_rate
-    cost_after_student_discount = base_cost - student_staff_discount
+    student_staff_cents = apply_rate(base_cents, STUDENT_STAFF_BASIS_POINTS) if is_student_or_staff else 0
+    cents_after_student_discount = base_cents - student_staff_cents
     
-    # Promo code discount (applied after student/staff discount)
-    promo_applied = None
-    promo_rate = 0.0
-    promo_discount = 0.0
+    # Promo code discounts (applied after student/staff discount, each to
+    # the amount left by the previous one); invalid codes are ignored
+    applied = resolve_promos(promo, promo_codes, now)
+    promo_applied = "+".join(code for code, _ in applied) or None
+    promo_rate = combined_rate(applied) if applied else 0.0
+    promo_cents = 0
     
-    if promo:
-        promo_upper = promo.strip().upper()
-        if promo_upper in promo_codes:
-            promo_applied = promo_upper
-            promo_rate = promo_codes[promo_upper]
-            promo_discount = cost_after_student_discount * promo_rate
-        else:
-            # Invalid promo code - we'll note it but don't apply
-            promo_applied = None
+    for _, rate in applied:
+        promo_cents += apply_rate(cents_after_student_discount - promo_cents, to_basis_points(rate))
     
-    final_cost = cost_after_student_discount - promo_discount
+    final_cents = cents_after_student_discount - promo_cents
     
     return {
         "plan": plan,
         "months": months,
         "monthly_price": monthly_price,
-        "base_cost": base_cost,
-        "student_staff_discount": student_staff_discount,
+        "base_cost": from_cents(base_cents),
+        "student_staff_discount": from_cents(student_staff_cents),
         "promo_applied": promo_applied,
         "promo_rate": promo_rate,
-        "final_cost": max(0.0, final_cost)  # Ensure non-negative
+        "promo_discount": from_cents(promo_cents),
+        "final_cost": from_cents(max(0, final_cents))  # Ensure non-negative
     }
 
+
+def purchase_membership(
+    plan: str,
+    months: int,
+    is_student_or_staff: bool,
+    promo: Optional[str],
+    plans: Dict[str, float],
+    promo_codes: Union[Dict[str, float], PromoCatalog],
+    now: Optional[float] = None
+) -> Dict:
+    """
+    Price a membership sale and redeem the promo codes it uses.
+    
+    Quotes (price_membership) never use up a code; a purchase counts one
+    redemption of each applied code, so capped and single-use codes run
+    out. If a code runs out between pricing and redeeming (another
+    purchase took its last use), the codes already redeemed are released
+    and the sale is priced again without it.
+    
+    Args:
+        plan, months, is_student_or_staff, promo, plans, promo_codes, now:
+            As for price_membership
+            
+    Returns:
+        Pricing breakdown of the sale (see price_membership); its
+        promo_applied codes have been redeemed
+        
+    Raises:
+        ValueError: If plan is invalid, months <= 0, or the codes kept
+            running out after PURCHASE_ATTEMPTS tries
+    """
+    for _ in range(PURCHASE_ATTEMPTS):
+        breakdown = price_membership(plan, months, is_student_or_staff, promo, plans, promo_codes, now)
+        if not isinstance(promo_codes, PromoCatalog) or not breakdown["promo_applied"]:
+            return breakdown
+        redeemed = []
+        for code in breakdown["promo_applied"].split("+"):
+            if not promo_codes.redeem(code, now):
+                break
+            redeemed.append(code)
+        else:
+            return breakdown
+        for code in redeemed:
+            promo_codes.release(code)
+    raise ValueError(f"Promo codes {promo!r} ran out while purchasing; try again")
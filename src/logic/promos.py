@@ -0,0 +1,486 @@
+"""Promo code catalog with expiry, redemption caps and stacking rules."""
+
+import math
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_right, insort
+from collections import Counter
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.logic.catalog import next_version
+from src.logic.money import BASIS_POINTS, to_basis_points
+from src.logic.records import record_fields
+
+# Number of redemption lock stripes (codes share a lock by slot modulo this)
+DEFAULT_STRIPES = 64
+
+# Most codes applied to one quote; extra codes are ignored
+MAX_STACKED_CODES = 3
+
+# Separators between several codes entered in one promo field
+_CODE_SEPARATORS = re.compile(r"[\s,+]+")
+
+NEVER = math.inf
+
+
+def normalize_code(code: str) -> str:
+    """Normalize a promo code for lookup (strip and uppercase)."""
+    return code.strip().upper()
+
+
+def parse_timestamp(value) -> float:
+    """
+    Parse an expiry as a Unix timestamp.
+    
+    Args:
+        value: None/"" (never expires), a number, or an ISO date or
+            datetime string such as "2026-12-31"
+            
+    Returns:
+        Unix timestamp (math.inf for no expiry)
+    """
+    if value is None or value == "":
+        return NEVER
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+class PromoCatalog(Mapping):
+    """
+    Promo codes grouped into campaigns, held in flat arrays.
+    
+    A campaign carries the rate, expiry, per-code redemption cap and
+    stacking rule; each code only stores its campaign number and
+    redemption count, so tens of thousands of single-use codes cost a
+    dictionary slot plus 8 bytes each. Validation is one dictionary
+    lookup and a few array reads.
+    
+    Redemptions are counted under striped locks (codes hash to one of
+    DEFAULT_STRIPES locks), so kiosks redeeming different codes rarely
+    wait for each other, and a capped code is never over-redeemed.
+    
+    As a Mapping the catalog maps codes to their discount rates, like the
+    plain promo_codes dict it replaces. The version attribute changes when
+    codes are added, a code reaches its cap, or a campaign expires.
+    """
+
+    def __init__(self, stripes: int = DEFAULT_STRIPES):
+        """
+        Create an empty catalog.
+        
+        Args:
+            stripes: Number of redemption locks
+        """
+        self._slots: Dict[str, int] = {}
+        self._code_campaign = array("I")
+        self._redeemed = array("I")
+        
+        self._campaign_names: List[str] = []
+        self._campaign_points = array("H")
+        self._campaign_expires = array("d")
+        self._campaign_caps = array("I")  # 0 = unlimited
+        self._campaign_exclusive = array("B")
+        self._expiry_times: List[float] = []
+        
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._write_lock = threading.Lock()
+        self._changed = next_version()
+
+    @classmethod
+    def from_rates(cls, rates: Dict[str, float]) -> "PromoCatalog":
+        """
+        Build a catalog of unlimited, non-expiring, stackable codes.
+        
+        Args:
+            rates: Dictionary of promo codes to discount rates
+            
+        Returns:
+            New catalog with one campaign per code
+        """
+        catalog = cls()
+        for code, rate in rates.items():
+            catalog.add(code, rate)
+        return catalog
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "PromoCatalog":
+        """
+        Build a catalog from records such as CSV rows.
+        
+        Each record has a "code" plus either a "campaign" name, or the
+        campaign fields "rate", "expires_at", "max_redemptions" and
+        "exclusive". Records naming the same campaign share the fields
+        of the first one; records without a campaign get their own.
+        
+        Args:
+            records: Iterable of dicts
+            
+        Returns:
+            New catalog
+            
+        Raises:
+            ValueError: If a record is invalid or malformed, or a code is duplicated
+        """
+        catalog = cls()
+        campaigns: Dict[str, int] = {}
+        for record in records:
+            record = record_fields(record)
+            name = record.get("campaign") or None
+            campaign = campaigns.get(name) if name else None
+            if campaign is None:
+                campaign = catalog.add_campaign(
+                    name or normalize_code(str(record["code"])),
+                    float(record["rate"]),
+                    expires_at=parse_timestamp(record.get("expires_at")),
+                    max_redemptions=int(record.get("max_redemptions") or 0) or None,
+                    exclusive=str(record.get("exclusive", "")).strip().lower() in ("1", "true", "yes", "y")
+                )
+                if name:
+                    campaigns[name] = campaign
+            catalog.add_codes([str(record["code"])], campaign)
+        return catalog
+
+    def add_campaign(
+        self,
+        name: str,
+        rate: float,
+        expires_at: Optional[float] = None,
+        max_redemptions: Optional[int] = None,
+        exclusive: bool = False
+    ) -> int:
+        """
+        Define a campaign that codes can be added to.
+        
+        Args:
+            name: Campaign name (for reporting)
+            rate: Discount rate as a decimal (0 < rate <= 1)
+            expires_at: Unix timestamp after which its codes are invalid
+                (None for no expiry)
+            max_redemptions: Redemptions allowed per code (None for
+                unlimited; 1 for single-use codes)
+            exclusive: Whether its codes refuse to stack with other codes
+            
+        Returns:
+            Campaign number for add_codes
+            
+        Raises:
+            ValueError: If rate or max_redemptions is out of range
+        """
+        if not 0 < rate <= 1:
+            raise ValueError(f"Promo rate must be between 0 and 1, got {rate}")
+        if max_redemptions is not None and max_redemptions <= 0:
+            raise ValueError(f"Max redemptions must be greater than 0, got {max_redemptions}")
+        expires = NEVER if expires_at is None else float(expires_at)
+        
+        with self._write_lock:
+            self._campaign_names.append(name)
+            self._campaign_points.append(to_basis_points(rate))
+            self._campaign_expires.append(expires)
+            self._campaign_caps.append(max_redemptions or 0)
+            self._campaign_exclusive.append(bool(exclusive))
+            if expires != NEVER:
+                insort(self._expiry_times, expires)
+            self._changed = next_version()
+            return len(self._campaign_names) - 1
+
+    def add_codes(self, codes: Iterable[str], campaign: int) -> None:
+        """
+        Add codes to a campaign.
+        
+        Args:
+            codes: Promo codes (normalized to uppercase)
+            campaign: Campaign number from add_campaign
+            
+        Raises:
+            ValueError: If the campaign is unknown or a code already exists
+        """
+        if not 0 <= campaign < len(self._campaign_names):
+            raise ValueError(f"Unknown campaign: {campaign}")
+        with self._write_lock:
+            for code in codes:
+                code = normalize_code(code)
+                if not code:
+                    raise ValueError("Promo code cannot be empty")
+                if _CODE_SEPARATORS.search(code):
+                    raise ValueError(f"Promo code cannot contain spaces, commas or '+': {code}")
+                if code in self._slots:
+                    raise ValueError(f"Duplicate promo code: {code}")
+                self._slots[code] = len(self._code_campaign)
+                self._code_campaign.append(campaign)
+                self._redeemed.append(0)
+            self._changed = next_version()
+
+    def add(
+        self,
+        code: str,
+        rate: float,
+        expires_at: Optional[float] = None,
+        max_redemptions: Optional[int] = None,
+        exclusive: bool = False
+    ) -> None:
+        """Add one code with its own campaign (see add_campaign for arguments)."""
+        self.add_codes([code], self.add_campaign(normalize_code(code), rate, expires_at, max_redemptions, exclusive))
+
+    @property
+    def version(self) -> Tuple[int, int]:
+        """Catalog version: changes with edits, exhausted codes and expiries."""
+        return self._changed, bisect_right(self._expiry_times, time.time())
+
+    def __getitem__(self, code: str) -> float:
+        """Discount rate of a code (regardless of expiry or redemptions)."""
+        campaign = self._code_campaign[self._slots[normalize_code(code)]]
+        return self._campaign_points[campaign] / BASIS_POINTS
+
+    def __contains__(self, code) -> bool:
+        return isinstance(code, str) and normalize_code(code) in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _valid_slot(self, code: str, now: Optional[float]) -> Optional[int]:
+        """Slot of a normalized code that exists, has not expired and is not used up."""
+        slot = self._slots.get(code)
+        if slot is None:
+            return None
+        campaign = self._code_campaign[slot]
+        if (time.time() if now is None else now) >= self._campaign_expires[campaign]:
+            return None
+        cap = self._campaign_caps[campaign]
+        if cap and self._redeemed[slot] >= cap:
+            return None
+        return slot
+
+    def is_valid(self, code: str, now: Optional[float] = None) -> bool:
+        """
+        Check whether a code can be applied.
+        
+        Args:
+            code: Promo code (any case, surrounding spaces ignored)
+            now: Unix timestamp to check expiry against (defaults to now)
+            
+        Returns:
+            True if the code exists, has not expired and has redemptions left
+        """
+        return self._valid_slot(normalize_code(code), now) is not None
+
+    def campaign_of(self, code: str) -> str:
+        """
+        Get the campaign name of a code.
+        
+        Raises:
+            KeyError: If the code does not exist
+        """
+        return self._campaign_names[self._code_campaign[self._slots[normalize_code(code)]]]
+
+    def details(self, code: str) -> Dict:
+        """
+        Describe a code.
+        
+        Args:
+            code: Promo code
+            
+        Returns:
+            Dictionary with code, campaign, rate, expires_at (None for
+            never), max_redemptions (None for unlimited), redeemed and
+            exclusive
+            
+        Raises:
+            KeyError: If the code does not exist
+        """
+        code = normalize_code(code)
+        slot = self._slots[code]
+        campaign = self._code_campaign[slot]
+        expires = self._campaign_expires[campaign]
+        return {
+            "code": code,
+            "campaign": self._campaign_names[campaign],
+            "rate": self._campaign_points[campaign] / BASIS_POINTS,
+            "expires_at": None if expires == NEVER else expires,
+            "max_redemptions": self._campaign_caps[campaign] or None,
+            "redeemed": self._redeemed[slot],
+            "exclusive": bool(self._campaign_exclusive[campaign]),
+        }
+
+    def campaigns(self, now: Optional[float] = None) -> List[Dict]:
+        """
+        List the campaigns whose codes can currently be used.
+        
+        Args:
+            now: Unix timestamp to check expiry against (defaults to now)
+            
+        Returns:
+            One dictionary per unexpired campaign that has codes not yet
+            used up, with name, rate, expires_at (None for never),
+            max_redemptions (None for unlimited), exclusive and codes
+            (number of codes that can still be redeemed)
+        """
+        now = time.time() if now is None else now
+        caps = self._campaign_caps
+        counts = Counter(
+            campaign for campaign, used in zip(self._code_campaign, self._redeemed)
+            if not caps[campaign] or used < caps[campaign]
+        )
+        result = []
+        for campaign, name in enumerate(self._campaign_names):
+            expires = self._campaign_expires[campaign]
+            if not counts[campaign] or now >= expires:
+                continue
+            result.append({
+                "name": name,
+                "rate": self._campaign_points[campaign] / BASIS_POINTS,
+                "expires_at": None if expires == NEVER else expires,
+                "max_redemptions": self._campaign_caps[campaign] or None,
+                "exclusive": bool(self._campaign_exclusive[campaign]),
+                "codes": counts[campaign],
+            })
+        return result
+
+    def resolve(self, promo: str, now: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        Choose the codes to apply from a promo field.
+        
+        The field may hold several codes separated by spaces, commas or
+        "+" (at most MAX_STACKED_CODES are considered). Invalid codes are
+        skipped. If several valid codes remain and any is exclusive, only
+        the one with the highest rate applies; otherwise all of them
+        stack, in the order entered.
+        
+        Args:
+            promo: Promo field text
+            now: Unix timestamp to check expiry against (defaults to now)
+            
+        Returns:
+            (code, rate) pairs to apply, in order
+        """
+        code = normalize_code(promo)
+        if code in self._slots:  # A single code (codes never contain separators)
+            slot = self._valid_slot(code, now)
+            if slot is None:
+                return []
+            return [(code, self._campaign_points[self._code_campaign[slot]] / BASIS_POINTS)]
+        if not _CODE_SEPARATORS.search(code):
+            return []  # A single unknown code
+        
+        codes = list(dict.fromkeys(c for c in _CODE_SEPARATORS.split(code) if c))
+        valid = []
+        for code in codes[:MAX_STACKED_CODES]:
+            slot = self._valid_slot(code, now)
+            if slot is not None:
+                valid.append((code, self._code_campaign[slot]))
+        
+        if len(valid) > 1 and any(self._campaign_exclusive[campaign] for _, campaign in valid):
+            valid = [max(valid, key=lambda item: self._campaign_points[item[1]])]
+        return [(code, self._campaign_points[campaign] / BASIS_POINTS) for code, campaign in valid]
+
+    def redeem(self, code: str, now: Optional[float] = None) -> bool:
+        """
+        Record one redemption of a code.
+        
+        Safe to call from many threads: the check against the cap and the
+        increment happen under the code's lock stripe.
+        
+        Args:
+            code: Promo code
+            now: Unix timestamp to check expiry against (defaults to now)
+            
+        Returns:
+            True if redeemed; False if the code is unknown, expired or
+            has no redemptions left
+        """
+        slot = self._slots.get(normalize_code(code))
+        if slot is None:
+            return False
+        campaign = self._code_campaign[slot]
+        if (time.time() if now is None else now) >= self._campaign_expires[campaign]:
+            return False
+        cap = self._campaign_caps[campaign]
+        with self._locks[slot % len(self._locks)]:
+            used = self._redeemed[slot]
+            if cap and used >= cap:
+                return False
+            self._redeemed[slot] = used + 1
+        if cap and used + 1 == cap:
+            self._changed = next_version()  # Quotes using this code are now stale
+        return True
+
+    def release(self, code: str) -> bool:
+        """
+        Undo one redemption of a code (a sale that did not go through).
+        
+        Args:
+            code: Promo code
+            
+        Returns:
+            True if a redemption was undone; False if the code is unknown
+            or has none
+        """
+        slot = self._slots.get(normalize_code(code))
+        if slot is None:
+            return False
+        cap = self._campaign_caps[self._code_campaign[slot]]
+        with self._locks[slot % len(self._locks)]:
+            used = self._redeemed[slot]
+            if not used:
+                return False
+            self._redeemed[slot] = used - 1
+        if cap and used == cap:
+            self._changed = next_version()  # Usable again
+        return True
+
+    def redemptions(self, code: str) -> int:
+        """Number of times a code has been redeemed."""
+        return self._redeemed[self._slots[normalize_code(code)]]
+
+
+def resolve_promos(
+    promo: Optional[str],
+    promo_codes: Union[Dict[str, float], PromoCatalog],
+    now: Optional[float] = None
+) -> List[Tuple[str, float]]:
+    """
+    Choose the promo codes to apply to a quote.
+    
+    Args:
+        promo: Promo field text (None or empty for no promo)
+        promo_codes: PromoCatalog, or a plain dictionary of codes to rates
+            (one exact code, no expiry or caps)
+        now: Unix timestamp to check expiry against (defaults to now)
+        
+    Returns:
+        (code, rate) pairs to apply, in order (empty if none is valid)
+    """
+    if not promo:
+        return []
+    if isinstance(promo_codes, PromoCatalog):
+        return promo_codes.resolve(promo, now)
+    code = normalize_code(promo)
+    if code in promo_codes:
+        return [(code, promo_codes[code])]
+    return []
+
+
+def combined_rate(applied: List[Tuple[str, float]]) -> float:
+    """
+    Effective discount rate of stacked codes.
+    
+    Args:
+        applied: (code, rate) pairs, applied one after another
+        
+    Returns:
+        The single code's rate, or 1 - product of (1 - rate) for several
+    """
+    if len(applied) == 1:
+        return applied[0][1]
+    remaining = 1.0
+    for _, rate in applied:
+        remaining *= 1 - rate
+    return round(1 - remaining, 6)
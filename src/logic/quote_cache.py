@@ -0,0 +1,149 @@
+"""Bounded LRU cache of membership quotes."""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from src.logic.pricing import price_membership
+
+DEFAULT_MAXSIZE = 4096
+
+
+def quote_key(
+    plan: str,
+    months: int,
+    is_student_or_staff: bool,
+    promo: Optional[str]
+) -> Tuple[str, int, bool, Optional[str]]:
+    """
+    Normalize quote inputs the way price_membership interprets them.
+    
+    " welcome10 " and "WELCOME10" share a key, as do None and "".
+    
+    Args:
+        plan: Membership plan name
+        months: Number of months
+        is_student_or_staff: Student/staff flag
+        promo: Optional promo code
+        
+    Returns:
+        Hashable cache key
+    """
+    promo_key = promo.strip().upper() if promo else None
+    return plan, months, bool(is_student_or_staff), promo_key or None
+
+
+class QuoteCache:
+    """
+    Thread-safe LRU cache in front of price_membership.
+    
+    Entries are tied to the versions of the plans and promo_codes catalogs
+    (see src.logic.catalog.catalog_version): when either catalog changes, the whole cache
+    is dropped, so a price change never serves a stale quote. Catalogs
+    without a version (plain dicts) are priced directly, uncached.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Create an empty cache.
+        
+        Args:
+            maxsize: Maximum number of quotes kept (must be > 0)
+            
+        Raises:
+            ValueError: If maxsize <= 0
+        """
+        if maxsize <= 0:
+            raise ValueError(f"Cache size must be greater than 0, got {maxsize}")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Dict]" = OrderedDict()
+        self._catalogs: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def quote(
+        self,
+        plan: str,
+        months: int,
+        is_student_or_staff: bool,
+        promo: Optional[str],
+        plans: Dict[str, float],
+        promo_codes: Dict[str, float]
+    ) -> Dict:
+        """
+        Get a pricing breakdown, computing it only on a cache miss.
+        
+        Args:
+            plan, months, is_student_or_staff, promo, plans, promo_codes:
+                As for src.logic.pricing.price_membership
+            
+        Returns:
+            A new breakdown dictionary (safe for the caller to modify)
+            
+        Raises:
+            ValueError: If plan is invalid or months <= 0 (not cached)
+        """
+        versions = (getattr(plans, "version", None), getattr(promo_codes, "version", None))
+        if None in versions:
+            return price_membership(plan, months, is_student_or_staff, promo, plans, promo_codes)
+        
+        key = quote_key(plan, months, is_student_or_staff, promo)
+        entries = self._entries
+        with self._lock:
+            if versions != self._catalogs:
+                if entries:
+                    self.invalidations += 1
+                entries.clear()
+                self._catalogs = versions
+            breakdown = entries.get(key)
+            if breakdown is not None:
+                entries.move_to_end(key)
+                self.hits += 1
+                return breakdown.copy()
+            self.misses += 1
+        
+        breakdown = price_membership(*key, plans, promo_codes)
+        
+        with self._lock:
+            if versions == self._catalogs:
+                entries[key] = breakdown
+                if len(entries) > self.maxsize:
+                    entries.popitem(last=False)
+                    self.evictions += 1
+        return breakdown.copy()
+
+    def __len__(self) -> int:
+        """Number of cached quotes."""
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with hits, misses, evictions, invalidations, size
+            and maxsize
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached quotes and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._catalogs = None
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+
+# Process-wide cache shared by the dashboard and the CLI
+quote_cache = QuoteCache()
@@ -0,0 +1,33 @@
+"""Input records that could not be read, and the check every reader makes.
+
+read_records (src/logic/bulk.py) yields a MalformedRecord in place of a
+line it cannot parse, so a run carries on past it. A MalformedRecord is
+not a mapping: code that reads records calls record_fields on each one,
+inside its per-row error handling, and reports the row like any other
+invalid row.
+"""
+
+from typing import Mapping, NamedTuple, Union
+
+
+class MalformedRecord(NamedTuple):
+    """A line of an input file that is not a record, with the reason."""
+    error: str
+
+
+def record_fields(record: Union[Mapping, MalformedRecord]) -> Mapping:
+    """
+    Get the fields of an input record.
+    
+    Args:
+        record: Record from read_records
+        
+    Returns:
+        The record itself
+        
+    Raises:
+        ValueError: If the record is a MalformedRecord (the message says why)
+    """
+    if isinstance(record, MalformedRecord):
+        raise ValueError(record.error)
+    return record
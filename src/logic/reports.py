@@ -0,0 +1,375 @@
+"""Personal month-end summaries for every member, written in parallel.
+
+The layout is compiled once into a ReportTemplate. Compiling checks the
+placeholders, fills in the parts that are the same for every member
+(rules, center, period) and splits the rest into literal text and member
+fields, so rendering a report parses nothing.
+Members are processed in chunks: each chunk is priced, rendered and
+written by one worker process, and each file goes through export_text.
+"""
+
+import hashlib
+import re
+import string
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.logic.bulk import chunked, map_chunks, pricing_request
+from src.logic.export import export_text
+from src.logic.quote_cache import quote_cache
+from src.logic.records import MalformedRecord, record_fields
+
+REPORT_LAYOUT = """\
+{rule}
+FITNESS CENTER MEMBER SUMMARY
+{rule}
+Name: {name}
+Member ID: {member_id}
+Center: {center}
+Period: {period}
+
+PRICING BREAKDOWN:
+  Plan: {plan}
+  Months: {months}
+  Final Cost: {final_cost}
+
+ATTENDANCE SUMMARY:
+{attendance}
+
+{rule}"""
+
+ATTENDANCE_TOTALS = """\
+  Total Attendance: {total}
+  Average per Activity: {average:.2f}
+  By Activity:"""
+
+ACTIVITY_LINE = "    • {activity}: {count}"
+
+NO_ATTENDANCE = "  No attendance data recorded."
+
+# Fields filled in per member; everything else in a layout is fixed at compile time
+MEMBER_FIELDS = ("name", "member_id", "plan", "months", "final_cost", "attendance")
+
+DEFAULT_CENTER = "Baun Fitness Center"
+
+# Members per chunk handed to a worker
+DEFAULT_CHUNK_SIZE = 500
+
+REPORT_FIELDS = ["row", "member_id", "path", "error"]
+
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+class CompiledLayout:
+    """
+    A str.format-style layout split into literal text and field slots.
+    
+    Calling it with the field values formats each slot with format() and
+    joins the parts, so a call does no parsing (str.format_map would parse
+    the layout again on every call).
+    """
+
+    def __init__(self, layout: str, fields: Sequence[str], fixed: Mapping[str, object]):
+        """
+        Parse a layout.
+        
+        Args:
+            layout: Text with {placeholders}, optionally with !conversion
+                and :format_spec
+            fields: Names of the values passed positionally to each call
+            fixed: Values substituted now
+            
+        Raises:
+            ValueError: If the layout uses an unknown placeholder, a nested
+                format spec or an unknown conversion
+        """
+        indexes = {name: i for i, name in enumerate(fields)}
+        # (literal text, field index or None, conversion or None, format spec)
+        self._parts: List[Tuple[str, Optional[int], Optional[Callable[[Any], str]], str]] = []
+        literal = ""
+        for text, name, spec, conversion in string.Formatter().parse(layout):
+            literal += text
+            if name is None:
+                continue
+            if conversion is not None and conversion not in _CONVERSIONS:
+                raise ValueError(f"Unsupported conversion !{conversion} in {{{name}}}")
+            if "{" in spec:
+                raise ValueError(f"Unsupported format spec {spec!r} in {{{name}}}")
+            convert = _CONVERSIONS[conversion] if conversion else None
+            if name in fixed:
+                value = fixed[name]
+                literal += format(convert(value) if convert else value, spec)
+            elif name in indexes:
+                self._parts.append((literal, indexes[name], convert, spec))
+                literal = ""
+            else:
+                raise ValueError(f"Unknown report field {{{name}}}; use one of {sorted(set(fields) | set(fixed))}")
+        self._tail = literal
+
+    def __call__(self, *values) -> str:
+        """Format the layout with the field values, in the order of its fields."""
+        return "".join([
+            literal + format(values[index] if convert is None else convert(values[index]), spec)
+            for literal, index, convert, spec in self._parts
+        ]) + self._tail
+
+
+def compile_layout(layout: str, fields: Sequence[str], fixed: Mapping[str, object]) -> CompiledLayout:
+    """
+    Compile a str.format-style layout into a function of its fields.
+    
+    Args:
+        layout: Text with {placeholders}, optionally with !conversion
+            and :format_spec
+        fields: Names of the function's positional parameters
+        fixed: Values substituted at compile time
+        
+    Returns:
+        Function taking the fields positionally and returning the text
+        
+    Raises:
+        ValueError: If the layout uses an unknown placeholder or a
+            conversion or format spec that is not supported
+    """
+    return CompiledLayout(layout, fields, fixed)
+
+
+class ReportTemplate:
+    """
+    A report layout compiled for one run.
+    
+    Fixed fields are substituted once at construction and the rest of the
+    layout is split into literal text and member fields (see
+    compile_layout), as are the attendance lines. Templates pickle as their
+    layout and are compiled again in each worker process.
+    """
+
+    def __init__(
+        self,
+        layout: str = REPORT_LAYOUT,
+        activity_line: str = ACTIVITY_LINE,
+        center: str = DEFAULT_CENTER,
+        period: str = "",
+        rule: str = "=" * 60
+    ):
+        """
+        Compile a layout.
+        
+        Args:
+            layout: Report text with {placeholders}: the MEMBER_FIELDS plus
+                rule, center and period
+            activity_line: Line per activity, with {activity} and {count}
+            center: Center name
+            period: Reporting period, e.g. "October 2026"
+            rule: Separator line
+            
+        Raises:
+            ValueError: If a layout uses an unknown placeholder
+        """
+        self._args = (layout, activity_line, center, period, rule)
+        self._render = compile_layout(layout, MEMBER_FIELDS, {"rule": rule, "center": center, "period": period})
+        self._totals = compile_layout(ATTENDANCE_TOTALS, ("total", "average"), {})
+        self._activity = compile_layout(activity_line, ("activity", "count"), {})
+
+    def __reduce__(self):
+        """Pickle as the layout arguments, which are smaller than the compiled parts."""
+        return ReportTemplate, self._args
+
+    def render(self, member: Mapping, breakdown: Mapping, attendance: Mapping[str, int]) -> str:
+        """
+        Render one member's report.
+        
+        Args:
+            member: Member record (id, name)
+            breakdown: Pricing breakdown (plan, months, final_cost)
+            attendance: Activity -> count for the member
+            
+        Returns:
+            Report text
+        """
+        if attendance:
+            total = sum(attendance.values())
+            activity = self._activity
+            attendance_text = "\n".join([
+                self._totals(total, total / len(attendance)),
+                *[activity(name, count) for name, count in attendance.items()]
+            ])
+        else:
+            attendance_text = NO_ATTENDANCE
+        return self._render(
+            member.get("name") or "Member",
+            member.get("id", ""),
+            breakdown.get("plan", "N/A"),
+            breakdown.get("months", "N/A"),
+            f"${breakdown.get('final_cost', 0.0):,.2f}",
+            attendance_text
+        )
+
+
+def _member_id(member: Union[Mapping, MalformedRecord]) -> str:
+    """Id of a member record ("" for a malformed one)."""
+    return "" if isinstance(member, MalformedRecord) else str(member.get("id", "")).strip()
+
+
+def report_path(directory: str, member_id: str) -> Path:
+    """
+    File a member's report is written to.
+    
+    Ids that are not safe file names have their unsafe characters replaced
+    and a short hash of the raw id appended, so "a/b" and "a_b" get
+    different files.
+    """
+    name = _UNSAFE_FILENAME.sub("_", member_id)
+    if name != member_id:
+        name += "-" + hashlib.blake2s(member_id.encode(), digest_size=4).hexdigest()
+    return Path(directory) / f"{name}.txt"
+
+
+def claim_report_paths(
+    directory: str,
+    chunk: Iterable[Tuple[int, Mapping, object]],
+    claimed: Dict[str, Tuple[str, int]]
+) -> Dict[int, str]:
+    """
+    Reserve each member's report file for this run, catching overwrites.
+    
+    Args:
+        directory: Output directory
+        chunk: (row number, member record, ...) tuples
+        claimed: Case-folded file name -> (member id, row) reserved so far;
+            updated in place (case-folded because files differing only in
+            case collide on some file systems)
+            
+    Returns:
+        row number -> error for members whose file is already taken
+    """
+    errors = {}
+    for row, member, *_ in chunk:
+        member_id = _member_id(member)
+        if not member_id:
+            continue  # Reported by report_chunk
+        key = report_path(directory, member_id).name.casefold()
+        owner = claimed.setdefault(key, (member_id, row))
+        if owner[1] != row:
+            if owner[0] == member_id:
+                errors[row] = f"Duplicate member id {member_id!r} (first on row {owner[1]})"
+            else:
+                errors[row] = f"Report file for {member_id!r} collides with member {owner[0]!r} (row {owner[1]})"
+    return errors
+
+
+def report_chunk(
+    job: Tuple[str, ReportTemplate, List[Tuple[int, Dict, Dict[str, int]]], Mapping[int, str]]
+) -> List[Dict]:
+    """
+    Price, render and write the reports of a chunk of members.
+    
+    Args:
+        job: (output directory, template, chunk, errors) where chunk holds
+            (row number, member record, attendance by activity) triples and
+            errors maps rows not to write to their error (see
+            claim_report_paths); members have "id", "name", "plan",
+            "months" and optional "is_student_or_staff" and "promo" fields
+            
+    Returns:
+        One record per member (row, member_id, path, error), in order
+    """
+    directory, template, chunk, errors = job
+    results = []
+    for row, member, attendance in chunk:
+        member_id = _member_id(member)
+        try:
+            member = record_fields(member)
+            if not member_id:
+                raise ValueError("Member id cannot be empty")
+            if row in errors:
+                raise ValueError(errors[row])
+            breakdown = quote_cache.quote(**pricing_request(member))
+            path = report_path(directory, member_id)
+            export_text(str(path), [template.render(member, breakdown, attendance)])
+            results.append({"row": row, "member_id": member_id, "path": str(path), "error": None})
+        except (TypeError, ValueError, OSError) as e:
+            results.append({"row": row, "member_id": member_id, "path": None, "error": str(e)})
+    return results
+
+
+def attendance_by_member(
+    checkins: Iterable[Union[Mapping, MalformedRecord]],
+    errors: Optional[List[Tuple[int, str]]] = None
+) -> Dict[str, Dict[str, int]]:
+    """
+    Total check-ins per member and activity.
+    
+    Args:
+        checkins: Records with "member_id", "activity" and optional "count"
+            (default 1); records without a member or activity are skipped
+        errors: If given, malformed records and bad counts are appended
+            to it as (row number, error) and skipped instead of raising
+            
+    Returns:
+        member id -> {activity: count}, activities in first-seen order
+        
+    Raises:
+        ValueError: If a record is malformed or a count is not a whole
+            number (only when errors is None)
+    """
+    totals: Dict[str, Dict[str, int]] = {}
+    for row, checkin in enumerate(checkins, start=1):
+        try:
+            checkin = record_fields(checkin)
+            member_id = str(checkin.get("member_id", "")).strip()
+            activity = str(checkin.get("activity", "")).strip()
+            if not member_id or not activity:
+                continue
+            count = checkin.get("count")
+            count = 1 if count in (None, "") else int(count)
+        except (TypeError, ValueError) as e:
+            if errors is None:
+                raise
+            errors.append((row, str(e)))
+            continue
+        by_activity = totals.setdefault(member_id, {})
+        by_activity[activity] = by_activity.get(activity, 0) + count
+    return totals
+
+
+def generate_reports(
+    members: Iterable[Dict],
+    directory: str,
+    template: Optional[ReportTemplate] = None,
+    attendance: Optional[Mapping[str, Mapping[str, int]]] = None,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Dict]:
+    """
+    Write a report for every member, fanning chunks out over worker processes.
+    
+    Args:
+        members: Member records (streamed; see report_chunk for fields)
+        directory: Output directory (one file per member id; a repeated
+            id or a colliding file name is an error, not an overwrite)
+        template: Compiled layout (default: REPORT_LAYOUT)
+        attendance: member id -> {activity: count}
+        workers: Worker processes (1 runs in this process)
+        chunk_size: Members per chunk
+        
+    Yields:
+        One record per member (row, member_id, path, error), in input order
+    """
+    template = template or ReportTemplate()
+    attendance = attendance or {}
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    rows = (
+        (row, member, dict(attendance.get(_member_id(member), {})))
+        for row, member in enumerate(members, start=1)
+    )
+    claimed: Dict[str, Tuple[str, int]] = {}
+    jobs = (
+        (directory, template, chunk, claim_report_paths(directory, chunk, claimed))
+        for chunk in chunked(rows, chunk_size)
+    )
+    for results in map_chunks(report_chunk, jobs, workers):
+        yield from results
+
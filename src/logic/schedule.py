@@ -1,6 +1,17 @@
 """Schedule utilities for class management."""
 
-from typing import List, Dict
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+# "Yoga Flow - 6:00 AM": class name, then a 12-hour clock time
+_ENTRY_PATTERN = re.compile(r"^\s*(?P<name>.+?)\s+-\s+(?P<time>\d{1,2}(?::\d{2})?\s*[AaPp][Mm])\s*$")
+_TIME_PATTERN = re.compile(r"^\s*(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<period>[AaPp][Mm])?\s*$")
 
 
 def normalized_day(day: str) -> str:
@@ -49,3 +60,228 @@ def day_classes(day: str, schedule: Dict[str, List[str]]) -> List[str]:
     normalized = normalized_day(day)
     return schedule.get(normalized, [])
 
+
+def parse_time(text: str) -> int:
+    """
+    Parse a clock time into minutes after midnight.
+    
+    Args:
+        text: Time such as "6:00 AM", "5 pm" or "17:30"
+        
+    Returns:
+        Minutes after midnight (0-1439)
+        
+    Raises:
+        ValueError: If the time cannot be parsed
+    """
+    match = _TIME_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Invalid time: {text!r}")
+    
+    hour = int(match["hour"])
+    minute = int(match["minute"] or 0)
+    period = (match["period"] or "").upper()
+    
+    if period:
+        if not 1 <= hour <= 12:
+            raise ValueError(f"Invalid time: {text!r}")
+        hour = hour % 12 + (12 if period == "PM" else 0)
+    if hour > 23 or minute > 59:
+        raise ValueError(f"Invalid time: {text!r}")
+    
+    return hour * 60 + minute
+
+
+def format_time(minute: int) -> str:
+    """
+    Format minutes after midnight as a 12-hour clock time.
+    
+    Args:
+        minute: Minutes after midnight
+        
+    Returns:
+        Time string such as "6:00 AM"
+    """
+    hour, minute = divmod(minute % MINUTES_PER_DAY, 60)
+    period = "AM" if hour < 12 else "PM"
+    return f"{hour % 12 or 12}:{minute:02d} {period}"
+
+
+@dataclass(frozen=True)
+class ClassSlot:
+    """A parsed class entry from the schedule."""
+    
+    name: str
+    day: str
+    start_minute: int
+
+    @property
+    def week_minute(self) -> int:
+        """Minutes since Monday 00:00."""
+        return DAYS.index(self.day) * MINUTES_PER_DAY + self.start_minute
+
+    def __str__(self) -> str:
+        """Format the slot the way schedule entries are written."""
+        return f"{self.name} - {format_time(self.start_minute)}"
+
+
+def parse_class_entry(entry: str, day: str) -> ClassSlot:
+    """
+    Parse a schedule entry such as "Yoga Flow - 6:00 AM".
+    
+    Args:
+        entry: Class string from the schedule
+        day: Day the class runs on
+        
+    Returns:
+        ClassSlot for the entry
+        
+    Raises:
+        ValueError: If the entry or day cannot be parsed
+    """
+    day_name = normalized_day(day)
+    if day_name not in DAYS:
+        raise ValueError(f"Invalid day: {day!r}")
+    
+    match = _ENTRY_PATTERN.match(entry)
+    if not match:
+        raise ValueError(f"Invalid class entry: {entry!r}")
+    
+    return ClassSlot(name=match["name"], day=day_name, start_minute=parse_time(match["time"]))
+
+
+class ScheduleIndex:
+    """
+    Sorted index over parsed class slots.
+    
+    Slots are kept in two sorted orders, by time of week and by time of
+    day, so day, next-class and time-window queries are binary searches.
+    Name lookups use a dictionary keyed on the case-folded class name.
+    """
+
+    def __init__(self, slots: Iterable[ClassSlot]):
+        """
+        Build the index.
+        
+        Args:
+            slots: Class slots to index
+        """
+        self._by_week: List[ClassSlot] = sorted(slots, key=lambda slot: (slot.week_minute, slot.name))
+        self._week_keys: List[int] = [slot.week_minute for slot in self._by_week]
+        
+        self._by_time: List[ClassSlot] = sorted(self._by_week, key=lambda slot: slot.start_minute)
+        self._time_keys: List[int] = [slot.start_minute for slot in self._by_time]
+        
+        self._by_name: Dict[str, List[ClassSlot]] = {}
+        for slot in self._by_week:
+            self._by_name.setdefault(slot.name.casefold(), []).append(slot)
+
+    @classmethod
+    def from_schedule(cls, schedule: Dict[str, List[str]]) -> "ScheduleIndex":
+        """
+        Parse a day -> class strings schedule and index it.
+        
+        Args:
+            schedule: Dictionary mapping days to lists of class strings
+            
+        Returns:
+            ScheduleIndex over every class in the schedule
+            
+        Raises:
+            ValueError: If any entry cannot be parsed
+        """
+        return cls(
+            parse_class_entry(entry, day)
+            for day, entries in schedule.items()
+            for entry in entries
+        )
+
+    def __len__(self) -> int:
+        """Number of indexed slots."""
+        return len(self._by_week)
+
+    def __iter__(self) -> Iterator[ClassSlot]:
+        """Iterate over slots in time-of-week order."""
+        return iter(self._by_week)
+
+    def _week_range(self, start: int, end: int) -> List[ClassSlot]:
+        """Slots starting in [start, end) minutes of the week."""
+        return self._by_week[bisect_left(self._week_keys, start):bisect_left(self._week_keys, end)]
+
+    def day(self, day: str) -> List[ClassSlot]:
+        """
+        Get the classes on a day, in start time order.
+        
+        Args:
+            day: Day of the week (case-insensitive, can be abbreviation)
+            
+        Returns:
+            List of slots on that day
+        """
+        day_name = normalized_day(day)
+        if day_name not in DAYS:
+            return []
+        start = DAYS.index(day_name) * MINUTES_PER_DAY
+        return self._week_range(start, start + MINUTES_PER_DAY)
+
+    def next_after(self, day: str, minute: int) -> Optional[ClassSlot]:
+        """
+        Get the first class starting at or after a moment in the week.
+        
+        Wraps around from Sunday night to Monday morning.
+        
+        Args:
+            day: Day of the week
+            minute: Minutes after midnight on that day
+            
+        Returns:
+            The next slot, or None if the schedule is empty
+            
+        Raises:
+            ValueError: If the day cannot be parsed
+        """
+        day_name = normalized_day(day)
+        if day_name not in DAYS:
+            raise ValueError(f"Invalid day: {day!r}")
+        if not self._by_week:
+            return None
+        moment = DAYS.index(day_name) * MINUTES_PER_DAY + minute
+        position = bisect_left(self._week_keys, moment)
+        return self._by_week[position % len(self._by_week)]
+
+    def between(self, start_minute: int, end_minute: int, days: Optional[Sequence[str]] = None) -> List[ClassSlot]:
+        """
+        Get classes starting within a time-of-day window.
+        
+        Args:
+            start_minute: Window start, minutes after midnight (inclusive)
+            end_minute: Window end, minutes after midnight (exclusive)
+            days: Only these days (default: every day of the week)
+            
+        Returns:
+            Matching slots in time-of-week order
+        """
+        if days is not None:
+            return [
+                slot
+                for day in sorted({normalized_day(d) for d in days} & set(DAYS), key=DAYS.index)
+                for slot in self._week_range(
+                    DAYS.index(day) * MINUTES_PER_DAY + start_minute,
+                    DAYS.index(day) * MINUTES_PER_DAY + end_minute
+                )
+            ]
+        
+        window = self._by_time[bisect_left(self._time_keys, start_minute):bisect_left(self._time_keys, end_minute)]
+        return sorted(window, key=lambda slot: slot.week_minute)
+
+    def named(self, name: str) -> List[ClassSlot]:
+        """
+        Get every slot of a class, matched case-insensitively.
+        
+        Args:
+            name: Class name such as "Yoga Flow"
+            
+        Returns:
+            Matching slots in time-of-week order
+        """
+        return list(self._by_name.get(name.strip().casefold(), []))
@@ -0,0 +1,482 @@
+"""Multi-room timetables: conflict detection and free-slot suggestions.
+
+A timetable is a list of sessions. Each session has a class, a day, a
+start and end time, a room and an instructor. Sessions are indexed per
+room and per instructor in an IntervalIndex. This is a static interval
+tree: intervals sorted by start, where every node of the implicit
+balanced tree also stores the latest end in its subtree. An overlap query
+reports its k hits in O((k + 1) log n). Finding every conflict takes one
+query per session, so the whole check costs O((n + k) log n). Sessions
+are never compared pairwise.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from src.logic.records import MalformedRecord, record_fields
+from src.logic.schedule import DAYS, MINUTES_PER_DAY, format_time, normalized_day, parse_class_entry, parse_time
+
+# Class length when the schedule or a record does not give one
+DEFAULT_MINUTES = 60
+
+# Opening hours searched for free slots (minutes after midnight)
+OPEN_MINUTE = 5 * 60
+CLOSE_MINUTE = 22 * 60
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    """
+    Static interval tree over half-open [start, end) intervals.
+    
+    Intervals are kept sorted by start. The middle element of every
+    range is the root of that range's subtree and records the latest end
+    in the subtree. A query skips any subtree that ends before the query
+    starts, and stops at the first start past the query's end.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[int, int, T]]):
+        """
+        Build the index.
+        
+        Args:
+            intervals: (start, end, item) tuples
+        """
+        ordered = sorted(intervals, key=lambda interval: (interval[0], interval[1]))
+        self._starts: List[int] = [interval[0] for interval in ordered]
+        self._ends: List[int] = [interval[1] for interval in ordered]
+        self._items: List[T] = [interval[2] for interval in ordered]
+        self._max_end: List[int] = list(self._ends)
+        self._build(0, len(ordered))
+
+    def _build(self, lo: int, hi: int) -> Optional[int]:
+        """Fill in the latest end of the subtree over [lo, hi) and return it."""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        latest = max(
+            end for end in (self._ends[mid], self._build(lo, mid), self._build(mid + 1, hi))
+            if end is not None
+        )
+        self._max_end[mid] = latest
+        return latest
+
+    def __len__(self) -> int:
+        """Number of indexed intervals."""
+        return len(self._starts)
+
+    def _positions(self, start: int, end: int) -> List[int]:
+        """Sorted positions of the intervals overlapping [start, end)."""
+        found: List[int] = []
+
+        def visit(lo: int, hi: int) -> None:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._max_end[mid] <= start:
+                    return
+                visit(lo, mid)
+                if self._starts[mid] >= end:
+                    return
+                if self._ends[mid] > start:
+                    found.append(mid)
+                lo = mid + 1
+        
+        visit(0, len(self._starts))
+        return found
+
+    def overlapping(self, start: int, end: int) -> List[Tuple[int, int, T]]:
+        """
+        Get the intervals overlapping [start, end).
+        
+        Args:
+            start: Query start (inclusive)
+            end: Query end (exclusive)
+            
+        Returns:
+            (start, end, item) tuples in start order
+        """
+        return [(self._starts[i], self._ends[i], self._items[i]) for i in self._positions(start, end)]
+
+    def overlapping_pairs(self) -> Iterator[Tuple[Tuple[int, int, T], Tuple[int, int, T]]]:
+        """
+        Iterate over every pair of overlapping intervals, each once.
+        
+        Yields:
+            (earlier, later) interval tuples, in start order of the earlier
+        """
+        for i in range(len(self._starts)):
+            for j in self._positions(self._starts[i], self._ends[i]):
+                if j > i:
+                    yield (
+                        (self._starts[i], self._ends[i], self._items[i]),
+                        (self._starts[j], self._ends[j], self._items[j]),
+                    )
+
+
+@dataclass(frozen=True)
+class Session:
+    """A class held in a room, with an instructor, on one day of the week."""
+    
+    name: str
+    day: str
+    start_minute: int
+    end_minute: int
+    room: str
+    instructor: str = ""
+
+    def __post_init__(self):
+        """Validate the day and times."""
+        if self.day not in DAYS:
+            raise ValueError(f"Invalid day: {self.day!r}")
+        if not 0 <= self.start_minute < self.end_minute <= MINUTES_PER_DAY:
+            raise ValueError(
+                f"Session must start before it ends and end by midnight, got "
+                f"{self.start_minute}-{self.end_minute} for {self.name!r}"
+            )
+
+    @property
+    def week_start(self) -> int:
+        """Start in minutes since Monday 00:00."""
+        return DAYS.index(self.day) * MINUTES_PER_DAY + self.start_minute
+
+    @property
+    def week_end(self) -> int:
+        """End in minutes since Monday 00:00."""
+        return DAYS.index(self.day) * MINUTES_PER_DAY + self.end_minute
+
+    @property
+    def minutes(self) -> int:
+        """Length in minutes."""
+        return self.end_minute - self.start_minute
+
+    def __str__(self) -> str:
+        """Format as "Yoga Flow - 6:00 AM-7:00 AM (Studio A, Maya)"."""
+        people = f", {self.instructor}" if self.instructor else ""
+        return f"{self.name} - {format_time(self.start_minute)}-{format_time(self.end_minute)} ({self.room}{people})"
+
+
+def overnight_sessions(
+    name: str,
+    day: str,
+    start_minute: int,
+    minutes: int,
+    room: str,
+    instructor: str = ""
+) -> List[Session]:
+    """
+    Sessions for a class that may run past midnight.
+    
+    A class that ends after midnight is split at midnight; the rest is
+    booked at the start of the next day (Sunday wraps to Monday).
+    
+    Args:
+        name: Class name
+        day: Day the class starts
+        start_minute: Start, minutes after midnight
+        minutes: Length in minutes (at most a day)
+        room: Room name
+        instructor: Instructor name
+        
+    Returns:
+        One session, or two if the class runs past midnight
+        
+    Raises:
+        ValueError: If the day is invalid or the length is not 1 to MINUTES_PER_DAY
+    """
+    if not 0 < minutes <= MINUTES_PER_DAY:
+        raise ValueError(f"Class length must be 1 to {MINUTES_PER_DAY} minutes, got {minutes} for {name!r}")
+    end_minute = start_minute + minutes
+    if end_minute <= MINUTES_PER_DAY:
+        return [Session(name, day, start_minute, end_minute, room, instructor)]
+    if day not in DAYS:
+        raise ValueError(f"Invalid day: {day!r}")
+    next_day = DAYS[(DAYS.index(day) + 1) % len(DAYS)]
+    return [
+        Session(name, day, start_minute, MINUTES_PER_DAY, room, instructor),
+        Session(name, next_day, 0, end_minute - MINUTES_PER_DAY, room, instructor),
+    ]
+
+
+def parse_session(record: Dict) -> List[Session]:
+    """
+    Parse a timetable record.
+    
+    Args:
+        record: Dict with name (or class), day, start, room, and optionally
+            end or minutes (default DEFAULT_MINUTES) and instructor; an end
+            at or before the start is on the next day
+            
+    Returns:
+        Sessions for the record: one, or two if it runs past midnight
+        (see overnight_sessions)
+        
+    Raises:
+        ValueError: If a field is missing or invalid
+    """
+    name = str(record.get("name") or record.get("class") or "").strip()
+    room = str(record.get("room") or "").strip()
+    if not name or not room:
+        raise ValueError(f"Session needs a name and a room: {record!r}")
+    
+    start = parse_time(str(record.get("start", "")))
+    if record.get("end"):
+        minutes = (parse_time(str(record["end"])) - start) % MINUTES_PER_DAY
+        if not minutes:
+            raise ValueError(f"Session {name!r} must start before it ends")
+    else:
+        minutes = int(record.get("minutes") or DEFAULT_MINUTES)
+    return overnight_sessions(
+        name=name,
+        day=normalized_day(str(record.get("day", ""))),
+        start_minute=start,
+        minutes=minutes,
+        room=room,
+        instructor=str(record.get("instructor") or "").strip(),
+    )
+
+
+@dataclass(frozen=True)
+class Conflict:
+    """Two sessions overlapping in the same room or with the same instructor."""
+    
+    kind: str
+    resource: str
+    first: Session
+    second: Session
+
+    @property
+    def start_minute(self) -> int:
+        """Start of the overlap, minutes after midnight."""
+        return max(self.first.start_minute, self.second.start_minute)
+
+    @property
+    def end_minute(self) -> int:
+        """End of the overlap, minutes after midnight."""
+        return min(self.first.end_minute, self.second.end_minute)
+
+    def __str__(self) -> str:
+        """Describe the conflict in one line."""
+        return (
+            f"{self.kind.title()} {self.resource} on {self.first.day.title()} "
+            f"{format_time(self.start_minute)}-{format_time(self.end_minute)}: "
+            f"{self.first.name} and {self.second.name}"
+        )
+
+
+class Timetable:
+    """
+    Sessions indexed by room and by instructor for overlap queries.
+    """
+
+    def __init__(self, sessions: Iterable[Session]):
+        """
+        Build the timetable indexes.
+        
+        Args:
+            sessions: Sessions to index
+        """
+        self._sessions: List[Session] = sorted(sessions, key=lambda s: (s.week_start, s.room, s.name))
+        self._rooms = self._index(lambda session: session.room)
+        self._instructors = self._index(lambda session: session.instructor)
+
+    def _index(self, resource) -> Dict[str, IntervalIndex[int]]:
+        """One IntervalIndex of session numbers per room or instructor."""
+        groups: Dict[str, List[Tuple[int, int, int]]] = {}
+        for number, session in enumerate(self._sessions):
+            key = resource(session)
+            if key:
+                groups.setdefault(key, []).append((session.week_start, session.week_end, number))
+        return {key: IntervalIndex(intervals) for key, intervals in groups.items()}
+
+    @classmethod
+    def from_schedule(
+        cls,
+        schedule: Dict[str, List[str]],
+        details: Dict[str, Dict],
+        default_room: str = "Main Studio"
+    ) -> "Timetable":
+        """
+        Build a timetable from a day -> class strings schedule.
+        
+        Args:
+            schedule: Dictionary mapping days to lists of class strings
+            details: Class name -> {"room", "instructor", "minutes"}; classes
+                without details get default_room and DEFAULT_MINUTES
+            default_room: Room for classes without details
+            
+        Returns:
+            Timetable of every class in the schedule; a class running past
+            midnight is split into two sessions (see overnight_sessions)
+            
+        Raises:
+            ValueError: If any entry cannot be parsed
+        """
+        sessions = []
+        for day, entries in schedule.items():
+            for entry in entries:
+                slot = parse_class_entry(entry, day)
+                info = details.get(slot.name, {})
+                sessions.extend(overnight_sessions(
+                    name=slot.name,
+                    day=slot.day,
+                    start_minute=slot.start_minute,
+                    minutes=int(info.get("minutes", DEFAULT_MINUTES)),
+                    room=info.get("room", default_room),
+                    instructor=info.get("instructor", ""),
+                ))
+        return cls(sessions)
+
+    def __len__(self) -> int:
+        """Number of sessions."""
+        return len(self._sessions)
+
+    def __iter__(self) -> Iterator[Session]:
+        """Iterate over sessions in time-of-week order."""
+        return iter(self._sessions)
+
+    @property
+    def rooms(self) -> List[str]:
+        """Room names, sorted."""
+        return sorted(self._rooms)
+
+    @property
+    def instructors(self) -> List[str]:
+        """Instructor names, sorted."""
+        return sorted(self._instructors)
+
+    def conflicts(self) -> List[Conflict]:
+        """
+        Find every pair of sessions sharing a room or an instructor at the same time.
+        
+        Returns:
+            Room conflicts, then instructor conflicts, each by resource and time
+        """
+        found = []
+        for kind, indexes in (("room", self._rooms), ("instructor", self._instructors)):
+            for resource in sorted(indexes):
+                for (_, _, first), (_, _, second) in indexes[resource].overlapping_pairs():
+                    found.append(Conflict(kind, resource, self._sessions[first], self._sessions[second]))
+        return found
+
+    def _busy(self, indexes: Dict[str, IntervalIndex[int]], key: str, start: int, end: int, ignore: Optional[Session]) -> List[Tuple[int, int]]:
+        """Week-minute intervals a room or instructor is booked within [start, end)."""
+        index = indexes.get(key)
+        if index is None:
+            return []
+        return [
+            (first, last)
+            for first, last, number in index.overlapping(start, end)
+            if self._sessions[number] is not ignore
+        ]
+
+    def free_slots(
+        self,
+        day: str,
+        minutes: int,
+        room: Optional[str] = None,
+        instructor: Optional[str] = None,
+        open_minute: int = OPEN_MINUTE,
+        close_minute: int = CLOSE_MINUTE,
+        ignore: Optional[Session] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Find gaps of at least minutes when a room and/or instructor are free.
+        
+        Args:
+            day: Day of the week
+            minutes: Required length
+            room: Room that must be free (default: any)
+            instructor: Instructor who must be free (default: any)
+            open_minute: Earliest start, minutes after midnight
+            close_minute: Latest end, minutes after midnight
+            ignore: Session to treat as not booked (the one being moved)
+            
+        Returns:
+            (start, end) gaps in minutes after midnight, in time order
+            
+        Raises:
+            ValueError: If the day cannot be parsed or minutes is not positive
+        """
+        day_name = normalized_day(day)
+        if day_name not in DAYS:
+            raise ValueError(f"Invalid day: {day!r}")
+        if minutes <= 0:
+            raise ValueError(f"Minutes must be greater than 0, got {minutes}")
+        offset = DAYS.index(day_name) * MINUTES_PER_DAY
+        start, end = offset + open_minute, offset + close_minute
+        
+        busy = []
+        if room:
+            busy += self._busy(self._rooms, room, start, end, ignore)
+        if instructor:
+            busy += self._busy(self._instructors, instructor, start, end, ignore)
+        
+        gaps, cursor = [], start
+        for first, last in sorted(busy):
+            if first - cursor >= minutes:
+                gaps.append((cursor - offset, first - offset))
+            cursor = max(cursor, last)
+        if end - cursor >= minutes:
+            gaps.append((cursor - offset, end - offset))
+        return gaps
+
+    def suggest(self, session: Session, limit: int = 3) -> List[Session]:
+        """
+        Suggest conflict-free alternatives for a session.
+        
+        The same time in another free room comes first (when the instructor
+        is free), then the nearest free times within opening hours on the
+        same day in the same room.
+        
+        Args:
+            session: Session to move (it does not block itself)
+            limit: Maximum number of suggestions
+            
+        Returns:
+            Alternative sessions, best first
+        """
+        suggestions = []
+        if not self._busy(self._instructors, session.instructor, session.week_start, session.week_end, session):
+            for room in self.rooms:
+                if room != session.room and not self._busy(self._rooms, room, session.week_start, session.week_end, session):
+                    suggestions.append(replace(session, room=room))
+                if len(suggestions) >= limit:
+                    return suggestions
+        
+        gaps = self.free_slots(session.day, session.minutes, session.room, session.instructor, ignore=session)
+        starts = {
+            start
+            for gap_start, gap_end in gaps
+            for start in (
+                gap_start,
+                gap_end - session.minutes,
+                min(max(session.start_minute, gap_start), gap_end - session.minutes),
+            )
+        }
+        starts.discard(session.start_minute)
+        for start in sorted(starts, key=lambda start: (abs(start - session.start_minute), start)):
+            suggestions.append(replace(session, start_minute=start, end_minute=start + session.minutes))
+            if len(suggestions) >= limit:
+                break
+        return suggestions
+
+
+def timetable_from_records(records: Iterable[Union[Dict, MalformedRecord]]) -> Tuple[Timetable, List[Tuple[int, str]]]:
+    """
+    Build a timetable from CSV / JSON Lines records, skipping invalid ones.
+    
+    Args:
+        records: Timetable records (see parse_session), e.g. from read_records
+        
+    Returns:
+        (timetable, [(row number, error message)]) with rows numbered from 1
+    """
+    sessions: List[Session] = []
+    errors = []
+    for row, record in enumerate(records, start=1):
+        try:
+            sessions.extend(parse_session(record_fields(record)))
+        except (TypeError, ValueError) as e:
+            errors.append((row, str(e)))
+    return Timetable(sessions), errors
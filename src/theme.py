@@ -1,5 +1,9 @@
 """University of the Pacific theme colors and styling."""
 
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
 # University of the Pacific Brand Colors
 PACIFIC_ORANGE = "#F15A22"
 PACIFIC_NAVY = "#002D62"
@@ -8,10 +12,21 @@ GRAY = "#F5F7FA"
 BLACK = "#000000"
 
 
+# Logo files tried in order, relative to the project root
+LOGO_PATHS = [
+    Path("assets") / "pacific_logo.png",
+    Path("assets") / "UOP-Logo.jpg",
+    Path("assets") / "pacific_logo.jpg",
+]
+
+
+@lru_cache(maxsize=None)
 def get_custom_css() -> str:
     """
     Get custom CSS for Streamlit app with Pacific theme.
     
+    Built once per process; every rerun reuses the same string.
+    
     Returns:
         CSS string to inject via st.markdown
     """
@@ -66,3 +81,20 @@ def get_custom_css() -> str:
     </style>
     """
 
+
+@lru_cache(maxsize=None)
+def get_logo() -> Optional[bytes]:
+    """
+    Read the sidebar logo once per process.
+    
+    Returns:
+        Bytes of the first logo file in LOGO_PATHS that can be read, or
+        None if there is none
+    """
+    project_root = Path(__file__).parent.parent
+    for logo_path in LOGO_PATHS:
+        try:
+            return (project_root / logo_path).read_bytes()
+        except OSError:
+            continue
+    return None
@@ -0,0 +1,57 @@
+"""Dashboard pages, imported on demand.
+
+Each page is a module with a render() function. app.py imports only this
+registry, so a run loads just the page being shown: pandas and the
+pricing and attendance logic are imported the first time a page that
+needs them is opened, not on every cold start.
+"""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Dict, List
+
+from src.logic.instrumentation import timed
+
+# Navigation label -> module name under src.views, in sidebar order
+PAGES: Dict[str, str] = {
+    "Home": "home",
+    "Pricing Calculator": "pricing",
+    "Class Schedule": "schedule",
+    "Attendance": "attendance",
+    "Summary & Export": "summary",
+    "Diagnostics": "diagnostics",
+}
+
+
+def page_names() -> List[str]:
+    """Navigation labels in sidebar order."""
+    return list(PAGES)
+
+
+def load_page(page: str) -> ModuleType:
+    """
+    Import a page module, timing the import the first time.
+    
+    Args:
+        page: Navigation label, e.g. "Pricing Calculator"
+        
+    Returns:
+        The page module
+        
+    Raises:
+        ValueError: If page is not a known page
+    """
+    if page not in PAGES:
+        raise ValueError(f"Unknown page: {page}")
+    name = f"{__name__}.{PAGES[page]}"
+    module = sys.modules.get(name)
+    if module is None:
+        with timed(f"import.{PAGES[page]}"):
+            module = importlib.import_module(name)
+    return module
+
+
+def render(page: str) -> None:
+    """Render a page, importing its module on first use."""
+    load_page(page).render()
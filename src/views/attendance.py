@@ -0,0 +1,172 @@
+"""Attendance page: entry controls and a live summary, run as fragments."""
+
+import altair as alt
+import streamlit as st
+
+from src.logic.analytics import WEEKDAYS
+from src.logic.attendance import add_entry, summarize
+from src.logic.instrumentation import start_timer, stop_timer, timed
+from src.views.shared import get_activity_table, get_attendance_analytics, get_attendance_store
+from src.views.tables import activity_chart, activity_table
+
+# Seconds between refreshes of the attendance summary, so entries made at
+# other front desks show up without a full rerun
+ATTENDANCE_REFRESH_SECONDS = 30
+
+# Text staff must type before "Clear All" deletes the shared attendance store
+CLEAR_CONFIRMATION = "DELETE"
+
+
+def close_clear_confirmation(action=None) -> None:
+    """Button callback: run the confirmed action (if any) and hide the "Clear All" confirmation."""
+    if action is not None:
+        action()
+    st.session_state.confirm_clear_attendance = False
+    st.session_state.clear_attendance_confirmation = ""
+
+
+@st.fragment(run_every=ATTENDANCE_REFRESH_SECONDS)
+def attendance_summary_panel():
+    """Render the attendance metrics, table and chart."""
+    fragment_started = start_timer()
+    attendance_store = get_attendance_store()
+    if attendance_store:
+        st.markdown("---")
+        st.markdown("### Attendance Summary")
+        
+        with timed("logic.summarize"):
+            summary = summarize(attendance_store)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Attendance", summary['total'])
+        with col2:
+            st.metric("Average per Activity", f"{summary['avg_per_activity']:.2f}")
+        
+        table = get_activity_table(attendance_store.version())
+        
+        # Table
+        st.markdown("#### By Activity")
+        activity_table(table, key="attendance")
+        
+        # Bar chart
+        st.markdown("#### Attendance Chart")
+        activity_chart(table)
+    else:
+        st.info("No attendance data yet. Add entries above to get started.")
+    stop_timer("fragment.attendance_summary", fragment_started)
+
+
+# Activities drawn in the trend chart when no single activity is selected
+TREND_ACTIVITIES = 5
+
+ALL_ACTIVITIES = "All activities"
+
+
+@st.fragment(run_every=ATTENDANCE_REFRESH_SECONDS)
+def attendance_trends_panel():
+    """Render the weekday/hour heatmap, 30-day trend and week-over-week table."""
+    fragment_started = start_timer()
+    analytics = get_attendance_analytics()
+    with timed("logic.analytics"):
+        analytics.refresh(get_attendance_store())
+    
+    if not len(analytics):
+        stop_timer("fragment.attendance_trends", fragment_started)
+        return
+    
+    st.markdown("---")
+    st.markdown("### Attendance Trends")
+    choice = st.selectbox("Activity", [ALL_ACTIVITIES] + sorted(analytics.activities), key="trend_activity")
+    activity = None if choice == ALL_ACTIVITIES else choice
+    
+    with timed("logic.analytics"):
+        heat = analytics.heatmap(activity)
+        rolling = analytics.rolling(window=7, days=30)
+        weekly = analytics.week_over_week()
+    
+    st.markdown("#### Peak Hours by Weekday")
+    cells = heat.stack().rename("Check-ins").reset_index().rename(columns={"level_1": "Hour"})
+    st.altair_chart(
+        alt.Chart(cells).mark_rect().encode(
+            x=alt.X("Hour:O", title="Hour of day"),
+            y=alt.Y("Weekday:O", sort=WEEKDAYS, title=None),
+            color=alt.Color("Check-ins:Q", scale=alt.Scale(scheme="oranges")),
+            tooltip=["Weekday", "Hour", "Check-ins"]
+        ),
+        use_container_width=True
+    )
+    
+    st.markdown("#### 7-Day Rolling Attendance (last 30 days)")
+    if activity is None:
+        columns = weekly["Activity"].head(TREND_ACTIVITIES).tolist()
+    else:
+        columns = [activity]
+    st.line_chart(rolling[columns])
+    
+    st.markdown("#### Week over Week")
+    st.dataframe(
+        weekly.style.format({"Change": "{:+d}", "Change %": "{:+.0f}%"}, na_rep="new"),
+        hide_index=True,
+        use_container_width=True
+    )
+    stop_timer("fragment.attendance_trends", fragment_started)
+
+
+@st.fragment
+def attendance_panel():
+    """
+    Render the attendance entry controls and summary.
+    
+    Runs as a fragment: clicking "Add Entry" or "Clear All" reruns only this
+    function (entry controls plus the summary below them), not the whole
+    script with its logo, CSS and navigation.
+    """
+    fragment_started = start_timer()
+    attendance_store = get_attendance_store()
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        activity = st.text_input("Activity Name", placeholder="e.g., Yoga, Spin Class")
+        count = st.number_input("Attendance Count", min_value=0, value=0, step=1)
+        
+        if st.button("Add Entry", type="primary"):
+            if activity.strip():
+                try:
+                    add_entry(attendance_store, activity.strip(), count)
+                    st.success(f"✓ Added {count} to {activity}")
+                except ValueError as e:
+                    st.error(f"❌ Error: {e}")
+            else:
+                st.warning("⚠️ Activity name cannot be empty")
+    
+    with col2:
+        # The store is shared by every front desk, so clearing it needs a second, typed step
+        if st.button("Clear All", type="secondary"):
+            st.session_state.confirm_clear_attendance = True
+        if st.session_state.get("confirm_clear_attendance"):
+            st.warning("⚠️ This permanently deletes all attendance history and check-ins, for every front desk.")
+            confirmation = st.text_input(f'Type "{CLEAR_CONFIRMATION}" to confirm', key="clear_attendance_confirmation")
+            confirm_col, cancel_col = st.columns(2)
+            with confirm_col:
+                st.button(
+                    "Delete All",
+                    type="primary",
+                    disabled=confirmation != CLEAR_CONFIRMATION,
+                    on_click=close_clear_confirmation,
+                    args=(attendance_store.clear,)
+                )
+            with cancel_col:
+                st.button("Cancel", on_click=close_clear_confirmation)
+    
+    attendance_summary_panel()
+    attendance_trends_panel()
+    stop_timer("fragment.attendance", fragment_started)
+
+
+def render() -> None:
+    """Render the Attendance page."""
+    st.title("📊 Attendance Tracking")
+    st.markdown("---")
+    
+    attendance_panel()
@@ -0,0 +1,70 @@
+"""Diagnostics page: instrumentation timers, counters and cache stats."""
+
+import pandas as pd
+import streamlit as st
+
+from src.logic import instrumentation
+from src.logic.quote_cache import quote_cache
+
+
+def render() -> None:
+    """Render the Diagnostics page."""
+    st.title("🩺 Diagnostics")
+    st.markdown("---")
+    
+    enabled = st.toggle("Enable instrumentation", value=instrumentation.is_enabled())
+    if enabled != instrumentation.is_enabled():
+        instrumentation.enable(enabled)
+        st.rerun()
+    
+    if st.button("Reset Measurements", type="secondary"):
+        instrumentation.reset()
+        st.rerun()
+    
+    diagnostics = instrumentation.snapshot()
+    if diagnostics['timers']:
+        st.markdown("### Latency by Page and Logic Call")
+        st.table(pd.DataFrame([
+            {
+                "Timer": name,
+                "Count": t['count'],
+                "Mean (ms)": f"{t['mean'] * 1e3:.2f}",
+                "p50 (ms)": f"{t['p50'] * 1e3:.2f}",
+                "p95 (ms)": f"{t['p95'] * 1e3:.2f}",
+                "p99 (ms)": f"{t['p99'] * 1e3:.2f}",
+                "Max (ms)": f"{t['max'] * 1e3:.2f}",
+            }
+            for name, t in sorted(diagnostics['timers'].items())
+        ]))
+        
+        st.markdown("### Latency Histogram")
+        timer_name = st.selectbox("Timer", sorted(diagnostics['timers']))
+        buckets = diagnostics['timers'][timer_name]['buckets']
+        used = [i for i, hits in enumerate(buckets) if hits]
+        # Bucket labels are text, so keep them in bucket order rather than sorted as strings
+        st.bar_chart(pd.DataFrame({
+            "Upper bound (µs)": [str(1 << i) for i in range(used[0], used[-1] + 1)],
+            "Count": buckets[used[0]:used[-1] + 1]
+        }).set_index("Upper bound (µs)"), sort=False)
+    elif enabled:
+        st.info("No measurements yet. Visit other pages to record timings.")
+    else:
+        st.info("Instrumentation is off. Enable it to record page and logic timings.")
+    
+    if diagnostics['counters']:
+        st.markdown("### Counters")
+        st.table(pd.DataFrame(
+            [{"Counter": name, "Value": value} for name, value in sorted(diagnostics['counters'].items())]
+        ))
+    
+    st.markdown("### Quote Cache")
+    cache_stats = quote_cache.stats()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Hits", cache_stats['hits'])
+    with col2:
+        st.metric("Misses", cache_stats['misses'])
+    with col3:
+        st.metric("Evictions", cache_stats['evictions'])
+    with col4:
+        st.metric("Cached Quotes", f"{cache_stats['size']} / {cache_stats['maxsize']}")
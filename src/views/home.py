@@ -0,0 +1,49 @@
+"""Home page: welcome text, member greeting and an overview of the other pages."""
+
+import streamlit as st
+
+from src.logic.messaging import build_welcome
+from src.views.shared import get_member_registry
+
+
+def render() -> None:
+    """Render the Home page."""
+    st.title("🏋️ Welcome to Fitness Center Assistant")
+    st.markdown("---")
+    
+    st.markdown(f"""
+    ### Welcome to Baun Fitness Center!
+    
+    This assistant helps you with:
+    - **Personalized greetings** and class reminders
+    - **Membership pricing** with discounts and promo codes
+    - **Attendance tracking** and summaries
+    - **Session summaries** for export
+    
+    Use the sidebar to navigate to different sections.
+    """)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.info("💳 **Pricing Calculator**\n\nCalculate membership costs with discounts")
+    with col2:
+        st.info("📅 **Class Schedule**\n\nView classes by day of the week")
+    with col3:
+        st.info("📊 **Attendance**\n\nTrack and visualize attendance data")
+    
+    st.markdown("---")
+    st.markdown("### 👋 Member Greeting")
+    registry = get_member_registry()
+    query = st.text_input("Your name or member ID", placeholder="Start typing your name...").strip()
+    if query:
+        member = registry.lookup(query)
+        suggestions = registry.complete(query) if member is None else []
+        if suggestions:
+            member = st.selectbox(
+                "Did you mean",
+                suggestions,
+                index=None,
+                format_func=lambda m: f"{m.name} ({m.id})",
+                placeholder="Pick your name"
+            )
+        st.success(build_welcome(member.id if member else query, registry=registry))
@@ -0,0 +1,136 @@
+"""Pricing Calculator page: quotes, price list and cheapest options."""
+
+import streamlit as st
+
+from src.data import plans, promo_codes
+from src.logic.instrumentation import timed
+from src.logic.price_matrix import NO_PROMO, current_price_matrix
+from src.logic.pricing import purchase_membership
+from src.logic.quote_cache import quote_cache
+from src.theme import PACIFIC_NAVY, PACIFIC_ORANGE
+
+
+def render() -> None:
+    """Render the Pricing Calculator page."""
+    st.title("💳 Membership Pricing Calculator")
+    st.markdown("---")
+    
+    price_matrix = current_price_matrix(plans, promo_codes)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        plan = st.selectbox("Select Membership Plan", list(plans.keys()))
+        months = st.number_input("Number of Months", min_value=1, value=1, step=1)
+        is_student_or_staff = st.checkbox("Student or Staff Member (15% discount)")
+        promo = st.text_input("Promo Code (optional)", placeholder="e.g., WELCOME10")
+    
+    with col2:
+        st.markdown("### Pricing Information")
+        plan_lines = "\n".join(
+            f"- {name}: ${price:.2f}/month"
+            for name, price in zip(price_matrix.plans, price_matrix.monthly_prices)
+        )
+        promo_lines = "\n".join(
+            f"- {label}: {rate * 100:g}% off" for label, rate in price_matrix.promos
+        ) or "- None right now"
+        st.info(f"**Available Plans:**\n{plan_lines}\n\n**Promo Campaigns:**\n{promo_lines}")
+    
+    if st.button("Calculate Price", type="primary"):
+        try:
+            with timed("logic.pricing"):
+                breakdown = price_matrix.lookup(
+                    plan, months, is_student_or_staff, promo if promo else None, promo_codes
+                )
+                if breakdown is None:  # Beyond the price list, or stacked codes
+                    breakdown = quote_cache.quote(
+                        plan=plan,
+                        months=months,
+                        is_student_or_staff=is_student_or_staff,
+                        promo=promo if promo else None,
+                        plans=plans,
+                        promo_codes=promo_codes
+                    )
+            
+            # Display breakdown in a styled container
+            st.markdown("---")
+            st.markdown("### Pricing Breakdown")
+            
+            breakdown_html = f"""
+            <div style="border: 2px solid {PACIFIC_NAVY}; border-radius: 8px; padding: 1.5rem; background-color: #F5F7FA;">
+                <p><strong>Plan:</strong> {breakdown['plan']}</p>
+                <p><strong>Duration:</strong> {breakdown['months']} month(s)</p>
+                <p><strong>Monthly Price:</strong> ${breakdown['monthly_price']:,.2f}</p>
+                <p><strong>Base Cost:</strong> ${breakdown['base_cost']:,.2f}</p>
+            """
+            
+            if breakdown['student_staff_discount'] > 0:
+                breakdown_html += f"<p><strong>Student/Staff Discount (15%):</strong> -${breakdown['student_staff_discount']:,.2f}</p>"
+            
+            if breakdown['promo_applied']:
+                promo_discount = breakdown['promo_discount']
+                breakdown_html += f"<p><strong>Promo Code ({breakdown['promo_applied']}):</strong> -${promo_discount:,.2f}</p>"
+            elif promo:
+                breakdown_html += "<p style='color: red;'><strong>⚠️ Invalid promo code - not applied</strong></p>"
+            
+            breakdown_html += f"""
+                <hr style="border-color: {PACIFIC_NAVY};">
+                <h2 style="color: {PACIFIC_ORANGE}; margin-top: 1rem;">
+                    Final Cost: ${breakdown['final_cost']:,.2f}
+                </h2>
+            </div>
+            """
+            
+            st.markdown(breakdown_html, unsafe_allow_html=True)
+        
+        except ValueError as e:
+            st.error(f"❌ Error: {e}")
+    
+    # A purchase redeems the promo codes it uses (quotes above never do)
+    if st.button("Confirm Purchase"):
+        try:
+            with timed("logic.purchase"):
+                sale = purchase_membership(plan, months, is_student_or_staff, promo or None, plans, promo_codes)
+            redeemed = f" Promo {sale['promo_applied']} redeemed." if sale["promo_applied"] else ""
+            st.success(f"✅ Purchased {sale['plan']} for {sale['months']} month(s): ${sale['final_cost']:,.2f}.{redeemed}")
+            if promo and not sale["promo_applied"]:
+                st.warning("⚠️ Promo code invalid, expired or used up - not applied")
+        except ValueError as e:
+            st.error(f"❌ Error: {e}")
+    
+    st.markdown("---")
+    st.markdown("### Price List")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        grid_promo = st.selectbox("Promo campaign", [NO_PROMO] + [label for label, _ in price_matrix.promos])
+    with col2:
+        grid_months = st.slider("Months shown", 1, price_matrix.max_months, 12)
+    with col3:
+        grid_student = st.checkbox("Student/staff prices")
+    st.dataframe(
+        price_matrix.grid(grid_student, grid_promo, grid_months).style.format("${:,.2f}"),
+        use_container_width=True
+    )
+    
+    st.markdown("### Cheapest Options")
+    col1, col2 = st.columns(2)
+    with col1:
+        budget = st.number_input("Budget ($, 0 for any)", min_value=0.0, value=0.0, step=25.0)
+    with col2:
+        rank_by = st.radio("Rank by", ["Cost per month", "Total cost"], horizontal=True)
+    options = price_matrix.cheapest(
+        k=5,
+        is_student_or_staff=is_student_or_staff,
+        budget=budget or None,
+        per_month=rank_by == "Cost per month"
+    )
+    if options.empty:
+        st.info("No option fits that budget.")
+    else:
+        st.table(options.drop(columns="student_or_staff").rename(columns={
+            "plan": "Plan",
+            "months": "Months",
+            "promo": "Promo Campaign",
+            "final_cost": "Total Cost",
+            "cost_per_month": "Per Month",
+        }).style.format({"Total Cost": "${:,.2f}", "Per Month": "${:,.2f}"}))
@@ -0,0 +1,112 @@
+"""Class Schedule page: classes by day, notes and time-window search."""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from src.data import class_schedule
+from src.logic.instrumentation import timed
+from src.logic.schedule import DAYS, day_classes, format_time, normalized_day
+from src.views.shared import get_schedule_index, get_timetable
+
+
+def render() -> None:
+    """Render the Class Schedule page."""
+    if 'schedule_notes' not in st.session_state:
+        st.session_state.schedule_notes = {}
+    
+    st.title("📅 Class Schedule")
+    st.markdown("---")
+    
+    day = st.selectbox(
+        "Select Day of Week",
+        ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    )
+    
+    day_normalized = normalized_day(day)
+    with timed("logic.schedule"):
+        classes = day_classes(day_normalized, class_schedule)
+    
+    if classes:
+        st.markdown(f"### Classes on {day}")
+        
+        # Display classes in a table
+        class_data = []
+        for i, cls in enumerate(classes, 1):
+            class_data.append({"#": i, "Class": cls})
+        
+        df = pd.DataFrame(class_data)
+        st.table(df)
+        
+        # Custom note section
+        st.markdown("---")
+        st.markdown("### Add a Note")
+        note_key = f"note_{day_normalized}"
+        note = st.text_area(
+            f"Add a note for {day}",
+            value=st.session_state.schedule_notes.get(note_key, ""),
+            key=note_key
+        )
+        st.session_state.schedule_notes[note_key] = note
+        
+        if note:
+            st.info(f"📝 Note: {note}")
+    else:
+        st.info(f"No classes scheduled for {day}")
+    
+    # Week-wide lookups from the parsed schedule index
+    schedule_index = get_schedule_index()
+    now = datetime.now()
+    next_class = schedule_index.next_after(DAYS[now.weekday()], now.hour * 60 + now.minute)
+    
+    st.markdown("---")
+    st.markdown("### Find Classes")
+    if next_class:
+        st.success(f"⏭️ Next class: **{next_class.name}** on {next_class.day.title()} at {format_time(next_class.start_minute)}")
+    
+    start_hour, end_hour = st.slider("Start time window (hour of day)", 0, 24, (17, 20))
+    window = schedule_index.between(start_hour * 60, end_hour * 60)
+    if window:
+        st.table(pd.DataFrame([
+            {"Day": slot.day.title(), "Time": format_time(slot.start_minute), "Class": slot.name}
+            for slot in window
+        ]))
+    else:
+        st.info("No classes start in that window.")
+    
+    # Rooms and instructors: conflicts and free slots
+    st.markdown("---")
+    st.markdown("### Rooms & Instructors")
+    try:
+        timetable = get_timetable()
+    except ValueError as e:
+        st.error(f"❌ Cannot build the room timetable: {e}")
+        return
+    with timed("logic.timetable"):
+        conflicts = timetable.conflicts()
+    if conflicts:
+        st.warning(f"⚠️ {len(conflicts)} room or instructor conflict(s)")
+        st.table(pd.DataFrame([
+            {
+                "Conflict": f"{conflict.kind.title()}: {conflict.resource}",
+                "Day": conflict.first.day.title(),
+                "Overlap": f"{format_time(conflict.start_minute)}-{format_time(conflict.end_minute)}",
+                "Classes": f"{conflict.first.name} / {conflict.second.name}",
+                "Suggestion": next((str(move) for move in timetable.suggest(conflict.second, limit=1)), ""),
+            }
+            for conflict in conflicts
+        ]))
+    else:
+        st.success("✅ No room or instructor conflicts")
+    
+    room = st.selectbox("Find free time in room", timetable.rooms)
+    minutes = st.slider("Class length (minutes)", 15, 120, 60, step=15)
+    free = timetable.free_slots(day_normalized, minutes, room=room)
+    if free:
+        st.table(pd.DataFrame([
+            {"From": format_time(start), "Until": format_time(end), "Minutes": end - start}
+            for start, end in free
+        ]))
+    else:
+        st.info(f"{room} has no free {minutes}-minute slot on {day}.")
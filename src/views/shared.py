@@ -0,0 +1,59 @@
+"""Process-wide resources shared by several pages."""
+
+import streamlit as st
+
+from src.data import class_details, class_schedule
+from src.logic.analytics import AttendanceAnalytics
+from src.logic.attendance_sqlite import SQLiteAttendanceStore, open_attendance_store
+from src.logic.frames import ActivityTable
+from src.logic.members import MemberRegistry, open_member_registry
+from src.logic.schedule import ScheduleIndex
+from src.logic.timetable import Timetable
+
+
+@st.cache_resource
+def get_attendance_store() -> SQLiteAttendanceStore:
+    """Open the attendance database once per process, shared by all sessions."""
+    return open_attendance_store()
+
+
+@st.cache_resource
+def get_attendance_analytics() -> AttendanceAnalytics:
+    """
+    Attendance analytics shared by all sessions.
+    
+    Call refresh(get_attendance_store()) before reading: it folds in only
+    the entries recorded since the last refresh.
+    """
+    return AttendanceAnalytics()
+
+
+@st.cache_resource(max_entries=2)
+def get_activity_table(version) -> ActivityTable:
+    """
+    Attendance by activity for one version of the store, shared by all sessions.
+    
+    Pass get_attendance_store().version(): reruns with unchanged data reuse
+    the table and its cached pages, and the table is rebuilt once after
+    each change. The snapshot is read after the version, so it is never
+    older than the version it is cached under.
+    """
+    return ActivityTable(get_attendance_store().summarize()["by_activity"])
+
+
+@st.cache_resource
+def get_member_registry() -> MemberRegistry:
+    """Load the member registry snapshot once per process, shared by all sessions."""
+    return open_member_registry()
+
+
+@st.cache_resource
+def get_schedule_index() -> ScheduleIndex:
+    """Parse and index the class schedule once per process."""
+    return ScheduleIndex.from_schedule(class_schedule)
+
+
+@st.cache_resource
+def get_timetable() -> Timetable:
+    """Index the class schedule by room and instructor once per process."""
+    return Timetable.from_schedule(class_schedule, class_details)
@@ -0,0 +1,111 @@
+"""Summary & Export page: attendance summary and a downloadable report."""
+
+from typing import BinaryIO, Callable
+
+import streamlit as st
+
+from src.data import plans, promo_codes
+from src.logic.attendance import summarize
+from src.logic.export import TABLE_MIME_TYPES, spool_table, table_formats
+from src.logic.frames import EXPORT_CHUNK_ROWS, attendance_export_frame, attendance_history_frames
+from src.logic.instrumentation import timed
+from src.logic.price_matrix import current_price_matrix
+from src.views.shared import get_activity_table, get_attendance_store
+from src.views.tables import activity_table
+
+# Datasets offered as columnar downloads: label -> (file stem, chunk source)
+EXPORT_DATASETS = {
+    "Attendance history": ("attendance_history", lambda: attendance_history_frames(get_attendance_store())),
+    "Attendance totals": ("attendance_totals", lambda: [attendance_export_frame(get_attendance_store().summarize()["by_activity"])]),
+    "Price list": ("price_list", lambda: current_price_matrix(plans, promo_codes).frame_chunks(EXPORT_CHUNK_ROWS)),
+}
+
+FORMAT_LABELS = {"parquet": "Parquet", "arrow": "Arrow IPC", "csv": "CSV"}
+
+
+def table_download(dataset: str, fmt: str) -> Callable[[], BinaryIO]:
+    """Deferred download: the export runs only when the button is clicked."""
+    def build() -> BinaryIO:
+        _, chunks = EXPORT_DATASETS[dataset]
+        with timed("logic.export_table"):
+            return spool_table(chunks(), fmt)
+    return build
+
+
+def summary_download() -> Callable[[], str]:
+    """Deferred download: the text summary is built only when the button is clicked."""
+    def build() -> str:
+        with timed("logic.export"):
+            summary = summarize(get_attendance_store())
+            lines = [
+                "="*60,
+                "FITNESS CENTER SESSION SUMMARY",
+                "="*60,
+                f"Center: Baun Fitness Center",
+                "",
+                "ATTENDANCE SUMMARY:",
+            ]
+            
+            if summary['by_activity']:
+                lines.append(f"  Total Attendance: {summary['total']}")
+                lines.append(f"  Average per Activity: {summary['avg_per_activity']:.2f}")
+                lines.append("  By Activity:")
+                for activity, count in summary['by_activity'].items():
+                    lines.append(f"    • {activity}: {count}")
+            else:
+                lines.append("  No attendance data recorded.")
+            
+            lines.append("")
+            lines.append("="*60)
+            return "\n".join(lines)
+    return build
+
+
+def render() -> None:
+    """Render the Summary & Export page."""
+    st.title("📋 Summary & Export")
+    st.markdown("---")
+    
+    # Get summary data
+    with timed("logic.summarize"):
+        summary = summarize(get_attendance_store())
+    
+    st.markdown("### Attendance Summary")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Total Attendance", summary['total'])
+    with col2:
+        st.metric("Average per Activity", f"{summary['avg_per_activity']:.2f}")
+    
+    if summary['by_activity']:
+        st.markdown("#### By Activity")
+        activity_table(get_activity_table(get_attendance_store().version()), key="summary")
+    else:
+        st.info("No attendance data to summarize.")
+    
+    st.markdown("---")
+    st.markdown("### Export Session Summary")
+    
+    st.download_button(
+        label="📥 Download Summary",
+        data=summary_download(),
+        file_name="fitness_session_summary.txt",
+        mime="text/plain",
+        type="primary"
+    )
+    
+    st.markdown("---")
+    st.markdown("### Export Data")
+    st.caption("Columnar files for spreadsheets and BI tools, written in chunks when you click Download.")
+    col1, col2 = st.columns(2)
+    with col1:
+        dataset = st.selectbox("Dataset", list(EXPORT_DATASETS))
+    with col2:
+        fmt = st.selectbox("Format", table_formats(), format_func=FORMAT_LABELS.get)
+    stem, _ = EXPORT_DATASETS[dataset]
+    st.download_button(
+        label=f"📥 Download {FORMAT_LABELS[fmt]}",
+        data=table_download(dataset, fmt),
+        file_name=f"{stem}.{fmt}",
+        mime=TABLE_MIME_TYPES[fmt]
+    )
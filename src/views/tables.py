@@ -0,0 +1,61 @@
+"""Activity table and chart widgets shared by the attendance pages."""
+
+import math
+
+import streamlit as st
+
+from src.logic.frames import ActivityTable
+from src.logic.instrumentation import timed
+
+# Sort choices: label -> (column, descending)
+SORT_OPTIONS = {
+    "Most attended": ("Count", True),
+    "Least attended": ("Count", False),
+    "Name (A-Z)": ("Activity", False),
+    "Name (Z-A)": ("Activity", True),
+}
+
+PAGE_SIZES = [25, 50, 100]
+
+
+def activity_table(table: ActivityTable, key: str) -> None:
+    """
+    Render a filterable, sortable table showing one page of activities.
+    
+    Filtering, sorting and slicing happen on the server (see
+    ActivityTable), so only the rows of the current page are sent.
+    
+    Args:
+        table: Attendance by activity
+        key: Widget key prefix, unique per page
+    """
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        search = st.text_input("Filter", key=f"{key}_search", placeholder="Activity name contains...")
+    with col2:
+        sort_by, descending = SORT_OPTIONS[st.selectbox("Sort by", list(SORT_OPTIONS), key=f"{key}_sort")]
+    with col3:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, key=f"{key}_page_size")
+    
+    with timed("logic.activity_table"):
+        matches = len(table.rows(search, sort_by, descending))
+    pages = max(math.ceil(matches / page_size), 1)
+    # A narrower filter or bigger pages can leave the remembered page past the end
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+    
+    with timed("logic.activity_table"):
+        rows = table.page(page, page_size, search, sort_by, descending)
+    if len(rows):
+        st.table(rows)
+        st.caption(f"Showing {rows.index[0]:,}-{rows.index[-1]:,} of {matches:,} activities")
+    else:
+        st.info("No activities match the filter.")
+
+
+def activity_chart(table: ActivityTable) -> None:
+    """Render the most attended activities, with the rest as one "Other" bar."""
+    with timed("logic.activity_table"):
+        chart = table.top_frame()
+    st.bar_chart(chart, sort=False)
@@ -0,0 +1,120 @@
+"""Tests for time-series attendance analytics."""
+
+import math
+
+import pandas as pd
+import pytest
+from src.logic.analytics import DAILY_RETENTION_DAYS, AttendanceAnalytics, analytics_from_entries
+from src.logic.attendance_sqlite import SQLiteAttendanceStore
+
+DAY = 86400.0
+
+# Monday 2025-10-13 18:30 UTC
+MONDAY_EVENING = pd.Timestamp("2025-10-13 18:30", tz="UTC").timestamp()
+
+
+def test_heatmap_by_weekday_and_hour():
+    """Test check-ins land in their local weekday and hour."""
+    analytics = analytics_from_entries([
+        ("Yoga", 3, MONDAY_EVENING),
+        ("Yoga", 5, MONDAY_EVENING - 7 * DAY),
+        ("Spin", 4, MONDAY_EVENING + DAY + 3600),
+    ], tz="UTC")
+    
+    assert analytics.heatmap().loc["Monday", 18] == 8
+    assert analytics.heatmap("Spin").loc["Tuesday", 19] == 4
+    assert analytics.heatmap("Spin").to_numpy().sum() == 4
+    assert analytics.heatmap("Nope").to_numpy().sum() == 0
+    # Los Angeles is 7 hours behind UTC in October
+    assert analytics_from_entries([("Yoga", 1, MONDAY_EVENING)], tz="America/Los_Angeles").heatmap().loc["Monday", 11] == 1
+
+
+def test_rolling_window_sums():
+    """Test trailing window sums match a pandas rolling sum."""
+    entries = [("Yoga", day + 1, MONDAY_EVENING - day * DAY) for day in range(40)]
+    analytics = analytics_from_entries(entries, tz="UTC")
+    rolling = analytics.rolling(window=7, days=30, now=MONDAY_EVENING)
+    
+    daily = pd.Series(
+        [count for _, count, _ in entries],
+        index=pd.to_datetime([t for _, _, t in entries], unit="s").normalize()
+    ).sort_index()
+    expected = daily.rolling(7, min_periods=1).sum().iloc[-30:]
+    
+    assert len(rolling) == 30
+    assert rolling.index[-1] == pd.Timestamp("2025-10-13")
+    assert rolling["Yoga"].tolist() == expected.astype(int).tolist()
+    with pytest.raises(ValueError, match="Window"):
+        analytics.rolling(window=0)
+
+
+def test_week_over_week():
+    """Test the last 7 days are compared with the 7 days before."""
+    analytics = analytics_from_entries([
+        ("Yoga", 10, MONDAY_EVENING),
+        ("Yoga", 5, MONDAY_EVENING - 8 * DAY),
+        ("Spin", 2, MONDAY_EVENING - DAY),
+        ("Barre", 9, MONDAY_EVENING - 20 * DAY),
+    ], tz="UTC")
+    weekly = analytics.week_over_week(now=MONDAY_EVENING).set_index("Activity")
+    
+    assert weekly.loc["Yoga"].tolist()[:3] == [10, 5, 5]
+    assert weekly.loc["Yoga", "Change %"] == 100.0
+    assert math.isnan(weekly.loc["Spin", "Change %"])
+    assert weekly.loc["Barre", "This Week"] == 0
+    assert list(weekly.index) == ["Yoga", "Spin", "Barre"]
+
+
+def test_views_update_incrementally():
+    """Test cached views are rebuilt after new entries arrive."""
+    analytics = AttendanceAnalytics(tz="UTC")
+    analytics.add_entry("Yoga", 2, MONDAY_EVENING)
+    first = analytics.heatmap()
+    
+    assert analytics.heatmap() is first
+    analytics.add_entries(["Yoga", "Spin"], [3, 1], [MONDAY_EVENING - 30 * DAY, MONDAY_EVENING + 30 * DAY])
+    assert analytics.heatmap() is not first
+    assert analytics.heatmap().to_numpy().sum() == 6
+    assert analytics.rolling(1, 61, now=MONDAY_EVENING + 30 * DAY).to_numpy().sum() == 6
+    with pytest.raises(ValueError, match="non-negative"):
+        analytics.add_entry("Yoga", -1)
+
+
+def test_bad_timestamps_do_not_grow_the_views():
+    """Test zero, millisecond and non-finite timestamps are skipped and old days are dropped."""
+    analytics = AttendanceAnalytics(tz="UTC")
+    analytics.add_entries(
+        ["Yoga", "Yoga", "Yoga", "Spin"],
+        [1, 2, 3, 4],
+        [0.0, MONDAY_EVENING * 1000, float("nan"), MONDAY_EVENING]
+    )
+    
+    assert (analytics.skipped, len(analytics)) == (3, 1)
+    assert analytics.heatmap().to_numpy().sum() == 4
+    assert analytics._daily.shape[1] <= DAILY_RETENTION_DAYS + 56
+    
+    years = [MONDAY_EVENING - day * DAY for day in range(0, 3 * 365, 5)]
+    analytics.add_entries(["Yoga"] * len(years), [1] * len(years), years)
+    assert analytics._daily.shape[1] <= DAILY_RETENTION_DAYS + 56
+    assert analytics.heatmap("Yoga").to_numpy().sum() == len(years)
+    assert analytics.rolling(7, 1, now=MONDAY_EVENING)["Yoga"].iloc[-1] == 2
+    assert analytics.rolling(1, 3 * 365, now=MONDAY_EVENING)["Yoga"].sum() <= DAILY_RETENTION_DAYS // 5 + 1
+
+
+def test_refresh_follows_store():
+    """Test refresh folds in only new entries and restarts after a clear."""
+    store = SQLiteAttendanceStore(":memory:")
+    store.add_entries([("Yoga", 1, MONDAY_EVENING), ("Spin", 2, MONDAY_EVENING)])
+    analytics = AttendanceAnalytics(tz="UTC")
+    
+    assert analytics.refresh(store) == 2
+    assert analytics.refresh(store) == 0
+    store.add_entry("Yoga", 4, MONDAY_EVENING)
+    assert analytics.refresh(store) == 1
+    assert analytics.heatmap("Yoga").loc["Monday", 18] == 5
+    
+    store.clear()
+    store.add_entry("HIIT", 1, MONDAY_EVENING)
+    assert analytics.refresh(store) == 1
+    assert analytics.activities == ["HIIT"]
+    store.close()
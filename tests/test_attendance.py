@@ -1,7 +1,7 @@
 """Tests for attendance logic."""
 
 import pytest
-from src.logic.attendance import add_entry, summarize
+from src.logic.attendance import AttendanceAggregate, add_entry, summarize
 
 
 def test_add_entry_new_activity():
@@ -68,3 +68,52 @@ def test_summarize_multiple_activities():
     assert result['avg_per_activity'] == 15.0
     assert result['by_activity'] == {"Yoga": 10, "Spin": 20, "Pilates": 15}
 
+
+def test_aggregate_matches_summarize():
+    """Test the aggregate tracks the same statistics as summarize."""
+    store = {}
+    aggregate = AttendanceAggregate()
+    for activity, count in [("Yoga", 10), ("Spin", 20), ("Yoga", 5), ("Pilates", 0)]:
+        add_entry(store, activity, count)
+        add_entry(aggregate, activity, count)
+    
+    assert summarize(aggregate) == summarize(store)
+    assert aggregate.total == 35
+    assert len(aggregate) == 3
+
+
+def test_aggregate_summary_is_live_view():
+    """Test by_activity is a read-only view rather than a copy."""
+    aggregate = AttendanceAggregate({"Yoga": 10})
+    by_activity = aggregate.summarize()['by_activity']
+    aggregate.add_entry("Spin", 3)
+    
+    assert by_activity == {"Yoga": 10, "Spin": 3}
+    with pytest.raises(TypeError):
+        by_activity["Yoga"] = 0
+
+
+def test_aggregate_top():
+    """Test top-k ranking follows increments, ties broken by name."""
+    aggregate = AttendanceAggregate({"Yoga": 10, "Spin": 20, "Pilates": 15})
+    
+    assert aggregate.top(2) == [("Spin", 20), ("Pilates", 15)]
+    
+    aggregate.add_entry("Yoga", 10)
+    assert aggregate.top(3) == [("Spin", 20), ("Yoga", 20), ("Pilates", 15)]
+
+
+def test_aggregate_negative_count():
+    """Test that negative count raises ValueError."""
+    aggregate = AttendanceAggregate()
+    with pytest.raises(ValueError, match="Count must be non-negative"):
+        aggregate.add_entry("Yoga", -1)
+
+
+def test_aggregate_clear():
+    """Test clearing resets every statistic."""
+    aggregate = AttendanceAggregate({"Yoga": 10})
+    aggregate.clear()
+    
+    assert aggregate.summarize() == {"total": 0, "avg_per_activity": 0.0, "by_activity": {}}
+    assert aggregate.top(1) == []
@@ -0,0 +1,91 @@
+"""Tests for the compact (interned, array-backed) attendance store."""
+
+import numpy as np
+import pytest
+from src.logic.attendance import add_entry, summarize
+from src.logic.attendance_compact import CompactAttendanceStore
+from src.logic.frames import attendance_chart_frame, attendance_frame
+
+
+def test_matches_dict_store():
+    """Test the same entries give the same summary as a dict store."""
+    entries = [("Yoga", 10), (" Spin ", 4), ("Yoga", 5), ("", 3), ("HIIT", 0)]
+    store, expected = CompactAttendanceStore(capacity=1), {}
+    for activity, count in entries:
+        add_entry(store, activity, count)
+        add_entry(expected, activity, count)
+    
+    assert summarize(store) == summarize(expected)
+    assert list(store.summarize()["by_activity"]) == ["Yoga", "Spin", "HIIT"]
+    assert store.count("Yoga") == 15
+    assert store.activity_id(" Spin") == 1
+    assert len(store) == 3
+
+
+def test_top_orders_by_count_then_name():
+    """Test top(k) ranks like AttendanceAggregate, including ties."""
+    store = CompactAttendanceStore.from_counts({"Spin": 5, "Yoga": 9, "Barre": 5, "HIIT": 1})
+    
+    assert store.top(3) == [("Yoga", 9), ("Barre", 5), ("Spin", 5)]
+    assert store.top(10) == [("Yoga", 9), ("Barre", 5), ("Spin", 5), ("HIIT", 1)]
+    assert store.top(0) == []
+
+
+def test_invalid_input():
+    """Test negative counts and bad capacities raise ValueError."""
+    with pytest.raises(ValueError, match="non-negative"):
+        CompactAttendanceStore().add_entry("Yoga", -1)
+    with pytest.raises(ValueError, match="Capacity"):
+        CompactAttendanceStore(capacity=0)
+
+
+def test_history_columns():
+    """Test kept entries come back as typed columns and tuples."""
+    store = CompactAttendanceStore.from_entries([("Yoga", 3, 100.0), ("Spin", 2, 160.0), ("Yoga", 1, 200.0)])
+    history = store.history()
+    
+    assert history["activity_id"].tolist() == [0, 1, 0]
+    assert history["count"].dtype == np.int32
+    assert history["recorded_at"].tolist() == [100.0, 160.0, 200.0]
+    assert list(store.entries()) == [("Yoga", 3, 100.0), ("Spin", 2, 160.0), ("Yoga", 1, 200.0)]
+    assert CompactAttendanceStore().add_entry("Yoga", 1).history()["count"].size == 0
+
+
+def test_frames_share_memory_with_store():
+    """Test dashboard frames wrap the store's arrays without copying."""
+    store = CompactAttendanceStore.from_counts({"Yoga": 10, "Spin": 4})
+    by_activity = store.summarize()["by_activity"]
+    table = attendance_frame(by_activity)
+    chart = attendance_chart_frame(by_activity)
+    
+    assert table.to_dict("list") == {"Activity": ["Yoga", "Spin"], "Count": [10, 4]}
+    assert chart["Count"].to_dict() == {"Yoga": 10, "Spin": 4}
+    assert np.shares_memory(table["Count"].to_numpy(), by_activity.counts)
+    assert np.shares_memory(chart.index.to_numpy(), by_activity.names)
+    with pytest.raises(ValueError):
+        by_activity.counts[0] = 0
+
+
+def test_snapshot_does_not_change():
+    """Test summarize(snapshot=True) is unaffected by later entries."""
+    store = CompactAttendanceStore.from_counts({"Yoga": 10})
+    live = store.summarize()["by_activity"]
+    frozen = store.summarize(snapshot=True)["by_activity"]
+    store.add_entry("Yoga", 5).add_entry("Spin", 1)
+    
+    assert live == {"Yoga": 15}
+    assert frozen == {"Yoga": 10}
+    assert "Spin" not in frozen
+
+
+def test_clear():
+    """Test clear removes all data but leaves earlier views intact."""
+    store = CompactAttendanceStore(keep_history=True)
+    store.add_entry("Yoga", 3, 100.0)
+    view = store.by_activity
+    store.clear()
+    
+    assert summarize(store) == {"total": 0, "avg_per_activity": 0.0, "by_activity": {}}
+    assert not store
+    assert list(store.entries()) == []
+    assert view == {"Yoga": 3}
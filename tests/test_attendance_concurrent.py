@@ -0,0 +1,59 @@
+"""Tests for the lock-striped attendance store."""
+
+import threading
+
+import pytest
+from src.logic.attendance import add_entry, summarize
+from src.logic.attendance_concurrent import StripedAttendanceStore
+
+
+def test_matches_dict_store():
+    """Test the same entries give the same summary as a dict store."""
+    entries = [("Yoga", 10), (" Spin ", 4), ("Yoga", 5), ("", 3), ("HIIT", 0)]
+    store, expected = StripedAttendanceStore(stripes=4), {}
+    for activity, count in entries:
+        add_entry(store, activity, count)
+        add_entry(expected, activity, count)
+    
+    assert summarize(store) == summarize(expected)
+    assert store.count("Yoga") == 15
+    assert len(store) == 3
+    assert store.top(2) == [("Yoga", 15), ("Spin", 4)]
+
+
+def test_negative_count_and_bad_stripes():
+    """Test invalid input raises ValueError."""
+    with pytest.raises(ValueError, match="non-negative"):
+        StripedAttendanceStore().add_entry("Yoga", -1)
+    with pytest.raises(ValueError, match="Stripes"):
+        StripedAttendanceStore(stripes=0)
+
+
+def test_concurrent_adds_lose_nothing():
+    """Test many threads adding to shared activities keep every increment."""
+    store = StripedAttendanceStore(stripes=4)
+    activities = [f"Class {i}" for i in range(10)]
+    
+    def kiosk(offset):
+        for i in range(2000):
+            store.add_entry(activities[(i + offset) % len(activities)], 1)
+    
+    threads = [threading.Thread(target=kiosk, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    summary = store.summarize()
+    assert summary["total"] == 16000
+    assert all(count == 1600 for count in summary["by_activity"].values())
+
+
+def test_clear():
+    """Test clear removes all data."""
+    store = StripedAttendanceStore()
+    store.add_entry("Yoga", 3)
+    store.clear()
+    
+    assert summarize(store) == {"total": 0, "avg_per_activity": 0.0, "by_activity": {}}
+    assert not store
@@ -0,0 +1,151 @@
+"""Tests for the SQLite attendance store."""
+
+import sqlite3
+import threading
+
+import pytest
+from src.logic.attendance import add_entry, summarize
+from src.logic.attendance_sqlite import SQLiteAttendanceStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store backed by a temporary database file."""
+    store = SQLiteAttendanceStore(tmp_path / "attendance.db")
+    yield store
+    store.close()
+
+
+def test_summarize_empty(store):
+    """Test summarizing an empty database."""
+    result = store.summarize()
+    
+    assert result == {"total": 0, "avg_per_activity": 0.0, "by_activity": {}}
+    assert len(store) == 0
+
+
+def test_add_entry_aggregates(store):
+    """Test entries aggregate per activity like the dict store."""
+    store.add_entry("Yoga", 10)
+    store.add_entry("Spin", 20)
+    store.add_entry(" Yoga ", 5)
+    store.add_entry("   ", 7)  # Blank activity is ignored
+    result = store.summarize()
+    
+    assert result['total'] == 35
+    assert result['avg_per_activity'] == 17.5
+    assert result['by_activity'] == {"Yoga": 15, "Spin": 20}
+    assert store.total() == 35
+    assert len(store) == 2
+
+
+def test_add_entry_negative_count(store):
+    """Test that negative count raises ValueError and writes nothing."""
+    with pytest.raises(ValueError, match="Count must be non-negative"):
+        store.add_entry("Yoga", -1)
+    
+    assert store.total() == 0
+
+
+def test_module_functions_delegate(store):
+    """Test the attendance module functions accept a store object."""
+    add_entry(store, "Pilates", 4)
+    
+    assert summarize(store)['by_activity'] == {"Pilates": 4}
+
+
+def test_persists_across_reopen(tmp_path):
+    """Test attendance survives closing and reopening the database."""
+    path = tmp_path / "attendance.db"
+    first = SQLiteAttendanceStore(path)
+    first.add_entries([("Yoga", 3), ("Spin", 4)])
+    first.close()
+    
+    second = SQLiteAttendanceStore(path)
+    assert second.summarize()['by_activity'] == {"Yoga": 3, "Spin": 4}
+    second.close()
+
+
+def test_add_entries_batches(store):
+    """Test bulk inserts across several transactions."""
+    store.add_entries((("Yoga" if i % 2 else "Spin", 1) for i in range(2500)), batch_size=1000)
+    
+    assert store.summarize()['by_activity'] == {"Yoga": 1250, "Spin": 1250}
+
+
+def test_entries_filters_by_activity_and_time(store):
+    """Test querying the entry history by activity and time range."""
+    store.add_entries([("Yoga", 1, 100.0), ("Spin", 2, 150.0), ("Yoga", 3, 200.0)])
+    
+    assert list(store.entries(activity="Yoga")) == [("Yoga", 1, 100.0), ("Yoga", 3, 200.0)]
+    assert list(store.entries(since=120.0, until=200.0)) == [("Spin", 2, 150.0)]
+
+
+def test_clear(store):
+    """Test clearing all attendance."""
+    store.add_entry("Yoga", 10)
+    store.clear()
+    
+    assert store.summarize()['total'] == 0
+    assert len(store) == 0
+
+
+def test_failed_clear_and_prune_roll_back(store):
+    """Test a failing clear or prune leaves the data and the connection usable."""
+    store.add_entry("Yoga", 10)
+    store.record_check_ins([("M1", "yoga@1", "Yoga", 100.0)])
+    store._connection().execute(
+        "CREATE TRIGGER keep_checkins BEFORE DELETE ON attendance_checkins BEGIN SELECT RAISE(ABORT, 'kept'); END"
+    )
+    
+    for action in (store.clear, lambda: store.prune_check_ins(200.0)):
+        with pytest.raises(sqlite3.IntegrityError, match="kept"):
+            action()
+        assert store.total() == 11 and store.has_check_in("M1", "yoga@1")
+    store.add_entry("Spin", 5)
+    assert store.summarize()['total'] == 16
+
+
+def test_concurrent_writers(tmp_path):
+    """Test many threads writing at once never lose an entry."""
+    store = SQLiteAttendanceStore(tmp_path / "attendance.db")
+
+    def worker():
+        for _ in range(50):
+            store.add_entry("Spin", 1)
+    
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert store.summarize()['by_activity'] == {"Spin": 400}
+
+
+def test_summary_catches_up_with_other_writers(tmp_path):
+    """Test summaries include entries written through another connection."""
+    path = tmp_path / "attendance.db"
+    reader = SQLiteAttendanceStore(path)
+    writer = SQLiteAttendanceStore(path)
+    reader.add_entry("Yoga", 1)
+    assert reader.summarize()['by_activity'] == {"Yoga": 1}
+    
+    writer.add_entries([("Yoga", 2), ("Spin", 5)])
+    assert reader.summarize()['by_activity'] == {"Yoga": 3, "Spin": 5}
+    assert reader.top(1) == [("Spin", 5)]
+    
+    writer.clear()
+    writer.add_entry("Pilates", 4)
+    assert reader.summarize()['by_activity'] == {"Pilates": 4}
+
+
+def test_version_changes_with_entries_and_clear(store):
+    """Test the version identifies the contents for cache keys."""
+    empty = store.version()
+    store.add_entry("Yoga", 10)
+    added = store.version()
+    
+    assert added != empty and store.version() == added
+    store.clear()
+    assert store.version() not in (empty, added)
@@ -0,0 +1,105 @@
+"""Tests for vectorized batch pricing."""
+
+import itertools
+
+import pandas as pd
+import pytest
+from src.logic.batch_pricing import price_membership_batch, price_membership_frame
+from src.logic.pricing import price_membership
+from src.logic.promos import PromoCatalog
+from src.data import plans, promo_codes
+
+# Expiry of the campaign in the expiry parity test
+EXPIRES = 1_800_000_000.0
+
+
+def _all_combinations():
+    """Build every plan/months/student/promo combination as columns."""
+    rows = list(itertools.product(
+        plans.keys(),
+        [1, 2, 3, 7, 12],
+        [False, True],
+        [None, "", "WELCOME10", " fall5 ", "INVALID"],
+    ))
+    return [list(column) for column in zip(*rows)]
+
+
+def test_batch_matches_scalar_row_for_row():
+    """Test every batch row equals the scalar price_membership result."""
+    plan, months, student, promo = _all_combinations()
+    result = price_membership_batch(plan, months, student, promo, plans, promo_codes)
+    
+    for i in range(len(plan)):
+        expected = price_membership(plan[i], months[i], student[i], promo[i], plans, promo_codes)
+        for key, value in expected.items():
+            assert result[key][i] == value
+
+
+def test_batch_without_promo_column():
+    """Test quoting without any promo column."""
+    result = price_membership_batch(["Basic", "Plus"], [1, 2], [False, True], None, plans, promo_codes)
+    
+    assert list(result['final_cost']) == [25.0, 59.5]
+    assert list(result['promo_applied']) == [None, None]
+
+
+def test_batch_final_cost_non_negative():
+    """Test that promo rates above 100% never produce a negative cost."""
+    result = price_membership_batch(["Basic"], [1], [False], ["FREE"], plans, {"FREE": 1.5})
+    
+    assert result['final_cost'][0] == 0.0
+
+
+def test_batch_invalid_plan():
+    """Test that an invalid plan in any row raises ValueError."""
+    with pytest.raises(ValueError, match="Invalid plan: Gold"):
+        price_membership_batch(["Basic", "Gold"], [1, 1], [False, False], None, plans, promo_codes)
+
+
+def test_batch_invalid_months():
+    """Test that months <= 0 in any row raises ValueError."""
+    with pytest.raises(ValueError, match="Months must be greater than 0, got -2"):
+        price_membership_batch(["Basic", "Plus"], [1, -2], [False, False], None, plans, promo_codes)
+
+
+def test_batch_length_mismatch():
+    """Test that columns of different lengths are rejected."""
+    with pytest.raises(ValueError, match="same length"):
+        price_membership_batch(["Basic", "Plus"], [1], [False, False], None, plans, promo_codes)
+
+
+def test_price_membership_frame():
+    """Test DataFrame input returns an aligned breakdown DataFrame."""
+    quotes = pd.DataFrame({
+        "plan": ["Basic", "Premium"],
+        "months": [1, 3],
+        "is_student_or_staff": [True, False],
+        "promo": ["WELCOME10", None],
+    }, index=["a", "b"])
+    result = price_membership_frame(quotes, plans, promo_codes)
+    
+    assert list(result.index) == ["a", "b"]
+    assert result.loc["a", "final_cost"] == 19.12
+    assert result.loc["b", "final_cost"] == 150.0
+    assert result.loc["a", "promo_applied"] == "WELCOME10"
+
+
+def test_price_membership_frame_checks_expiry_at_now():
+    """Test frame rows match price_membership at the same now, on either side of a promo's expiry."""
+    catalog = PromoCatalog.from_rates({"WELCOME10": 0.10})
+    catalog.add("ENDING20", 0.20, expires_at=EXPIRES)
+    quotes = pd.DataFrame({
+        "plan": ["Basic", "Plus", "Premium"],
+        "months": [1, 6, 12],
+        "is_student_or_staff": [False, True, False],
+        "promo": ["ENDING20", "ending20+WELCOME10", "WELCOME10"],
+    })
+    
+    for now in (EXPIRES - 1, EXPIRES):
+        result = price_membership_frame(quotes, plans, catalog, now=now)
+        for i, quote in quotes.iterrows():
+            expected = price_membership(quote["plan"], quote["months"], quote["is_student_or_staff"], quote["promo"], plans, catalog, now=now)
+            for key, value in expected.items():
+                assert pd.isna(result.loc[i, key]) if value is None else result.loc[i, key] == value
+    assert price_membership_frame(quotes, plans, catalog, now=EXPIRES - 1).loc[0, "promo_applied"] == "ENDING20"
+    assert pd.isna(price_membership_frame(quotes, plans, catalog, now=EXPIRES).loc[0, "promo_applied"])
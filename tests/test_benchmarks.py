@@ -0,0 +1,42 @@
+"""Tests for the benchmark suite runner."""
+
+import json
+
+from benchmarks.suite import CASES, compare_results, main, parse_scales, run_suite
+
+
+def _document(seconds):
+    """Build a results document with one case."""
+    return {"results": [{"case": "pricing.price_membership", "scale": 1000, "seconds": seconds}]}
+
+
+def test_parse_scales():
+    """Test scientific-notation scale lists."""
+    assert parse_scales("1e3,1e4, 50000") == [1000, 10000, 50000]
+
+
+def test_every_case_runs_at_small_scale():
+    """Test each registered case runs and reports a timing."""
+    document = run_suite(list(CASES.values()), [10], repeat=1)
+    
+    assert {r["case"] for r in document["results"]} == set(CASES)
+    assert all(r["seconds"] >= 0 for r in document["results"])
+
+
+def test_compare_flags_regressions():
+    """Test slowdowns beyond the threshold are flagged."""
+    rows = compare_results(_document(1.0), _document(1.3), threshold=0.25)
+    
+    assert rows[0]["regression"] is True
+    assert compare_results(_document(1.0), _document(1.2), threshold=0.25)[0]["regression"] is False
+
+
+def test_compare_command_exit_status(tmp_path, capsys):
+    """Test the compare command exits non-zero on regressions."""
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    baseline.write_text(json.dumps(_document(1.0)))
+    current.write_text(json.dumps(_document(2.0)))
+    
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert main(["compare", str(baseline), str(baseline)]) == 0
+    assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,136 @@
+"""Tests for bulk CLI processing."""
+
+import csv
+import json
+
+import pytest
+from src.cli import main
+from src.logic.attendance_sqlite import SQLiteAttendanceStore
+from src.logic import bulk
+from src.logic.bulk import chunked, map_chunks, price_chunk, read_records
+from src.logic.promos import PromoCatalog
+
+
+def _write_jsonl(path, records):
+    """Write records as JSON Lines."""
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+
+
+def test_chunked():
+    """Test grouping into fixed-size chunks."""
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    with pytest.raises(ValueError, match="Chunk size"):
+        list(chunked(range(5), 0))
+
+
+def test_map_chunks_keeps_order_with_workers():
+    """Test parallel mapping yields results in input order."""
+    chunks = list(chunked(range(100), 7))
+    
+    assert list(map_chunks(sum, chunks, workers=2)) == [sum(chunk) for chunk in chunks]
+
+
+def test_price_chunk_reports_errors():
+    """Test invalid requests become error records."""
+    results = price_chunk([
+        (1, {"plan": "Basic", "months": "3", "is_student_or_staff": "Y", "promo": ""}),
+        (2, {"plan": "Gold", "months": 1}),
+        (3, {"plan": "Plus", "months": "abc"}),
+    ])
+    
+    assert results[0]["final_cost"] == 63.75
+    assert results[0]["error"] is None
+    assert "Invalid plan" in results[1]["error"]
+    assert results[2]["row"] == 3 and results[2]["error"]
+
+
+def test_bulk_price_csv_to_csv(tmp_path):
+    """Test the price command streams CSV requests to CSV results."""
+    source = tmp_path / "requests.csv"
+    source.write_text(
+        "plan,months,is_student_or_staff,promo\n"
+        "Basic,1,false,WELCOME10\n"
+        "Premium,2,true,\n",
+        encoding="utf-8"
+    )
+    output = tmp_path / "quotes.csv"
+    
+    assert main(["price", str(source), "-o", str(output), "--workers", "2", "--chunk-size", "1"]) == 0
+    
+    with open(output, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["final_cost"] for row in rows] == ["22.5", "85.0"]
+    assert [row["row"] for row in rows] == ["1", "2"]
+
+
+def test_bulk_price_exit_code_on_errors(tmp_path, capsys):
+    """Test invalid rows are written out and give a non-zero exit code."""
+    source = tmp_path / "requests.jsonl"
+    _write_jsonl(source, [{"plan": "Basic", "months": 0}])
+    
+    assert main(["price", str(source)]) == 1
+    
+    out, err = capsys.readouterr()
+    assert "Months must be greater than 0" in json.loads(out)["error"]
+    assert "Priced 1 rows" in err
+
+
+def test_malformed_json_lines_are_error_rows(tmp_path, capsys):
+    """Test a line that is not a JSON object is reported for its row and the rest are processed."""
+    source = tmp_path / "requests.jsonl"
+    source.write_text(
+        '{"plan": "Basic", "months": 1}\n{"plan": "Basic", "months": \n\n[1, 2]\n{"plan": "Plus", "months": 2}\n',
+        encoding="utf-8"
+    )
+    
+    assert main(["price", str(source), "--workers", "2", "--chunk-size", "2"]) == 1
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["row"] for r in results] == [1, 2, 3, 4]
+    assert results[1]["error"].startswith("Malformed JSON on line 2")
+    assert results[2]["error"] == "Line 4 is not a JSON object"
+    assert [r["final_cost"] for r in (results[0], results[3])] == [25.0, 70.0]
+
+
+def test_numeric_promo_is_read_as_a_code(tmp_path, capsys):
+    """Test a promo read from JSON as a number is looked up as text instead of stopping the run."""
+    source = tmp_path / "requests.jsonl"
+    _write_jsonl(source, [{"plan": "Basic", "months": 2, "promo": 10}, {"plan": "Plus", "months": 1, "promo": " welcome10 "}])
+    
+    assert main(["price", str(source)]) == 0
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["promo_applied"], r["final_cost"]) for r in results] == [(None, 50.0), ("WELCOME10", 31.5)]
+
+
+def test_bulk_purchases_use_up_single_use_codes(tmp_path, monkeypatch, capsys):
+    """Test quotes leave a single-use code alone and purchases redeem it once, in row order."""
+    catalog = PromoCatalog.from_rates({"WELCOME10": 0.10})
+    catalog.add("ONCE25", 0.25, max_redemptions=1)
+    monkeypatch.setattr(bulk, "promo_codes", catalog)
+    source = tmp_path / "sales.jsonl"
+    _write_jsonl(source, [{"plan": "Basic", "months": 1, "promo": "ONCE25"}] * 3)
+    
+    assert main(["price", str(source)]) == 0
+    assert [json.loads(line)["promo_applied"] for line in capsys.readouterr().out.splitlines()] == ["ONCE25"] * 3
+    assert main(["price", str(source), "--purchase", "--workers", "2"]) == 0
+    sales = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(s["promo_applied"], s["final_cost"]) for s in sales] == [("ONCE25", 18.75), (None, 25.0), (None, 25.0)]
+    assert catalog.redemptions("ONCE25") == 1
+
+
+def test_bulk_attendance(tmp_path):
+    """Test the attendance command records entries into the database."""
+    source = tmp_path / "entries.jsonl"
+    _write_jsonl(source, [
+        {"activity": "Yoga", "count": 10, "recorded_at": 100.0},
+        {"activity": "Spin", "count": 5},
+        {"activity": "Yoga", "count": -1},
+        {"activity": "Yoga", "count": 2},
+    ])
+    db = tmp_path / "attendance.db"
+    output = tmp_path / "errors.jsonl"
+    
+    assert main(["attendance", str(source), "--db", str(db), "-o", str(output), "--workers", "2", "--chunk-size", "2"]) == 1
+    
+    store = SQLiteAttendanceStore(db)
+    assert store.summarize()['by_activity'] == {"Yoga": 12, "Spin": 5}
+    assert list(read_records(str(output))) == [{"row": 3, "error": "Count must be non-negative, got -1"}]
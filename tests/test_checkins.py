@@ -0,0 +1,133 @@
+"""Tests for idempotent check-ins and their Bloom filters."""
+
+import json
+
+import pytest
+from src.cli import main
+from src.logic.attendance_sqlite import SQLiteAttendanceStore
+from src.logic.checkins import (
+    BloomFilter,
+    CheckInDeduplicator,
+    RotatingBloomFilter,
+    bloom_size,
+    occurrence_key,
+)
+
+START = 1_700_000_000.0
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store backed by a temporary database file."""
+    store = SQLiteAttendanceStore(tmp_path / "attendance.db")
+    yield store
+    store.close()
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Test every added key is found and the false-positive rate is near its target."""
+    bloom = BloomFilter(2000, 0.01)
+    for i in range(2000):
+        bloom.add(f"member-{i}")
+    
+    assert all(f"member-{i}" in bloom for i in range(2000))
+    observed = sum(f"other-{i}" in bloom for i in range(20_000)) / 20_000
+    assert observed < 0.02
+    assert bloom.false_positive_rate() == pytest.approx(0.01, rel=0.2)
+    assert len(bloom) <= 2000 and bloom.nbytes == (bloom_size(2000, 0.01)[0] + 7) // 8
+    with pytest.raises(ValueError, match="Error rate"):
+        BloomFilter(10, 1.5)
+
+
+def test_rotating_filter_forgets_old_slices():
+    """Test keys are kept for the window and dropped once their slice leaves it."""
+    bloom = RotatingBloomFilter(window=300, slices=3, capacity=100, error_rate=0.001)
+    bloom.add("early", START)
+    bloom.add("late", START + 250)
+    
+    bloom.advance(START + 350)
+    assert "early" in bloom and "late" in bloom
+    bloom.advance(START + 450)
+    assert "early" not in bloom and "late" in bloom
+    assert len(bloom._filters) <= 4
+    assert bloom.oldest_timestamp <= START + 450 - 300
+
+
+def test_duplicates_are_counted_once(store):
+    """Test double scans and repeats within an occurrence record one entry."""
+    with CheckInDeduplicator(store) as guard:
+        assert guard.check_in("M1", "Yoga", START, "Yoga@6am") is True
+        assert guard.check_in("M1", "Yoga", START + 0.2, "Yoga@6am") is False
+        assert guard.check_in("M1", "Yoga", START + 60, "Yoga@6pm") is True
+        assert guard.check_in(" M2 ", " Yoga ", START + 1, "Yoga@6am") is True
+        guard.flush()
+        assert guard.check_in("M2", "Yoga", START + 2, "Yoga@6am") is False
+        with pytest.raises(ValueError, match="empty"):
+            guard.check_in("", "Yoga", START)
+    
+    assert store.summarize()["by_activity"] == {"Yoga": 3}
+    assert (guard.stats.checked_in, guard.stats.duplicates, guard.stats.false_positives) == (3, 2, 0)
+    assert store.has_check_in("M2", "Yoga@6am") and not store.has_check_in("M3", "Yoga@6am")
+
+
+def test_store_catches_what_the_filter_forgot(store):
+    """Test repeats are suppressed by the store after a restart or outside the window."""
+    with CheckInDeduplicator(store, window=60, slices=2) as guard:
+        guard.check_in("M1", "Spin", START, "Spin@1")
+        guard.check_in("M2", "Spin", START + 600, "Spin@1")
+        assert guard.check_in("M1", "Spin", START + 601, "Spin@1") is True  # Left the filter
+    
+    with CheckInDeduplicator(store) as replay:
+        for member in ("M1", "M2"):
+            replay.check_in(member, "Spin", START, "Spin@1")
+    
+    assert store.summarize()["total"] == 2
+    assert (guard.stats.checked_in, guard.stats.duplicates) == (2, 1)
+    assert (replay.stats.checked_in, replay.stats.duplicates) == (0, 2)
+
+
+def test_retention_prunes_the_store(store):
+    """Test check-ins past their retention are forgotten and counted again."""
+    with CheckInDeduplicator(store, window=60, slices=2, retention=120) as guard:
+        guard.check_in("M1", "Swim", START, "Swim@1")
+        guard.flush()
+        guard.check_in("M2", "Swim", START + 1000, "Swim@2")
+        guard.flush()
+        assert not store.has_check_in("M1", "Swim@1")
+        assert guard.check_in("M1", "Swim", START + 1001, "Swim@1") is True
+    
+    with pytest.raises(ValueError, match="Retention"):
+        CheckInDeduplicator(store, window=60, retention=30)
+
+
+def test_false_positives_are_measured(store):
+    """Test an undersized filter reports false positives without losing check-ins."""
+    with CheckInDeduplicator(store, capacity=20, error_rate=0.2, batch_size=50) as guard:
+        for i in range(400):
+            guard.check_in(f"M{i}", "Yoga", START + i, "Yoga@1")
+    
+    assert guard.stats.checked_in == 400 and store.summarize()["total"] == 400
+    assert guard.stats.false_positives > 0
+    assert guard.stats.false_positive_rate == guard.stats.false_positives / 400
+
+
+def test_occurrence_key_uses_the_local_date():
+    """Test the default occurrence is the activity on the scan's date."""
+    assert occurrence_key("Yoga", START).startswith("Yoga@2023-11-1")
+
+
+def test_checkin_command(tmp_path, capsys):
+    """Test the checkin command suppresses double scans and reports the filter."""
+    scans = [{"member_id": "M1", "activity": "Yoga", "recorded_at": START}] * 3 + [
+        {"member_id": "M2", "activity": "Yoga", "recorded_at": START + 5},
+        {"member_id": "M2", "activity": "", "recorded_at": START + 5},
+    ]
+    path = tmp_path / "scans.jsonl"
+    path.write_text("".join(json.dumps(s) + "\n" for s in scans), encoding="utf-8")
+    db = tmp_path / "attendance.db"
+    
+    assert main(["checkin", str(path), "--db", str(db), "-o", str(tmp_path / "errors.csv")]) == 1
+    assert "Checked in 2, suppressed 2 duplicates" in capsys.readouterr().err
+    assert main(["checkin", str(path), "--db", str(db), "-o", str(tmp_path / "errors.csv")]) == 1
+    assert "Checked in 0, suppressed 4 duplicates" in capsys.readouterr().err
+    assert SQLiteAttendanceStore(db).summarize()["total"] == 2
@@ -0,0 +1,200 @@
+"""Tests for export utilities."""
+
+import gzip
+import os
+
+import pandas as pd
+import pytest
+from src.cli import main
+from src.data import plans, promo_codes
+from src.logic import export
+from src.logic.attendance_compact import CompactAttendanceStore
+from src.logic.attendance_sqlite import SQLiteAttendanceStore
+from src.logic.export import atomic_file, export_table, export_text, spool_table
+from src.logic.frames import attendance_export_frame, attendance_history_frames
+from src.logic.price_matrix import current_price_matrix
+
+
+def test_export_text_list(tmp_path):
+    """Test exporting a list of lines."""
+    path = tmp_path / "summary.txt"
+    export_text(str(path), ["Line 1", "Line 2"])
+    
+    assert path.read_text(encoding="utf-8") == "Line 1\nLine 2\n"
+
+
+def test_export_text_generator_creates_parent(tmp_path):
+    """Test exporting lines from a generator into a new directory."""
+    path = tmp_path / "reports" / "summary.txt"
+    export_text(str(path), (f"Row {i}" for i in range(10000)))
+    
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 10000
+    assert lines[-1] == "Row 9999"
+
+
+@pytest.fixture
+def umask_022():
+    """Run a test with umask 022, as on a typical server."""
+    previous = os.umask(0o022)
+    yield
+    os.umask(previous)
+
+
+def test_export_file_permissions(tmp_path, umask_022):
+    """Test a new file gets open()'s mode, a replaced file keeps its mode, and mode= overrides both."""
+    path = tmp_path / "summary.txt"
+    export_text(str(path), ["Line 1"])
+    assert path.stat().st_mode & 0o777 == 0o644
+    
+    path.chmod(0o600)
+    export_text(str(path), ["Line 2"])
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert path.read_text(encoding="utf-8") == "Line 2\n"
+    
+    with atomic_file(str(path), mode=0o640) as f:
+        f.write(b"Line 3\n")
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["summary.txt"]
+
+
+def test_export_text_gzip(tmp_path):
+    """Test gzip-compressed export round-trips."""
+    path = tmp_path / "summary.txt.gz"
+    export_text(str(path), ["• Yoga: 10", "• Spin: 5"], compression="gzip")
+    
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert f.read() == "• Yoga: 10\n• Spin: 5\n"
+
+
+def test_export_text_zstd(tmp_path):
+    """Test zstd-compressed export round-trips."""
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "summary.txt.zst"
+    export_text(str(path), ["Line 1"], compression="zstd")
+    
+    with zstandard.open(path, "rt", encoding="utf-8") as f:
+        assert f.read() == "Line 1\n"
+
+
+def test_export_text_zstd_missing(tmp_path, monkeypatch):
+    """Test a clear error when zstandard is not installed."""
+    monkeypatch.setattr(export, "zstandard", None)
+    with pytest.raises(ImportError, match="zstandard"):
+        export_text(str(tmp_path / "summary.txt.zst"), ["Line 1"], compression="zstd")
+    
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_text_invalid_compression(tmp_path):
+    """Test that unsupported compression raises ValueError."""
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        export_text(str(tmp_path / "summary.txt"), ["Line 1"], compression="bz2")
+
+
+def test_export_text_failure_keeps_existing_file(tmp_path):
+    """Test a crash mid-export leaves the previous file intact and no temp file."""
+    path = tmp_path / "summary.txt"
+    path.write_text("previous report\n", encoding="utf-8")
+
+    def failing_lines():
+        yield "partial"
+        raise RuntimeError("crashed mid-export")
+    
+    with pytest.raises(RuntimeError):
+        export_text(str(path), failing_lines())
+    
+    assert path.read_text(encoding="utf-8") == "previous report\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["summary.txt"]
+
+
+def _history_store(entries=1000):
+    """Compact store with a kept history over three activities."""
+    return CompactAttendanceStore.from_entries(
+        (f"Class {i % 3}", i % 7, 1.7e9 + 60 * i) for i in range(entries)
+    )
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow", ".csv"])
+def test_export_table_round_trip(tmp_path, suffix):
+    """Test history chunks round-trip through every columnar format."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / f"history{suffix}"
+    rows = export_table(str(path), attendance_history_frames(_history_store(), rows=300))
+    
+    if suffix == ".parquet":
+        frame = pd.read_parquet(path)
+    elif suffix == ".arrow":
+        frame = pd.read_feather(path)
+    else:
+        frame = pd.read_csv(path, parse_dates=["recorded_at"])
+    assert rows == len(frame) == 1000
+    assert frame["activity"].astype(str).tolist()[:4] == ["Class 0", "Class 1", "Class 2", "Class 0"]
+    assert frame["count"].sum() == sum(i % 7 for i in range(1000))
+    assert frame["recorded_at"].iloc[1] == pd.Timestamp(1.7e9 + 60, unit="s", tz="UTC")
+
+
+def test_export_table_writes_one_row_group_per_chunk(tmp_path):
+    """Test Parquet row groups follow the chunks."""
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "history.parquet"
+    export_table(str(path), attendance_history_frames(_history_store(), rows=300))
+    
+    assert pyarrow_parquet.ParquetFile(path).metadata.num_row_groups == 4
+
+
+def test_export_table_without_pyarrow(tmp_path, monkeypatch):
+    """Test CSV falls back to pandas and Parquet needs pyarrow."""
+    monkeypatch.setattr(export, "_pyarrow", lambda: None)
+    path = tmp_path / "totals.csv"
+    store = CompactAttendanceStore.from_counts({"Yoga": 10, "Spin": 4})
+    
+    assert export_table(str(path), [attendance_export_frame(store.by_activity)] * 2) == 4
+    assert path.read_text(encoding="utf-8") == "activity,count\nYoga,10\nSpin,4\nYoga,10\nSpin,4\n"
+    with pytest.raises(ImportError, match="pyarrow"):
+        export_table(str(tmp_path / "totals.parquet"), [attendance_export_frame(store.by_activity)])
+    assert not (tmp_path / "totals.parquet").exists()
+
+
+def test_export_table_invalid(tmp_path):
+    """Test unknown formats and empty chunk streams raise ValueError."""
+    with pytest.raises(ValueError, match="Unsupported table format"):
+        export_table(str(tmp_path / "data.xlsx"), [])
+    with pytest.raises(ValueError, match="No chunks"):
+        export_table(str(tmp_path / "data.csv"), [])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sqlite_history_chunks(tmp_path):
+    """Test a SQLite store's history is read in chunks, and an empty one gives one empty chunk."""
+    store = SQLiteAttendanceStore(tmp_path / "attendance.db")
+    for i in range(10):
+        store.add_entry("Yoga" if i % 2 else "Spin", i, recorded_at=1.7e9 + i)
+    chunks = list(attendance_history_frames(store, rows=4))
+    
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert pd.concat(chunks)["count"].tolist() == list(range(10))
+    empty = list(attendance_history_frames(SQLiteAttendanceStore(tmp_path / "empty.db")))
+    assert len(empty) == 1 and list(empty[0].columns) == ["activity", "count", "recorded_at"]
+    with pytest.raises(ValueError, match="history"):
+        next(attendance_history_frames({"Yoga": 1}))
+
+
+def test_spool_table_rolls_over_to_disk():
+    """Test a spooled export moves to disk past max_size and reads back whole."""
+    with spool_table(attendance_history_frames(_history_store(), rows=100), "csv", max_size=1024) as f:
+        assert f._rolled
+        assert f.read().decode("utf-8").count("\n") == 1001
+
+
+def test_export_command(tmp_path, capsys):
+    """Test the export command writes the price list and attendance totals."""
+    pytest.importorskip("pyarrow")
+    db = str(tmp_path / "attendance.db")
+    SQLiteAttendanceStore(db).add_entry("Yoga", 3)
+    
+    assert main(["export", "prices", str(tmp_path / "prices.parquet"), "--chunk-size", "1000"]) == 0
+    assert main(["export", "totals", str(tmp_path / "totals.csv"), "--db", db]) == 0
+    assert len(pd.read_parquet(tmp_path / "prices.parquet")) == current_price_matrix(plans, promo_codes).final_cents.size
+    assert (tmp_path / "totals.csv").read_text(encoding="utf-8") == "\"activity\",\"count\"\n\"Yoga\",3\n"
+    assert "Exported prices:" in capsys.readouterr().err
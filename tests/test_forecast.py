@@ -0,0 +1,94 @@
+"""Tests for batch Holt-Winters class attendance forecasting."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.logic.forecast import class_history, fit_holt_winters, forecast_classes
+
+WEEK = 7 * 86400.0
+
+# Monday 2025-10-13 06:05 UTC, just after "Yoga Flow - 6:00 AM"
+MONDAY_YOGA = pd.Timestamp("2025-10-13 06:05", tz="UTC").timestamp()
+
+SCHEDULE = {
+    "monday": ["Yoga Flow - 6:00 AM", "HIIT Training - 7:30 PM"],
+    "tuesday": ["Yoga Flow - 6:00 AM"],
+}
+
+
+def _seasonal(steps, noise=0.0, seed=0):
+    """Two trending seasonal series with a four-step cycle."""
+    t = np.arange(steps)
+    pattern = np.array([0.0, 4.0, -3.0, -1.0])
+    rng = np.random.default_rng(seed)
+    return np.stack([20 + 0.5 * t + pattern[t % 4], 50 - 0.2 * t + 2 * pattern[t % 4]]) + rng.normal(0, noise, (2, steps))
+
+
+def test_recovers_trend_and_season():
+    """Test a noiseless seasonal series is forecast almost exactly."""
+    series = _seasonal(48)
+    model = fit_holt_winters(series[:, :40])
+    
+    assert np.allclose(model.forecast(8), series[:, 40:], atol=0.5)
+    assert model.forecast(0).shape == (2, 0)
+    assert len(model) == 2
+
+
+def test_batch_matches_one_series_at_a_time():
+    """Test fitting all rows at once equals fitting each row alone."""
+    series = _seasonal(30, noise=1.5)
+    series[1, :6] = np.nan
+    series[0, 17] = np.nan
+    batch = fit_holt_winters(series)
+    
+    for row in range(2):
+        single = fit_holt_winters(series[row])
+        assert np.allclose(batch.forecast(5)[row], single.forecast(5)[0])
+        assert batch.alpha[row] == single.alpha[0] and batch.rmse[row] == pytest.approx(single.rmse[0])
+    assert batch.observations.tolist() == [29, 24]
+
+
+def test_series_without_observations_and_validation():
+    """Test empty series forecast NaN and bad arguments raise ValueError."""
+    model = fit_holt_winters(np.full((1, 10), np.nan))
+    assert np.isnan(model.forecast(2)).all()
+    assert fit_holt_winters([5.0, 6.0, 7.0], season_length=1).forecast(1)[0, 0] > 7
+    
+    with pytest.raises(ValueError, match="Season length"):
+        fit_holt_winters(np.ones((1, 8)), season_length=0)
+    with pytest.raises(ValueError, match="at least one step"):
+        fit_holt_winters(np.ones((1, 0)))
+    with pytest.raises(ValueError, match="Horizon"):
+        model.forecast(-1)
+
+
+def test_class_history_matches_entries_to_slots():
+    """Test check-ins land in their slot's week by name, day and start time."""
+    entries = [
+        ("Yoga Flow", 10, MONDAY_YOGA - 2 * WEEK),
+        ("yoga flow ", 2, MONDAY_YOGA - 2 * WEEK + 600),
+        ("Yoga Flow", 7, MONDAY_YOGA + 86400 - WEEK),       # Tuesday's slot
+        ("HIIT Training", 9, MONDAY_YOGA + 13 * 3600),      # Monday 7:05 PM
+        ("Yoga Flow", 5, MONDAY_YOGA + 5 * 3600),           # 11 AM: no class near
+        ("Spin", 3, MONDAY_YOGA - WEEK),
+    ]
+    slots, history = class_history(entries, SCHEDULE, weeks=3, now=MONDAY_YOGA + 14 * 3600, tz="UTC")
+    
+    assert [str(slot) for slot in slots] == ["Yoga Flow - 6:00 AM", "HIIT Training - 7:30 PM", "Yoga Flow - 6:00 AM"]
+    assert np.isnan(history[0, 0]) and history[0, 1:].tolist() == [12.0, 0.0]
+    assert np.isnan(history[1]).all()  # this week's class is not history yet
+    assert np.isnan(history[2, :2]).all() and history[2, 2] == 7
+
+
+def test_forecast_classes_frame():
+    """Test one forecast row per slot and week, NaN for slots without history."""
+    entries = [("Yoga Flow", 10 + week % 2, MONDAY_YOGA - week * WEEK) for week in range(1, 13)]
+    frame = forecast_classes(entries, SCHEDULE, weeks_ahead=2, history_weeks=12, now=MONDAY_YOGA, tz="UTC")
+    
+    assert list(frame.columns) == ["Week", "Day", "Time", "Class", "Forecast", "Upper"]
+    assert len(frame) == 6
+    assert frame["Week"].iloc[0] == pd.Timestamp("2025-10-13") and frame["Week"].iloc[3] == pd.Timestamp("2025-10-20")
+    monday_yoga = frame[(frame["Day"] == "Monday") & (frame["Class"] == "Yoga Flow")]
+    assert monday_yoga["Forecast"].between(9, 12).all()
+    assert (monday_yoga["Upper"] >= monday_yoga["Forecast"]).all()
+    assert frame.loc[frame["Class"] == "HIIT Training", "Forecast"].isna().all()
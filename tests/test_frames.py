@@ -0,0 +1,55 @@
+"""Tests for the dashboard's paginated activity table."""
+
+import pytest
+from src.logic.attendance_compact import CompactAttendanceStore
+from src.logic.frames import ActivityTable
+
+COUNTS = {"Yoga": 30, "Spin": 50, "Pilates": 30, "Boxing": 5, "Swim": 12, "Yoga Flow": 8}
+
+
+@pytest.fixture
+def table():
+    """Table over a compact store's snapshot."""
+    return ActivityTable(CompactAttendanceStore.from_counts(COUNTS).summarize(snapshot=True)["by_activity"])
+
+
+def test_sorting_breaks_ties_by_name(table):
+    """Test count and name sorts, with equal counts in name order."""
+    assert table.names[table.rows()].tolist() == ["Spin", "Pilates", "Yoga", "Swim", "Yoga Flow", "Boxing"]
+    assert table.names[table.rows(sort_by="Count", descending=False)].tolist()[:2] == ["Boxing", "Yoga Flow"]
+    assert table.names[table.rows(sort_by="Activity", descending=True)].tolist()[0] == "Yoga Flow"
+    with pytest.raises(ValueError, match="sort"):
+        table.rows(sort_by="Total")
+
+
+def test_filter_and_pages(table):
+    """Test case-insensitive filtering and 1-based page slices."""
+    page = table.page(1, page_size=4)
+    
+    assert page["Activity"].tolist() == ["Spin", "Pilates", "Yoga", "Swim"]
+    assert page.index.tolist() == [1, 2, 3, 4]
+    assert table.page(2, page_size=4).index.tolist() == [5, 6]
+    assert table.page(3, page_size=4).empty
+    assert table.page(1, search=" yOGA ")["Activity"].tolist() == ["Yoga", "Yoga Flow"]
+    assert len(table.rows("zumba")) == 0
+    with pytest.raises(ValueError, match="Page"):
+        table.page(0)
+
+
+def test_pages_are_cached(table):
+    """Test rereading a page returns the cached slice."""
+    first = table.page(1, page_size=2, search="o")
+    
+    assert table.page(1, page_size=2, search="o ") is first
+    assert table.page(2, page_size=2, search="o") is not first
+
+
+def test_top_frame_collapses_the_rest(table):
+    """Test the chart keeps the top activities and one bar for the rest."""
+    chart = table.top_frame(3)
+    
+    assert chart.index.tolist() == ["Spin", "Pilates", "Yoga", "Other (3)"]
+    assert chart["Count"].tolist() == [50, 30, 30, 25]
+    assert chart["Count"].sum() == table.total == sum(COUNTS.values())
+    assert "Other" not in table.top_frame(10).index[-1]
+    assert ActivityTable({}).top_frame().empty
@@ -0,0 +1,82 @@
+"""Tests for timing and counter hooks."""
+
+import json
+
+import pytest
+from src.cli import main
+from src.logic import instrumentation
+from src.logic.instrumentation import LatencyHistogram, count, snapshot, start_timer, stop_timer, timed
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    """Start each test disabled with no measurements."""
+    instrumentation.enable(False)
+    instrumentation.reset()
+    yield
+    instrumentation.enable(False)
+    instrumentation.reset()
+
+
+def test_disabled_hooks_record_nothing():
+    """Test hooks are no-ops while instrumentation is off."""
+    with timed("logic.pricing"):
+        pass
+    stop_timer("page.Home", start_timer())
+    count("rows")
+    
+    assert snapshot() == {"timers": {}, "counters": {}}
+
+
+def test_enabled_hooks_record_timings_and_counters():
+    """Test timers and counters accumulate when enabled."""
+    instrumentation.enable()
+    for _ in range(3):
+        with timed("logic.pricing"):
+            pass
+    stop_timer("page.Home", start_timer())
+    count("rows", 5)
+    count("rows")
+    
+    data = snapshot()
+    assert data["timers"]["logic.pricing"]["count"] == 3
+    assert data["timers"]["page.Home"]["count"] == 1
+    assert sum(data["timers"]["logic.pricing"]["buckets"]) == 3
+    assert data["counters"] == {"rows": 6}
+
+
+def test_histogram_percentiles():
+    """Test percentiles come from log2 microsecond buckets."""
+    histogram = LatencyHistogram()
+    for _ in range(99):
+        histogram.record(0.000010)  # 10 us, bucket bound 16 us
+    histogram.record(0.5)
+    
+    assert histogram.count == 100
+    assert histogram.percentile(0.50) == pytest.approx(16e-6)
+    assert histogram.percentile(0.99) == pytest.approx(16e-6)
+    assert histogram.percentile(1.0) == pytest.approx(0.5)
+    assert histogram.mean == pytest.approx((99 * 0.00001 + 0.5) / 100)
+
+
+def test_reset_discards_measurements():
+    """Test reset clears timers and counters."""
+    instrumentation.enable()
+    with timed("logic.export"):
+        pass
+    count("rows")
+    instrumentation.reset()
+    
+    assert snapshot() == {"timers": {}, "counters": {}}
+
+
+def test_cli_profile_prints_report(tmp_path, capsys):
+    """Test --profile prints a latency report to stderr."""
+    source = tmp_path / "requests.jsonl"
+    source.write_text(json.dumps({"plan": "Basic", "months": 1}) + "\n", encoding="utf-8")
+    
+    assert main(["--profile", "price", str(source), "-o", str(tmp_path / "out.jsonl")]) == 0
+    
+    err = capsys.readouterr().err
+    assert "command.price" in err
+    assert "bulk.rows" in err
@@ -0,0 +1,108 @@
+"""Tests for the member registry and its snapshot."""
+
+import json
+
+import pytest
+from src.cli import main
+from src.logic.members import (
+    Member,
+    MemberRegistry,
+    normalize_name,
+    open_member_registry,
+    registry_from_records,
+)
+from src.logic.messaging import build_welcome
+
+MEMBERS = [
+    {"id": "M3", "name": "Ana Smithers"},
+    {"id": "M1", "name": "  Ana   Smith "},
+    {"id": "M2", "name": "José O'Neil"},
+    {"id": "M4", "name": "ana smith"},
+    {"id": "", "name": "Nobody"},
+    {"id": "M5", "name": "--"},
+    {"id": "M1", "name": "Ana Again"},
+]
+
+
+@pytest.fixture
+def registry():
+    """Build a registry from the sample members."""
+    registry, _ = registry_from_records(MEMBERS)
+    return registry
+
+
+def test_normalize_name():
+    """Test case, accents, apostrophes and punctuation are normalized away."""
+    assert normalize_name("  José  O'Neil-Smith ") == "jose oneil smith"
+    assert normalize_name("ÑOÑO") == "nono"
+    assert normalize_name("--") == ""
+
+
+def test_invalid_records_are_reported():
+    """Test empty ids, nameless members and repeated ids are skipped with their rows."""
+    registry, errors = registry_from_records(MEMBERS)
+    
+    assert [row for row, _ in errors] == [5, 6, 7]
+    assert "empty" in errors[0][1] and "no name" in errors[1][1] and "Duplicate" in errors[2][1]
+    assert list(registry) == [
+        Member("M1", "Ana Smith"), Member("M2", "José O'Neil"), Member("M3", "Ana Smithers"), Member("M4", "ana smith"),
+    ]
+    with pytest.raises(ValueError, match="Duplicate"):
+        MemberRegistry([Member("M1", "A"), Member("M1", "B")])
+
+
+def test_lookup_by_id_and_name(registry):
+    """Test ids and unique names resolve, shared names and suffixes do not."""
+    assert registry.get(" M2 ") == Member("M2", "José O'Neil") and "M3" in registry
+    assert registry.get("M9") is None and "M9" not in registry
+    assert registry.lookup("jose oneil") == Member("M2", "José O'Neil")
+    assert registry.find("ANA SMITH") == [Member("M1", "Ana Smith"), Member("M4", "ana smith")]
+    assert registry.lookup("Ana Smith") is None
+    assert registry.find("Smith") == []
+
+
+def test_complete_matches_any_word(registry):
+    """Test prefixes of the name or of a later word suggest each member once."""
+    assert [m.id for m in registry.complete("an")] == ["M1", "M4", "M3"]
+    assert [m.id for m in registry.complete("smithe")] == ["M3"]
+    assert [m.id for m in registry.complete("ONE")] == ["M2"]
+    assert len(registry.complete("a", limit=2)) == 2
+    assert registry.complete("") == [] and registry.complete("zed") == []
+
+
+def test_snapshot_round_trip(registry, tmp_path):
+    """Test a loaded snapshot answers like the registry it was saved from."""
+    path = tmp_path / "members.idx"
+    registry.save(path)
+    loaded = MemberRegistry.load(path)
+    
+    assert list(loaded) == list(registry)
+    assert loaded.complete("a", limit=None) == registry.complete("a", limit=None)
+    assert loaded.lookup("M2") == registry.lookup("M2")
+    assert len(open_member_registry(tmp_path / "missing.idx")) == 0
+    
+    MemberRegistry().save(path)
+    assert len(MemberRegistry.load(path)) == 0
+    path.write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError, match="not a member registry snapshot"):
+        MemberRegistry.load(path)
+
+
+def test_welcome_uses_registered_name(registry):
+    """Test a member id or unique name is greeted by the registered name."""
+    assert "José O'Neil!" in build_welcome("M2", registry=registry)
+    assert "Sam!" in build_welcome("Sam", registry=registry)
+    assert "M2!" in build_welcome("M2")
+
+
+def test_members_and_lookup_commands(tmp_path, capsys):
+    """Test the members command saves a snapshot that lookup searches."""
+    members = tmp_path / "members.jsonl"
+    members.write_text("".join(json.dumps(m) + "\n" for m in MEMBERS), encoding="utf-8")
+    snapshot = str(tmp_path / "members.idx")
+    
+    assert main(["members", str(members), "--snapshot", snapshot, "-o", str(tmp_path / "errors.csv")]) == 1
+    assert "Saved 4 members" in capsys.readouterr().err
+    assert main(["lookup", "smithe", "--snapshot", snapshot]) == 0
+    assert json.loads(capsys.readouterr().out) == {"id": "M3", "name": "Ana Smithers"}
+    assert main(["lookup", "zed", "--snapshot", snapshot]) == 1
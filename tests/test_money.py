@@ -0,0 +1,68 @@
+"""Tests for fixed-point money arithmetic."""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+import pytest
+from src.logic.money import apply_rate, from_cents, to_basis_points, to_cents
+from src.logic.pricing import price_membership
+from src.data import plans, promo_codes
+
+
+@pytest.mark.parametrize("amount,expected", [
+    (25.0, 2500),
+    (19.99, 1999),
+    (0.1, 10),
+    (1.005, 101),  # Half up, despite 1.005 being stored as 1.00499...
+    (0.0, 0),
+])
+def test_to_cents(amount, expected):
+    """Test dollar amounts convert to exact cents."""
+    assert to_cents(amount) == expected
+
+
+def test_to_basis_points():
+    """Test rates convert to whole basis points."""
+    assert to_basis_points(0.15) == 1500
+    assert to_basis_points(0.05) == 500
+    assert to_basis_points(0.0) == 0
+
+
+def test_to_basis_points_too_precise():
+    """Test that rates finer than a basis point raise ValueError."""
+    with pytest.raises(ValueError, match="basis points"):
+        to_basis_points(0.123456)
+
+
+@pytest.mark.parametrize("cents,points,expected", [
+    (2125, 1000, 213),   # 212.5 rounds up
+    (2124, 1000, 212),   # 212.4 rounds down
+    (2500, 1500, 375),
+    (-2125, 1000, -213),  # Ties round away from zero
+    (0, 1500, 0),
+])
+def test_apply_rate(cents, points, expected):
+    """Test rate application rounds half up to the cent."""
+    assert apply_rate(cents, points) == expected
+
+
+def test_apply_rate_matches_decimal():
+    """Test apply_rate agrees with Decimal ROUND_HALF_UP."""
+    for cents in range(0, 5000, 7):
+        for points in (500, 1000, 1500, 3333):
+            expected = (Decimal(cents) * points / 10000).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+            assert apply_rate(cents, points) == int(expected)
+
+
+def test_from_cents():
+    """Test cents convert back to dollars."""
+    assert from_cents(1912) == 19.12
+
+
+def test_breakdown_line_items_add_up():
+    """Test discounts always reconcile exactly with the final cost."""
+    for months in range(1, 25):
+        result = price_membership("Plus", months, True, "WELCOME10", plans, promo_codes)
+        total = to_cents(result['base_cost'])
+        total -= to_cents(result['student_staff_discount'])
+        total -= to_cents(result['promo_discount'])
+        assert total == to_cents(result['final_cost'])
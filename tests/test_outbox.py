@@ -0,0 +1,222 @@
+"""Tests for the asynchronous reminder outbox."""
+
+import asyncio
+import json
+import smtplib
+import time
+
+import pytest
+from src.cli import main
+from src.data import class_schedule
+from src.logic.records import MalformedRecord
+from src.logic.outbox import (
+    FileSinkTransport,
+    Journal,
+    Message,
+    Outbox,
+    RateLimiter,
+    SMTPTransport,
+    TransientError,
+    reminder_messages,
+)
+
+MEMBERS = [
+    {"id": "M1", "name": "Ana", "email": "ana@example.com"},
+    {"id": "M2", "name": "", "email": "ben@example.com"},
+    {"id": "M3", "name": "Cy", "email": ""},
+    {"id": "M4", "name": "Dee", "email": "dee@example.com"},
+]
+
+
+class RecordingTransport:
+    """Transport that records deliveries and can fail on chosen attempts."""
+
+    def __init__(self, fail=None, delay=0.0):
+        self.delivered = []
+        self.attempts = {}
+        self.fail = fail or (lambda message, attempt: None)
+        self.delay = delay
+        self.in_flight = self.max_in_flight = 0
+    
+    async def send(self, message):
+        self.attempts[message.key] = attempt = self.attempts.get(message.key, 0) + 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            error = self.fail(message, attempt)
+            if error is not None:
+                raise error
+            self.delivered.append(message.key)
+        finally:
+            self.in_flight -= 1
+
+
+def _messages(count):
+    """Numbered test messages."""
+    return [Message(f"run:{i}", f"m{i}@example.com", "Classes", "Yoga at 6") for i in range(count)]
+
+
+def test_reminder_messages():
+    """Test one reminder per member with an email, keyed by run and member."""
+    messages = list(reminder_messages(MEMBERS, "Mon", class_schedule, run_id="r1"))
+    
+    assert [m.key for m in messages] == ["r1:M1", "r1:M2", "r1:M4"]
+    assert "Hi Ana" in messages[0].body and "Yoga Flow - 6:00 AM" in messages[0].body
+    assert messages[1].body.startswith("Hi there")
+    assert messages[0].subject == "Your Monday classes at Baun Fitness Center"
+    assert list(reminder_messages(MEMBERS, "Someday", class_schedule)) == []
+
+
+def test_message_key_validation():
+    """Test keys that would corrupt the journal are rejected."""
+    with pytest.raises(ValueError, match="key"):
+        Message("a\tb", "x@example.com", "s", "b")
+
+
+def test_file_sink_sends_everything(tmp_path):
+    """Test every message lands in the sink and the journal."""
+    sink = FileSinkTransport(tmp_path / "outbox")
+    messages = list(reminder_messages(MEMBERS, "monday", class_schedule, run_id="r1"))
+    report = Outbox(sink, tmp_path / "journal.tsv", concurrency=2).run(messages)
+    
+    assert (report.sent, report.skipped, report.failed) == (3, 0, 0)
+    text = sink.path_for(messages[0]).read_text(encoding="utf-8")
+    assert "To: ana@example.com" in text and "Subject: Your Monday classes" in text
+    assert Journal(tmp_path / "journal.tsv").state("r1:M4") == "sent"
+
+
+def test_rerun_skips_sent_messages(tmp_path):
+    """Test a second run with the same journal sends nothing again."""
+    transport = RecordingTransport()
+    Outbox(transport, tmp_path / "journal.tsv").run(_messages(5))
+    report = Outbox(transport, tmp_path / "journal.tsv").run(_messages(5) + _messages(2))
+    
+    assert (report.sent, report.skipped) == (0, 7)
+    assert len(transport.delivered) == 5
+
+
+def test_transient_failures_are_retried(tmp_path):
+    """Test transient errors are retried and permanent ones recorded."""
+    def fail(message, attempt):
+        if message.key == "run:1" and attempt < 3:
+            return TransientError("busy")
+        if message.key == "run:2":
+            return ValueError("bad address")
+        return None
+    
+    transport = RecordingTransport(fail)
+    report = Outbox(transport, tmp_path / "journal.tsv", retry_delay=0.001).run(_messages(4))
+    
+    assert (report.sent, report.failed, report.retries) == (3, 1, 2)
+    assert "bad address" in report.failures["run:2"]
+    assert transport.attempts["run:2"] == 1
+    
+    # Failed messages were never delivered, so the next run tries them again
+    report = Outbox(RecordingTransport(), tmp_path / "journal.tsv").run(_messages(4))
+    assert (report.sent, report.skipped) == (1, 3)
+
+
+def test_crashed_run_resumes_without_duplicates(tmp_path):
+    """Test messages in flight during a crash are not resent."""
+    class Crash(BaseException):
+        pass
+
+    def crash(message, attempt):
+        return Crash() if message.key == "run:12" else None
+    
+    first = RecordingTransport(crash)
+    with pytest.raises(Crash):
+        Outbox(first, tmp_path / "journal.tsv", batch_size=5).run(_messages(20))
+    
+    second = RecordingTransport()
+    report = Outbox(second, tmp_path / "journal.tsv", batch_size=5).run(_messages(20))
+    delivered = first.delivered + second.delivered
+    
+    assert len(delivered) == len(set(delivered))
+    assert report.skipped == 10 and report.in_doubt == 5
+    assert sorted(set(delivered) | {f"run:{i}" for i in range(10, 15)}) == sorted(m.key for m in _messages(20))
+
+
+def test_torn_journal_line_is_ignored(tmp_path):
+    """Test a partially written last line does not count as an outcome."""
+    path = tmp_path / "journal.tsv"
+    path.write_text("started\trun:0\nsent\trun:0\nstarted\trun:1\nsen", encoding="utf-8")
+    journal = Journal(path)
+    
+    assert journal.state("run:0") == "sent"
+    assert journal.in_doubt() == ["run:1"]
+    journal.close()
+
+
+def test_concurrency_and_rate_limits(tmp_path):
+    """Test sends in flight and sends per second stay within the limits."""
+    transport = RecordingTransport(delay=0.01)
+    start = time.monotonic()
+    Outbox(transport, tmp_path / "journal.tsv", concurrency=3, rate=100).run(_messages(20))
+    
+    assert transport.max_in_flight <= 3
+    assert time.monotonic() - start >= 19 / 100
+    with pytest.raises(ValueError, match="Rate"):
+        RateLimiter(0)
+    with pytest.raises(ValueError, match="Concurrency"):
+        Outbox(transport, tmp_path / "journal.tsv", concurrency=0)
+
+
+def test_smtp_errors_are_classified(monkeypatch):
+    """Test dropped connections and 4xx replies are transient, 5xx permanent."""
+    sent = []
+    errors = [smtplib.SMTPServerDisconnected("gone"), smtplib.SMTPDataError(451, b"try later"), None]
+
+    class FakeSMTP:
+        def __init__(self, host, port, timeout):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def send_message(self, email):
+            error = errors.pop(0)
+            if error is not None:
+                raise error
+            sent.append(email["To"])
+    
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    transport = SMTPTransport()
+    message = _messages(1)[0]
+    for _ in range(2):
+        with pytest.raises(TransientError):
+            asyncio.run(transport.send(message))
+    asyncio.run(transport.send(message))
+    assert sent == ["m0@example.com"]
+    
+    errors.append(smtplib.SMTPDataError(554, b"rejected"))
+    with pytest.raises(smtplib.SMTPDataError):
+        asyncio.run(transport.send(message))
+
+
+def test_remind_command(tmp_path, capsys):
+    """Test the remind command writes reminders and resumes from its journal."""
+    members = tmp_path / "members.jsonl"
+    members.write_text("".join(json.dumps(m) + "\n" for m in MEMBERS), encoding="utf-8")
+    argv = ["remind", str(members), "--day", "tue", "--run-id", "r1", "--outbox-dir", str(tmp_path / "outbox")]
+    
+    assert main(argv) == 0
+    assert len(list((tmp_path / "outbox").glob("*.eml"))) == 3
+    assert main(argv) == 0
+    assert "Sent 0 reminders" in capsys.readouterr().err
+
+
+def test_remind_command_reports_malformed_lines(tmp_path, capsys):
+    """Test a malformed member line is reported and the other members still get reminders."""
+    members = tmp_path / "members.jsonl"
+    members.write_text(json.dumps(MEMBERS[0]) + "\n{bad\n" + json.dumps(MEMBERS[3]) + "\n", encoding="utf-8")
+    
+    assert main(["remind", str(members), "--day", "tue", "--run-id", "r1", "--outbox-dir", str(tmp_path / "outbox")]) == 1
+    assert len(list((tmp_path / "outbox").glob("*.eml"))) == 2
+    assert "row 2: Malformed JSON on line 2" in capsys.readouterr().err
+    with pytest.raises(ValueError, match="bad"):
+        list(reminder_messages([MalformedRecord("bad")], "tue", class_schedule))
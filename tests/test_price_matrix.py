@@ -0,0 +1,116 @@
+"""Tests for the materialized price matrix."""
+
+import pandas as pd
+import pytest
+from src.logic.catalog import VersionedDict
+from src.logic.price_matrix import NO_PROMO, PriceMatrix, current_price_matrix
+from src.logic.pricing import price_membership
+from src.logic.promos import PromoCatalog
+
+
+@pytest.fixture
+def catalogs():
+    """Versioned plans and a promo catalog with a multi-code campaign."""
+    plans = VersionedDict({"Basic": 25.0, "Plus": 35.0, "Premium": 50.0})
+    promo_codes = PromoCatalog.from_rates({"WELCOME10": 0.10, "FALL5": 0.05})
+    campaign = promo_codes.add_campaign("Spring", 0.25, max_redemptions=1)
+    promo_codes.add_codes(["SPRING-1", "SPRING-2"], campaign)
+    return plans, promo_codes
+
+
+def test_lookup_matches_price_membership(catalogs):
+    """Test every table read equals the computed quote."""
+    plans, promo_codes = catalogs
+    matrix = PriceMatrix.build(plans, promo_codes, max_months=24)
+    
+    for plan in plans:
+        for months in range(1, 25):
+            for student in (False, True):
+                for promo in (None, "welcome10", "FALL5", "spring-2", "BOGUS"):
+                    expected = price_membership(plan, months, student, promo, plans, promo_codes)
+                    assert matrix.lookup(plan, months, student, promo, promo_codes) == expected
+
+
+def test_lookup_outside_matrix(catalogs):
+    """Test quotes the matrix does not hold return None."""
+    plans, promo_codes = catalogs
+    matrix = PriceMatrix.build(plans, promo_codes, max_months=12)
+    
+    assert matrix.lookup("Basic", 13, False, None, promo_codes) is None
+    assert matrix.lookup("Gold", 1, False, None, promo_codes) is None
+    assert matrix.lookup("Basic", 1, False, "WELCOME10 FALL5", promo_codes) is None
+
+
+def test_campaign_codes_share_a_column(catalogs):
+    """Test the promo axis has one column per campaign, not per code."""
+    plans, promo_codes = catalogs
+    matrix = PriceMatrix.build(plans, promo_codes, max_months=12)
+    
+    assert matrix.promos == [("WELCOME10", 0.10), ("FALL5", 0.05), ("Spring", 0.25)]
+    assert matrix.final_cents.shape == (3, 12, 2, 4)
+    
+    promo_codes.redeem("SPRING-1")
+    assert matrix.lookup("Basic", 1, False, "SPRING-1", promo_codes)["promo_applied"] is None
+
+
+def test_grid_and_cheapest(catalogs):
+    """Test the price grid and cheapest-option search."""
+    plans, promo_codes = catalogs
+    matrix = PriceMatrix.build(plans, promo_codes, max_months=12)
+    
+    grid = matrix.grid(is_student_or_staff=False, promo="FALL5", max_months=3)
+    assert list(grid.columns) == ["Basic", "Plus", "Premium"]
+    assert grid.loc[2, "Plus"] == 66.5
+    assert matrix.grid(promo=NO_PROMO).loc[12, "Premium"] == 600.0
+    
+    cheapest = matrix.cheapest(k=3, plan="Premium", months=6, is_student_or_staff=False, per_month=False)
+    assert list(cheapest["promo"]) == ["Spring", "WELCOME10", "FALL5"]
+    assert cheapest["final_cost"].iloc[0] == 225.0
+    
+    assert matrix.cheapest(budget=5.0).empty
+    within_budget = matrix.cheapest(k=100, budget=30.0)
+    assert (within_budget["final_cost"] <= 30.0).all()
+
+
+@pytest.mark.parametrize("suffix", [".npz", ".parquet"])
+def test_save_and_load(catalogs, tmp_path, suffix):
+    """Test a saved matrix loads back identically."""
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    plans, promo_codes = catalogs
+    matrix = PriceMatrix.build(plans, promo_codes, max_months=6)
+    
+    matrix.save(tmp_path / f"prices{suffix}")
+    loaded = PriceMatrix.load(tmp_path / f"prices{suffix}")
+    
+    assert loaded.plans == matrix.plans
+    assert loaded.promos == matrix.promos
+    assert (loaded.final_cents == matrix.final_cents).all()
+    assert loaded.lookup("Plus", 4, True, "FALL5", promo_codes) == matrix.lookup("Plus", 4, True, "FALL5", promo_codes)
+
+
+def test_current_matrix_rebuilds_on_catalog_change(catalogs):
+    """Test the cached matrix is reused until a catalog changes."""
+    plans, promo_codes = catalogs
+    first = current_price_matrix(plans, promo_codes)
+    
+    assert current_price_matrix(plans, promo_codes) is first
+    
+    plans["Basic"] = 30.0
+    rebuilt = current_price_matrix(plans, promo_codes)
+    assert rebuilt is not first
+    assert rebuilt.lookup("Basic", 1, False, None, promo_codes)["final_cost"] == 30.0
+    
+    promo_codes.add("NEW15", 0.15)
+    assert ("NEW15", 0.15) in current_price_matrix(plans, promo_codes).promos
+
+
+def test_frame_chunks_match_to_frame(catalogs):
+    """Test chunked flattening gives the same rows as to_frame."""
+    matrix = PriceMatrix.build(*catalogs, max_months=5)
+    chunks = list(matrix.frame_chunks(7))
+    
+    assert all(len(chunk) == 7 for chunk in chunks[:-1])
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), matrix.to_frame())
+    with pytest.raises(ValueError, match="Rows"):
+        next(matrix.frame_chunks(0))
@@ -0,0 +1,194 @@
+"""Tests for the promo code catalog."""
+
+import threading
+
+import pytest
+from src.logic.batch_pricing import price_membership_batch
+from src.logic.catalog import VersionedDict
+from src.logic.price_matrix import current_price_matrix
+from src.logic.pricing import price_membership, purchase_membership
+from src.logic.promos import PromoCatalog, resolve_promos
+from src.logic.quote_cache import QuoteCache
+
+PLANS = VersionedDict({"Basic": 25.0, "Plus": 35.0, "Premium": 50.0})
+NOW = 1_800_000_000.0
+
+
+@pytest.fixture
+def catalog():
+    """Catalog with open, expiring, single-use and exclusive codes."""
+    catalog = PromoCatalog.from_rates({"WELCOME10": 0.10, "FALL5": 0.05})
+    catalog.add("SUMMER20", 0.20, expires_at=NOW + 60)
+    spring = catalog.add_campaign("Spring single-use", 0.25, max_redemptions=1)
+    catalog.add_codes([f"SPRING-{i:05d}" for i in range(1000)], spring)
+    catalog.add("VIP50", 0.50, exclusive=True)
+    return catalog
+
+
+def test_lookup_and_mapping(catalog):
+    """Test codes behave like the promo_codes dict."""
+    assert len(catalog) == 1004
+    assert " welcome10 " in catalog
+    assert catalog["FALL5"] == 0.05
+    assert "NOPE" not in catalog
+    assert catalog.details("spring-00007") == {
+        "code": "SPRING-00007",
+        "campaign": "Spring single-use",
+        "rate": 0.25,
+        "expires_at": None,
+        "max_redemptions": 1,
+        "redeemed": 0,
+        "exclusive": False,
+    }
+
+
+def test_expiry(catalog):
+    """Test codes stop validating at their expiry time."""
+    assert catalog.is_valid("SUMMER20", now=NOW)
+    assert not catalog.is_valid("SUMMER20", now=NOW + 60)
+    assert not catalog.redeem("SUMMER20", now=NOW + 61)
+    assert price_membership("Basic", 1, False, "SUMMER20", PLANS, catalog, now=NOW + 61)["promo_applied"] is None
+
+
+def test_single_use_code(catalog):
+    """Test a capped code can be redeemed only up to its cap."""
+    assert catalog.redeem("SPRING-00001")
+    assert not catalog.redeem("SPRING-00001")
+    assert not catalog.is_valid("SPRING-00001")
+    assert catalog.is_valid("SPRING-00002")
+    assert catalog.redemptions("SPRING-00001") == 1
+    assert not catalog.redeem("UNKNOWN")
+
+
+def test_purchase_redeems_and_quotes_do_not(catalog):
+    """Test quoting never uses up a single-use code and a purchase does."""
+    for _ in range(3):
+        assert price_membership("Basic", 1, False, "SPRING-00005", PLANS, catalog)["promo_applied"] == "SPRING-00005"
+    assert catalog.redemptions("SPRING-00005") == 0
+    
+    first = purchase_membership("Basic", 1, False, "SPRING-00005", PLANS, catalog)
+    second = purchase_membership("Basic", 1, False, "SPRING-00005", PLANS, catalog)
+    assert (first["promo_applied"], first["final_cost"]) == ("SPRING-00005", 18.75)
+    assert (second["promo_applied"], second["final_cost"]) == (None, 25.0)
+    assert catalog.redemptions("SPRING-00005") == 1
+
+
+def test_used_up_campaigns_leave_the_price_list():
+    """Test a campaign whose codes are all used up is no longer offered or suggested."""
+    catalog = PromoCatalog.from_rates({"WELCOME10": 0.10})
+    catalog.add("ONCE50", 0.50, max_redemptions=1)
+    assert current_price_matrix(PLANS, catalog).cheapest(k=1)["promo"].tolist() == ["ONCE50"]
+    
+    assert catalog.redeem("ONCE50", NOW)
+    assert [c["name"] for c in catalog.campaigns(NOW)] == ["WELCOME10"]
+    assert current_price_matrix(PLANS, catalog).cheapest(k=1)["promo"].tolist() == ["WELCOME10"]
+    assert catalog.release("ONCE50")
+    assert [(c["name"], c["codes"]) for c in catalog.campaigns(NOW)] == [("WELCOME10", 1), ("ONCE50", 1)]
+
+
+def test_purchase_reprices_when_a_code_runs_out(catalog, monkeypatch):
+    """Test a code used up by another sale mid-purchase is dropped and stacked codes are released."""
+    redeem = catalog.redeem
+    
+    def redeem_after_another_kiosk(code, now=None):
+        if code == "SPRING-00003" and catalog.redemptions(code) == 0:
+            redeem(code, now)  # Another purchase takes the last use first
+        return redeem(code, now)
+    monkeypatch.setattr(catalog, "redeem", redeem_after_another_kiosk)
+    
+    sale = purchase_membership("Basic", 1, False, "WELCOME10+SPRING-00003", PLANS, catalog)
+    assert sale["promo_applied"] == "WELCOME10"
+    assert catalog.redemptions("WELCOME10") == 1
+    assert catalog.redemptions("SPRING-00003") == 1
+    assert catalog.release("SPRING-00003") and catalog.redemptions("SPRING-00003") == 0
+
+
+def test_concurrent_redemptions_respect_caps():
+    """Test many threads never over-redeem and never lose counts."""
+    catalog = PromoCatalog(stripes=4)
+    catalog.add("LIMITED", 0.10, max_redemptions=500)
+    catalog.add("OPEN", 0.10)
+    redeemed = []
+    
+    def kiosk():
+        count = 0
+        for _ in range(200):
+            count += catalog.redeem("LIMITED")
+            catalog.redeem("OPEN")
+        redeemed.append(count)
+    
+    threads = [threading.Thread(target=kiosk) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert sum(redeemed) == 500
+    assert catalog.redemptions("LIMITED") == 500
+    assert catalog.redemptions("OPEN") == 1600
+
+
+def test_stacking_rules(catalog):
+    """Test stackable codes compound and exclusive codes apply alone."""
+    stacked = price_membership("Basic", 4, False, "welcome10 + fall5", PLANS, catalog)
+    assert stacked["promo_applied"] == "WELCOME10+FALL5"
+    assert stacked["promo_discount"] == 14.5  # 10.00 off 100, then 4.50 off 90
+    assert stacked["final_cost"] == 85.5
+    assert stacked["promo_rate"] == pytest.approx(0.145)
+    
+    exclusive = price_membership("Basic", 4, False, "WELCOME10, VIP50", PLANS, catalog)
+    assert exclusive["promo_applied"] == "VIP50"
+    assert exclusive["final_cost"] == 50.0
+    
+    skipped = price_membership("Basic", 4, False, "BOGUS FALL5", PLANS, catalog)
+    assert skipped["promo_applied"] == "FALL5"
+
+
+def test_plain_dict_promo_codes_unchanged():
+    """Test plain dict catalogs keep exact single-code matching."""
+    assert resolve_promos(" fall5 ", {"FALL5": 0.05}) == [("FALL5", 0.05)]
+    assert resolve_promos("FALL5 WELCOME10", {"FALL5": 0.05, "WELCOME10": 0.10}) == []
+
+
+def test_batch_matches_scalar_with_catalog(catalog):
+    """Test vectorized pricing applies the same catalog rules."""
+    promos = [None, "WELCOME10", "welcome10+fall5", "VIP50 FALL5", "SUMMER20", "SPRING-00003", "BOGUS"]
+    plans = ["Basic", "Plus", "Premium", "Basic", "Plus", "Premium", "Basic"]
+    months = [1, 3, 12, 5, 2, 7, 9]
+    student = [True, False, True, False, True, False, True]
+    
+    batch = price_membership_batch(plans, months, student, promos, PLANS, catalog, now=NOW)
+    
+    for i in range(len(promos)):
+        expected = price_membership(plans[i], months[i], student[i], promos[i], PLANS, catalog, now=NOW)
+        for key, value in expected.items():
+            assert batch[key][i] == value, (i, key)
+
+
+def test_from_records():
+    """Test loading campaigns and codes from CSV-style records."""
+    catalog = PromoCatalog.from_records([
+        {"code": "gym-1", "campaign": "Gym launch", "rate": "0.3", "max_redemptions": "1", "expires_at": "2030-01-01"},
+        {"code": "gym-2", "campaign": "Gym launch"},
+        {"code": "solo", "rate": "0.15", "exclusive": "yes"},
+    ])
+    
+    assert catalog.details("GYM-2")["rate"] == 0.3
+    assert catalog.details("GYM-2")["max_redemptions"] == 1
+    assert catalog.details("GYM-1")["expires_at"] is not None
+    assert catalog.details("SOLO")["exclusive"] is True
+    
+    with pytest.raises(ValueError, match="Duplicate"):
+        PromoCatalog.from_records([{"code": "A", "rate": 0.1}, {"code": "a", "rate": 0.2}])
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        PromoCatalog().add("BAD", 1.5)
+
+
+def test_exhausted_code_invalidates_cached_quotes(catalog):
+    """Test the quote cache stops applying a code once it is used up."""
+    cache = QuoteCache()
+    assert cache.quote("Basic", 1, False, "SPRING-00009", PLANS, catalog)["promo_applied"] == "SPRING-00009"
+    
+    catalog.redeem("SPRING-00009")
+    
+    assert cache.quote("Basic", 1, False, "SPRING-00009", PLANS, catalog)["promo_applied"] is None
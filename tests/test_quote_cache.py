@@ -0,0 +1,121 @@
+"""Tests for the quote cache and versioned catalogs."""
+
+import pickle
+
+import pytest
+from src.logic.catalog import VersionedDict, catalog_version
+from src.logic.pricing import price_membership
+from src.logic.quote_cache import QuoteCache, quote_key
+
+
+@pytest.fixture
+def catalogs():
+    """Fresh versioned plans and promo codes."""
+    plans = VersionedDict({"Basic": 25.0, "Plus": 35.0, "Premium": 50.0})
+    promo_codes = VersionedDict({"WELCOME10": 0.10, "FALL5": 0.05})
+    return plans, promo_codes
+
+
+def test_versioned_dict_bumps_on_change():
+    """Test every kind of modification assigns a new version."""
+    catalog = VersionedDict({"A": 1.0})
+    seen = {catalog.version}
+    for change in (
+        lambda c: c.__setitem__("B", 2.0),
+        lambda c: c.update(C=3.0),
+        lambda c: c.pop("C"),
+        lambda c: c.__delitem__("B"),
+        lambda c: c.setdefault("D", 4.0),
+        lambda c: c.clear(),
+    ):
+        change(catalog)
+        assert catalog.version not in seen
+        seen.add(catalog.version)
+    
+    assert catalog_version({"A": 1.0}) is None
+    assert pickle.loads(pickle.dumps(VersionedDict({"A": 1.0}))) == {"A": 1.0}
+
+
+def test_quote_key_normalizes_promo():
+    """Test equivalent promo spellings share a key."""
+    assert quote_key("Basic", 3, 1, " welcome10 ") == quote_key("Basic", 3, True, "WELCOME10")
+    assert quote_key("Basic", 3, False, "") == quote_key("Basic", 3, False, None)
+
+
+def test_hits_match_direct_pricing(catalogs):
+    """Test cached quotes equal price_membership and count hits and misses."""
+    plans, promo_codes = catalogs
+    cache = QuoteCache()
+    
+    first = cache.quote("Plus", 6, True, "welcome10", plans, promo_codes)
+    second = cache.quote("Plus", 6, True, "WELCOME10 ", plans, promo_codes)
+    
+    assert first == second == price_membership("Plus", 6, True, "WELCOME10", plans, promo_codes)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_returned_quotes_are_copies(catalogs):
+    """Test modifying a returned quote does not alter the cache."""
+    plans, promo_codes = catalogs
+    cache = QuoteCache()
+    
+    cache.quote("Basic", 1, False, None, plans, promo_codes)["final_cost"] = 0
+    
+    assert cache.quote("Basic", 1, False, None, plans, promo_codes)["final_cost"] == 25.0
+
+
+def test_lru_eviction(catalogs):
+    """Test the least recently used quote is evicted beyond maxsize."""
+    plans, promo_codes = catalogs
+    cache = QuoteCache(maxsize=2)
+    
+    cache.quote("Basic", 1, False, None, plans, promo_codes)
+    cache.quote("Basic", 2, False, None, plans, promo_codes)
+    cache.quote("Basic", 1, False, None, plans, promo_codes)  # Refresh months=1
+    cache.quote("Basic", 3, False, None, plans, promo_codes)  # Evicts months=2
+    cache.quote("Basic", 1, False, None, plans, promo_codes)
+    
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+    assert stats["hits"] == 2
+    
+    with pytest.raises(ValueError, match="Cache size"):
+        QuoteCache(maxsize=0)
+
+
+def test_catalog_change_invalidates(catalogs):
+    """Test a price or promo change is reflected immediately."""
+    plans, promo_codes = catalogs
+    cache = QuoteCache()
+    assert cache.quote("Basic", 2, False, "FALL5", plans, promo_codes)["final_cost"] == 47.5
+    
+    plans["Basic"] = 30.0
+    assert cache.quote("Basic", 2, False, "FALL5", plans, promo_codes)["final_cost"] == 57.0
+    
+    del promo_codes["FALL5"]
+    assert cache.quote("Basic", 2, False, "FALL5", plans, promo_codes)["promo_applied"] is None
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_unversioned_catalogs_bypass_cache():
+    """Test plain dict catalogs are priced directly."""
+    plans = {"Basic": 25.0}
+    cache = QuoteCache()
+    
+    assert cache.quote("Basic", 1, False, None, plans, {})["final_cost"] == 25.0
+    plans["Basic"] = 20.0
+    assert cache.quote("Basic", 1, False, None, plans, {})["final_cost"] == 20.0
+    assert len(cache) == 0
+
+
+def test_errors_are_not_cached(catalogs):
+    """Test invalid requests raise every time."""
+    plans, promo_codes = catalogs
+    cache = QuoteCache()
+    
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid plan"):
+            cache.quote("Gold", 1, False, None, plans, promo_codes)
+    assert len(cache) == 0
@@ -0,0 +1,155 @@
+"""Tests for month-end member reports."""
+
+import json
+import pickle
+
+import pytest
+from src.cli import main
+from src.logic.records import MalformedRecord
+from src.logic.reports import (
+    ReportTemplate,
+    attendance_by_member,
+    compile_layout,
+    generate_reports,
+    report_chunk,
+    report_path,
+)
+
+MEMBERS = [
+    {"id": "M1", "name": "Ana", "plan": "Basic", "months": 3},
+    {"id": "M2", "name": "", "plan": "Premium", "months": "12", "is_student_or_staff": "yes", "promo": "WELCOME10"},
+    {"id": "", "name": "Nobody", "plan": "Basic", "months": 1},
+    {"id": "M/4", "name": "Dee", "plan": "Platinum", "months": 1},
+    {"id": "M5", "name": "Eve", "plan": "Basic", "months": 6},
+]
+
+CHECKINS = [
+    {"member_id": "M1", "activity": "Yoga", "count": 3},
+    {"member_id": "M1", "activity": "Spin"},
+    {"member_id": "M1", "activity": "Yoga", "count": "2"},
+    {"member_id": "M5", "activity": "Swim", "count": 0},
+    {"member_id": "", "activity": "Yoga", "count": 4},
+]
+
+
+def test_template_renders_member_report():
+    """Test fixed fields, pricing and attendance lines in a rendered report."""
+    template = ReportTemplate(center="Baun", period="October 2026")
+    text = template.render(MEMBERS[0], {"plan": "Basic", "months": 3, "final_cost": 1234.5}, {"Yoga": 3, "Spin": 2})
+    
+    assert text.startswith("=" * 60 + "\nFITNESS CENTER MEMBER SUMMARY")
+    assert "Name: Ana\nMember ID: M1\nCenter: Baun\nPeriod: October 2026" in text
+    assert "Final Cost: $1,234.50" in text
+    assert "Total Attendance: 5\n  Average per Activity: 2.50" in text
+    assert "    • Yoga: 3\n    • Spin: 2" in text
+    assert "No attendance data recorded." in template.render(MEMBERS[1], {}, {})
+
+
+def test_compile_layout_escapes_and_validates():
+    """Test literal braces, specs and conversions survive compilation and bad fields are rejected."""
+    render = compile_layout("{{x}} {name:>5}|{period!r}|{count:,}", ("name", "count"), {"period": "{Oct}"})
+    
+    assert render("Ana", 1200) == "{x}   Ana|'{Oct}'|1,200"
+    with pytest.raises(ValueError, match="Unknown report field"):
+        ReportTemplate("{name} {email}")
+    with pytest.raises(ValueError, match="Unknown report field"):
+        ReportTemplate("{name.upper}")
+    with pytest.raises(ValueError, match="format spec"):
+        ReportTemplate("{name:{width}}")
+    with pytest.raises(ValueError, match="conversion"):
+        compile_layout("{name!x}", ("name",), {})
+    assert compile_layout("{name:'>4}", ("name",), {})("x") == "x".rjust(4, "'")
+
+
+def test_template_pickles_as_layout():
+    """Test a template sent to a worker process renders the same reports."""
+    template = ReportTemplate("{name}: {final_cost} ({period})", period="Q4")
+    copy = pickle.loads(pickle.dumps(template))
+    
+    assert copy.render(MEMBERS[0], {"final_cost": 75.0}, {}) == "Ana: $75.00 (Q4)"
+
+
+def test_attendance_by_member():
+    """Test check-ins are totalled per member and activity."""
+    assert attendance_by_member(CHECKINS) == {"M1": {"Yoga": 5, "Spin": 1}, "M5": {"Swim": 0}}
+    with pytest.raises(ValueError):
+        attendance_by_member([{"member_id": "M1", "activity": "Yoga", "count": "many"}])
+    errors = []
+    assert attendance_by_member([MalformedRecord("bad"), *CHECKINS], errors) == {"M1": {"Yoga": 5, "Spin": 1}, "M5": {"Swim": 0}}
+    assert errors == [(1, "bad")]
+
+
+def test_report_chunk_records_errors(tmp_path):
+    """Test invalid members are reported without stopping the chunk."""
+    chunk = [(row, member, {}) for row, member in enumerate(MEMBERS, start=1)]
+    results = report_chunk((str(tmp_path), ReportTemplate(), chunk, {}))
+    
+    assert [r["row"] for r in results] == [1, 2, 3, 4, 5]
+    assert [r["error"] is None for r in results] == [True, True, False, False, True]
+    assert "empty" in results[2]["error"] and "Platinum" in results[3]["error"]
+    assert "Name: Member" in (tmp_path / "M2.txt").read_text(encoding="utf-8")
+    assert report_path(str(tmp_path), "M_4").name == "M_4.txt"
+    assert report_path(str(tmp_path), "../M 4").name.startswith(".._M_4-")
+    assert report_path(str(tmp_path), "M/4") != report_path(str(tmp_path), "M_4")
+
+
+def test_colliding_report_files_are_errors(tmp_path):
+    """Test repeated ids and ids sharing a file name are reported, not overwritten."""
+    members = [dict(MEMBERS[0], id=member_id, name=member_id) for member_id in ("a/b", "a_b", "A_B", "a/b")]
+    results = list(generate_reports(members, str(tmp_path), chunk_size=1, workers=2))
+    
+    assert [r["error"] is None for r in results] == [True, True, False, False]
+    assert "collides with member 'a_b'" in results[2]["error"]
+    assert "Duplicate member id 'a/b' (first on row 1)" in results[3]["error"]
+    assert "Name: a_b" in (tmp_path / "a_b.txt").read_text(encoding="utf-8")
+
+
+def test_generate_reports_in_parallel(tmp_path):
+    """Test worker processes write the same files, in input order, as one process."""
+    members = [dict(MEMBERS[0], id=f"M{i}") for i in range(40)] + MEMBERS
+    attendance = attendance_by_member(CHECKINS)
+    serial = list(generate_reports(members, str(tmp_path / "serial"), attendance=attendance, chunk_size=7))
+    parallel = list(generate_reports(members, str(tmp_path / "parallel"), attendance=attendance, workers=2, chunk_size=7))
+    
+    assert [r["row"] for r in parallel] == list(range(1, len(members) + 1))
+    assert [r["error"] for r in parallel] == [r["error"] for r in serial]
+    for result in serial:
+        if result["error"] is None:
+            name = result["path"].rsplit("/", 1)[-1]
+            assert (tmp_path / "parallel" / name).read_text(encoding="utf-8") == (tmp_path / "serial" / name).read_text(encoding="utf-8")
+    assert "• Yoga: 5" in (tmp_path / "serial" / "M1.txt").read_text(encoding="utf-8")
+
+
+def test_reports_command(tmp_path, capsys):
+    """Test the reports command writes a file per member and a results file."""
+    members = tmp_path / "members.jsonl"
+    members.write_text("".join(json.dumps(m) + "\n" for m in MEMBERS), encoding="utf-8")
+    checkins = tmp_path / "checkins.jsonl"
+    checkins.write_text("".join(json.dumps(c) + "\n" for c in CHECKINS), encoding="utf-8")
+    argv = [
+        "reports", str(members), "--checkins", str(checkins), "--out-dir", str(tmp_path / "reports"),
+        "--period", "October 2026", "-o", str(tmp_path / "results.csv"), "--workers", "2", "--chunk-size", "2",
+    ]
+    
+    assert main(argv) == 1
+    assert sorted(p.name for p in (tmp_path / "reports").iterdir()) == ["M1.txt", "M2.txt", "M5.txt"]
+    assert "Period: October 2026" in (tmp_path / "reports" / "M5.txt").read_text(encoding="utf-8")
+    assert len((tmp_path / "results.csv").read_text(encoding="utf-8").splitlines()) == 6
+    assert "Wrote 3 member reports" in capsys.readouterr().err
+
+
+def test_reports_command_reports_malformed_lines(tmp_path, capsys):
+    """Test malformed member and check-in lines are errors and the other reports are still written."""
+    members = tmp_path / "members.jsonl"
+    members.write_text(json.dumps(MEMBERS[0]) + "\n{bad\n" + json.dumps(MEMBERS[4]) + "\n", encoding="utf-8")
+    checkins = tmp_path / "checkins.jsonl"
+    checkins.write_text(json.dumps(CHECKINS[0]) + "\n[1]\n", encoding="utf-8")
+    output = tmp_path / "results.jsonl"
+    argv = ["reports", str(members), "--checkins", str(checkins), "--out-dir", str(tmp_path / "reports"), "-o", str(output)]
+    
+    assert main(argv) == 1
+    results = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [(r["row"], r["error"] is None) for r in results] == [(1, True), (2, False), (3, True)]
+    assert results[1]["error"].startswith("Malformed JSON on line 2")
+    assert "• Yoga: 3" in (tmp_path / "reports" / "M1.txt").read_text(encoding="utf-8")
+    assert "check-in row 2: Line 2 is not a JSON object" in capsys.readouterr().err
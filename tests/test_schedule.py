@@ -0,0 +1,98 @@
+"""Tests for schedule parsing and indexing."""
+
+import pytest
+from src.logic.schedule import (
+    ClassSlot,
+    ScheduleIndex,
+    day_classes,
+    format_time,
+    parse_class_entry,
+    parse_time,
+)
+from src.data import class_schedule
+
+
+@pytest.fixture
+def index():
+    """Index the default class schedule."""
+    return ScheduleIndex.from_schedule(class_schedule)
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("6:00 AM", 360),
+    ("12:00 AM", 0),
+    ("12:30 PM", 750),
+    ("5 pm", 1020),
+    ("17:30", 1050),
+])
+def test_parse_time(text, expected):
+    """Test clock times convert to minutes after midnight."""
+    assert parse_time(text) == expected
+
+
+@pytest.mark.parametrize("text", ["13:00 PM", "25:00", "noon", "6:75 AM"])
+def test_parse_time_invalid(text):
+    """Test that invalid times raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid time"):
+        parse_time(text)
+
+
+def test_format_time_round_trips():
+    """Test formatting is the inverse of parsing."""
+    assert format_time(360) == "6:00 AM"
+    assert format_time(1170) == "7:30 PM"
+    assert all(parse_time(format_time(m)) == m for m in range(0, 1440, 15))
+
+
+def test_parse_class_entry():
+    """Test parsing a schedule entry into a slot."""
+    slot = parse_class_entry("Stretch & Restore - 9:00 AM", "Sun")
+    
+    assert slot == ClassSlot(name="Stretch & Restore", day="sunday", start_minute=540)
+    assert str(slot) == "Stretch & Restore - 9:00 AM"
+
+
+def test_parse_class_entry_invalid():
+    """Test that unparseable entries raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid class entry"):
+        parse_class_entry("Yoga at dawn", "monday")
+    with pytest.raises(ValueError, match="Invalid day"):
+        parse_class_entry("Yoga - 6:00 AM", "someday")
+
+
+def test_index_day_matches_day_classes(index):
+    """Test indexed day lookups agree with the raw schedule."""
+    for day in class_schedule:
+        assert [str(slot) for slot in index.day(day)] == day_classes(day, class_schedule)
+    assert index.day("funday") == []
+
+
+def test_next_after(index):
+    """Test next-class lookups, including wrapping past Sunday."""
+    assert index.next_after("monday", 360).name == "Yoga Flow"
+    assert index.next_after("monday", 361).name == "HIIT Training"
+    assert index.next_after("sunday", 23 * 60).name == "Yoga Flow"
+
+
+def test_between_across_week(index):
+    """Test time-window queries across the week."""
+    evening = index.between(parse_time("5 PM"), parse_time("8 PM"))
+    
+    assert [slot.name for slot in evening] == [
+        "HIIT Training", "Strength Training", "Cardio Blast", "CrossFit", "Dance Fitness"
+    ]
+    assert [slot.name for slot in index.between(0, 1440, days=["sat", "Sunday"])] == [
+        "Bootcamp", "Swimming Lessons", "Stretch & Restore", "Cycling"
+    ]
+
+
+def test_named(index):
+    """Test case-insensitive lookups by class name."""
+    slots = ScheduleIndex([
+        ClassSlot("Yoga", "friday", 600),
+        ClassSlot("Yoga", "monday", 600),
+        ClassSlot("Spin", "monday", 420),
+    ]).named(" yoga ")
+    
+    assert [slot.day for slot in slots] == ["monday", "friday"]
+    assert index.named("Nonexistent") == []
@@ -0,0 +1,140 @@
+"""Tests for timetable conflict detection and free-slot suggestions."""
+
+import itertools
+import json
+import random
+
+import pytest
+from src.cli import main
+from src.data import class_details, class_schedule
+from src.logic.records import MalformedRecord
+from src.logic.timetable import IntervalIndex, Session, Timetable, overnight_sessions, parse_session, timetable_from_records
+
+RECORDS = [
+    {"name": "Yoga", "day": "mon", "start": "6:00 AM", "minutes": 60, "room": "Studio A", "instructor": "Maya"},
+    {"name": "Pilates", "day": "monday", "start": "6:30 AM", "end": "7:30 AM", "room": "Studio A", "instructor": "Sam"},
+    {"name": "Spin", "day": "Mon", "start": "6:45", "minutes": 45, "room": "Cycle Studio", "instructor": "Maya"},
+    {"name": "Barre", "day": "mon", "start": "7:00 AM", "room": "Studio A", "instructor": "Jo"},
+    {"name": "Yoga", "day": "tue", "start": "6:00 AM", "room": "Studio A", "instructor": "Maya"},
+    {"name": "Stretch", "day": "tue", "start": "6:00 PM", "room": "Studio B"},
+]
+
+
+def test_interval_index_matches_brute_force():
+    """Test overlap queries and pairs agree with comparing every pair."""
+    rng = random.Random(0)
+    intervals = [(start, start + rng.randint(1, 50), i) for i, start in enumerate(rng.sample(range(1000), 300))]
+    index = IntervalIndex(intervals)
+    
+    for start, end in [(0, 10), (100, 180), (500, 501), (990, 2000)]:
+        expected = {i for s, e, i in intervals if s < end and start < e}
+        assert {i for _, _, i in index.overlapping(start, end)} == expected
+    pairs = {frozenset((a[2], b[2])) for a, b in index.overlapping_pairs()}
+    assert pairs == {
+        frozenset((a[2], b[2])) for a, b in itertools.combinations(intervals, 2) if a[0] < b[1] and b[0] < a[1]
+    }
+    assert IntervalIndex([]).overlapping(0, 10) == []
+
+
+def test_conflicts_by_room_and_instructor():
+    """Test overlapping sessions are reported once per shared room or instructor."""
+    timetable, _ = timetable_from_records(RECORDS)
+    conflicts = [(c.kind, c.resource, c.first.name, c.second.name) for c in timetable.conflicts()]
+    
+    # Yoga ends at 7:00 AM when Barre starts: touching is not overlapping
+    assert conflicts == [
+        ("room", "Studio A", "Yoga", "Pilates"),
+        ("room", "Studio A", "Pilates", "Barre"),
+        ("instructor", "Maya", "Yoga", "Spin"),
+    ]
+    assert str(timetable.conflicts()[0]) == "Room Studio A on Monday 6:30 AM-7:00 AM: Yoga and Pilates"
+
+
+def test_default_schedule_has_no_conflicts():
+    """Test the shipped schedule and class details are conflict-free."""
+    timetable = Timetable.from_schedule(class_schedule, class_details)
+    
+    assert len(timetable) == sum(len(entries) for entries in class_schedule.values())
+    assert timetable.conflicts() == []
+    assert "Studio A" in timetable.rooms and "Maya" in timetable.instructors
+
+
+def test_free_slots_and_suggestions():
+    """Test gaps account for room and instructor bookings, and moves avoid both."""
+    timetable, _ = timetable_from_records(RECORDS)
+    
+    assert timetable.free_slots("monday", 30, room="Studio A") == [(300, 360), (480, 1320)]
+    assert timetable.free_slots("monday", 30, room="Studio A", instructor="Maya") == [(300, 360), (480, 1320)]
+    assert timetable.free_slots("monday", 60, room="Studio A", open_minute=330) == [(480, 1320)]
+    
+    pilates = next(s for s in timetable if s.name == "Pilates")
+    moves = timetable.suggest(pilates, limit=3)
+    assert [(m.room, m.start_minute) for m in moves] == [("Studio B", 390), ("Studio A", 300), ("Studio A", 480)]
+    # Maya teaches Yoga until 7:00 AM, so Spin cannot just change rooms
+    spin = next(s for s in timetable if s.name == "Spin")
+    assert [(m.room, m.start_minute) for m in timetable.suggest(spin, limit=2)] == [("Cycle Studio", 420), ("Cycle Studio", 315)]
+    for move in moves:
+        others = Timetable([s for s in timetable if s is not pilates] + [move])
+        assert not [c for c in others.conflicts() if move in (c.first, c.second)]
+    with pytest.raises(ValueError, match="Invalid day"):
+        timetable.free_slots("someday", 30)
+
+
+def test_overnight_classes_are_split_at_midnight():
+    """Test a schedule class past midnight books the end of its day and the start of the next."""
+    timetable = Timetable.from_schedule(
+        {"sunday": ["Night Ride - 11:30 PM"], "monday": ["Early Spin - 12:15 AM"]},
+        {"Night Ride": {"room": "Cycle Studio", "minutes": 90}, "Early Spin": {"room": "Cycle Studio"}},
+    )
+    
+    assert [(s.day, s.start_minute, s.end_minute) for s in timetable] == [
+        ("monday", 0, 60), ("monday", 15, 75), ("sunday", 1410, 1440),
+    ]
+    assert [(c.first.name, c.second.name) for c in timetable.conflicts()] == [("Night Ride", "Early Spin")]
+    assert len(overnight_sessions("Yoga", "monday", 360, 60, "A")) == 1
+    with pytest.raises(ValueError, match="length"):
+        overnight_sessions("Retreat", "monday", 360, 2000, "A")
+
+
+def test_overnight_records_are_split_at_midnight():
+    """Test a record running past midnight, by length or by an earlier end time, becomes two sessions."""
+    by_minutes = parse_session({"name": "Late", "day": "sun", "start": "11:30 PM", "minutes": 60, "room": "A"})
+    by_end = parse_session({"name": "Late", "day": "sun", "start": "11:30 PM", "end": "12:30 AM", "room": "A"})
+    
+    assert by_minutes == by_end
+    assert [(s.day, s.start_minute, s.end_minute) for s in by_end] == [("sunday", 1410, 1440), ("monday", 0, 30)]
+    with pytest.raises(ValueError, match="start before it ends"):
+        parse_session({"name": "Late", "day": "mon", "start": "6:00 AM", "end": "6:00 AM", "room": "A"})
+
+
+def test_invalid_records():
+    """Test bad records raise ValueError, and are skipped with their rows when building a timetable."""
+    with pytest.raises(ValueError, match="name and a room"):
+        parse_session({"name": "Yoga", "day": "mon", "start": "6:00 AM"})
+    with pytest.raises(ValueError, match="Invalid day"):
+        Session("Yoga", "funday", 360, 420, "A")
+    
+    timetable, errors = timetable_from_records([
+        RECORDS[0], {"name": "Yoga", "day": "funday", "start": "6:00 AM", "room": "A"}, MalformedRecord("bad"), RECORDS[1],
+    ])
+    assert [s.name for s in timetable] == ["Yoga", "Pilates"]
+    assert [row for row, _ in errors] == [2, 3] and "Invalid day" in errors[0][1] and errors[1][1] == "bad"
+
+
+def test_timetable_command(tmp_path, capsys):
+    """Test the timetable command writes conflicts with suggestions and fails on conflicts."""
+    path = tmp_path / "timetable.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in RECORDS), encoding="utf-8")
+    output = tmp_path / "conflicts.csv"
+    
+    assert main(["timetable", str(path), "--suggest", "-o", str(output)]) == 1
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "kind,resource,day,start,end,first,second,suggestion,row,error"
+    assert len(lines) == 4 and "Pilates - 6:30 AM-7:30 AM (Studio B, Sam)" in lines[1]
+    assert "3 conflicts" in capsys.readouterr().err
+    
+    path.write_text(json.dumps(RECORDS[0]) + "\n{bad\n", encoding="utf-8")
+    assert main(["timetable", str(path), "-o", str(output)]) == 1
+    assert output.read_text(encoding="utf-8").splitlines()[1].startswith(",,,,,,,,2,Malformed JSON on line 2")
+    assert "0 conflicts, 1 invalid rows" in capsys.readouterr().err
+    assert main(["timetable"]) == 0
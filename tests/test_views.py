@@ -0,0 +1,37 @@
+"""Tests for the lazily loaded dashboard pages and cached theme assets."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from src import views
+from src.theme import get_custom_css, get_logo
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def test_every_page_loads_and_renders():
+    """Test each registered page module exposes render()."""
+    for page in views.page_names():
+        assert callable(views.load_page(page).render)
+
+
+def test_unknown_page():
+    """Test an unknown page raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown page"):
+        views.load_page("Nowhere")
+
+
+def test_shell_does_not_import_pandas():
+    """Test the app shell imports leave pandas for the pages that need it."""
+    script = "import sys, src.theme, src.views; print('pandas' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    
+    assert result.stdout.strip() == "False"
+
+
+def test_theme_assets_are_cached():
+    """Test the CSS string and logo bytes are built once per process."""
+    assert get_custom_css() is get_custom_css()
+    assert get_logo() is get_logo()